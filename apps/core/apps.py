@@ -1,7 +1,35 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.contrib.staticfiles.apps import StaticFilesConfig as BaseStaticFilesConfig
 
 
 class CoreConfig(AppConfig):
+    # This module also holds StaticFilesConfig, so say which one 'apps.core' means
+    default = True
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.core'
     verbose_name = 'Core'
+
+    def ready(self):
+        # Register connection_created handlers for database tuning
+        from . import db  # noqa: F401
+
+        from django.db.backends.signals import connection_created
+        from . import slow_queries
+        connection_created.connect(slow_queries.attach, dispatch_uid='slow-query-log')
+
+        if getattr(settings, 'PERF_INSTRUMENTATION', True):
+            from . import instrumentation, metrics
+            instrumentation.install()
+            metrics.connect_signals()
+        if getattr(settings, 'TRACING_ENABLED', True):
+            from . import tracing
+            tracing.install()
+
+
+class StaticFilesConfig(BaseStaticFilesConfig):
+    """django.contrib.staticfiles, leaving STATICFILES_PRUNE out of collectstatic"""
+
+    @property
+    def ignore_patterns(self):
+        return [*BaseStaticFilesConfig.ignore_patterns, *getattr(settings, 'STATICFILES_PRUNE', [])]
@@ -0,0 +1,331 @@
+"""
+HTTP load benchmarks for the public site and admin portal hot paths.
+
+Scenarios are short scripted user journeys (browsing, booking, inquiring,
+chat polling, admin lists). They run either in-process through Django's test
+client, where every database query is counted and all writes are rolled back
+afterwards, or against a running server over HTTP.
+
+Results report p50/p95/p99 latency, requests per second and queries per
+request for each step, and can be compared against a stored baseline JSON.
+Used by the ``benchmark_http`` management command.
+"""
+import http.cookiejar
+import json
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from contextlib import ExitStack
+from datetime import timedelta
+
+from django.db import connections
+from django.test import Client as TestClient
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.services.models import Service
+
+
+class Step:
+    """
+    One request in a scenario.
+
+    ``path`` and ``data`` may be callables taking the scenario state dict and
+    the iteration number, for URLs and payloads that depend on earlier steps
+    or must be unique per iteration. ``after`` can read the response body to
+    update the state.
+    """
+
+    def __init__(self, name, path, method='GET', data=None, json_body=False,
+                 expect=(200,), after=None):
+        self.name = name
+        self.path = path
+        self.method = method
+        self.data = data
+        self.json_body = json_body
+        self.expect = expect
+        self.after = after
+
+    def resolve(self, value, state, iteration):
+        return value(state, iteration) if callable(value) else value
+
+
+def _booking_data(state, iteration):
+    return {
+        'service': state['service_id'],
+        'contact_name': 'Bench Mark',
+        'contact_email': f'bench-{state["run"]}-{iteration}@benchmark.example.com',
+        'contact_phone': '+254700000000',
+        'preferred_date': (timezone.localdate() + timedelta(days=7)).isoformat(),
+        'preferred_time_slot': 'flexible',
+        'location_address': '1 Benchmark Road, Nairobi',
+        'message': 'Benchmark booking',
+        'priority': 'normal',
+    }
+
+
+def _inquiry_data(state, iteration):
+    return {
+        'contact_name': 'Bench Mark',
+        'contact_email': f'bench-{state["run"]}-{iteration}@benchmark.example.com',
+        'contact_phone': '+254700000000',
+        'subject': 'Benchmark inquiry',
+        'service': state['service_id'],
+        'message': 'Please send a quotation.',
+        'priority': 'normal',
+    }
+
+
+def _chat_start_data(state, iteration):
+    return {
+        'message': 'Hello, what are your hours?',
+        'name': 'Bench Mark',
+        'email': f'bench-{state["run"]}-{iteration}@benchmark.example.com',
+    }
+
+
+def _remember_chat_session(state, body):
+    state['chat_session'] = json.loads(body)['session_id']
+
+
+SCENARIOS = {
+    'browse': {
+        'staff': False,
+        'steps': [
+            Step('home', '/'),
+            Step('services', lambda s, i: reverse('services:list')),
+            Step('service_detail', lambda s, i: reverse('services:detail', args=[s['service_slug']])),
+            Step('products', lambda s, i: reverse('services:products')),
+            Step('portfolio', lambda s, i: reverse('portfolio:list')),
+        ],
+    },
+    'booking': {
+        'staff': False,
+        'steps': [
+            Step('form', lambda s, i: reverse('leads:booking_create')),
+            Step('submit', lambda s, i: reverse('leads:booking_create'), 'POST', _booking_data, expect=(302,)),
+        ],
+    },
+    'inquiry': {
+        'staff': False,
+        'steps': [
+            Step('form', lambda s, i: reverse('leads:inquiry_create')),
+            Step('submit', lambda s, i: reverse('leads:inquiry_create'), 'POST', _inquiry_data, expect=(302,)),
+        ],
+    },
+    'chat': {
+        'staff': False,
+        'steps': [
+            Step('start', lambda s, i: reverse('leads:chat_message'), 'POST', _chat_start_data,
+                 json_body=True, after=_remember_chat_session),
+            Step('poll', lambda s, i: reverse('leads:chat_history', args=[s['chat_session']])),
+            Step('reply', lambda s, i: reverse('leads:chat_message'), 'POST',
+                 lambda s, i: {'message': 'How much is a service?', 'session_id': s['chat_session']},
+                 json_body=True),
+            Step('poll_again', lambda s, i: reverse('leads:chat_history', args=[s['chat_session']])),
+        ],
+    },
+    'admin': {
+        'staff': True,
+        'steps': [
+            Step('dashboard', lambda s, i: reverse('users:admin_dashboard')),
+            Step('bookings', lambda s, i: reverse('users:admin_bookings_list')),
+            Step('quotations', lambda s, i: reverse('users:admin_quotations_list')),
+            Step('customers', lambda s, i: reverse('users:admin_customers_list')),
+            Step('leads', lambda s, i: reverse('users:admin_leads_list')),
+        ],
+    },
+}
+
+
+def initial_state(run_id):
+    """Look up the objects scenario URLs and payloads refer to"""
+    service = Service.objects.filter(is_active=True).order_by('pk').only('pk', 'slug').first()
+    if service is None:
+        raise ValueError('Benchmarks need at least one active service; run populate_sample_data first.')
+    return {'run': run_id, 'service_id': service.pk, 'service_slug': service.slug}
+
+
+class TestClientTransport:
+    """Sends requests in-process and counts the queries each one runs"""
+
+    def __init__(self):
+        self.client = TestClient(raise_request_exception=False)
+
+    def login(self, user):
+        self.client.force_login(user)
+
+    def request(self, method, path, data=None, json_body=False):
+        queries = []
+
+        def count(execute, sql, params, many, context):
+            queries.append(sql)
+            return execute(sql, params, many, context)
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(count))
+            started = time.perf_counter()
+            if method == 'GET':
+                response = self.client.get(path, data)
+            elif json_body:
+                response = self.client.post(path, json.dumps(data), content_type='application/json')
+            else:
+                response = self.client.post(path, data)
+            body = b''.join(response.streaming_content) if response.streaming else response.content
+            elapsed = time.perf_counter() - started
+        return response.status_code, body, elapsed, len(queries)
+
+
+class HTTPTransport:
+    """Sends requests to a running server, keeping cookies between requests"""
+
+    def __init__(self, base_url, timeout=30):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.cookies = http.cookiejar.CookieJar()
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(self.cookies),
+            _NoRedirect,
+        )
+
+    def csrf_token(self):
+        for cookie in self.cookies:
+            if cookie.name == 'csrftoken':
+                return cookie.value
+        return ''
+
+    def login(self, email, password):
+        path = reverse('users:admin_login')
+        self.request('GET', path)
+        status, _, _, _ = self.request('POST', path, {'email': email, 'password': password})
+        if status != 302:
+            raise ValueError(f'Admin login as {email} failed (HTTP {status}).')
+
+    def request(self, method, path, data=None, json_body=False):
+        url = self.base_url + path
+        body = None
+        headers = {}
+        if method == 'GET' and data:
+            url += '?' + urllib.parse.urlencode(data)
+        elif method != 'GET':
+            if json_body:
+                body = json.dumps(data or {}).encode()
+                headers['Content-Type'] = 'application/json'
+            else:
+                body = urllib.parse.urlencode(data or {}).encode()
+                headers['Content-Type'] = 'application/x-www-form-urlencoded'
+            headers['X-CSRFToken'] = self.csrf_token()
+            headers['Referer'] = url
+
+        request = urllib.request.Request(url, data=body, headers=headers, method=method)
+        started = time.perf_counter()
+        try:
+            with self.opener.open(request, timeout=self.timeout) as response:
+                status, content = response.status, response.read()
+        except urllib.error.HTTPError as error:
+            status, content = error.code, error.read()
+        elapsed = time.perf_counter() - started
+        return status, content, elapsed, None
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    """Report redirects as responses so POST-redirect-GET is measured as one step"""
+
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+def percentile(sorted_values, pct):
+    """Linear-interpolated percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def run_scenario(transport, scenario, state, iterations, warmup=0):
+    """
+    Run every step of ``scenario`` ``warmup + iterations`` times.
+
+    Returns per-step samples (seconds), query counts and error messages, plus
+    the wall-clock time of the measured iterations.
+    """
+    steps = SCENARIOS[scenario]['steps']
+    samples = {step.name: {'timings': [], 'queries': [], 'errors': []} for step in steps}
+    started = None
+
+    for iteration in range(warmup + iterations):
+        if iteration == warmup:
+            started = time.perf_counter()
+        for step in steps:
+            path = step.resolve(step.path, state, iteration)
+            data = step.resolve(step.data, state, iteration)
+            status, body, elapsed, queries = transport.request(step.method, path, data, step.json_body)
+            if step.after and status in step.expect:
+                step.after(state, body)
+            if iteration < warmup:
+                continue
+            sample = samples[step.name]
+            sample['timings'].append(elapsed)
+            if queries is not None:
+                sample['queries'].append(queries)
+            if status not in step.expect:
+                sample['errors'].append(f'{step.method} {path} returned HTTP {status}')
+
+    wall = time.perf_counter() - started if started is not None else 0
+    return samples, wall
+
+
+def summarize(scenario, samples, wall):
+    """Turn raw samples into the result structure stored in JSON"""
+    steps = {}
+    requests = 0
+    for name, sample in samples.items():
+        timings = sorted(sample['timings'])
+        requests += len(timings)
+        steps[f'{scenario}.{name}'] = {
+            'count': len(timings),
+            'errors': len(sample['errors']),
+            'p50_ms': round(percentile(timings, 50) * 1000, 2),
+            'p95_ms': round(percentile(timings, 95) * 1000, 2),
+            'p99_ms': round(percentile(timings, 99) * 1000, 2),
+            'mean_ms': round(sum(timings) / len(timings) * 1000, 2) if timings else 0,
+            'queries': round(sum(sample['queries']) / len(sample['queries']), 1) if sample['queries'] else None,
+        }
+    return steps, {
+        'requests': requests,
+        'seconds': round(wall, 3),
+        'rps': round(requests / wall, 1) if wall else 0,
+    }
+
+
+def compare(results, baseline, threshold=0.2, min_delta_ms=2.0):
+    """
+    List regressions of ``results`` against ``baseline``.
+
+    A step regresses when its p95 grows by more than ``threshold`` (and by at
+    least ``min_delta_ms``, to ignore noise on very fast pages) or it runs more
+    queries per request. A scenario regresses when its requests/s drops by
+    more than ``threshold``.
+    """
+    regressions = []
+    for name, current in results.get('steps', {}).items():
+        before = baseline.get('steps', {}).get(name)
+        if not before:
+            continue
+        if (current['p95_ms'] > before['p95_ms'] * (1 + threshold)
+                and current['p95_ms'] - before['p95_ms'] >= min_delta_ms):
+            regressions.append(f"{name}: p95 {before['p95_ms']:.1f}ms -> {current['p95_ms']:.1f}ms")
+        if current.get('queries') is not None and before.get('queries') is not None:
+            if current['queries'] > before['queries']:
+                regressions.append(f"{name}: queries {before['queries']} -> {current['queries']}")
+
+    for name, current in results.get('scenarios', {}).items():
+        before = baseline.get('scenarios', {}).get(name)
+        if before and before['rps'] and current['rps'] < before['rps'] * (1 - threshold):
+            regressions.append(f"{name}: {before['rps']:.1f} req/s -> {current['rps']:.1f} req/s")
+    return regressions
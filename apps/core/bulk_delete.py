@@ -0,0 +1,211 @@
+"""
+Chunked bulk deletion for maintenance commands.
+
+``Model.objects.all().delete()`` makes Django's collector load every row and
+every cascaded row into memory and delete them in one transaction. On a large
+table that holds locks for minutes or runs out of memory.
+
+``chunked_delete`` instead deletes by primary-key ranges of ``batch_size``
+rows, each batch in its own short transaction. Within a batch, rows that
+cascade from the batch are deleted children first with ``_raw_delete`` and
+SET_NULL references are cleared with a single UPDATE, so nothing is loaded
+into Python. Models where that is not safe (delete signal receivers,
+PROTECT/RESTRICT/SET_DEFAULT relations, generic relations, multi-table
+inheritance, self-referencing cascades) fall back to the regular collector,
+still one batch at a time.
+
+Progress is written to an optional checkpoint file after every batch so an
+interrupted run can be resumed.
+"""
+import json
+import os
+import time
+from collections import Counter
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import router, transaction
+from django.db.models import CASCADE, DO_NOTHING, SET_NULL
+from django.db.models.deletion import Collector, get_candidate_relations_to_delete
+
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class DeleteCheckpoint:
+    """JSON file recording the last deleted primary key of each step"""
+
+    def __init__(self, path, resume=True):
+        self.path = path
+        self.state = {}
+        if resume and os.path.exists(path):
+            with open(path) as f:
+                self.state = json.load(f)
+
+    def get(self, key):
+        return self.state.get(key)
+
+    def set(self, key, value):
+        self.state[key] = value
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.state, f, cls=DjangoJSONEncoder)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        self.state = {}
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def _can_raw_delete(model, seen=()):
+    """Return True if rows of ``model`` and their cascades can be deleted without the collector"""
+    opts = model._meta
+    if model in seen or opts.parents or Collector(using='default')._has_signal_listeners(model):
+        return False
+    if any(hasattr(field, 'bulk_related_objects') for field in opts.private_fields):
+        return False
+
+    for related in get_candidate_relations_to_delete(opts):
+        on_delete = related.field.remote_field.on_delete
+        if on_delete is CASCADE:
+            if not _can_raw_delete(related.related_model, seen + (model,)):
+                return False
+        elif on_delete not in (SET_NULL, DO_NOTHING):
+            return False
+    return True
+
+
+def _related_queryset(related, queryset, using):
+    field = related.field
+    return related.related_model._base_manager.using(using).filter(
+        **{f'{field.name}__in': queryset.values(field.target_field.attname)}
+    )
+
+
+def _raw_delete(queryset, using):
+    """Delete ``queryset`` and its cascades, children first. Returns rows per model."""
+    model = queryset.model
+    counts = Counter()
+    for related in get_candidate_relations_to_delete(model._meta):
+        on_delete = related.field.remote_field.on_delete
+        if on_delete is CASCADE:
+            counts += _raw_delete(_related_queryset(related, queryset, using), using)
+        elif on_delete is SET_NULL:
+            _related_queryset(related, queryset, using).update(**{related.field.name: None})
+
+    deleted = queryset.order_by()._raw_delete(using)
+    if deleted:
+        counts[model._meta.label] += deleted
+    return counts
+
+
+def count_cascade(queryset, using=None):
+    """Count the rows a delete of ``queryset`` would remove, per model, without deleting"""
+    using = using or router.db_for_write(queryset.model)
+    model = queryset.model
+    counts = Counter()
+    total = queryset.using(using).count()
+    if total:
+        counts[model._meta.label] += total
+        for related in get_candidate_relations_to_delete(model._meta):
+            if related.field.remote_field.on_delete is CASCADE and related.related_model is not model:
+                counts += count_cascade(_related_queryset(related, queryset, using), using)
+    return counts
+
+
+def chunked_delete(queryset, batch_size=DEFAULT_BATCH_SIZE, dry_run=False,
+                   checkpoint=None, checkpoint_key=None, progress=None):
+    """
+    Delete the rows of ``queryset`` in primary-key ordered batches.
+
+    Each batch runs in its own transaction. ``progress`` is called after every
+    batch with a dict of ``label``, ``deleted``, ``total`` and ``rate`` (rows
+    per second). With a ``checkpoint``, the last deleted primary key is saved
+    under ``checkpoint_key`` and deletion resumes after it. Returns a Counter
+    of deleted rows per model label (the planned counts when ``dry_run``).
+    """
+    model = queryset.model
+    label = model._meta.label
+    using = queryset._db or router.db_for_write(model)
+    checkpoint_key = checkpoint_key or label
+
+    last_pk = checkpoint.get(checkpoint_key) if checkpoint else None
+    remaining = queryset.using(using)
+    if last_pk is not None:
+        remaining = remaining.filter(pk__gt=last_pk)
+
+    if dry_run:
+        return count_cascade(remaining, using)
+
+    raw = _can_raw_delete(model)
+    total = remaining.count()
+    counts = Counter()
+    deleted = 0
+    started = time.perf_counter()
+
+    while True:
+        remaining = queryset.using(using)
+        if last_pk is not None:
+            remaining = remaining.filter(pk__gt=last_pk)
+
+        # Upper primary key of this batch; None means the rest fits in one batch
+        upper = list(remaining.order_by('pk').values_list('pk', flat=True)[batch_size - 1:batch_size])
+        batch = remaining.filter(pk__lte=upper[0]) if upper else remaining
+
+        with transaction.atomic(using=using):
+            if raw:
+                batch_counts = _raw_delete(batch, using)
+            else:
+                batch_counts = Counter(batch.order_by().delete()[1])
+
+        counts += batch_counts
+        deleted += batch_counts.get(label, 0)
+
+        if upper:
+            last_pk = upper[0]
+            if checkpoint:
+                checkpoint.set(checkpoint_key, last_pk)
+
+        if progress:
+            elapsed = time.perf_counter() - started
+            progress({
+                'label': label,
+                'deleted': deleted,
+                'total': total,
+                'rate': deleted / elapsed if elapsed else 0,
+            })
+
+        if not upper:
+            break
+
+    return counts
+
+
+def delete_in_order(querysets, batch_size=DEFAULT_BATCH_SIZE, dry_run=False,
+                    checkpoint=None, progress=None):
+    """
+    Run ``chunked_delete`` over several querysets in dependency order.
+
+    List children before parents (images before services, services before
+    categories) so each step's cascades stay small. Completed steps are
+    recorded in the checkpoint and skipped when resuming.
+    """
+    counts = Counter()
+    for index, queryset in enumerate(querysets):
+        key = f'{index}:{queryset.model._meta.label}'
+        if checkpoint and checkpoint.get(f'{key}:done'):
+            continue
+        counts += chunked_delete(
+            queryset,
+            batch_size=batch_size,
+            dry_run=dry_run,
+            checkpoint=checkpoint,
+            checkpoint_key=key,
+            progress=progress,
+        )
+        if checkpoint and not dry_run:
+            checkpoint.set(f'{key}:done', True)
+
+    if checkpoint and not dry_run:
+        checkpoint.clear()
+    return counts
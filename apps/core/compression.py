@@ -0,0 +1,196 @@
+"""
+On-the-fly compression of dynamic responses.
+
+``CompressionMiddleware`` (in apps.core.middleware) compresses HTML, JSON,
+CSV, NDJSON, event streams and other text responses with brotli (when the
+Brotli package is installed) or gzip, whichever the client prefers in
+``Accept-Encoding``. Bodies under ``COMPRESSION_MIN_SIZE`` bytes, responses
+that already have a ``Content-Encoding`` and file responses (static files
+come precompressed from collectstatic) are left alone.
+
+Streaming responses stay streamed: every chunk is compressed and flushed as
+it is produced, so exports start downloading at once and server-sent events
+reach the browser when they are sent.
+
+BREACH: a page that reflects request input next to a secret lets an attacker
+who can watch response sizes guess the secret a byte at a time. Django masks
+the CSRF token differently in every response, and responses that carry one
+(the view called ``get_token``, so the CSRF middleware refreshed the cookie)
+are only ever gzipped, with a random-length file name in the gzip header so
+their size stops being a reliable signal. ``COMPRESSION_SKIP_CSRF = True``
+sends them uncompressed instead.
+
+Bytes in and out are added to the application counters, which /metrics
+exposes together with the overall compression ratio.
+"""
+import os
+import struct
+import zlib
+
+from django.conf import settings
+
+from . import instrumentation
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# Content types worth compressing, besides text/*
+COMPRESSIBLE_TYPES = {
+    'application/json',
+    'application/x-ndjson',
+    'application/javascript',
+    'application/xml',
+    'application/xhtml+xml',
+    'application/manifest+json',
+    'image/svg+xml',
+}
+
+DEFAULT_MIN_SIZE = 1024
+
+# Upper bound of the random gzip file name added to responses with a CSRF token
+MAX_PADDING = 100
+
+
+def is_compressible(content_type):
+    media_type = content_type.split(';')[0].strip().lower()
+    return media_type.startswith('text/') or media_type in COMPRESSIBLE_TYPES
+
+
+def carries_csrf_token(request, response):
+    """Whether the view asked for a CSRF token, most likely to put it in the body"""
+    if settings.CSRF_USE_SESSIONS:
+        return 'CSRF_COOKIE' in request.META
+    return settings.CSRF_COOKIE_NAME in response.cookies
+
+
+def accepted_encodings(header):
+    """``{coding: q}`` from an Accept-Encoding header"""
+    accepted = {}
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+def choose_encoding(header, allow_brotli=True):
+    """'br', 'gzip' or None for what the client accepts, brotli first when it is as welcome as gzip"""
+    accepted = accepted_encodings(header)
+    wildcard = accepted.get('*', 0.0)
+    gzip_q = accepted.get('gzip', accepted.get('x-gzip', wildcard))
+    br_q = accepted.get('br', wildcard)
+    if allow_brotli and brotli is not None and br_q > 0 and br_q >= gzip_q:
+        return 'br'
+    if gzip_q > 0:
+        return 'gzip'
+    return None
+
+
+class GzipStream:
+    """
+    gzip member written with zlib, flushed on demand.
+
+    With ``padding`` a random file name of up to that many bytes goes into
+    the header, which changes the compressed size of otherwise identical
+    bodies.
+    """
+
+    def __init__(self, padding=0):
+        self.compressor = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
+        self.crc = 0
+        self.size = 0
+        flags = 0
+        name = b''
+        if padding:
+            flags = 0x08  # FNAME
+            length = 1 + int.from_bytes(os.urandom(1), 'big') % padding
+            name = os.urandom(length).hex()[:length].encode('ascii') + b'\x00'
+        self.header = b'\x1f\x8b\x08' + bytes([flags]) + b'\x00\x00\x00\x00\x00\xff' + name
+
+    def compress(self, data, flush=False):
+        self.crc = zlib.crc32(data, self.crc)
+        self.size += len(data)
+        out = self.header + self.compressor.compress(data)
+        self.header = b''
+        if flush:
+            out += self.compressor.flush(zlib.Z_SYNC_FLUSH)
+        return out
+
+    def finish(self):
+        return (self.header + self.compressor.flush()
+                + struct.pack('<II', self.crc & 0xffffffff, self.size & 0xffffffff))
+
+
+class BrotliStream:
+    def __init__(self):
+        self.compressor = brotli.Compressor(quality=5)
+
+    def compress(self, data, flush=False):
+        out = self.compressor.process(data)
+        if flush:
+            out += self.compressor.flush()
+        return out
+
+    def finish(self):
+        return self.compressor.finish()
+
+
+def compressor(encoding, padding=0):
+    return BrotliStream() if encoding == 'br' else GzipStream(padding)
+
+
+def compress(data, encoding, padding=0):
+    stream = compressor(encoding, padding)
+    return stream.compress(data) + stream.finish()
+
+
+def record(raw, compressed):
+    """Add a compressed response to the application counters"""
+    instrumentation.histograms.increment('http_compressed_responses_total')
+    instrumentation.histograms.increment('http_compression_input_bytes_total', raw)
+    instrumentation.histograms.increment('http_compression_output_bytes_total', compressed)
+
+
+def compress_stream(content, encoding, padding=0):
+    """Compress an iterable of byte chunks, flushing after each one"""
+    stream = compressor(encoding, padding)
+    raw = compressed = 0
+    for chunk in content:
+        raw += len(chunk)
+        out = stream.compress(chunk, flush=True)
+        compressed += len(out)
+        if out:
+            yield out
+    out = stream.finish()
+    record(raw, compressed + len(out))
+    yield out
+
+
+async def compress_async_stream(content, encoding, padding=0):
+    stream = compressor(encoding, padding)
+    raw = compressed = 0
+    async for chunk in content:
+        raw += len(chunk)
+        out = stream.compress(chunk, flush=True)
+        compressed += len(out)
+        if out:
+            yield out
+    out = stream.finish()
+    record(raw, compressed + len(out))
+    yield out
+
+
+def min_size():
+    return getattr(settings, 'COMPRESSION_MIN_SIZE', DEFAULT_MIN_SIZE)
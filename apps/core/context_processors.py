@@ -18,3 +18,13 @@ def site_settings(request):
         'brand_colors': getattr(settings, 'BRAND_COLORS', {}),
         'company_info': getattr(settings, 'COMPANY_INFO', {}),
     }
+
+
+def critical_css(request):
+    """
+    Above-the-fold CSS for public pages that have it, see apps.core.critical_css
+    """
+    from .critical_css import inline_css
+
+    match = getattr(request, 'resolver_match', None)
+    return {'critical_css': inline_css(match.view_name) if match else ''}
@@ -0,0 +1,212 @@
+"""
+Above-the-fold CSS for the public pages.
+
+``manage.py critical_css`` renders each view in ``CRITICAL_CSS_PAGES`` and
+keeps the rules of the built ``dist/public.css`` whose selectors can match
+something above the fold: everything in ``<body>`` except the footer and the
+sections of ``<main>`` after the first ``CRITICAL_CSS_SECTIONS``. The result
+is written to ``CRITICAL_CSS_DIR`` as ``<app>-<view>.css``.
+
+The ``critical_css`` context processor hands that CSS to ``base/base.html``,
+which inlines it in ``<head>`` and loads the full stylesheet without
+blocking first paint. Pages without a file get the plain stylesheet link.
+"""
+import os
+import re
+from functools import lru_cache
+from html.parser import HTMLParser
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+
+
+BUNDLE = 'dist/public.css'
+
+_CLASS = re.compile(r'\.((?:\\[0-9a-fA-F]{1,6} ?|\\.|[\w-])+)')
+_ID = re.compile(r'#((?:\\.|[\w-])+)')
+_ESCAPE = re.compile(r'\\([0-9a-fA-F]{1,6}) ?|\\(.)')
+_URL = re.compile(r'url\(\s*(["\']?)([^"\')]+)\1\s*\)')
+_ANIMATION = re.compile(r'animation(?:-name)?:([^;}]+)')
+_KEYFRAMES = re.compile(r'@(?:-webkit-)?keyframes\s+([\w-]+)')
+# At-rules whose bodies hold blocks rather than declarations
+_NESTING = ('@media', '@supports', '@layer', '@container', '@keyframes', '@-webkit-keyframes')
+
+
+def _unescape(name):
+    return _ESCAPE.sub(lambda m: chr(int(m.group(1), 16)) if m.group(1) else m.group(2), name)
+
+
+def parse(css):
+    """Split a stylesheet into ``(prelude, body)`` blocks; bodies of at-rules that nest are lists"""
+    blocks, _ = _parse(re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL), 0)
+    return blocks
+
+
+def _parse(css, pos):
+    blocks = []
+    length = len(css)
+    while pos < length:
+        if css[pos] == '}':
+            return blocks, pos + 1
+        brace = css.find('{', pos)
+        semicolon = css.find(';', pos)
+        if brace == -1:
+            break
+        if semicolon != -1 and semicolon < brace:
+            # Statement at-rule such as @charset or @import
+            blocks.append((css[pos:semicolon].strip(), None))
+            pos = semicolon + 1
+            continue
+        prelude = css[pos:brace].strip()
+        if prelude.startswith(_NESTING):
+            body, pos = _parse(css, brace + 1)
+        else:
+            end = css.find('}', brace)
+            body, pos = css[brace + 1:end].strip(), end + 1
+        if prelude:
+            blocks.append((prelude, body))
+    return blocks, pos
+
+
+def serialize(blocks):
+    out = []
+    for prelude, body in blocks:
+        if body is None:
+            out.append(f'{prelude};')
+        elif isinstance(body, list):
+            out.append(f'{prelude}{{{serialize(body)}}}')
+        else:
+            out.append(f'{prelude}{{{body}}}')
+    return ''.join(out)
+
+
+class FoldParser(HTMLParser):
+    """Classes and IDs of the elements a visitor sees before scrolling"""
+
+    VOID = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+    UNSEEN = {'script', 'style', 'template'}
+
+    def __init__(self, sections):
+        super().__init__()
+        self.sections = sections
+        self.classes, self.ids = set(), set()
+        self.stack = []
+        self.skipping = None
+        self.main_children = 0
+
+    def handle_starttag(self, tag, attrs):
+        depth = len(self.stack)
+        if tag not in self.VOID:
+            self.stack.append(tag)
+        if self.skipping is not None:
+            return
+        parent = self.stack[depth - 1] if depth else None
+        if tag == 'footer' or (parent == 'main' and tag not in self.UNSEEN and self._below_fold()):
+            if tag not in self.VOID:
+                self.skipping = depth
+            return
+        attrs = dict(attrs)
+        self.classes.update((attrs.get('class') or '').split())
+        if attrs.get('id'):
+            self.ids.add(attrs['id'])
+
+    def _below_fold(self):
+        self.main_children += 1
+        return self.main_children > self.sections
+
+    def handle_endtag(self, tag):
+        if tag in self.VOID or tag not in self.stack:
+            return
+        while self.stack:
+            if self.stack.pop() == tag:
+                break
+        if self.skipping is not None and len(self.stack) <= self.skipping:
+            self.skipping = None
+
+
+def above_the_fold(html, sections=None):
+    """``(classes, ids)`` used above the fold of a rendered page"""
+    parser = FoldParser(sections or getattr(settings, 'CRITICAL_CSS_SECTIONS', 2))
+    parser.feed(html)
+    parser.close()
+    return parser.classes, parser.ids
+
+
+def _matches(selector, classes, ids):
+    return (
+        all(_unescape(name) in classes for name in _CLASS.findall(selector))
+        and all(_unescape(name) in ids for name in _ID.findall(selector))
+    )
+
+
+def _filter(blocks, classes, ids):
+    kept = []
+    for prelude, body in blocks:
+        if body is None or _KEYFRAMES.match(prelude):
+            kept.append((prelude, body))
+        elif isinstance(body, list):
+            inner = _filter(body, classes, ids)
+            if inner:
+                kept.append((prelude, inner))
+        elif prelude.startswith('@'):
+            kept.append((prelude, body))
+        else:
+            selectors = [s for s in prelude.split(',') if _matches(s, classes, ids)]
+            if selectors:
+                kept.append((','.join(selectors), body))
+    return kept
+
+
+def _drop_unused_keyframes(blocks, used):
+    kept = []
+    for prelude, body in blocks:
+        keyframes = _KEYFRAMES.match(prelude)
+        if keyframes:
+            if keyframes.group(1) in used:
+                kept.append((prelude, body))
+        elif isinstance(body, list):
+            kept.append((prelude, _drop_unused_keyframes(body, used)))
+        else:
+            kept.append((prelude, body))
+    return kept
+
+
+def extract(css, html, sections=None, base=BUNDLE):
+    """The rules of ``css`` that style the part of ``html`` above the fold"""
+    classes, ids = above_the_fold(html, sections)
+    critical = serialize(_filter(parse(css), classes, ids))
+    used = {name for value in _ANIMATION.findall(critical) for name in re.findall(r'[\w-]+', value)}
+    critical = serialize(_drop_unused_keyframes(parse(critical), used))
+    # Relative URLs point next to the bundle; keep them as static paths until
+    # render time, when the hashed names are known
+    directory = os.path.dirname(base)
+
+    def static_path(match):
+        quote, url = match.groups()
+        if url.startswith(('data:', 'http:', 'https:', '/', '#')):
+            return match.group(0)
+        return f'url({quote}static:{os.path.normpath(os.path.join(directory, url)).replace(os.sep, "/")}{quote})'
+
+    return _URL.sub(static_path, critical)
+
+
+def filename(view_name):
+    return f"{view_name.replace(':', '-')}.css"
+
+
+@lru_cache(maxsize=None)
+def inline_css(view_name):
+    """Critical CSS to inline for a view, with static URLs resolved, or ''"""
+    directory = getattr(settings, 'CRITICAL_CSS_DIR', None)
+    if not directory or view_name not in getattr(settings, 'CRITICAL_CSS_PAGES', ()):
+        return ''
+    try:
+        with open(os.path.join(directory, filename(view_name)), encoding='utf-8') as f:
+            css = f.read()
+    except FileNotFoundError:
+        return ''
+    return re.sub(
+        r'url\((["\']?)static:([^"\')]+)\1\)',
+        lambda m: f'url({m.group(1)}{staticfiles_storage.url(m.group(2))}{m.group(1)})',
+        css,
+    ).replace('</', '<\\/')
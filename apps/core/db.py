@@ -0,0 +1,52 @@
+"""
+Database connection tuning.
+
+SQLite pragmas are per-connection, so they are applied every time Django
+opens a new connection. With CONN_MAX_AGE set this happens once per worker
+thread rather than once per request.
+"""
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+# Sensible production defaults for SQLite. WAL lets readers proceed while a
+# single writer (view_count updates, session saves) holds the write lock.
+DEFAULT_SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 5000,            # milliseconds
+    'mmap_size': 256 * 1024 * 1024,  # 256 MB
+    'cache_size': -20000,            # ~20 MB page cache
+    'temp_store': 'MEMORY',
+    'foreign_keys': 'ON',
+}
+
+
+def get_sqlite_pragmas():
+    """Return the pragmas to apply, allowing settings.SQLITE_PRAGMAS to override"""
+    pragmas = dict(DEFAULT_SQLITE_PRAGMAS)
+    pragmas.update(getattr(settings, 'SQLITE_PRAGMAS', {}))
+    return pragmas
+
+
+def apply_sqlite_pragmas(cursor, pragmas):
+    """Apply a dict of pragmas using a DB-API cursor"""
+    for name, value in pragmas.items():
+        if value is None:
+            continue
+        cursor.execute(f'PRAGMA {name} = {value}')
+
+
+@receiver(connection_created)
+def configure_sqlite_connection(sender, connection, **kwargs):
+    """Tune each new SQLite connection; other vendors are left untouched"""
+    if connection.vendor != 'sqlite':
+        return
+
+    # In-memory test databases do not support WAL
+    if connection.is_in_memory_db():
+        return
+
+    with connection.cursor() as cursor:
+        apply_sqlite_pragmas(cursor, get_sqlite_pragmas())
@@ -0,0 +1,349 @@
+"""
+Bulk CSV/XLSX importers for clients, bookings and products.
+
+Rows are stream-parsed, validated with the same form rules the admin portal
+uses, and inserted with ``bulk_create`` in batches, each inside its own
+transaction. Foreign keys (service slug, product category name, client email)
+are resolved through dictionaries loaded once up front, so validating a row
+never touches the database.
+
+Used by the ``import_data`` management command and the admin upload page.
+"""
+import codecs
+import csv
+import os
+import time
+
+from django import forms
+from django.db import transaction
+from django.utils.text import slugify
+
+from apps.leads.forms import BookingForm, ClientForm
+from apps.leads.models import Booking, Client
+from apps.services.forms import ProductForm
+from apps.services.models import Product, ProductCategory, Service
+
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def read_rows(fileobj, filename):
+    """
+    Yield one dict per data row from a CSV or XLSX file.
+
+    ``fileobj`` may be opened in binary or text mode. Header names are
+    stripped and lower-cased; empty rows are skipped.
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    if extension in ('.xlsx', '.xlsm'):
+        yield from _read_xlsx(fileobj)
+        return
+
+    lines = fileobj
+    if isinstance(fileobj.read(0), bytes):
+        lines = codecs.iterdecode(fileobj, 'utf-8-sig')
+    reader = csv.reader(lines)
+    headers = [header.strip().lower() for header in next(reader, [])]
+    for values in reader:
+        if any(value.strip() for value in values):
+            yield dict(zip(headers, (value.strip() for value in values)))
+
+
+def _read_xlsx(fileobj):
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportError('Reading .xlsx files requires openpyxl (pip install openpyxl).')
+
+    workbook = load_workbook(fileobj, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        headers = [str(header or '').strip().lower() for header in next(rows, ())]
+        for values in rows:
+            if any(value not in (None, '') for value in values):
+                yield dict(zip(headers, ('' if value is None else str(value).strip() for value in values)))
+    finally:
+        workbook.close()
+
+
+class ClientImportForm(ClientForm):
+    """ClientForm with the email uniqueness check run against a preloaded set"""
+
+    def __init__(self, *args, existing_emails=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.existing_emails = existing_emails
+
+    def clean_email(self):
+        email = self.cleaned_data.get('email')
+        if email and email.lower() in self.existing_emails:
+            raise forms.ValidationError("A client with this email address already exists.")
+        return email
+
+    def validate_unique(self):
+        # Uniqueness is checked against the preloaded sets instead
+        pass
+
+
+class BookingImportForm(BookingForm):
+    """BookingForm taking a service slug resolved through a preloaded map"""
+
+    service = forms.CharField()
+
+    def __init__(self, *args, services=None, allow_past_dates=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.services = services
+        self.allow_past_dates = allow_past_dates
+
+    def clean_service(self):
+        slug = self.cleaned_data['service'].strip().lower()
+        service = self.services.get(slug)
+        if service is None:
+            raise forms.ValidationError(f"Unknown or inactive service '{slug}'.")
+        return service
+
+    def clean_preferred_date(self):
+        if self.allow_past_dates:
+            return self.cleaned_data.get('preferred_date')
+        return super().clean_preferred_date()
+
+    def _get_validation_exclusions(self):
+        # The service was resolved from the preloaded map; skip the per-row FK lookup
+        exclude = super()._get_validation_exclusions()
+        exclude.add('service')
+        return exclude
+
+    def validate_unique(self):
+        pass
+
+
+class ProductImportForm(ProductForm):
+    """ProductForm taking a category name resolved through a preloaded map"""
+
+    category = forms.CharField()
+
+    def __init__(self, *args, categories=None, existing_skus=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.categories = categories
+        self.existing_skus = existing_skus
+
+    def clean_category(self):
+        name = self.cleaned_data['category'].strip()
+        category = self.categories.get(name.lower())
+        if category is None:
+            raise forms.ValidationError(f"Unknown or inactive product category '{name}'.")
+        return category
+
+    def clean_sku(self):
+        sku = self.cleaned_data.get('sku', '')
+        if sku in self.existing_skus:
+            if not sku:
+                # sku is unique, so only one product may have it blank
+                raise forms.ValidationError("SKU is required; a product without one already exists.")
+            raise forms.ValidationError("A product with this SKU already exists.")
+        return sku
+
+    def _get_validation_exclusions(self):
+        exclude = super()._get_validation_exclusions()
+        exclude.add('category')
+        return exclude
+
+    def validate_unique(self):
+        pass
+
+
+class BaseImporter:
+    """
+    Validate rows with ``form_class`` and bulk insert the valid ones.
+
+    Subclasses preload lookup tables in ``preload()``, pass them to the form
+    via ``get_form_kwargs()`` and can adjust instances in ``prepare()`` before
+    a batch is inserted.
+    """
+    model = None
+    form_class = None
+
+    # Values used when a column is missing or empty, matching the model defaults
+    defaults = {}
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE, dry_run=False, progress=None, **options):
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.progress = progress
+        self.options = options
+        self.errors = []
+        self.processed = 0
+        self.created = 0
+        self.started = None
+
+    def preload(self):
+        pass
+
+    def get_form_kwargs(self):
+        return {}
+
+    def build(self, form):
+        """Turn a valid form into an unsaved model instance"""
+        return form.save(commit=False)
+
+    def prepare(self, batch):
+        """Hook run on each batch right before insertion"""
+        pass
+
+    def run(self, rows):
+        """Import the rows and return a summary dict"""
+        self.started = time.perf_counter()
+        self.preload()
+        # One form is built and rebound per row; constructing a ModelForm
+        # deep-copies every field and dominates the cost of small rows.
+        form = self.form_class(data={}, **self.get_form_kwargs())
+        batch = []
+
+        for row_number, row in enumerate(rows, start=2):  # row 1 is the header
+            self.processed += 1
+            data = dict(self.defaults)
+            data.update((key, value) for key, value in row.items() if value != '')
+            self.rebind(form, data)
+            if form.is_valid():
+                batch.append(self.build(form))
+            else:
+                self.errors.append((row_number, row, form.errors))
+
+            if len(batch) >= self.batch_size:
+                self.flush(batch)
+                batch = []
+
+        self.flush(batch)
+        return self.summary()
+
+    def rebind(self, form, data):
+        """Reset a bound form so it validates ``data`` into a fresh instance"""
+        form.data = data
+        form.instance = self.model()
+        form._errors = None
+        form.cleaned_data = {}
+
+    def flush(self, batch):
+        if batch and not self.dry_run:
+            with transaction.atomic():
+                self.prepare(batch)
+                self.model.objects.bulk_create(batch, batch_size=self.batch_size)
+        self.created += len(batch)
+        if self.progress:
+            self.progress(self.summary())
+
+    def summary(self):
+        elapsed = time.perf_counter() - self.started
+        return {
+            'processed': self.processed,
+            'created': self.created,
+            'failed': len(self.errors),
+            'elapsed': elapsed,
+            'rate': self.processed / elapsed if elapsed else 0,
+        }
+
+    def write_errors(self, fileobj):
+        """Write a row-level error report as CSV"""
+        writer = csv.writer(fileobj)
+        writer.writerow(['row', 'field', 'error', 'data'])
+        for row_number, row, errors in self.errors:
+            for field, messages in errors.items():
+                for message in messages:
+                    writer.writerow([row_number, field, message, '; '.join(f'{k}={v}' for k, v in row.items())])
+
+
+class ClientImporter(BaseImporter):
+    model = Client
+    form_class = ClientImportForm
+    defaults = {'client_type': 'individual', 'preferred_contact_method': 'phone'}
+
+    def preload(self):
+        self.existing_emails = {
+            email.lower() for email in Client.objects.values_list('email', flat=True)
+        }
+
+    def get_form_kwargs(self):
+        return {'existing_emails': self.existing_emails}
+
+    def build(self, form):
+        client = form.save(commit=False)
+        # Later rows with the same email are rejected like existing clients
+        self.existing_emails.add(client.email.lower())
+        return client
+
+
+class BookingImporter(BaseImporter):
+    model = Booking
+    form_class = BookingImportForm
+    defaults = {'preferred_time_slot': 'flexible', 'priority': 'normal'}
+
+    def preload(self):
+        self.services = {
+            service.slug: service
+            for service in Service.objects.filter(is_active=True).only('id', 'slug', 'name').order_by()
+        }
+        # Booking.save() links or creates a client by email; mirror that here
+        self.client_ids = {}
+        for client_id, email in Client.objects.order_by('-pk').values_list('pk', 'email'):
+            self.client_ids[email.lower()] = client_id
+
+    def get_form_kwargs(self):
+        return {
+            'services': self.services,
+            'allow_past_dates': self.options.get('allow_past_dates', False),
+        }
+
+    def prepare(self, batch):
+        new_clients = {}
+        for booking in batch:
+            email = booking.contact_email.lower()
+            if email not in self.client_ids and email not in new_clients:
+                new_clients[email] = Client(
+                    name=booking.contact_name,
+                    email=booking.contact_email,
+                    phone=booking.contact_phone,
+                )
+        if new_clients:
+            Client.objects.bulk_create(new_clients.values(), batch_size=self.batch_size)
+            for email, client in new_clients.items():
+                self.client_ids[email] = client.pk
+
+        for booking in batch:
+            booking.client_id = self.client_ids[booking.contact_email.lower()]
+
+
+class ProductImporter(BaseImporter):
+    model = Product
+    form_class = ProductImportForm
+    defaults = {'stock_quantity': '0', 'stock_status': 'in_stock', 'is_active': 'true'}
+
+    def preload(self):
+        self.categories = {
+            category.name.lower(): category
+            for category in ProductCategory.objects.filter(is_active=True).only('id', 'name').order_by()
+        }
+        self.existing_skus = set(Product.objects.values_list('sku', flat=True))
+        self.existing_slugs = set(Product.objects.values_list('slug', flat=True))
+
+    def get_form_kwargs(self):
+        return {'categories': self.categories, 'existing_skus': self.existing_skus}
+
+    def build(self, form):
+        product = form.save(commit=False)
+        self.existing_skus.add(product.sku)
+
+        # Product.save() builds the slug, which bulk_create skips
+        base_slug = slug = slugify(f"{product.category.name}-{product.name}")
+        suffix = 2
+        while slug in self.existing_slugs:
+            slug = f'{base_slug}-{suffix}'
+            suffix += 1
+        self.existing_slugs.add(slug)
+        product.slug = slug
+        return product
+
+
+IMPORTERS = {
+    'clients': ClientImporter,
+    'bookings': BookingImporter,
+    'products': ProductImporter,
+}
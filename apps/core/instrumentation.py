@@ -0,0 +1,439 @@
+"""
+Lightweight request-level performance instrumentation.
+
+``PerformanceMiddleware`` (in apps.core.middleware) measures, for every
+request, the total time, the number and duration of SQL queries (through
+``connection.execute_wrapper``), template render time, cache hits and misses
+and outbound email time. Staff users get the numbers back in a
+``Server-Timing`` header, which browser dev tools show under the request's
+Timing tab.
+
+Every request is also added to a per-route histogram. Histograms are kept in
+process memory and flushed to the shared cache every
+``PERF_METRICS_FLUSH_INTERVAL`` seconds, one cache key per process so
+workers never overwrite each other; ``route_stats()`` merges them. The same
+snapshots carry application counters (``increment()``), which
+``app_counters()`` sums across processes.
+
+The index of process keys is only changed while holding a lock taken with
+``cache.add``, so concurrent flushes cannot drop each other's entries.
+Processes that have not flushed for ``PERF_METRICS_RETIRE_AFTER`` seconds
+(recycled or exited workers) are pruned from it, and their last snapshot is
+added to "retired" totals kept in the index itself, so summed counters never
+go backwards when a worker goes away. A pruned process that was only idle
+finds its handed-over snapshot on its next flush and subtracts it from its
+own numbers, so nothing is counted twice.
+
+Template, cache and email timing is done by wrapping ``Template.render``, the
+configured cache backends' ``get``/``get_many`` and ``mail.get_connection``
+once at startup (see ``install()``, called from ``CoreConfig.ready``).
+"""
+import functools
+import os
+import socket
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+DEFAULT_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+CACHE_KEY_PREFIX = 'perf:'
+PROCESS_INDEX_KEY = f'{CACHE_KEY_PREFIX}processes'
+INDEX_LOCK_KEY = f'{CACHE_KEY_PREFIX}processes:lock'
+HANDED_OVER_PREFIX = f'{CACHE_KEY_PREFIX}handed-over:'
+
+# Longest a flush may hold the index lock before another worker can take it
+INDEX_LOCK_TIMEOUT = 10
+
+_current = ContextVar('request_metrics', default=None)
+_MISSING = object()
+
+
+class RequestMetrics:
+    """Counters for one request (or any other unit of work)"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        # What is being measured, e.g. the view name once the URL resolves
+        self.source = ''
+        self.total = 0.0
+        self.sql_count = 0
+        self.sql_time = 0.0
+        self.template_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.email_count = 0
+        self.email_time = 0.0
+        # Nesting guards so included templates and get()->get_many() are counted once
+        self._template_depth = 0
+        self._in_cache = False
+
+    def server_timing(self):
+        """Format the metrics as a Server-Timing header value"""
+        parts = [
+            f'total;dur={self.total * 1000:.1f}',
+            f'db;dur={self.sql_time * 1000:.1f};desc="{self.sql_count} queries"',
+            f'tpl;dur={self.template_time * 1000:.1f};desc="templates"',
+            f'cache;desc="{self.cache_hits} hits, {self.cache_misses} misses"',
+        ]
+        if self.email_count:
+            parts.append(f'email;dur={self.email_time * 1000:.1f};desc="{self.email_count} sent"')
+        return ', '.join(parts)
+
+
+def current_metrics():
+    """The metrics being collected for the current request, if any"""
+    return _current.get()
+
+
+def _count_sql(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.sql_count += 1
+        metrics.sql_time += time.perf_counter() - started
+
+
+@contextmanager
+def collect():
+    """Collect metrics for the enclosed block"""
+    metrics = RequestMetrics()
+    token = _current.set(metrics)
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(_count_sql))
+            yield metrics
+    finally:
+        metrics.total = time.perf_counter() - metrics.started
+        _current.reset(token)
+
+
+def _wrap_template_render(render):
+    @functools.wraps(render)
+    def timed_render(self, context):
+        metrics = _current.get()
+        if metrics is None:
+            return render(self, context)
+        metrics._template_depth += 1
+        started = time.perf_counter()
+        try:
+            return render(self, context)
+        finally:
+            metrics._template_depth -= 1
+            if not metrics._template_depth:
+                metrics.template_time += time.perf_counter() - started
+    return timed_render
+
+
+def _wrap_cache_get(get):
+    @functools.wraps(get)
+    def counted_get(self, key, default=None, version=None):
+        metrics = _current.get()
+        if metrics is None or metrics._in_cache:
+            return get(self, key, default, version)
+        metrics._in_cache = True
+        try:
+            value = get(self, key, _MISSING, version)
+        finally:
+            metrics._in_cache = False
+        if value is _MISSING:
+            metrics.cache_misses += 1
+            return default
+        metrics.cache_hits += 1
+        return value
+    return counted_get
+
+
+def _wrap_cache_get_many(get_many):
+    @functools.wraps(get_many)
+    def counted_get_many(self, keys, version=None):
+        metrics = _current.get()
+        if metrics is None or metrics._in_cache:
+            return get_many(self, keys, version)
+        keys = list(keys)
+        metrics._in_cache = True
+        try:
+            values = get_many(self, keys, version)
+        finally:
+            metrics._in_cache = False
+        metrics.cache_hits += len(values)
+        metrics.cache_misses += len(keys) - len(values)
+        return values
+    return counted_get_many
+
+
+def _wrap_get_connection(get_connection):
+    @functools.wraps(get_connection)
+    def timed_get_connection(*args, **kwargs):
+        connection = get_connection(*args, **kwargs)
+        send_messages = connection.send_messages
+
+        def timed_send_messages(email_messages):
+            metrics = _current.get()
+            if metrics is None:
+                return send_messages(email_messages)
+            started = time.perf_counter()
+            try:
+                return send_messages(email_messages)
+            finally:
+                metrics.email_count += len(email_messages)
+                metrics.email_time += time.perf_counter() - started
+
+        connection.send_messages = timed_send_messages
+        return connection
+    return timed_get_connection
+
+
+_installed = False
+
+
+def install():
+    """Wrap template rendering, cache reads and email sending. Safe to call twice."""
+    global _installed
+    if _installed:
+        return
+    _installed = True
+
+    from django.core import mail
+    from django.core.cache import caches
+    from django.template.base import Template
+
+    Template.render = _wrap_template_render(Template.render)
+
+    patched = set()
+    for alias in settings.CACHES:
+        backend = type(caches[alias])
+        if backend not in patched:
+            backend.get = _wrap_cache_get(backend.get)
+            backend.get_many = _wrap_cache_get_many(backend.get_many)
+            patched.add(backend)
+
+    mail.get_connection = _wrap_get_connection(mail.get_connection)
+
+
+class RouteHistograms:
+    """Per-route latency histograms, totals and counters for this process"""
+
+    def __init__(self, buckets_ms=DEFAULT_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self.routes = {}
+        self.counters = {}
+        self.lock = threading.Lock()
+        self.last_flush = time.monotonic()
+
+    @property
+    def process_key(self):
+        # Computed on use: worker processes may be forked after import
+        return f'{CACHE_KEY_PREFIX}process:{socket.gethostname()}:{os.getpid()}'
+
+    def observe(self, route, metrics):
+        elapsed_ms = metrics.total * 1000
+        with self.lock:
+            stats = self.routes.get(route)
+            if stats is None:
+                stats = self.routes[route] = empty_stats(len(self.buckets_ms))
+            stats['count'] += 1
+            stats['total_ms'] += elapsed_ms
+            stats['sql_count'] += metrics.sql_count
+            stats['sql_ms'] += metrics.sql_time * 1000
+            stats['template_ms'] += metrics.template_time * 1000
+            stats['cache_hits'] += metrics.cache_hits
+            stats['cache_misses'] += metrics.cache_misses
+            stats['email_count'] += metrics.email_count
+            stats['email_ms'] += metrics.email_time * 1000
+            for index, bound in enumerate(self.buckets_ms):
+                if elapsed_ms <= bound:
+                    stats['buckets'][index] += 1
+                    break
+            else:
+                stats['buckets'][-1] += 1
+
+    def increment(self, name, amount=1):
+        """Add to a monotonically increasing application counter"""
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def flush_due(self, interval):
+        return bool(interval) and time.monotonic() - self.last_flush >= interval
+
+    def snapshot(self):
+        """A copy of this process's cumulative histograms and counters"""
+        with self.lock:
+            return {
+                'buckets_ms': self.buckets_ms,
+                'routes': {route: dict(stats, buckets=list(stats['buckets']))
+                           for route, stats in self.routes.items()},
+                'counters': dict(self.counters),
+            }
+
+    @property
+    def handed_over_key(self):
+        return f'{HANDED_OVER_PREFIX}{self.process_key}'
+
+    def take_back(self, cache, handed_over=_MISSING):
+        """Drop numbers a prune handed over to the retired totals, so they are not counted twice"""
+        if handed_over is _MISSING:
+            handed_over = cache.get(self.handed_over_key)
+        if handed_over is not None:
+            with self.lock:
+                add_snapshot(
+                    {'buckets_ms': self.buckets_ms, 'routes': self.routes, 'counters': self.counters},
+                    handed_over, sign=-1,
+                )
+            cache.delete(self.handed_over_key)
+
+    def flush(self, cache, timeout, retire_after=None):
+        """Publish this process's cumulative histograms to the shared cache"""
+        if retire_after is None:
+            retire_after = getattr(settings, 'PERF_METRICS_RETIRE_AFTER', 15 * 60)
+        found = cache.get_many([self.handed_over_key, PROCESS_INDEX_KEY])
+        self.take_back(cache, found.get(self.handed_over_key))
+        snapshot = dict(self.snapshot(), published=time.time())
+        self.last_flush = time.monotonic()
+        cache.set(self.process_key, snapshot, timeout)
+        update_index(cache, self.process_key, timeout, retire_after, parse_index(found.get(PROCESS_INDEX_KEY)))
+
+
+def parse_index(index):
+    """The process index: live process keys and the totals of retired ones"""
+    if isinstance(index, list):
+        # Published before retired totals were kept
+        index = {'processes': index}
+    index = index or {}
+    return {
+        'processes': list(index.get('processes', [])),
+        'retired': index.get('retired') or {'buckets_ms': histograms.buckets_ms, 'routes': {}, 'counters': {}},
+    }
+
+
+def read_index(cache):
+    return parse_index(cache.get(PROCESS_INDEX_KEY))
+
+
+def _stale(cache, processes, process_key, retire_after):
+    snapshots = cache.get_many(processes) if processes else {}
+    cutoff = time.time() - retire_after
+    return snapshots, [
+        key for key in processes
+        if key != process_key and (key not in snapshots or snapshots[key].get('published', 0) < cutoff)
+    ]
+
+
+def update_index(cache, process_key, timeout, retire_after, index=None):
+    """Add ``process_key`` to the index and retire processes that stopped flushing"""
+    if index is None:
+        index = read_index(cache)
+    if process_key in index['processes'] and not _stale(cache, index['processes'], process_key, retire_after)[1]:
+        return
+    if not cache.add(INDEX_LOCK_KEY, process_key, INDEX_LOCK_TIMEOUT):
+        # Another worker is updating the index; this one retries on its next flush
+        return
+    try:
+        index = read_index(cache)
+        snapshots, stale = _stale(cache, index['processes'], process_key, retire_after)
+        for key in stale:
+            # Expired snapshots have nothing left to hand over
+            if key in snapshots:
+                add_snapshot(index['retired'], snapshots[key])
+                cache.set(f'{HANDED_OVER_PREFIX}{key}', snapshots[key], timeout)
+        index['processes'] = [key for key in index['processes'] if key not in stale]
+        if process_key not in index['processes']:
+            index['processes'].append(process_key)
+        # The retired totals live in the index so both change in one write;
+        # it never expires, stale entries are pruned instead
+        cache.set(PROCESS_INDEX_KEY, index, None)
+    finally:
+        cache.delete(INDEX_LOCK_KEY)
+
+
+def add_snapshot(total, snapshot, sign=1):
+    """Add (or with ``sign=-1`` subtract) a snapshot's routes and counters into ``total`` in place"""
+    if tuple(snapshot['buckets_ms']) == tuple(total['buckets_ms']):
+        for route, stats in snapshot['routes'].items():
+            into = total['routes'].setdefault(route, empty_stats(len(total['buckets_ms'])))
+            for key, value in stats.items():
+                if key == 'buckets':
+                    into['buckets'] = [a + sign * b for a, b in zip(into['buckets'], value)]
+                elif key in into:
+                    into[key] += sign * value
+    for name, value in snapshot.get('counters', {}).items():
+        total['counters'][name] = total['counters'].get(name, 0) + sign * value
+
+
+def empty_stats(bucket_count):
+    return {
+        'count': 0,
+        'total_ms': 0.0,
+        'sql_count': 0,
+        'sql_ms': 0.0,
+        'template_ms': 0.0,
+        'cache_hits': 0,
+        'cache_misses': 0,
+        'email_count': 0,
+        'email_ms': 0.0,
+        # One slot per bucket bound plus one for slower requests
+        'buckets': [0] * (bucket_count + 1),
+    }
+
+
+histograms = RouteHistograms(getattr(settings, 'PERF_HISTOGRAM_BUCKETS_MS', DEFAULT_BUCKETS_MS))
+
+
+def metrics_cache():
+    from django.core.cache import caches
+    return caches[getattr(settings, 'PERF_METRICS_CACHE', 'default')]
+
+
+def published_snapshots():
+    """Every live process's last published snapshot and the retired totals, with this process's live one"""
+    cache = metrics_cache()
+    found = cache.get_many([histograms.handed_over_key, PROCESS_INDEX_KEY])
+    histograms.take_back(cache, found.get(histograms.handed_over_key))
+    index = parse_index(found.get(PROCESS_INDEX_KEY))
+    processes = [key for key in index['processes'] if key != histograms.process_key]
+    snapshots = list(cache.get_many(processes).values()) if processes else []
+    return [index['retired']] + snapshots + [histograms.snapshot()]
+
+
+def _merge(snapshots):
+    if snapshots is None:
+        snapshots = published_snapshots()
+    total = {'buckets_ms': histograms.buckets_ms, 'routes': {}, 'counters': {}}
+    for snapshot in snapshots:
+        add_snapshot(total, snapshot)
+    return total
+
+
+def route_stats(snapshots=None):
+    """Merge the histograms every process has published to the shared cache"""
+    return _merge(snapshots)['routes']
+
+
+def app_counters(snapshots=None):
+    """Sum the counters every process has published to the shared cache"""
+    return _merge(snapshots)['counters']
+
+
+def estimate_percentile(stats, pct, buckets_ms=None):
+    """Upper bound of the bucket holding the ``pct`` percentile, in ms"""
+    buckets_ms = buckets_ms or histograms.buckets_ms
+    if not stats['count']:
+        return 0
+    target = stats['count'] * pct / 100
+    seen = 0
+    for bound, count in zip(list(buckets_ms) + [float('inf')], stats['buckets']):
+        seen += count
+        if seen >= target:
+            return bound
+    return float('inf')
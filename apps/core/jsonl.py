@@ -0,0 +1,117 @@
+"""
+JSON-lines log files written by every worker on a host.
+
+``RotatingFileHandler`` is not safe across processes: when one gunicorn
+worker rolls the file over, the others keep appending to the renamed file,
+and their own rollovers then overwrite each other's backups. So each process
+writes and rotates a file of its own, with its pid in the name
+(``logs/traces.jsonl`` becomes ``logs/traces.4312.jsonl``), and ``read``
+merges every worker's files by record time. Files no worker has written to
+for ``STALE_AFTER`` seconds, left by workers that have since exited, are
+removed when a process opens its file.
+
+Used by the slow-query log (apps.core.slow_queries) and the trace exporter
+(apps.core.tracing).
+"""
+import json
+import logging
+import logging.handlers
+import os
+import re
+import threading
+import time
+
+
+STALE_AFTER = 7 * 24 * 60 * 60
+
+
+def worker_path(path, pid=None):
+    """The file the process ``pid`` (default: this one) writes for ``path``"""
+    root, ext = os.path.splitext(str(path))
+    return f'{root}.{pid or os.getpid()}{ext}'
+
+
+def worker_files(path):
+    """Every worker's file for ``path``, rotated backups included"""
+    directory, name = os.path.split(str(path))
+    root, ext = os.path.splitext(name)
+    # "traces.jsonl" itself and its backups are still read, as written before
+    # files were kept per worker
+    pattern = re.compile(rf'{re.escape(root)}(?:\.\d+)?{re.escape(ext)}(?:\.\d+)?')
+    try:
+        names = os.listdir(directory or '.')
+    except FileNotFoundError:
+        return []
+    return [os.path.join(directory, name) for name in sorted(names) if pattern.fullmatch(name)]
+
+
+def remove_stale(path, max_age=STALE_AFTER):
+    cutoff = time.time() - max_age
+    for candidate in worker_files(path):
+        try:
+            if os.path.getmtime(candidate) < cutoff:
+                os.remove(candidate)
+        except OSError:
+            continue
+
+
+class JSONLFile:
+    """Appends records as JSON lines to this process's own rotating file for ``path``"""
+
+    def __init__(self, path, max_bytes, backups):
+        self.path = str(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.lock = threading.Lock()
+        self.handler = None
+        self.pid = None
+
+    def _handler(self):
+        with self.lock:
+            # Opened lazily and again after a fork, so a worker forked from a
+            # master that already logged gets a file of its own
+            if self.pid != os.getpid():
+                if self.handler is not None:
+                    self.handler.close()
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                remove_stale(self.path)
+                self.handler = logging.handlers.RotatingFileHandler(
+                    worker_path(self.path),
+                    maxBytes=self.max_bytes,
+                    backupCount=self.backups,
+                    delay=True,
+                )
+                self.handler.setFormatter(logging.Formatter('%(message)s'))
+                self.pid = os.getpid()
+            return self.handler
+
+    def write(self, record):
+        self._handler().handle(logging.makeLogRecord({
+            'msg': json.dumps(record, default=str),
+            'levelno': logging.INFO,
+            'levelname': 'INFO',
+        }))
+
+    def close(self):
+        with self.lock:
+            if self.handler is not None:
+                self.handler.close()
+                self.handler = None
+                self.pid = None
+
+
+def read(path, limit):
+    """The newest ``limit`` records across every worker's files for ``path``, oldest first"""
+    records = []
+    for candidate in worker_files(path):
+        try:
+            with open(candidate, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except OSError:
+            continue
+    records.sort(key=lambda record: record.get('time', ''))
+    return records[-limit:]
@@ -0,0 +1,153 @@
+"""
+Django management command comparing SQLite throughput before and after the
+connection tuning in apps.core.db.
+
+The "before" run opens a fresh connection for every operation in the default
+rollback-journal mode (what CONN_MAX_AGE=0 with no pragmas gives us). The
+"after" run keeps one connection per thread and applies the production
+pragmas. Both runs use a scratch database so real data is never touched.
+"""
+
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.core.db import apply_sqlite_pragmas, get_sqlite_pragmas
+
+
+class Command(BaseCommand):
+    help = 'Benchmark SQLite read/write throughput with and without connection tuning'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=20000, help='Rows in the scratch table')
+        parser.add_argument('--readers', type=int, default=8, help='Concurrent reader threads')
+        parser.add_argument('--writers', type=int, default=2, help='Concurrent writer threads')
+        parser.add_argument('--duration', type=float, default=5.0, help='Seconds per run')
+        parser.add_argument('--seed', type=int, default=42, help='Random seed')
+
+    def handle(self, *args, **options):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            results = {}
+            for label, tuned in (('before', False), ('after', True)):
+                path = os.path.join(tmpdir, f'{label}.sqlite3')
+                self.create_database(path, options['rows'], tuned)
+                results[label] = self.run(path, tuned, options)
+
+        self.stdout.write(self.style.HTTP_INFO('=== SQLite connection benchmark ==='))
+        self.stdout.write(
+            f"{'run':<8}{'reads/s':>12}{'writes/s':>12}{'p95 read ms':>14}"
+            f"{'p95 write ms':>14}{'errors':>8}"
+        )
+        for label, result in results.items():
+            self.stdout.write(
+                f"{label:<8}{result['reads_per_sec']:>12.0f}{result['writes_per_sec']:>12.0f}"
+                f"{result['p95_read_ms']:>14.2f}{result['p95_write_ms']:>14.2f}{result['errors']:>8}"
+            )
+
+        before, after = results['before'], results['after']
+        if before['reads_per_sec']:
+            speedup = after['reads_per_sec'] / before['reads_per_sec']
+            self.stdout.write(self.style.SUCCESS(f'Read throughput: {speedup:.1f}x'))
+        if before['writes_per_sec']:
+            speedup = after['writes_per_sec'] / before['writes_per_sec']
+            self.stdout.write(self.style.SUCCESS(f'Write throughput: {speedup:.1f}x'))
+
+    def connect(self, path, tuned):
+        """Open a connection the way Django would for the given mode"""
+        connection = sqlite3.connect(path, timeout=5, isolation_level=None, check_same_thread=False)
+        if tuned:
+            apply_sqlite_pragmas(connection.cursor(), get_sqlite_pragmas())
+        return connection
+
+    def create_database(self, path, rows, tuned):
+        """Create and fill the scratch table"""
+        connection = self.connect(path, tuned)
+        connection.execute(
+            'CREATE TABLE item (id INTEGER PRIMARY KEY, title TEXT, view_count INTEGER NOT NULL)'
+        )
+        connection.execute('BEGIN')
+        connection.executemany(
+            'INSERT INTO item (id, title, view_count) VALUES (?, ?, 0)',
+            ((i, f'Item {i}') for i in range(1, rows + 1)),
+        )
+        connection.execute('COMMIT')
+        connection.close()
+
+    def run(self, path, tuned, options):
+        """Run readers and writers concurrently for the configured duration"""
+        rows = options['rows']
+        deadline = time.perf_counter() + options['duration']
+        read_latencies, write_latencies = [], []
+        errors = [0]
+        lock = threading.Lock()
+
+        def worker(is_writer, seed):
+            rng = random.Random(seed)
+            persistent = self.connect(path, tuned) if tuned else None
+            latencies = []
+            failures = 0
+
+            while time.perf_counter() < deadline:
+                connection = persistent or self.connect(path, tuned)
+                item_id = rng.randint(1, rows)
+                started = time.perf_counter()
+                try:
+                    if is_writer:
+                        connection.execute('BEGIN IMMEDIATE')
+                        connection.execute(
+                            'UPDATE item SET view_count = view_count + 1 WHERE id = ?', (item_id,)
+                        )
+                        connection.execute('COMMIT')
+                    else:
+                        connection.execute(
+                            'SELECT id, title, view_count FROM item WHERE id BETWEEN ? AND ?',
+                            (item_id, item_id + 20),
+                        ).fetchall()
+                    latencies.append(time.perf_counter() - started)
+                except sqlite3.OperationalError:
+                    failures += 1
+                    if connection.in_transaction:
+                        connection.execute('ROLLBACK')
+                finally:
+                    if persistent is None:
+                        connection.close()
+
+            if persistent is not None:
+                persistent.close()
+
+            with lock:
+                (write_latencies if is_writer else read_latencies).extend(latencies)
+                errors[0] += failures
+
+        threads = [
+            threading.Thread(target=worker, args=(False, options['seed'] + i))
+            for i in range(options['readers'])
+        ] + [
+            threading.Thread(target=worker, args=(True, options['seed'] + 1000 + i))
+            for i in range(options['writers'])
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        duration = options['duration']
+        return {
+            'reads_per_sec': len(read_latencies) / duration,
+            'writes_per_sec': len(write_latencies) / duration,
+            'p95_read_ms': self.percentile(read_latencies, 95) * 1000,
+            'p95_write_ms': self.percentile(write_latencies, 95) * 1000,
+            'errors': errors[0],
+        }
+
+    @staticmethod
+    def percentile(values, pct):
+        if len(values) < 2:
+            return values[0] if values else 0.0
+        return statistics.quantiles(values, n=100)[pct - 1]
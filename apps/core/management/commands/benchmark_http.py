@@ -0,0 +1,197 @@
+"""
+Django management command running the HTTP load benchmarks in apps.core.benchmarks.
+
+By default scenarios run in-process through the test client against the
+configured database; every write is rolled back when the run finishes and
+outgoing email is captured in memory. With --base-url they run against a
+running server instead (queries per request are then not available).
+"""
+
+import json
+import os
+import platform
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from apps.core.benchmarks import (
+    SCENARIOS, HTTPTransport, TestClientTransport, compare, initial_state, run_scenario, summarize,
+)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark latency, throughput and queries per request of public and admin pages'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scenario',
+            action='append',
+            choices=sorted(SCENARIOS),
+            help='Scenario to run (repeatable; default: all)',
+        )
+        parser.add_argument('--iterations', type=int, default=20, help='Measured runs of each scenario')
+        parser.add_argument('--warmup', type=int, default=2, help='Unmeasured runs before measuring')
+        parser.add_argument('--base-url', help='Benchmark a running server instead of the test client')
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=1,
+            help='Parallel clients per scenario (with --base-url only)',
+        )
+        parser.add_argument('--email', help='Staff email for the admin scenario with --base-url')
+        parser.add_argument('--password', help='Staff password for the admin scenario with --base-url')
+        parser.add_argument('--output', help='Write results to this JSON file (use it as a future baseline)')
+        parser.add_argument('--baseline', help='Compare against this results JSON and fail on regressions')
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=0.2,
+            help='Allowed slowdown before a step counts as a regression (default 0.2 = 20%%)',
+        )
+
+    def handle(self, *args, **options):
+        scenarios = options['scenario'] or list(SCENARIOS)
+        if options['iterations'] < 1:
+            raise CommandError('--iterations must be at least 1.')
+        if options['concurrency'] > 1 and not options['base_url']:
+            raise CommandError('--concurrency requires --base-url; the test client runs in-process.')
+        if options['base_url'] and 'admin' in scenarios and not (options['email'] and options['password']):
+            if options['scenario']:
+                raise CommandError('The admin scenario needs --email and --password with --base-url.')
+            scenarios.remove('admin')
+
+        if options['base_url']:
+            steps, totals = self.run_http(scenarios, options)
+        else:
+            steps, totals = self.run_in_process(scenarios, options)
+
+        results = {
+            'meta': {
+                'created': timezone.now().isoformat(),
+                'target': options['base_url'] or 'test-client',
+                'iterations': options['iterations'],
+                'concurrency': options['concurrency'],
+                'database': settings.DATABASES['default']['ENGINE'].rsplit('.', 1)[-1],
+                'python': platform.python_version(),
+            },
+            'steps': steps,
+            'scenarios': totals,
+        }
+        self.report(results)
+
+        if options['output']:
+            directory = os.path.dirname(options['output'])
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(options['output'], 'w') as f:
+                json.dump(results, f, indent=2)
+            self.stdout.write(f"Results written to {options['output']}")
+
+        errors = sum(step['errors'] for step in steps.values())
+        if errors:
+            raise CommandError(f'{errors} request(s) returned an unexpected status.')
+
+        if options['baseline']:
+            try:
+                with open(options['baseline']) as f:
+                    baseline = json.load(f)
+            except (OSError, ValueError) as e:
+                raise CommandError(f"Could not read baseline {options['baseline']}: {e}")
+            regressions = compare(results, baseline, options['threshold'])
+            if regressions:
+                for regression in regressions:
+                    self.stdout.write(self.style.ERROR(f'  REGRESSION {regression}'))
+                raise CommandError(f'{len(regressions)} regression(s) against {options["baseline"]}.')
+            self.stdout.write(self.style.SUCCESS('No regressions against the baseline.'))
+
+    def run_in_process(self, scenarios, options):
+        """Run through the test client, rolling back everything the scenarios write"""
+        steps, totals = {}, {}
+        overrides = {
+            'EMAIL_BACKEND': 'django.core.mail.backends.locmem.EmailBackend',
+            'ALLOWED_HOSTS': [*settings.ALLOWED_HOSTS, 'testserver'],
+            'SECURE_SSL_REDIRECT': False,
+            # Keep histogram publishing out of the per-request query counts
+            'PERF_METRICS_FLUSH_INTERVAL': 0,
+        }
+        with override_settings(**overrides), transaction.atomic():
+            try:
+                state = initial_state(uuid.uuid4().hex[:8])
+            except ValueError as e:
+                raise CommandError(str(e))
+
+            for scenario in scenarios:
+                transport = TestClientTransport()
+                if SCENARIOS[scenario]['staff']:
+                    transport.login(User.objects.create_user(
+                        f"bench-{state['run']}", f"bench-{state['run']}@benchmark.example.com",
+                        is_staff=True,
+                    ))
+                samples, wall = run_scenario(
+                    transport, scenario, dict(state), options['iterations'], options['warmup']
+                )
+                self.print_errors(samples)
+                scenario_steps, totals[scenario] = summarize(scenario, samples, wall)
+                steps.update(scenario_steps)
+            transaction.set_rollback(True)
+        return steps, totals
+
+    def run_http(self, scenarios, options):
+        """Run against a live server with one cookie jar per parallel client"""
+        steps, totals = {}, {}
+        try:
+            state = initial_state(uuid.uuid4().hex[:8])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        for scenario in scenarios:
+            def client_run(worker):
+                transport = HTTPTransport(options['base_url'])
+                if SCENARIOS[scenario]['staff']:
+                    transport.login(options['email'], options['password'])
+                worker_state = dict(state, run=f"{state['run']}-{worker}")
+                return run_scenario(
+                    transport, scenario, worker_state, options['iterations'], options['warmup']
+                )
+
+            try:
+                with ThreadPoolExecutor(max_workers=options['concurrency']) as pool:
+                    runs = list(pool.map(client_run, range(options['concurrency'])))
+            except (OSError, ValueError) as e:
+                raise CommandError(f"Benchmark against {options['base_url']} failed: {e}")
+
+            # Merge the clients' samples; throughput is over the slowest client
+            samples = runs[0][0]
+            for other, _ in runs[1:]:
+                for name, sample in other.items():
+                    for key in sample:
+                        samples[name][key].extend(sample[key])
+            self.print_errors(samples)
+            scenario_steps, totals[scenario] = summarize(scenario, samples, max(wall for _, wall in runs))
+            steps.update(scenario_steps)
+        return steps, totals
+
+    def print_errors(self, samples):
+        for sample in samples.values():
+            for error in sorted(set(sample['errors'])):
+                self.stderr.write(self.style.WARNING(f'  {error}'))
+
+    def report(self, results):
+        self.stdout.write(self.style.HTTP_INFO(f"=== HTTP benchmark ({results['meta']['target']}) ==="))
+        self.stdout.write(
+            f"{'step':<26}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'queries':>9}{'errors':>8}"
+        )
+        for name, step in results['steps'].items():
+            queries = '-' if step['queries'] is None else f"{step['queries']:g}"
+            self.stdout.write(
+                f"{name:<26}{step['count']:>6}{step['p50_ms']:>10.1f}{step['p95_ms']:>10.1f}"
+                f"{step['p99_ms']:>10.1f}{queries:>9}{step['errors']:>8}"
+            )
+        for name, scenario in results['scenarios'].items():
+            self.stdout.write(f"{name}: {scenario['requests']} requests, {scenario['rps']:.1f} req/s")
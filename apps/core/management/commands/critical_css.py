@@ -0,0 +1,56 @@
+"""
+Django management command extracting the above-the-fold CSS of the public
+pages, after `npm run build` has written dist/public.css.
+
+    python manage.py critical_css
+    python manage.py critical_css core:home --sections 1
+
+Each page in CRITICAL_CSS_PAGES is rendered against the configured database,
+so run it where the pages show representative content. Restart the server
+afterwards; the CSS is read once per process.
+"""
+import os
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.urls import NoReverseMatch, reverse
+
+from apps.core.critical_css import BUNDLE, extract, filename
+
+
+class Command(BaseCommand):
+    help = 'Extract and save the above-the-fold CSS of the public pages'
+
+    def add_arguments(self, parser):
+        parser.add_argument('views', nargs='*', help='View names to extract (default: CRITICAL_CSS_PAGES)')
+        parser.add_argument('--sections', type=int, help='Sections of <main> above the fold (default CRITICAL_CSS_SECTIONS)')
+
+    def handle(self, *args, **options):
+        found = finders.find(BUNDLE)
+        if not found:
+            raise CommandError(f'{BUNDLE} does not exist; run `npm run build` first.')
+        with open(found, encoding='utf-8') as f:
+            css = f.read()
+
+        directory = settings.CRITICAL_CSS_DIR
+        os.makedirs(directory, exist_ok=True)
+        host = next((host for host in settings.ALLOWED_HOSTS if host != '*' and not host.startswith('.')),
+                    'localhost')
+        client = Client(HTTP_HOST=host)
+
+        self.stdout.write(f"{'view':<24}{'page KB':>10}{'critical KB':>13}")
+        for view_name in options['views'] or settings.CRITICAL_CSS_PAGES:
+            try:
+                url = reverse(view_name)
+            except NoReverseMatch:
+                raise CommandError(f'{view_name} is not a view name without arguments.')
+            response = client.get(url)
+            if response.status_code != 200:
+                raise CommandError(f'{url} returned {response.status_code}.')
+            critical = extract(css, response.content.decode(), options['sections'])
+            with open(os.path.join(directory, filename(view_name)), 'w', encoding='utf-8') as f:
+                f.write(critical)
+            self.stdout.write(f'{view_name:<24}{len(css) / 1024:>10.1f}{len(critical) / 1024:>13.1f}')
+        self.stdout.write(self.style.SUCCESS(f'Wrote critical CSS to {directory}'))
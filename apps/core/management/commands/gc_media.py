@@ -0,0 +1,73 @@
+"""
+Django management command listing, and with --delete removing, media files
+no database row refers to.
+
+    python manage.py gc_media
+    python manage.py gc_media --delete --min-age 48
+    python manage.py gc_media --storage private
+
+The storage tree and the file fields' references are streamed in sorted
+order and merged (see apps.core.media_gc), so memory use does not grow with
+the number of files. Files younger than --min-age hours are kept: their row
+may not be committed yet, or an upload of the same bytes has just reused
+them. Each file is checked against the database again before it is deleted. CKEditor uploads are referenced from rich text,
+not file fields, and are skipped.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.storage import storages
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.core.media_gc import is_referenced, orphans
+
+
+class Command(BaseCommand):
+    help = 'Report or delete media files that no database row references'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--storage', default='default', help='STORAGES alias to collect (default: default)')
+        parser.add_argument('--delete', action='store_true', help='Delete the orphaned files instead of listing them')
+        parser.add_argument('--min-age', type=float, default=24, help='Keep files modified in the last N hours (default: 24)')
+        parser.add_argument(
+            '--exclude',
+            action='append',
+            default=[getattr(settings, 'CKEDITOR_UPLOAD_PATH', 'uploads/')],
+            help='Path prefix to leave alone; may be repeated',
+        )
+
+    def handle(self, *args, **options):
+        if options['storage'] not in settings.STORAGES or options['storage'] == 'staticfiles':
+            raise CommandError(f"Unknown media storage {options['storage']!r}")
+        if options['min_age'] < 0:
+            raise CommandError('--min-age cannot be negative')
+
+        storage = storages[options['storage']]
+        cutoff = timezone.now() - timedelta(hours=options['min_age'])
+        found = kept = total_bytes = 0
+        for name in orphans(storage, exclude=options['exclude']):
+            # A row may have taken the file since its references were read:
+            # an upload of identical bytes reuses the file and touches it
+            if options['delete'] and is_referenced(storage, name):
+                continue
+            if options['min_age'] and storage.get_modified_time(name) > cutoff:
+                kept += 1
+                continue
+            size = storage.size(name)
+            found += 1
+            total_bytes += size
+            if options['delete']:
+                storage.delete(name)
+                self.stdout.write(f'  deleted {name} ({size / 1024:.1f} KB)')
+            else:
+                self.stdout.write(f'  {name} ({size / 1024:.1f} KB)')
+
+        verb = 'Deleted' if options['delete'] else 'Found'
+        self.stdout.write(self.style.SUCCESS(
+            f'{verb} {found} orphaned files ({total_bytes / 1024 / 1024:.1f} MB)'
+        ))
+        if kept:
+            self.stdout.write(f"Kept {kept} orphaned files younger than {options['min_age']:g} hours")
+        if found and not options['delete']:
+            self.stdout.write('Run again with --delete to remove them.')
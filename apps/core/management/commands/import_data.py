@@ -0,0 +1,81 @@
+"""
+Django management command for bulk importing clients, bookings or products.
+
+Streams a CSV or XLSX file, validates every row with the admin form rules and
+inserts valid rows with bulk_create in batched transactions. Rows that fail
+validation are written to an error report instead of stopping the import.
+"""
+
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.importers import DEFAULT_BATCH_SIZE, IMPORTERS, read_rows
+
+
+class Command(BaseCommand):
+    help = 'Bulk import clients, bookings or products from a CSV or XLSX file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('kind', choices=sorted(IMPORTERS), help='What the file contains')
+        parser.add_argument('path', help='Path to a .csv or .xlsx file')
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f'Rows inserted per transaction (default: {DEFAULT_BATCH_SIZE})',
+        )
+        parser.add_argument(
+            '--errors',
+            help='Where to write the row-level error report (default: <path>.errors.csv)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Validate rows without inserting anything',
+        )
+        parser.add_argument(
+            '--allow-past-dates',
+            action='store_true',
+            help='Accept bookings dated in the past (historical data)',
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if not os.path.exists(path):
+            raise CommandError(f'File not found: {path}')
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1')
+
+        importer = IMPORTERS[options['kind']](
+            batch_size=options['batch_size'],
+            dry_run=options['dry_run'],
+            progress=self.report_progress,
+            allow_past_dates=options['allow_past_dates'],
+        )
+
+        with open(path, 'rb') as fileobj:
+            try:
+                summary = importer.run(read_rows(fileobj, path))
+            except ImportError as e:
+                raise CommandError(str(e))
+
+        verb = 'Validated' if options['dry_run'] else 'Imported'
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {summary['created']} {options['kind']} from {summary['processed']} rows "
+            f"in {summary['elapsed']:.2f}s ({summary['rate']:.0f} rows/s)"
+        ))
+
+        if importer.errors:
+            errors_path = options['errors'] or f'{path}.errors.csv'
+            with open(errors_path, 'w', newline='', encoding='utf-8') as errors_file:
+                importer.write_errors(errors_file)
+            self.stdout.write(self.style.WARNING(
+                f"{summary['failed']} rows failed validation; see {errors_path}"
+            ))
+
+    def report_progress(self, summary):
+        self.stdout.write(
+            f"  {summary['processed']} rows processed, {summary['created']} valid, "
+            f"{summary['failed']} failed ({summary['rate']:.0f} rows/s)"
+        )
@@ -0,0 +1,56 @@
+"""
+Django management command printing the per-route performance histograms
+collected by apps.core.instrumentation across all processes.
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.core.instrumentation import estimate_percentile, route_stats
+
+
+class Command(BaseCommand):
+    help = 'Show per-route request latency, SQL and cache statistics from the shared cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sort',
+            choices=['count', 'p95', 'mean', 'sql'],
+            default='p95',
+            help='Column to sort routes by (default: p95)',
+        )
+        parser.add_argument('--limit', type=int, default=30, help='Number of routes to show')
+
+    def handle(self, *args, **options):
+        stats = route_stats()
+        if not stats:
+            self.stdout.write('No performance data has been published yet.')
+            return
+
+        rows = []
+        for route, route_stats_ in stats.items():
+            count = route_stats_['count']
+            rows.append({
+                'route': route,
+                'count': count,
+                'mean': route_stats_['total_ms'] / count,
+                'p95': estimate_percentile(route_stats_, 95),
+                'sql': route_stats_['sql_count'] / count,
+                'sql_ms': route_stats_['sql_ms'] / count,
+                'template_ms': route_stats_['template_ms'] / count,
+                'hits': route_stats_['cache_hits'],
+                'misses': route_stats_['cache_misses'],
+            })
+        rows.sort(key=lambda row: row[options['sort']], reverse=True)
+
+        self.stdout.write(self.style.HTTP_INFO('=== Request performance by route ==='))
+        self.stdout.write(
+            f"{'route':<48}{'n':>8}{'mean ms':>10}{'p95 ≤ms':>10}{'sql':>7}{'sql ms':>9}{'tpl ms':>9}"
+            f"{'cache hit %':>13}"
+        )
+        for row in rows[:options['limit']]:
+            lookups = row['hits'] + row['misses']
+            hit_rate = f"{row['hits'] * 100 / lookups:.0f}" if lookups else '-'
+            self.stdout.write(
+                f"{row['route'][:47]:<48}{row['count']:>8}{row['mean']:>10.1f}{row['p95']:>10g}"
+                f"{row['sql']:>7.1f}{row['sql_ms']:>9.1f}{row['template_ms']:>9.1f}{hit_rate:>13}"
+            )
@@ -0,0 +1,68 @@
+"""
+Django management command reporting the static bytes each page template
+ships, following its base templates and includes.
+
+    python manage.py static_report
+    python manage.py static_report admin/dashboard.html --assets
+
+Sizes are what WhiteNoise sends after collectstatic. Scripts and stylesheets
+from other hosts are counted but not measured.
+"""
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.template import TemplateDoesNotExist, TemplateSyntaxError
+
+from apps.core.static_assets import asset_size, page_report
+
+
+# Partials and emails are part of pages, not pages themselves
+SKIPPED_DIRS = ('components', 'emails')
+
+
+def page_templates():
+    names = []
+    for directory in settings.TEMPLATES[0]['DIRS']:
+        directory = str(directory)
+        for root, dirs, files in os.walk(directory):
+            dirs[:] = sorted(d for d in dirs if os.path.relpath(os.path.join(root, d), directory) not in SKIPPED_DIRS)
+            for filename in sorted(files):
+                if filename.endswith('.html'):
+                    names.append(os.path.relpath(os.path.join(root, filename), directory).replace(os.sep, '/'))
+    return names
+
+
+class Command(BaseCommand):
+    help = 'Show the static bytes shipped by each page template'
+
+    def add_arguments(self, parser):
+        parser.add_argument('templates', nargs='*', help='Templates to report (default: every page template)')
+        parser.add_argument('--limit', type=int, default=30, help='Number of templates to show')
+        parser.add_argument('--assets', action='store_true', help='List each template\'s assets')
+
+    def handle(self, *args, **options):
+        names = options['templates'] or page_templates()
+        try:
+            rows = page_report(names)
+        except (TemplateDoesNotExist, TemplateSyntaxError) as exc:
+            raise CommandError(f'Could not load template: {exc}')
+
+        self.stdout.write(
+            f"{'template':<44}{'assets':>7}{'raw KB':>10}{'gzip KB':>10}{'br KB':>9}{'external':>10}"
+        )
+        for row in rows[:options['limit']]:
+            brotli = f"{row['brotli'] / 1024:>9.1f}" if row['brotli'] is not None else f"{'-':>9}"
+            self.stdout.write(
+                f"{row['template']:<44}{len(row['assets']):>7}{row['raw'] / 1024:>10.1f}"
+                f"{row['gzip'] / 1024:>10.1f}{brotli}{len(row['external']):>10}"
+            )
+            if options['assets']:
+                for path in row['assets']:
+                    size = asset_size(path)
+                    if size:
+                        self.stdout.write(f"    {path} ({size['raw'] / 1024:.1f} KB, {size['gzip'] / 1024:.1f} KB gzip)")
+                for url in row['external']:
+                    self.stdout.write(f'    {url} (external)')
+            for path in row['missing']:
+                self.stdout.write(self.style.WARNING(f'    {path} is linked but does not exist'))
@@ -0,0 +1,70 @@
+"""
+Django management command that keeps a local SQLite replica current.
+
+Copies the primary SQLite database into the replica file with the SQLite
+online backup API, so dashboards and exports can be exercised against a
+second database locally. Production replicas should use native replication.
+"""
+
+import sqlite3
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.routers import PRIMARY_ALIAS, REPLICA_ALIAS
+
+
+class Command(BaseCommand):
+    help = 'Copy the primary SQLite database into the replica using the SQLite backup API'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=0,
+            help='Keep syncing every N seconds (default: sync once and exit)',
+        )
+        parser.add_argument(
+            '--pages',
+            type=int,
+            default=1024,
+            help='Pages copied per backup step; readers can run between steps',
+        )
+
+    def handle(self, *args, **options):
+        if REPLICA_ALIAS not in settings.DATABASES:
+            raise CommandError('No replica configured. Set REPLICA_DATABASE_URL first.')
+
+        primary = settings.DATABASES[PRIMARY_ALIAS]
+        replica = settings.DATABASES[REPLICA_ALIAS]
+        for alias, config in ((PRIMARY_ALIAS, primary), (REPLICA_ALIAS, replica)):
+            if config['ENGINE'] != 'django.db.backends.sqlite3':
+                raise CommandError(
+                    f"'{alias}' is not SQLite; use the database's native replication instead."
+                )
+
+        if str(primary['NAME']) == str(replica['NAME']):
+            raise CommandError('Primary and replica point at the same file.')
+
+        while True:
+            started = time.perf_counter()
+            self.sync(primary['NAME'], replica['NAME'], options['pages'])
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                self.style.SUCCESS(f'Replica synced from {primary["NAME"]} in {elapsed:.2f}s')
+            )
+
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
+
+    def sync(self, source_path, target_path, pages):
+        """Run one online backup from source to target"""
+        source = sqlite3.connect(source_path, timeout=30)
+        target = sqlite3.connect(target_path, timeout=30)
+        try:
+            source.backup(target, pages=pages)
+        finally:
+            target.close()
+            source.close()
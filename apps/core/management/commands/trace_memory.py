@@ -0,0 +1,47 @@
+"""
+Django management command running another command under tracemalloc.
+
+    python manage.py trace_memory --top 15 import_data clients.csv --kind clients
+
+Prints the peak and retained Python heap growth, the RSS before and after
+and the project lines responsible for the largest allocations, then checks
+the RSS watermark like a web worker would.
+"""
+
+import argparse
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.memory import MemoryTrace, watermark
+
+
+class Command(BaseCommand):
+    help = 'Run a management command and report its peak memory and top allocation sites'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=15, help='Allocation sites to show')
+        parser.add_argument('--frames', type=int, help='Frames kept per allocation (default MEMORY_TRACE_FRAMES)')
+        parser.add_argument('command_name', help='Command to run')
+        parser.add_argument('command_args', nargs=argparse.REMAINDER, help='Arguments for the command')
+
+    def handle(self, *args, **options):
+        name = options['command_name']
+        if name == 'trace_memory':
+            raise CommandError('trace_memory cannot trace itself.')
+
+        trace = MemoryTrace(frames=options['frames'], limit=options['top'])
+        with trace:
+            try:
+                call_command(name, *options['command_args'], stdout=self.stdout, stderr=self.stderr)
+            finally:
+                watermark.check(f'manage.py {name}')
+
+        self.stdout.write(self.style.HTTP_INFO(f'=== Memory: manage.py {name} ==='))
+        self.stdout.write(trace.summary())
+        self.stdout.write(f"{'retained KB':>12}{'blocks':>10}  site (allocated in)")
+        for allocation in trace.top_allocations:
+            allocated_in = f" ({allocation['allocated_in']})" if allocation['allocated_in'] else ''
+            self.stdout.write(
+                f"{allocation['size_kb']:>12.1f}{allocation['count']:>10}  {allocation['site']}{allocated_in}"
+            )
@@ -0,0 +1,164 @@
+"""
+Access-controlled serving of private uploads.
+
+Files in the 'private' storage (see apps.core.storage) are served by
+``core:protected_media`` to staff, or to anyone holding a link made by
+``signed_url``: a signature over the file name that expires after
+``PRIVATE_MEDIA_TOKEN_MAX_AGE`` seconds, so a quotation PDF can be mailed
+to a client who has no account.
+
+Once access is granted the worker only sets headers. The web server reads
+the file, handles Range requests and keeps the connection busy instead of a
+Python worker:
+
+``PRIVATE_MEDIA_SERVER = 'nginx'``
+    ``X-Accel-Redirect`` to ``PRIVATE_MEDIA_INTERNAL_URL``::
+
+        location /internal-media/ {
+            internal;
+            alias /srv/globalcool-light/private/;
+        }
+
+``PRIVATE_MEDIA_SERVER = 'apache'``
+    ``X-Sendfile`` with the file's absolute path (mod_xsendfile, with
+    ``XSendFilePath`` set to ``PRIVATE_MEDIA_ROOT``).
+
+``PRIVATE_MEDIA_SERVER = 'django'``
+    The worker sends the file itself, honouring a single byte range so PDF
+    viewers and media players can seek. For development only.
+
+With ``USE_S3`` the private storage is a bucket (see apps.core.s3) and
+the response is a redirect to a signed URL for the object instead, which
+the browser fetches from the bucket directly.
+"""
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core import signing
+from django.http import FileResponse, HttpResponse, HttpResponseRedirect
+from django.urls import reverse
+from django.utils.http import content_disposition_header
+
+
+TOKEN_SALT = 'apps.core.media'
+QUERY_PARAM = 'token'
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def signed_url(name):
+    """Protected media URL for ``name`` that works without logging in, until it expires"""
+    url = reverse('core:protected_media', kwargs={'path': name})
+    return f'{url}?{QUERY_PARAM}={signing.dumps(name, salt=TOKEN_SALT)}'
+
+
+def token_allows(token, name):
+    """Whether ``token`` was signed for ``name`` and has not expired"""
+    try:
+        signed_name = signing.loads(
+            token, salt=TOKEN_SALT, max_age=_setting('PRIVATE_MEDIA_TOKEN_MAX_AGE', 7 * 24 * 60 * 60)
+        )
+    except signing.BadSignature:
+        return False
+    return signed_name == name
+
+
+def can_access(request, name):
+    if request.user.is_authenticated and request.user.is_staff:
+        return True
+    token = request.GET.get(QUERY_PARAM)
+    return bool(token) and token_allows(token, name)
+
+
+def parse_range(header, size):
+    """
+    ``(start, end)`` inclusive for a single-range ``Range`` header.
+
+    None means the header is absent or not one this handles (the whole file
+    is sent); ValueError means the range lies outside the file.
+    """
+    match = RANGE_RE.match(header.strip()) if header else None
+    if not match or not any(match.groups()):
+        return None
+    first, last = match.groups()
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if not length:
+            raise ValueError(header)
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError(header)
+    return start, end
+
+
+def serve(request, storage, name):
+    """Response sending ``name`` from ``storage``, the file handed to the web server where one is configured"""
+    content_type, encoding = mimetypes.guess_type(name)
+    content_type = content_type or 'application/octet-stream'
+    server = _setting('PRIVATE_MEDIA_SERVER', 'django')
+    disposition = content_disposition_header(False, os.path.basename(name))
+
+    if not _is_local(storage, name):
+        response = HttpResponseRedirect(storage.url(name, parameters={
+            'ResponseContentDisposition': disposition,
+            'ResponseContentType': content_type,
+        }))
+        response['Cache-Control'] = 'private, no-store'
+        return response
+
+    if server == 'django':
+        response = _serve_from_worker(request, storage, name, content_type)
+    else:
+        response = HttpResponse(content_type=content_type)
+        if server == 'nginx':
+            internal_url = _setting('PRIVATE_MEDIA_INTERNAL_URL', '/internal-media/')
+            response['X-Accel-Redirect'] = internal_url.rstrip('/') + '/' + quote(name)
+        elif server == 'apache':
+            response['X-Sendfile'] = storage.path(name)
+        else:
+            raise ValueError(f'Unknown PRIVATE_MEDIA_SERVER {server!r}')
+
+    if encoding:
+        response['Content-Encoding'] = encoding
+    response['Content-Disposition'] = disposition
+    response['Cache-Control'] = 'private, max-age=0'
+    return response
+
+
+def _is_local(storage, name):
+    try:
+        storage.path(name)
+    except NotImplementedError:
+        return False
+    return True
+
+
+def _serve_from_worker(request, storage, name, content_type):
+    size = storage.size(name)
+    try:
+        byte_range = parse_range(request.headers.get('Range'), size)
+    except ValueError:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+        return response
+
+    if byte_range is None:
+        response = FileResponse(storage.open(name, 'rb'), content_type=content_type)
+    else:
+        start, end = byte_range
+        with storage.open(name, 'rb') as file:
+            file.seek(start)
+            response = HttpResponse(file.read(end - start + 1), content_type=content_type, status=206)
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+    response['Accept-Ranges'] = 'bytes'
+    return response
@@ -0,0 +1,110 @@
+"""
+Finding media files nothing references.
+
+Uploads are not deleted with their rows (content-addressed images may be
+shared by several rows, see apps.core.storage), so deleting services,
+products or projects leaves files behind. ``orphans`` finds them without
+holding either side in memory: the storage tree is walked in sorted order,
+the file names stored in every ``FileField`` on the same storage root are
+read from the database sorted the same way, and the two streams are merged
+like a sort-merge join.
+
+Both sides are ordered by code point, which is what Python compares strings
+by: directories are walked as if their names ended in "/", and the database
+sorts with a binary collation rather than the locale's.
+"""
+import heapq
+import os
+import posixpath
+
+from django.apps import apps
+from django.db import connections, models, router
+from django.db.models.functions import Collate
+
+
+BINARY_COLLATIONS = {
+    'postgresql': 'C',
+    'sqlite': 'BINARY',
+    'mysql': 'utf8mb4_bin',
+}
+
+# Rows read per round trip when streaming references
+CHUNK_SIZE = 2000
+
+
+def storage_root(storage):
+    """What two storages must share for their file names to point at the same files"""
+    bucket = getattr(storage, 'bucket_name', None)
+    if bucket is not None:
+        return ('s3', storage.endpoint_url, bucket, storage.location)
+    return ('filesystem', os.path.abspath(storage.location))
+
+
+def walk(storage, directory='', exclude=()):
+    """Every file name in ``storage`` under ``directory``, in sorted order"""
+    try:
+        directories, files = storage.listdir(directory)
+    except FileNotFoundError:
+        # Nothing has been uploaded yet, or the directory went away mid-walk
+        return
+    entries = [(name + '/', True) for name in directories] + [(name, False) for name in files]
+    for name, is_directory in sorted(entries):
+        path = posixpath.join(directory, name)
+        if any(path.startswith(prefix) for prefix in exclude):
+            continue
+        if is_directory:
+            yield from walk(storage, path.rstrip('/'), exclude)
+        else:
+            yield path
+
+
+def file_fields(storage):
+    """``(model, field name)`` of every file field storing into ``storage``'s root"""
+    root = storage_root(storage)
+    for model in apps.get_models():
+        for field in model._meta.concrete_fields:
+            if isinstance(field, models.FileField) and storage_root(field.storage) == root:
+                yield model, field.name
+
+
+def _sorted_names(model, field_name):
+    # References are read from the primary: a replica a few seconds behind
+    # could miss a file that was just attached
+    alias = router.db_for_write(model)
+    queryset = model._base_manager.using(alias).exclude(**{field_name: ''}).exclude(**{f'{field_name}__isnull': True})
+    collation = BINARY_COLLATIONS.get(connections[alias].vendor)
+    ordering = Collate(field_name, collation) if collation else field_name
+    return queryset.order_by(ordering).values_list(field_name, flat=True).iterator(chunk_size=CHUNK_SIZE)
+
+
+def referenced(storage):
+    """Distinct file names the database refers to in ``storage``, in sorted order"""
+    previous = None
+    for name in heapq.merge(*(_sorted_names(model, field) for model, field in file_fields(storage))):
+        if name != previous:
+            yield name
+            previous = name
+
+
+def is_referenced(storage, name):
+    """Whether a row refers to ``name`` right now, for a last check before deleting it"""
+    return any(
+        model._base_manager.using(router.db_for_write(model)).filter(**{field_name: name}).exists()
+        for model, field_name in file_fields(storage)
+    )
+
+
+def merge_orphans(stored, references):
+    """Names in the sorted iterable ``stored`` that are missing from the sorted iterable ``references``"""
+    references = iter(references)
+    reference = next(references, None)
+    for name in stored:
+        while reference is not None and reference < name:
+            reference = next(references, None)
+        if reference != name:
+            yield name
+
+
+def orphans(storage, exclude=()):
+    """Files in ``storage`` that no row references"""
+    return merge_orphans(walk(storage, exclude=exclude), referenced(storage))
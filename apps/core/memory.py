@@ -0,0 +1,169 @@
+"""
+Memory diagnostics with tracemalloc.
+
+``MemoryTrace`` measures a block of work: the peak and retained Python heap
+growth and the allocation sites responsible, each attributed to the
+innermost project frame (the view, command or model method that asked for
+the memory) and the library line that did the allocating. It backs memory
+runs started from Request Profiles in the custom admin (see
+ProfilerMiddleware) and the ``trace_memory`` management command.
+
+``watermark`` logs a warning the first time a worker's resident set size
+crosses ``MEMORY_RSS_WATERMARK_MB`` and names the request or command that
+took it over; it re-arms once RSS drops back below 90% of the limit.
+"""
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+from django.conf import settings
+
+from . import instrumentation, tracing
+
+
+logger = logging.getLogger(__name__)
+
+_IGNORED_FILES = (tracemalloc.__file__, __file__, '<frozen importlib._bootstrap>',
+                  '<frozen importlib._bootstrap_external>')
+# Project code that only wraps the code asking for memory
+_WRAPPER_FILES = {instrumentation.__file__, tracing.__file__}
+
+
+def current_rss():
+    """Resident set size of this process in bytes, or None when unknown"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Not the current size but the peak; ru_maxrss is in kB on Linux and bytes on macOS
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == 'darwin' else maxrss * 1024
+
+
+def _short_path(filename, base_dir):
+    if filename.startswith(base_dir):
+        return filename[len(base_dir):]
+    if 'site-packages' + os.sep in filename:
+        return filename.split('site-packages' + os.sep, 1)[1]
+    return filename
+
+
+class MemoryTrace:
+    """Trace allocations made between start() and stop()"""
+
+    def __init__(self, frames=None, limit=25):
+        self.frames = frames or getattr(settings, 'MEMORY_TRACE_FRAMES', 40)
+        self.limit = limit
+        self.peak = 0
+        self.retained = 0
+        self.duration = 0.0
+        self.rss_before = self.rss_after = None
+        self.top_allocations = []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        self._owns_tracing = not tracemalloc.is_tracing()
+        if self._owns_tracing:
+            tracemalloc.start(self.frames)
+        tracemalloc.reset_peak()
+        self._baseline = tracemalloc.get_traced_memory()[0]
+        self._before = tracemalloc.take_snapshot()
+        self.rss_before = current_rss()
+        self._started = time.perf_counter()
+
+    def stop(self):
+        self.duration = time.perf_counter() - self._started
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        if self._owns_tracing:
+            tracemalloc.stop()
+        self.peak = max(peak - self._baseline, 0)
+        self.retained = current - self._baseline
+        self.rss_after = current_rss()
+
+        filters = [tracemalloc.Filter(False, filename) for filename in _IGNORED_FILES]
+        diff = after.filter_traces(filters).compare_to(self._before.filter_traces(filters), 'traceback')
+        self.top_allocations = self._group_by_site(diff)
+        self._before = None
+
+    def _group_by_site(self, diff):
+        base_dir = str(settings.BASE_DIR) + os.sep
+        sites = {}
+        for stat in diff:
+            if stat.size_diff <= 0:
+                continue
+            frames = list(stat.traceback)
+            innermost = frames[-1] if frames else None
+            project = next(
+                (frame for frame in reversed(frames)
+                 if frame.filename.startswith(base_dir) and 'site-packages' not in frame.filename
+                 and frame.filename not in _WRAPPER_FILES),
+                innermost,
+            )
+            if project is None:
+                continue
+            site = f'{_short_path(project.filename, base_dir)}:{project.lineno}'
+            entry = sites.setdefault(site, {'site': site, 'allocated_in': '', 'size': 0, 'count': 0, '_largest': 0})
+            entry['size'] += stat.size_diff
+            entry['count'] += stat.count_diff
+            if stat.size_diff > entry['_largest'] and innermost is not project:
+                entry['_largest'] = stat.size_diff
+                entry['allocated_in'] = f'{_short_path(innermost.filename, base_dir)}:{innermost.lineno}'
+
+        top = sorted(sites.values(), key=lambda entry: entry['size'], reverse=True)[:self.limit]
+        return [
+            {'site': entry['site'], 'allocated_in': entry['allocated_in'],
+             'size_kb': round(entry['size'] / 1024, 1), 'count': entry['count']}
+            for entry in top
+        ]
+
+    def summary(self):
+        return (
+            f'peak {self.peak / 1024 / 1024:.1f} MB, retained {self.retained / 1024 / 1024:.1f} MB, '
+            f'RSS {_mb(self.rss_before)} -> {_mb(self.rss_after)} MB in {self.duration:.2f}s'
+        )
+
+
+def _mb(size):
+    return '?' if size is None else f'{size / 1024 / 1024:.0f}'
+
+
+class RSSWatermark:
+    """Warn once each time this process's RSS crosses the configured limit"""
+
+    def __init__(self):
+        self.exceeded = False
+
+    def check(self, source):
+        limit_mb = getattr(settings, 'MEMORY_RSS_WATERMARK_MB', 0)
+        if not limit_mb:
+            return
+        rss = current_rss()
+        if rss is None:
+            return
+        limit = limit_mb * 1024 * 1024
+        if rss >= limit and not self.exceeded:
+            self.exceeded = True
+            instrumentation.histograms.increment('memory_watermark_exceeded_total')
+            logger.warning(
+                'Worker %s RSS %.0f MB crossed the %s MB watermark during %s',
+                os.getpid(), rss / 1024 / 1024, limit_mb, source or 'unknown work',
+            )
+        elif rss < limit * 0.9:
+            self.exceeded = False
+
+
+watermark = RSSWatermark()
@@ -0,0 +1,172 @@
+"""
+Prometheus text exposition of the application's metrics.
+
+Request rate, latency histograms, query counts, cache hits and email sends
+per URL name come from the per-route histograms PerformanceMiddleware keeps
+(see apps.core.instrumentation). Bookings, inquiries and contact messages
+created are counted by post_save receivers into the same per-process
+snapshots, so counters from every gunicorn worker are summed at scrape time
+without a worker ever overwriting another's numbers; CompressionMiddleware
+adds the bytes it compresses the same way. Gauges that are cheap to
+read from the database (open chat sessions) are queried on each scrape.
+
+The endpoint is only served to requests presenting METRICS_TOKEN as a
+bearer token or, when METRICS_ALLOWED_IPS lists any, to scrapers at those
+addresses that connect directly. Behind NGINX every request arrives from
+127.0.0.1, so requests a proxy forwarded are never trusted by address, and
+nothing is allowed by address unless configured.
+"""
+import hmac
+
+from django.conf import settings
+from django.db.models.signals import post_save
+
+from . import instrumentation
+
+
+# post_save senders whose creations are counted, by counter name
+CREATION_COUNTERS = {
+    'leads.Booking': 'bookings_created_total',
+    'leads.Inquiry': 'inquiries_created_total',
+    'core.ContactMessage': 'contact_messages_created_total',
+}
+
+# Set by a reverse proxy in front of the app
+FORWARDED_HEADERS = ('HTTP_X_FORWARDED_FOR', 'HTTP_X_REAL_IP', 'HTTP_FORWARDED')
+
+COUNTER_HELP = {
+    'bookings_created_total': 'Bookings created.',
+    'inquiries_created_total': 'Inquiries created.',
+    'contact_messages_created_total': 'Contact form messages received.',
+    'memory_watermark_exceeded_total': 'Times a worker crossed MEMORY_RSS_WATERMARK_MB.',
+    'http_compressed_responses_total': 'Responses compressed by CompressionMiddleware.',
+    'http_compression_input_bytes_total': 'Response bytes before compression.',
+    'http_compression_output_bytes_total': 'Response bytes after compression.',
+}
+
+
+def _count_creation(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        instrumentation.histograms.increment(CREATION_COUNTERS[sender._meta.label])
+
+
+def connect_signals():
+    from django.apps import apps
+
+    for label in CREATION_COUNTERS:
+        post_save.connect(
+            _count_creation, sender=apps.get_model(label), dispatch_uid=f'metrics-{label}'
+        )
+
+
+def is_authorized(request):
+    """Allow a matching bearer token or a direct request from a configured scrape address"""
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    if token:
+        header = request.META.get('HTTP_AUTHORIZATION', '')
+        if header.startswith('Bearer ') and hmac.compare_digest(header[7:].strip(), token):
+            return True
+    # REMOTE_ADDR of a proxied request is the proxy's, whoever sent it
+    if any(header in request.META for header in FORWARDED_HEADERS):
+        return False
+    return request.META.get('REMOTE_ADDR') in getattr(settings, 'METRICS_ALLOWED_IPS', ())
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels):
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + '}'
+
+
+def _number(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Exposition:
+    """Collects metric families and renders them in text format 0.0.4"""
+
+    def __init__(self, prefix):
+        self.prefix = prefix
+        self.lines = []
+
+    def family(self, name, kind, help_text, samples):
+        """Add a metric family from (suffix, labels, value) samples"""
+        name = f'{self.prefix}{name}'
+        self.lines.append(f'# HELP {name} {help_text}')
+        self.lines.append(f'# TYPE {name} {kind}')
+        for suffix, labels, value in samples:
+            self.lines.append(f'{name}{suffix}{_labels(**labels) if labels else ""} {_number(value)}')
+
+    def render(self):
+        return '\n'.join(self.lines) + '\n'
+
+
+def route_labels(route):
+    method, _, view = route.partition(' ')
+    return {'method': method, 'view': view}
+
+
+def render_metrics():
+    """Current metrics of every process in Prometheus text format"""
+    from apps.leads.models import ChatSession
+
+    snapshots = instrumentation.published_snapshots()
+    routes = sorted(instrumentation.route_stats(snapshots).items())
+    counters = instrumentation.app_counters(snapshots)
+    buckets_ms = instrumentation.histograms.buckets_ms
+    out = Exposition(getattr(settings, 'METRICS_PREFIX', 'app_'))
+
+    out.family('http_requests_total', 'counter', 'Requests handled, by URL name and method.', [
+        ('', route_labels(route), stats['count']) for route, stats in routes
+    ])
+
+    duration = []
+    for route, stats in routes:
+        labels = route_labels(route)
+        cumulative = 0
+        for bound, count in zip(list(buckets_ms) + [float('inf')], stats['buckets']):
+            cumulative += count
+            duration.append(('_bucket', dict(labels, le=_number(bound / 1000)), cumulative))
+        duration.append(('_sum', labels, round(stats['total_ms'] / 1000, 6)))
+        duration.append(('_count', labels, stats['count']))
+    out.family('http_request_duration_seconds', 'histogram', 'Request latency.', duration)
+
+    out.family('db_queries_total', 'counter', 'SQL queries run while handling requests.', [
+        ('', route_labels(route), stats['sql_count']) for route, stats in routes
+    ])
+    out.family('db_query_duration_seconds_total', 'counter', 'Time spent in SQL queries.', [
+        ('', route_labels(route), round(stats['sql_ms'] / 1000, 6)) for route, stats in routes
+    ])
+
+    hits = sum(stats['cache_hits'] for _, stats in routes)
+    misses = sum(stats['cache_misses'] for _, stats in routes)
+    out.family('cache_hits_total', 'counter', 'Cache lookups that found a value.', [('', {}, hits)])
+    out.family('cache_misses_total', 'counter', 'Cache lookups that found nothing.', [('', {}, misses)])
+    out.family('cache_hit_ratio', 'gauge', 'Share of cache lookups that hit since the counters started.', [
+        ('', {}, round(hits / (hits + misses), 4) if hits + misses else 0.0)
+    ])
+
+    out.family('emails_sent_total', 'counter', 'Emails sent while handling requests.', [
+        ('', {}, sum(stats['email_count'] for _, stats in routes))
+    ])
+    out.family('email_send_duration_seconds_total', 'counter', 'Time spent sending email.', [
+        ('', {}, round(sum(stats['email_ms'] for _, stats in routes) / 1000, 6))
+    ])
+
+    for name, help_text in COUNTER_HELP.items():
+        out.family(name, 'counter', help_text, [('', {}, counters.get(name, 0))])
+
+    compressed_in = counters.get('http_compression_input_bytes_total', 0)
+    out.family('http_compression_ratio', 'gauge', 'Compressed size as a share of the original, all responses.', [
+        ('', {}, round(counters.get('http_compression_output_bytes_total', 0) / compressed_in, 4)
+         if compressed_in else 0.0)
+    ])
+
+    out.family('chat_sessions_open', 'gauge', 'Chat sessions that are still active.', [
+        ('', {}, ChatSession.objects.filter(status='active').count())
+    ])
+    return out.render()
@@ -0,0 +1,325 @@
+import time
+
+from django.conf import settings
+from django.contrib.auth import SESSION_KEY
+from django.http import FileResponse
+from django.utils.cache import patch_vary_headers
+
+from . import compression, instrumentation, memory, nplusone, profiling, tracing
+from .models import ProfileRun
+from .routers import replica_configured, track_writes
+
+
+class DatabaseRoutingMiddleware:
+    """
+    Keep users on the primary database shortly after they write.
+
+    Must come after SessionMiddleware so the sticky timestamp is saved with
+    the session.
+    """
+    session_key = '_db_sticky_until'
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not replica_configured() or not hasattr(request, 'session'):
+            return self.get_response(request)
+
+        sticky_until = request.session.get(self.session_key, 0)
+        with track_writes(pinned=time.time() < sticky_until) as wrote:
+            response = self.get_response(request)
+
+            if wrote():
+                window = getattr(settings, 'REPLICA_STICKY_SECONDS', 15)
+                request.session[self.session_key] = time.time() + window
+
+        return response
+
+
+class TracingMiddleware:
+    """
+    Give each request an ID, echoed in the X-Request-ID response header and
+    added to its log records, and trace sampled requests (see
+    apps.core.tracing).
+
+    Place it first in MIDDLEWARE so every other middleware runs inside the
+    request's trace.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.request_id = tracing.request_id_from(request.META.get(tracing.REQUEST_ID_HEADER))
+        parent = tracing.parse_traceparent(request.META.get(tracing.TRACEPARENT_HEADER))
+        attributes = {'http.method': request.method, 'http.target': request.path}
+        with tracing.start_trace(f'{request.method} {request.path}', request_id=request.request_id,
+                                 parent=parent, **attributes) as trace:
+            response = self.get_response(request)
+            if trace is not None:
+                trace.root.attributes['http.status_code'] = response.status_code
+        response['X-Request-ID'] = request.request_id
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        trace = tracing.current_trace()
+        if trace is not None and trace.root is not None and request.resolver_match:
+            trace.root.name = f'{request.method} {request.resolver_match.view_name}'
+            trace.root.attributes['http.route'] = request.resolver_match.route
+
+
+class PerformanceMiddleware:
+    """
+    Measure each request, record it in the per-route histograms and send a
+    Server-Timing header to staff.
+
+    Place it near the top of MIDDLEWARE so session and auth work is included.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not getattr(settings, 'PERF_INSTRUMENTATION', True):
+            return self.get_response(request)
+
+        with instrumentation.collect() as metrics:
+            metrics.source = f'{request.method} {request.path}'
+            response = self.get_response(request)
+
+        match = getattr(request, 'resolver_match', None)
+        route = f"{request.method} {match.view_name if match else '<unresolved>'}"
+        instrumentation.histograms.observe(route, metrics)
+
+        if self.is_staff(request):
+            response['Server-Timing'] = metrics.server_timing()
+
+        memory.watermark.check(route)
+
+        interval = getattr(settings, 'PERF_METRICS_FLUSH_INTERVAL', 10)
+        if instrumentation.histograms.flush_due(interval):
+            instrumentation.histograms.flush(
+                instrumentation.metrics_cache(), getattr(settings, 'PERF_METRICS_TTL', 86400)
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        metrics = instrumentation.current_metrics()
+        if metrics is not None and request.resolver_match:
+            metrics.source = request.resolver_match.view_name
+
+    def is_staff(self, request):
+        # Only look the user up for logged-in sessions; anonymous visitors
+        # should not pay a query for a header they never get
+        session = getattr(request, 'session', None)
+        if session is None or SESSION_KEY not in session:
+            return False
+        return request.user.is_staff
+
+
+class NPlusOneMiddleware:
+    """
+    Detect repeated, structurally identical queries within a request (see
+    apps.core.nplusone). NPLUSONE_DETECTION chooses off, log or raise.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if getattr(settings, 'NPLUSONE_DETECTION', 'off') == 'off':
+            return self.get_response(request)
+
+        with nplusone.record_queries() as recorder:
+            response = self.get_response(request)
+        if not nplusone.in_scope(request):
+            return response
+        if response.streaming:
+            # Streamed exports query as the body is sent, so check at the end
+            response.streaming_content = self.check_stream(request, response.streaming_content, recorder)
+        else:
+            nplusone.report(request, recorder.problems())
+        return response
+
+    def check_stream(self, request, content, recorder):
+        with nplusone.record_queries(recorder):
+            yield from content
+        nplusone.report(request, recorder.problems())
+
+
+class CompressionMiddleware:
+    """
+    Compress text responses with brotli or gzip, streamed ones chunk by
+    chunk (see apps.core.compression).
+
+    Place it above every middleware that changes the response body, so it
+    compresses the final content.
+    """
+    # Statuses without a body worth compressing, or with a byte range of one
+    SKIPPED_STATUSES = {204, 206, 304}
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not getattr(settings, 'COMPRESSION_ENABLED', True) or not self.compressible(response):
+            return response
+
+        # Whether or not this body is compressed, the next one may be
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        padding = 0
+        allow_brotli = True
+        if compression.carries_csrf_token(request, response):
+            # The body may hold a CSRF token: see BREACH in apps.core.compression
+            if getattr(settings, 'COMPRESSION_SKIP_CSRF', False):
+                return response
+            padding = compression.MAX_PADDING
+            allow_brotli = False
+
+        encoding = compression.choose_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''), allow_brotli)
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            stream = compression.compress_async_stream if response.is_async else compression.compress_stream
+            response.streaming_content = stream(response.streaming_content, encoding, padding)
+            del response['Content-Length']
+        else:
+            if len(response.content) < compression.min_size():
+                return response
+            compressed = compression.compress(response.content, encoding, padding)
+            if len(compressed) >= len(response.content):
+                return response
+            compression.record(len(response.content), len(compressed))
+            response.content = compressed
+            response['Content-Length'] = str(len(compressed))
+
+        # The compressed body is no longer byte-for-byte what a strong ETag named
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        response['Content-Encoding'] = encoding
+        return response
+
+    def compressible(self, response):
+        return (
+            response.status_code not in self.SKIPPED_STATUSES
+            and not response.has_header('Content-Encoding')
+            # Static and media files; collectstatic precompresses the former
+            and not isinstance(response, FileResponse)
+            and compression.is_compressible(response.get('Content-Type', ''))
+        )
+
+
+class ProfilerMiddleware:
+    """
+    Profile requests carrying a staff-issued profiling token and store the
+    result as a ProfileRun (see apps.core.profiling).
+
+    Must come after AuthenticationMiddleware so the token can be checked
+    against the logged-in user.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = profiling.token_from_request(request)
+        mode = profiling.token_mode(token, request) if token else None
+        if mode is None or not profiling.acquire_slot():
+            return self.get_response(request)
+
+        metrics = instrumentation.current_metrics()
+        sql_before = metrics.sql_count if metrics else None
+        if mode == 'memory':
+            return self.trace_memory(request, metrics, sql_before)
+
+        try:
+            interval = getattr(settings, 'PROFILER_INTERVAL_MS', 5) / 1000
+            with profiling.SamplingProfiler(interval, getattr(settings, 'PROFILER_MAX_SECONDS', 30)) as profiler:
+                response = self.get_response(request)
+
+            run = self.save_run(
+                request, response, metrics, sql_before,
+                duration_ms=profiler.duration * 1000,
+                interval_ms=interval * 1000,
+                sample_count=profiler.samples,
+                collapsed_stacks=profiler.collapsed(),
+                top_functions=profiler.top_functions(),
+            )
+        finally:
+            profiling.release_slot()
+
+        response['X-Profile-Run'] = str(run.pk)
+        return response
+
+    def trace_memory(self, request, metrics, sql_before):
+        """Trace allocations with tracemalloc; releases the profiling slot when done"""
+        trace = memory.MemoryTrace()
+        trace.start()
+        try:
+            response = self.get_response(request)
+        except BaseException:
+            trace.stop()
+            profiling.release_slot()
+            raise
+
+        def finish():
+            try:
+                trace.stop()
+                return self.save_run(
+                    request, response, metrics, sql_before, kind='memory',
+                    duration_ms=trace.duration * 1000,
+                    peak_memory_kb=trace.peak / 1024,
+                    top_allocations=trace.top_allocations,
+                )
+            finally:
+                profiling.release_slot()
+
+        if response.streaming:
+            # Exports stream their rows, so keep tracing until the body is sent
+            response.streaming_content = _FinishingStream(response.streaming_content, finish)
+        else:
+            response['X-Profile-Run'] = str(finish().pk)
+        return response
+
+    def save_run(self, request, response, metrics, sql_before, **fields):
+        match = getattr(request, 'resolver_match', None)
+        return ProfileRun.objects.create(
+            method=request.method,
+            path=request.path[:500],
+            view_name=match.view_name if match else '',
+            status_code=response.status_code,
+            requested_by=request.user,
+            sql_count=metrics.sql_count - sql_before if metrics else None,
+            **fields,
+        )
+
+
+class _FinishingStream:
+    """Iterate streaming content and call ``finish`` once it is exhausted or closed"""
+
+    def __init__(self, content, finish):
+        self.content = iter(content)
+        self.finish = finish
+        self.finished = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self.content)
+        except StopIteration:
+            self.close()
+            raise
+
+    def close(self):
+        if not self.finished:
+            self.finished = True
+            if hasattr(self.content, 'close'):
+                self.content.close()
+            self.finish()
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.16 on 2026-10-19 06:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_profilerun'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profilerun',
+            name='kind',
+            field=models.CharField(choices=[('cpu', 'CPU (sampling)'), ('memory', 'Memory (tracemalloc)')], default='cpu', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='profilerun',
+            name='peak_memory_kb',
+            field=models.FloatField(blank=True, help_text='Peak Python heap growth', null=True),
+        ),
+        migrations.AddField(
+            model_name='profilerun',
+            name='top_allocations',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
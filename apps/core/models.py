@@ -1,3 +1,4 @@
+from django.contrib.auth.models import User
 from django.db import models
 from django.core.validators import RegexValidator
 from ckeditor.fields import RichTextField
@@ -273,3 +274,45 @@ class SecuritySettings(models.Model):
         if not self.pk and SecuritySettings.objects.exists():
             raise ValueError("Only one SecuritySettings instance is allowed")
         super().save(*args, **kwargs)
+
+
+class ProfileRun(models.Model):
+    """A sampled CPU profile or memory trace of one request, taken on demand by staff"""
+
+    KIND_CHOICES = [
+        ('cpu', 'CPU (sampling)'),
+        ('memory', 'Memory (tracemalloc)'),
+    ]
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES, default='cpu')
+    method = models.CharField(max_length=10)
+    path = models.CharField(max_length=500)
+    view_name = models.CharField(max_length=200, blank=True)
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    requested_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True,
+                                     related_name='profile_runs')
+
+    duration_ms = models.FloatField(default=0)
+    interval_ms = models.FloatField(default=0)
+    sample_count = models.PositiveIntegerField(default=0)
+    sql_count = models.PositiveIntegerField(null=True, blank=True)
+
+    collapsed_stacks = models.TextField(blank=True, help_text="One 'root;...;leaf count' line per stack")
+    top_functions = models.JSONField(default=list, blank=True)
+
+    peak_memory_kb = models.FloatField(null=True, blank=True, help_text="Peak Python heap growth")
+    top_allocations = models.JSONField(default=list, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        if self.kind == 'memory':
+            return f"{self.method} {self.path} ({self.peak_memory_mb or 0:.1f} MB peak)"
+        return f"{self.method} {self.path} ({self.duration_ms:.0f} ms)"
+
+    @property
+    def peak_memory_mb(self):
+        return None if self.peak_memory_kb is None else self.peak_memory_kb / 1024
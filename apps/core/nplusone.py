@@ -0,0 +1,202 @@
+"""
+N+1 query detection.
+
+While a request is handled, every query is fingerprinted (see
+slow_queries.fingerprint) and attributed to what triggered it: the innermost
+template node being rendered, such as ``{{ booking.service.name }}`` at
+``admin/bookings_list.html:142``, and the innermost project Python frame.
+The same fingerprint running ``NPLUSONE_THRESHOLD`` or more times from the
+same place is an N+1, reported with a ``select_related``/``prefetch_related``
+suggestion derived from the table and column the repeated query filters on.
+
+``NPlusOneMiddleware`` runs the detector according to ``NPLUSONE_DETECTION``:
+``off``, ``log`` (warnings, the DEBUG default) or ``raise`` (CI: the request
+fails with NPlusOneError, so the test that made it fails). Only views in
+modules under ``NPLUSONE_SCOPE`` are checked; known offenders can be listed
+in ``NPLUSONE_IGNORE`` as view names or ``view_name:fingerprint``.
+"""
+import logging
+import os
+import re
+import sys
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.db import connections
+
+from . import instrumentation, slow_queries, tracing
+from .slow_queries import fingerprint
+
+
+logger = logging.getLogger(__name__)
+
+_TEMPLATE_BASE = os.path.join('django', 'template', 'base.py')
+# Execute wrappers and tracing spans sit between the ORM call and the recorder
+_WRAPPER_FILES = {__file__, instrumentation.__file__, slow_queries.__file__, tracing.__file__}
+_WHERE_COLUMN = re.compile(r'WHERE \(?"(\w+)"\."(\w+)" (?:= \?|IN \(\.\.\.\))')
+
+
+class NPlusOneError(AssertionError):
+    """Raised in ``raise`` mode when a request runs an N+1"""
+
+
+class NPlusOne:
+    """One repeated query and where it came from"""
+
+    def __init__(self, sql, fingerprint, count, template, python):
+        self.sql = sql
+        self.fingerprint = fingerprint
+        self.count = count
+        self.template = template
+        self.python = python
+        self.suggestion = suggest(sql)
+
+    @property
+    def location(self):
+        return self.template or self.python or 'unknown location'
+
+    def __str__(self):
+        return (
+            f'{self.count} similar queries from {self.location}'
+            f'{f" (via {self.python})" if self.template and self.python else ""}: {self.sql[:200]}'
+            f'{f" -> {self.suggestion}" if self.suggestion else ""}'
+        )
+
+
+def _trigger_locations():
+    """Innermost template node and project Python frame of the running query"""
+    base_dir = str(settings.BASE_DIR) + os.sep
+    template = python = None
+    frame = sys._getframe(2)
+    while frame is not None and not (template and python):
+        filename = frame.f_code.co_filename
+        if template is None and filename.endswith(_TEMPLATE_BASE) and frame.f_code.co_name == 'render_annotated':
+            node = frame.f_locals.get('self')
+            origin = getattr(node, 'origin', None)
+            token = getattr(node, 'token', None)
+            if origin is not None and token is not None:
+                contents = token.contents[:80]
+                tag = f'{{% {contents} %}}' if token.token_type.name == 'BLOCK' else f'{{{{ {contents} }}}}'
+                template = f'{origin.template_name or origin.name}:{token.lineno} {tag}'
+        elif (python is None and filename.startswith(base_dir) and filename not in _WRAPPER_FILES
+              and 'site-packages' not in filename and not filename.startswith(sys.prefix)):
+            python = f'{os.path.relpath(filename, base_dir)}:{frame.f_lineno} in {frame.f_code.co_qualname}'
+        frame = frame.f_back
+    return template, python
+
+
+class QueryRecorder:
+    """Execute wrapper grouping queries by fingerprint and trigger location"""
+
+    def __init__(self):
+        self.groups = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        fp, normalized = fingerprint(sql)
+        template, python = _trigger_locations()
+        key = (fp, template, python)
+        group = self.groups.get(key)
+        if group is None:
+            self.groups[key] = [normalized, 1]
+        else:
+            group[1] += 1
+        return execute(sql, params, many, context)
+
+    def problems(self, threshold=None):
+        threshold = threshold or getattr(settings, 'NPLUSONE_THRESHOLD', 3)
+        return [
+            NPlusOne(normalized, fp, count, template, python)
+            for (fp, template, python), (normalized, count) in self.groups.items()
+            if count >= threshold
+        ]
+
+
+@contextmanager
+def record_queries(recorder=None):
+    """Record the enclosed block's queries on every connection"""
+    recorder = recorder or QueryRecorder()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(recorder))
+        yield recorder
+
+
+def _model_for_table(table):
+    from django.apps import apps
+
+    for model in apps.get_models(include_auto_created=True):
+        if model._meta.db_table == table:
+            return model
+    return None
+
+
+def suggest(sql):
+    """A select_related/prefetch_related hint for a repeated query, or ''"""
+    from django.apps import apps
+
+    match = _WHERE_COLUMN.search(sql)
+    if not match:
+        return ''
+    model = _model_for_table(match.group(1))
+    if model is None:
+        return ''
+    column = match.group(2)
+
+    # Many-to-many: the query filters the through table on one side
+    if model._meta.auto_created:
+        owner = model._meta.auto_created
+        for field in owner._meta.many_to_many:
+            if field.remote_field.through is model:
+                if column == field.m2m_column_name():
+                    return f"prefetch_related('{field.name}') on {owner.__name__} querysets"
+                accessor = field.remote_field.get_accessor_name()
+                return f"prefetch_related('{accessor}') on {field.related_model.__name__} querysets"
+
+    # Reverse foreign key: children of each parent are fetched one by one
+    for field in model._meta.concrete_fields:
+        if field.column == column and field.is_relation and field.many_to_one:
+            accessor = field.remote_field.get_accessor_name()
+            return f"prefetch_related('{accessor}') on {field.related_model.__name__} querysets"
+
+    # Forward foreign key: each row's related object is fetched by primary key
+    if column == model._meta.pk.column:
+        candidates = [
+            f'{other.__name__}.{field.name}'
+            for other in apps.get_models()
+            for field in other._meta.concrete_fields
+            if field.is_relation and field.related_model is model
+        ]
+        if candidates:
+            names = sorted({candidate.split('.', 1)[1] for candidate in candidates})
+            return (
+                f"select_related({', '.join(repr(name) for name in names)}) "
+                f"for {', '.join(sorted(candidates))}"
+            )
+    return ''
+
+
+def in_scope(request):
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return False
+    module = getattr(match.func, '__module__', '') or ''
+    return module.startswith(tuple(getattr(settings, 'NPLUSONE_SCOPE', ('apps.',))))
+
+
+def is_ignored(view_name, problem):
+    ignored = getattr(settings, 'NPLUSONE_IGNORE', ())
+    return view_name in ignored or f'{view_name}:{problem.fingerprint}' in ignored
+
+
+def report(request, problems):
+    """Log or raise for the N+1s found while handling ``request``"""
+    mode = getattr(settings, 'NPLUSONE_DETECTION', 'off')
+    view_name = request.resolver_match.view_name
+    problems = [problem for problem in problems if not is_ignored(view_name, problem)]
+    if not problems:
+        return
+    lines = '\n'.join(f'  - {problem}' for problem in problems)
+    message = f'N+1 queries in {request.method} {request.path} ({view_name}):\n{lines}'
+    if mode == 'raise':
+        raise NPlusOneError(message)
+    logger.warning(message)
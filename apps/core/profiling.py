@@ -0,0 +1,200 @@
+"""
+On-demand sampling profiler for single requests.
+
+Staff ask for a profile from the custom admin, which signs the user and path
+into a short-lived token. The request carrying that token (as the
+``_profile`` query parameter or ``X-Profile-Token`` header) is profiled by
+``ProfilerMiddleware``: a background thread samples the request thread's
+stack every ``PROFILER_INTERVAL_MS``, and the result is stored as a
+``ProfileRun`` holding collapsed stacks (the input format of flamegraph.pl
+and speedscope) and the top functions by self and total samples. Memory
+runs trace the request with tracemalloc instead (see apps.core.memory) and
+store its peak heap growth and top allocation sites.
+
+Sampling rather than cProfile keeps the profiled request close to its real
+speed. Overhead is bounded by running one profile per process at a time,
+``PROFILER_MAX_RUNS_PER_HOUR`` across the site and a ``PROFILER_MAX_SECONDS``
+cap on each run.
+"""
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core import signing
+from django.utils import timezone
+
+
+QUERY_PARAM = '_profile'
+HEADER = 'HTTP_X_PROFILE_TOKEN'
+TOKEN_SALT = 'apps.core.profiling'
+MODES = ('cpu', 'memory')
+
+_process_lock = threading.Lock()
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def make_token(user, path, mode='cpu'):
+    """A signed token letting ``user`` profile one request to ``path``"""
+    return signing.dumps({'u': user.pk, 'p': path, 'm': mode}, salt=TOKEN_SALT)
+
+
+def token_from_request(request):
+    return request.GET.get(QUERY_PARAM) or request.META.get(HEADER)
+
+
+def token_mode(token, request):
+    """
+    The profiling mode a token grants for this request, or None. Checks the
+    signature, age, path and that the staff user who asked is the one browsing.
+    """
+    try:
+        data = signing.loads(token, salt=TOKEN_SALT, max_age=_setting('PROFILER_TOKEN_MAX_AGE', 600))
+    except signing.BadSignature:
+        return None
+    user = getattr(request, 'user', None)
+    if (
+        data.get('p') == request.path
+        and user is not None and user.is_authenticated and user.is_staff
+        and data.get('u') == user.pk
+        and data.get('m', 'cpu') in MODES
+    ):
+        return data.get('m', 'cpu')
+    return None
+
+
+def acquire_slot():
+    """Reserve a profiling slot, or return False when the budget is used up"""
+    from django.core.cache import cache
+
+    if not _process_lock.acquire(blocking=False):
+        return False
+    key = f"profiler:runs:{timezone.now():%Y%m%d%H}"
+    cache.add(key, 0, 60 * 60)
+    try:
+        runs = cache.incr(key)
+    except ValueError:
+        runs = 1
+    if runs > _setting('PROFILER_MAX_RUNS_PER_HOUR', 20):
+        _process_lock.release()
+        return False
+    return True
+
+
+def release_slot():
+    _process_lock.release()
+
+
+def frame_label(code):
+    """``qualname (file:line)`` with project paths relative to BASE_DIR"""
+    filename = code.co_filename
+    base_dir = str(settings.BASE_DIR) + os.sep
+    if filename.startswith(base_dir):
+        filename = filename[len(base_dir):]
+    elif 'site-packages' + os.sep in filename:
+        filename = filename.split('site-packages' + os.sep, 1)[1]
+    else:
+        filename = os.path.basename(filename)
+    # ';' separates frames in the collapsed format
+    return f'{code.co_qualname} ({filename}:{code.co_firstlineno})'.replace(';', ':')
+
+
+class SamplingProfiler:
+    """Sample one thread's Python stack from a background thread"""
+
+    def __init__(self, interval=0.005, max_seconds=30.0):
+        self.interval = interval
+        self.max_seconds = max_seconds
+        self.stacks = Counter()
+        self.samples = 0
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._labels = {}
+
+    def __enter__(self):
+        self._thread_id = threading.get_ident()
+        # Frames at or above the caller are the same for every sample
+        self._root = sys._getframe(1)
+        self._started = time.perf_counter()
+        self._sampler = threading.Thread(target=self._run, name='request-profiler', daemon=True)
+        self._sampler.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._sampler.join()
+        self.duration = time.perf_counter() - self._started
+
+    def _label(self, code):
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = frame_label(code)
+        return label
+
+    def _run(self):
+        deadline = time.perf_counter() + self.max_seconds
+        while not self._stop.wait(self.interval) and time.perf_counter() < deadline:
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None and frame is not self._root:
+                stack.append(self._label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.stacks[tuple(reversed(stack))] += 1
+                self.samples += 1
+
+    def collapsed(self):
+        """Collapsed stacks, one ``root;...;leaf count`` line per distinct stack"""
+        return '\n'.join(f"{';'.join(stack)} {count}" for stack, count in self.stacks.most_common())
+
+    def top_functions(self, limit=30):
+        """Functions by samples spent in them (self) and under them (total)"""
+        own, total = Counter(), Counter()
+        for stack, count in self.stacks.items():
+            own[stack[-1]] += count
+            for label in set(stack):
+                total[label] += count
+        return [
+            {'function': label, 'self': own[label], 'total': count}
+            for label, count in sorted(total.items(), key=lambda item: (-own[item[0]], -item[1]))[:limit]
+        ]
+
+
+def flame_rows(collapsed, min_percent=0.5):
+    """
+    Lay collapsed stacks out as flame graph rows of
+    ``{'name', 'left', 'width', 'samples'}`` boxes, widths in percent.
+    """
+    tree = {'children': {}, 'samples': 0}
+    for line in collapsed.splitlines():
+        stack, _, count = line.rpartition(' ')
+        if not stack or not count.isdigit():
+            continue
+        node = tree
+        node['samples'] += int(count)
+        for name in stack.split(';'):
+            node = node['children'].setdefault(name, {'children': {}, 'samples': 0})
+            node['samples'] += int(count)
+
+    rows = []
+    total = tree['samples']
+    if not total:
+        return rows
+
+    def walk(node, depth, left):
+        for name, child in sorted(node['children'].items()):
+            width = child['samples'] * 100 / total
+            if width >= min_percent:
+                if len(rows) <= depth:
+                    rows.append([])
+                rows[depth].append({'name': name, 'left': left, 'width': width, 'samples': child['samples']})
+                walk(child, depth + 1, left)
+            left += width
+
+    walk(tree, 0, 0.0)
+    return rows
@@ -0,0 +1,49 @@
+"""
+pytest plugin for N+1 query detection (see apps.core.nplusone).
+
+Load it with ``-p apps.core.pytest_plugin`` or ``pytest_plugins`` in a
+conftest, then run CI with ``--nplusone=raise`` so any view under apps/
+that repeats a query per row fails the test that requested it. The
+``assert_no_nplusone`` fixture checks code that runs outside a request:
+
+    def test_export_rows(assert_no_nplusone):
+        with assert_no_nplusone():
+            list(export_rows(Booking.objects.all()))
+"""
+from contextlib import contextmanager
+
+import pytest
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('nplusone', 'N+1 query detection')
+    group.addoption(
+        '--nplusone',
+        choices=['off', 'log', 'raise'],
+        default=None,
+        help='Override NPLUSONE_DETECTION for the test run ("raise" fails tests that hit an N+1).',
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    mode = config.getoption('nplusone')
+    if mode:
+        from django.conf import settings
+        settings.NPLUSONE_DETECTION = mode
+
+
+@pytest.fixture
+def assert_no_nplusone():
+    """Context manager failing the test if the block runs an N+1"""
+    from apps.core.nplusone import record_queries
+
+    @contextmanager
+    def check(threshold=None):
+        with record_queries() as recorder:
+            yield recorder
+        problems = recorder.problems(threshold)
+        if problems:
+            pytest.fail('N+1 queries:\n' + '\n'.join(f'  - {problem}' for problem in problems))
+
+    return check
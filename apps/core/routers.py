@@ -0,0 +1,101 @@
+"""
+Primary/replica database routing.
+
+Writes always go to the ``default`` (primary) database. Reads stay on the
+primary too unless a view or command opts in with ``use_replica`` — the admin
+dashboard, list statistics and exports do, since they run heavy read-only
+queries that should not compete with public booking and inquiry inserts.
+
+Read-after-write consistency: once a request writes, its remaining reads are
+pinned to the primary, and DatabaseRoutingMiddleware keeps the user's next
+requests on the primary for REPLICA_STICKY_SECONDS so they never see a stale
+replica.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+
+
+PRIMARY_ALIAS = 'default'
+REPLICA_ALIAS = 'replica'
+
+# Writes to these apps are bookkeeping (session saves, the database cache)
+# and should not make a user sticky to the primary.
+IGNORED_WRITE_APPS = {'sessions', 'django_cache'}
+
+_replica_reads = ContextVar('replica_reads', default=False)
+
+# Per-request write tracking state, set by track_writes(); None outside a request
+_write_state = ContextVar('write_state', default=None)
+
+
+def replica_configured():
+    """Return True if a replica alias is configured"""
+    return REPLICA_ALIAS in settings.DATABASES
+
+
+def get_read_alias():
+    """Alias reads should use in the current context"""
+    state = _write_state.get()
+    pinned = state is not None and state['pinned']
+    if _replica_reads.get() and not pinned and replica_configured():
+        return REPLICA_ALIAS
+    return PRIMARY_ALIAS
+
+
+@contextmanager
+def replica_reads():
+    """Route reads inside the block to the replica"""
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def use_replica(view_func):
+    """View decorator sending the view's read queries to the replica"""
+    @wraps(view_func)
+    def _wrapped_view(*args, **kwargs):
+        with replica_reads():
+            return view_func(*args, **kwargs)
+    return _wrapped_view
+
+
+@contextmanager
+def track_writes(pinned=False):
+    """
+    Track whether the block writes to the primary.
+
+    Yields a callable returning True once a write has been routed.
+    """
+    state = {'wrote': False, 'pinned': pinned}
+    token = _write_state.set(state)
+    try:
+        yield lambda: state['wrote']
+    finally:
+        _write_state.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """Database router for a single primary and an optional read replica"""
+
+    def db_for_read(self, model, **hints):
+        return get_read_alias()
+
+    def db_for_write(self, model, **hints):
+        state = _write_state.get()
+        if state is not None and model._meta.app_label not in IGNORED_WRITE_APPS:
+            state['wrote'] = True
+            state['pinned'] = True
+        return PRIMARY_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica is a copy of the primary and is never migrated directly
+        return db == PRIMARY_ALIAS
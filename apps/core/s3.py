@@ -0,0 +1,149 @@
+"""
+S3-compatible media storage, used when ``USE_S3`` is set.
+
+Uploads, product photos and quotation PDFs then live in one bucket
+(DigitalOcean Spaces in production) that every app server shares, instead
+of each server's ``MEDIA_ROOT``. ``MediaStorage`` holds public uploads and
+``ContentAddressedMediaStorage`` the deduplicated images (see
+apps.core.storage). ``PrivateMediaStorage`` keeps private ones under
+``private/`` with a private ACL, and apps.core.media redirects permitted
+requests to a short-lived signed URL for them.
+
+Large files go up as multipart uploads with ``AWS_S3_MAX_CONCURRENCY``
+parts in flight at once, each ``AWS_S3_MULTIPART_CHUNKSIZE`` bytes, once a
+file reaches ``AWS_S3_MULTIPART_THRESHOLD``.
+
+Rendering a page must not wait on the bucket. The storage keeps an
+existence map in the ``MEDIA_STORAGE_CACHE`` cache, name -> size or
+``None`` for a missing object, written on every save and delete, so
+``exists`` and ``size`` only send a HEAD request for a name the map has
+never seen. URLs are built locally and remembered per process, signed
+ones for half their lifetime so a URL handed out is still good for at
+least the other half.
+"""
+import time
+
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.core.cache import caches
+from storages.backends.s3 import S3Storage
+from storages.utils import clean_name
+
+from .storage import ContentAddressedMixin
+
+
+CACHE_PREFIX = 's3-media'
+
+# Bounds the per-process URL map
+MAX_CACHED_URLS = 10000
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+class MediaStorage(S3Storage):
+    """Public uploads in the shared bucket, without per-request round trips"""
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('transfer_config', TransferConfig(
+            multipart_threshold=_setting('AWS_S3_MULTIPART_THRESHOLD', 8 * 1024 * 1024),
+            multipart_chunksize=_setting('AWS_S3_MULTIPART_CHUNKSIZE', 8 * 1024 * 1024),
+            max_concurrency=_setting('AWS_S3_MAX_CONCURRENCY', 8),
+            use_threads=True,
+        ))
+        super().__init__(**kwargs)
+        self._urls = {}
+
+    @property
+    def cache(self):
+        return caches[_setting('MEDIA_STORAGE_CACHE', 'default')]
+
+    def _cache_key(self, name):
+        return f'{CACHE_PREFIX}:{self.bucket_name}:{self._normalize_name(clean_name(name))}'
+
+    def _remember(self, name, size):
+        self.cache.set(self._cache_key(name), size, _setting('MEDIA_STORAGE_CACHE_TTL', 7 * 24 * 60 * 60))
+
+    def _save(self, name, content):
+        name = super()._save(name, content)
+        self._remember(name, content.size)
+        return name
+
+    def delete(self, name):
+        super().delete(name)
+        self._remember(name, None)
+        self._urls.pop(name, None)
+
+    def _lookup(self, name):
+        """Size of ``name``, or None when it does not exist; from the map when it knows the name"""
+        key = self._cache_key(name)
+        size = self.cache.get(key, -1)
+        if size == -1:
+            try:
+                head = self.connection.meta.client.head_object(
+                    Bucket=self.bucket_name, Key=self._normalize_name(clean_name(name))
+                )
+                size = head['ContentLength']
+            except ClientError as err:
+                if err.response['ResponseMetadata']['HTTPStatusCode'] != 404:
+                    raise
+                size = None
+            self._remember(name, size)
+        return size
+
+    def exists(self, name):
+        return self._lookup(name) is not None
+
+    def size(self, name):
+        size = self._lookup(name)
+        if size is None:
+            raise FileNotFoundError(f'File does not exist: {name}')
+        return size
+
+    def url(self, name, parameters=None, expire=None, http_method=None):
+        if parameters or expire or http_method:
+            return super().url(name, parameters, expire, http_method)
+
+        cached = self._urls.get(name)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+        url = super().url(name)
+        lifetime = self.querystring_expire / 2 if self.querystring_auth else float('inf')
+        if len(self._urls) >= MAX_CACHED_URLS:
+            self._urls.clear()
+        self._urls[name] = (url, time.monotonic() + lifetime)
+        return url
+
+
+class ContentAddressedMediaStorage(ContentAddressedMixin, MediaStorage):
+    """Deduplicated public uploads in the shared bucket"""
+
+    def touch(self, name):
+        # S3 has no utime; copying the object onto itself with its metadata
+        # replaced is what moves LastModified
+        key = self._normalize_name(clean_name(name))
+        self.connection.meta.client.copy_object(
+            Bucket=self.bucket_name,
+            Key=key,
+            CopySource={'Bucket': self.bucket_name, 'Key': key},
+            MetadataDirective='REPLACE',
+            **self._get_write_parameters(name),
+        )
+
+
+class PrivateMediaStorage(MediaStorage):
+    """Private uploads, only reachable through signed URLs handed out by apps.core.media"""
+
+    location = 'private'
+    default_acl = 'private'
+    querystring_auth = True
+
+    # Signed URLs go to the bucket itself, not the public media domain
+    custom_domain = None
+
+    def get_default_settings(self):
+        defaults = super().get_default_settings()
+        defaults['querystring_expire'] = _setting('PRIVATE_MEDIA_URL_EXPIRE', 5 * 60)
+        return defaults
@@ -0,0 +1,460 @@
+"""
+Deterministic scale-data generation for load testing.
+
+Generates production-sized volumes of clients, bookings, inquiries,
+quotations, chat sessions and chat messages with realistic distributions
+(repeat customers, popular services, Nairobi-heavy counties, status by age,
+recent-skewed dates) and inserts them with ``bulk_create``.
+
+Rows are generated in fixed-size units, each with its own
+``random.Random`` seeded from ``(seed, kind, unit)``, so the same seed
+always produces the same data regardless of batch size or worker count.
+With ``workers`` > 0 the units are generated in a process pool while the
+main process inserts the previous ones.
+
+All generated rows carry a marker (the ``scale.example.com`` email domain or
+the ``scale-`` session prefix) so ``seeded_querysets()`` can find and remove
+them again.
+"""
+import random
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.db import connections, transaction
+from django.db.models import Count, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.leads.models import Booking, ChatMessage, ChatSession, Client, Inquiry, Quotation
+
+
+SEED_EMAIL_DOMAIN = 'scale.example.com'
+SEED_SESSION_PREFIX = 'scale-'
+
+# Rows per generation unit; fixed so output does not depend on batch size
+UNIT_SIZE = 5000
+
+DEFAULT_VOLUMES = {
+    'clients': 200_000,
+    'bookings': 1_000_000,
+    'inquiries': 300_000,
+    'quotations': 100_000,
+    'chat_sessions': 200_000,
+    'chat_messages': 2_000_000,
+}
+
+# Insert order; later kinds reference earlier ones
+SEED_ORDER = ['clients', 'bookings', 'inquiries', 'quotations', 'chat_sessions', 'chat_messages']
+
+# Kinds whose rows point at rows of another kind seeded in the same run
+PARENT_KINDS = {
+    'bookings': 'clients',
+    'inquiries': 'clients',
+    'quotations': 'clients',
+    'chat_messages': 'chat_sessions',
+}
+
+FIRST_NAMES = [
+    'James', 'Mary', 'John', 'Grace', 'Peter', 'Faith', 'David', 'Mercy', 'Joseph', 'Esther',
+    'Daniel', 'Ann', 'Samuel', 'Joyce', 'Brian', 'Lucy', 'Kevin', 'Janet', 'Dennis', 'Caroline',
+    'Paul', 'Nancy', 'George', 'Alice', 'Stephen', 'Susan', 'Michael', 'Rose', 'Francis', 'Sarah',
+]
+LAST_NAMES = [
+    'Kamau', 'Otieno', 'Wanjiku', 'Mwangi', 'Odhiambo', 'Njoroge', 'Kiprop', 'Achieng', 'Mutua',
+    'Wambui', 'Ochieng', 'Kariuki', 'Chebet', 'Omondi', 'Njeri', 'Kimani', 'Wafula', 'Atieno',
+    'Maina', 'Korir', 'Nyambura', 'Onyango', 'Mutiso', 'Jeptoo', 'Gitau',
+]
+COMPANY_SUFFIXES = ['Ltd', 'Enterprises', 'Holdings', 'Supermarket', 'Hotel', 'Hospital', 'Foods']
+INDUSTRIES = ['Hospitality', 'Retail', 'Healthcare', 'Manufacturing', 'Food Processing', 'Technology']
+
+# (county, city, weight)
+COUNTIES = [
+    ('Nairobi', 'Nairobi', 40), ('Mombasa', 'Mombasa', 14), ('Kiambu', 'Thika', 10),
+    ('Nakuru', 'Nakuru', 8), ('Kisumu', 'Kisumu', 7), ('Machakos', 'Machakos', 5),
+    ('Kajiado', 'Kitengela', 5), ('Uasin Gishu', 'Eldoret', 4), ('Kilifi', 'Malindi', 3),
+    ('Nyeri', 'Nyeri', 2), ('Meru', 'Meru', 2),
+]
+COUNTY_WEIGHTS = [weight for _, _, weight in COUNTIES]
+
+CHAT_LINES = {
+    'user': [
+        'Hello, I need help with my AC unit.',
+        'How much does installation cost?',
+        'Can a technician come tomorrow?',
+        'My cold room is not cooling properly.',
+        'Do you service commercial kitchens?',
+    ],
+    'bot': [
+        'Thanks for reaching out! An agent will be with you shortly.',
+        'You can book a service directly from our booking page.',
+    ],
+    'agent': [
+        'Hi, thanks for contacting Global Cool-Light. How can we help?',
+        'We can schedule a technician visit this week.',
+        'I have sent you a quotation by email.',
+    ],
+}
+
+
+def weighted(rng, choices, weights):
+    return rng.choices(choices, weights)[0]
+
+
+def person(index):
+    """Deterministic name and email for the ``index``-th seeded client"""
+    first = FIRST_NAMES[index % len(FIRST_NAMES)]
+    last = LAST_NAMES[(index // len(FIRST_NAMES)) % len(LAST_NAMES)]
+    return f'{first} {last}', f'{first}.{last}.{index}@{SEED_EMAIL_DOMAIN}'.lower()
+
+
+def phone_number(rng):
+    return f'+2547{rng.randrange(10**8):08d}'
+
+
+class SeedContext:
+    """Picklable state shared with generator workers"""
+
+    def __init__(self, seed, anchor, history_days, service_ids, staff_ids):
+        self.seed = seed
+        self.anchor = anchor
+        self.history_days = history_days
+        self.service_ids = service_ids
+        # Popular services get most of the traffic (Zipf-like)
+        self.service_weights = [1 / (rank + 1) for rank in range(len(service_ids))]
+        self.staff_ids = staff_ids or [None]
+        self.client_ids = []
+        self.inquiry_ids = []
+        self.session_ids = []
+
+    def rng(self, kind, unit):
+        return random.Random(f'{self.seed}:{kind}:{unit}')
+
+    def created_at(self, rng):
+        # Skewed towards recent dates, like a growing business
+        days_ago = self.history_days * (1 - rng.random() ** 0.5)
+        return self.anchor - timedelta(days=days_ago, seconds=rng.randrange(86400))
+
+    def pick_client(self, rng):
+        # A minority of clients account for most repeat business
+        return self.client_ids[int(len(self.client_ids) * rng.random() ** 2)]
+
+
+def generate_clients(ctx, start, stop):
+    rng = ctx.rng('clients', start)
+    clients = []
+    for index in range(start, stop):
+        name, email = person(index)
+        county, city, _ = weighted(rng, COUNTIES, COUNTY_WEIGHTS)
+        client_type = weighted(rng, ['individual', 'business', 'government', 'ngo'], [70, 24, 3, 3])
+        company_name = ''
+        if client_type != 'individual':
+            company_name = f'{name.split()[1]} {rng.choice(COMPANY_SUFFIXES)}'
+        created = ctx.created_at(rng)
+        clients.append(Client(
+            name=company_name or name,
+            client_type=client_type,
+            email=email,
+            phone=phone_number(rng),
+            address=f'{rng.randint(1, 400)} {city} Road',
+            city=city,
+            county=county,
+            company_name=company_name,
+            industry=rng.choice(INDUSTRIES) if company_name else '',
+            preferred_contact_method=weighted(rng, ['phone', 'email', 'whatsapp'], [50, 20, 30]),
+            created_at=created,
+            updated_at=created,
+        ))
+    return clients
+
+
+def generate_bookings(ctx, start, stop):
+    rng = ctx.rng('bookings', start)
+    today = ctx.anchor.date()
+    bookings = []
+    for _ in range(start, stop):
+        client_id, name, email, phone = ctx.pick_client(rng)
+        created = ctx.created_at(rng)
+        preferred_date = created.date() + timedelta(days=rng.randint(1, 21))
+        if preferred_date < today:
+            status = weighted(rng, ['completed', 'cancelled', 'rescheduled', 'in_progress'], [78, 14, 5, 3])
+        else:
+            status = weighted(rng, ['new', 'confirmed', 'rescheduled', 'cancelled'], [45, 40, 5, 10])
+        estimated = Decimal(rng.randrange(2500, 150000, 500))
+        bookings.append(Booking(
+            booking_id=uuid.UUID(int=rng.getrandbits(128), version=4),
+            service_id=weighted(rng, ctx.service_ids, ctx.service_weights),
+            client_id=client_id,
+            contact_name=name,
+            contact_email=email,
+            contact_phone=phone,
+            preferred_date=preferred_date,
+            preferred_time_slot=rng.choice([slot for slot, _ in Booking.TIME_SLOTS]),
+            location_address=f'{rng.randint(1, 400)} Ngong Road',
+            status=status,
+            priority=weighted(rng, ['low', 'normal', 'high', 'urgent'], [15, 60, 20, 5]),
+            source=weighted(rng, [s for s, _ in Booking.SOURCE_CHOICES], [55, 20, 8, 10, 5, 2]),
+            assigned_technician_id=rng.choice(ctx.staff_ids) if status != 'new' else None,
+            estimated_cost=estimated,
+            actual_cost=estimated if status == 'completed' else None,
+            created_at=created,
+            updated_at=created,
+        ))
+    return bookings
+
+
+def generate_inquiries(ctx, start, stop):
+    rng = ctx.rng('inquiries', start)
+    inquiries = []
+    for index in range(start, stop):
+        if rng.random() < 0.7:
+            client_id, name, email, phone = ctx.pick_client(rng)
+        else:
+            # Prospects who are not clients yet
+            client_id = None
+            name, email = person(10_000_000 + index)
+            phone = phone_number(rng)
+        service_id = weighted(rng, ctx.service_ids, ctx.service_weights) if rng.random() < 0.8 else None
+        created = ctx.created_at(rng)
+        inquiries.append(Inquiry(
+            inquiry_id=uuid.UUID(int=rng.getrandbits(128), version=4),
+            client_id=client_id,
+            service_id=service_id,
+            contact_name=name,
+            contact_email=email,
+            contact_phone=phone,
+            subject='Request for quotation' if service_id else 'General inquiry',
+            message='Please share pricing and availability for our premises.',
+            budget_range=rng.choice(['', 'Under 50,000', '50,000 - 200,000', 'Over 200,000']),
+            timeline=rng.choice(['', 'This week', 'This month', 'Flexible']),
+            status=weighted(rng, ['new', 'in_review', 'quoted', 'converted', 'closed'], [15, 15, 30, 20, 20]),
+            priority=weighted(rng, ['low', 'normal', 'high', 'urgent'], [15, 60, 20, 5]),
+            created_at=created,
+            updated_at=created,
+        ))
+    return inquiries
+
+
+def generate_quotations(ctx, start, stop):
+    rng = ctx.rng('quotations', start)
+    quotations = []
+    for index in range(start, stop):
+        client_id = ctx.pick_client(rng)[0]
+        inquiry_id = rng.choice(ctx.inquiry_ids) if ctx.inquiry_ids and rng.random() < 0.6 else None
+        quantity = rng.randint(1, 5)
+        unit_price = Decimal(rng.randrange(5000, 120000, 500))
+        subtotal = unit_price * quantity
+        tax_amount = subtotal * Decimal('0.16')
+        created = ctx.created_at(rng)
+        status = weighted(rng, ['draft', 'sent', 'viewed', 'accepted', 'rejected', 'expired'], [10, 25, 15, 25, 15, 10])
+        sent_at = created + timedelta(hours=rng.randint(1, 48)) if status != 'draft' else None
+        quotations.append(Quotation(
+            quote_number=f'QS-{index:09d}',
+            inquiry_id=inquiry_id,
+            client_id=client_id,
+            title='HVAC service quotation',
+            items=[{
+                'description': 'HVAC service',
+                'quantity': quantity,
+                'unit_price': str(unit_price),
+                'total': str(subtotal),
+            }],
+            subtotal=subtotal,
+            tax_amount=tax_amount,
+            total=subtotal + tax_amount,
+            valid_until=created.date() + timedelta(days=30),
+            status=status,
+            sent_at=sent_at,
+            decided_at=sent_at + timedelta(days=rng.randint(1, 14)) if status in ('accepted', 'rejected') else None,
+            created_at=created,
+            updated_at=created,
+        ))
+    return quotations
+
+
+def generate_chat_sessions(ctx, start, stop):
+    rng = ctx.rng('chat_sessions', start)
+    sessions = []
+    for index in range(start, stop):
+        created = ctx.created_at(rng)
+        identified = rng.random() < 0.4
+        name, email = person(20_000_000 + index) if identified else ('', '')
+        is_active = (ctx.anchor - created).days < 7
+        sessions.append(ChatSession(
+            session_id=f'{SEED_SESSION_PREFIX}{index:09d}',
+            name=name,
+            email=email,
+            phone=phone_number(rng) if identified else '',
+            is_active=is_active,
+            status='active' if is_active else weighted(rng, ['closed', 'archived'], [70, 30]),
+            created_at=created,
+            updated_at=created,
+        ))
+    return sessions
+
+
+def generate_chat_messages(ctx, start, stop):
+    rng = ctx.rng('chat_messages', start)
+    messages = []
+    count = stop - start
+    while len(messages) < count:
+        # Conversations of a few to a few dozen messages
+        session_id, session_created = rng.choice(ctx.session_ids)
+        timestamp = session_created
+        for position in range(min(rng.randint(2, 30), count - len(messages))):
+            message_type = 'user' if position % 2 == 0 else weighted(rng, ['agent', 'bot'], [80, 20])
+            timestamp += timedelta(seconds=rng.randint(5, 600))
+            messages.append(ChatMessage(
+                session_id=session_id,
+                message_type=message_type,
+                content=rng.choice(CHAT_LINES[message_type]),
+                timestamp=timestamp,
+                is_read=message_type != 'user' or rng.random() < 0.9,
+            ))
+    return messages
+
+
+GENERATORS = {
+    'clients': (Client, generate_clients),
+    'bookings': (Booking, generate_bookings),
+    'inquiries': (Inquiry, generate_inquiries),
+    'quotations': (Quotation, generate_quotations),
+    'chat_sessions': (ChatSession, generate_chat_sessions),
+    'chat_messages': (ChatMessage, generate_chat_messages),
+}
+
+
+def seeded_querysets():
+    """Querysets matching previously seeded rows, children before parents"""
+    return [
+        ChatMessage.objects.filter(session__session_id__startswith=SEED_SESSION_PREFIX),
+        ChatSession.objects.filter(session_id__startswith=SEED_SESSION_PREFIX),
+        Quotation.objects.filter(client__email__endswith=f'@{SEED_EMAIL_DOMAIN}'),
+        Inquiry.objects.filter(contact_email__endswith=f'@{SEED_EMAIL_DOMAIN}'),
+        Booking.objects.filter(contact_email__endswith=f'@{SEED_EMAIL_DOMAIN}'),
+        Client.objects.filter(email__endswith=f'@{SEED_EMAIL_DOMAIN}'),
+    ]
+
+
+@contextmanager
+def historic_timestamps(models):
+    """Let bulk_create keep generated created_at/updated_at values"""
+    toggled = []
+    for model in models:
+        for field in model._meta.concrete_fields:
+            for attr in ('auto_now', 'auto_now_add'):
+                if getattr(field, attr, False):
+                    setattr(field, attr, False)
+                    toggled.append((field, attr))
+    try:
+        yield
+    finally:
+        for field, attr in toggled:
+            setattr(field, attr, True)
+
+
+_worker_context = None
+
+
+def _init_worker(ctx):
+    global _worker_context
+    import django
+    django.setup()
+    _worker_context = ctx
+
+
+def _generate_unit(kind, start, stop):
+    return GENERATORS[kind][1](_worker_context, start, stop)
+
+
+def _units(total):
+    return [(start, min(start + UNIT_SIZE, total)) for start in range(0, total, UNIT_SIZE)]
+
+
+def _generate(ctx, kind, total, workers):
+    """Yield generated units in order, from a process pool if ``workers``"""
+    units = _units(total)
+    if not workers:
+        for start, stop in units:
+            yield GENERATORS[kind][1](ctx, start, stop)
+        return
+
+    # Forked workers must not reuse the parent's database connections
+    connections.close_all()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(ctx,)) as pool:
+        pending = []
+        for start, stop in units:
+            pending.append(pool.submit(_generate_unit, kind, start, stop))
+            # Keep a bounded number of units in flight
+            if len(pending) >= workers * 2:
+                yield pending.pop(0).result()
+        for future in pending:
+            yield future.result()
+
+
+def _load_references(ctx, kind):
+    """Load the ids later kinds refer to, once their rows exist"""
+    if kind == 'clients':
+        # Contacts use the person's name even for business clients
+        ctx.client_ids = [
+            (pk, person(int(email.split('@')[0].rsplit('.', 1)[1]))[0], email, phone)
+            for pk, email, phone in
+            Client.objects.filter(email__endswith=f'@{SEED_EMAIL_DOMAIN}')
+            .order_by('pk').values_list('pk', 'email', 'phone')
+        ]
+    elif kind == 'inquiries':
+        ctx.inquiry_ids = list(
+            Inquiry.objects.filter(contact_email__endswith=f'@{SEED_EMAIL_DOMAIN}')
+            .order_by('pk').values_list('pk', flat=True)
+        )
+    elif kind == 'chat_sessions':
+        ctx.session_ids = list(
+            ChatSession.objects.filter(session_id__startswith=SEED_SESSION_PREFIX)
+            .order_by('pk').values_list('pk', 'created_at')
+        )
+
+
+def update_client_totals():
+    """Refresh the denormalized booking counters on seeded clients"""
+    bookings = Booking.objects.filter(client=OuterRef('pk')).order_by().values('client')
+    Client.objects.filter(email__endswith=f'@{SEED_EMAIL_DOMAIN}').update(
+        total_bookings=Coalesce(Subquery(bookings.annotate(n=Count('pk')).values('n')), 0),
+        total_spent=Coalesce(
+            Subquery(bookings.filter(status='completed').annotate(s=Sum('actual_cost')).values('s')),
+            Decimal('0'),
+        ),
+    )
+
+
+def seed_scale_data(volumes, seed=42, batch_size=2000, workers=0, anchor=None,
+                    history_days=3 * 365, service_ids=None, staff_ids=None, progress=None):
+    """
+    Generate and insert the requested ``volumes`` (kind -> row count).
+
+    ``progress`` is called after each unit with ``kind``, ``created`` and
+    ``total``. Returns the number of rows inserted per kind.
+    """
+    if anchor is None:
+        anchor = timezone.make_aware(datetime.combine(timezone.localdate(), time(12)))
+    ctx = SeedContext(seed, anchor, history_days, service_ids or [], staff_ids or [])
+    created = {}
+
+    with historic_timestamps(model for model, _ in GENERATORS.values()):
+        for kind in SEED_ORDER:
+            total = volumes.get(kind, 0)
+            if total:
+                model = GENERATORS[kind][0]
+                created[kind] = 0
+                for rows in _generate(ctx, kind, total, workers):
+                    with transaction.atomic():
+                        model.objects.bulk_create(rows, batch_size=batch_size)
+                    created[kind] += len(rows)
+                    if progress:
+                        progress({'kind': kind, 'created': created[kind], 'total': total})
+            _load_references(ctx, kind)
+
+    if created.get('bookings'):
+        update_client_totals()
+    return created
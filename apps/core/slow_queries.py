@@ -0,0 +1,206 @@
+"""
+Slow-query log with call-site capture.
+
+A database execute wrapper, attached to every connection as it is opened,
+records each query slower than ``SLOW_QUERY_THRESHOLD_MS`` and, when
+``SLOW_QUERY_SAMPLE_EVERY`` is set, every Nth query regardless of speed.
+A record holds the SQL, the shape of its parameters (types, never values),
+the duration, the view or management command that ran it, the request ID
+(see apps.core.tracing) and a trimmed stack of project frames ending at the
+ORM call site, e.g.
+``apps/users/views.py:812 in admin_customers_list``.
+
+Records are kept in an in-process ring buffer and appended as JSON lines to
+``SLOW_QUERY_LOG_FILE``, one rotating file per worker (see apps.core.jsonl)
+that ``load_records()`` reads back together. ``top_offenders()`` groups them
+by a normalized SQL fingerprint for the staff page.
+"""
+import hashlib
+import itertools
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque
+
+from django.conf import settings
+from django.utils import timezone
+
+from . import instrumentation, jsonl, tracing
+
+
+STACK_DEPTH = 6
+MAX_SQL_LENGTH = 2000
+
+_buffer = deque(maxlen=getattr(settings, 'SLOW_QUERY_BUFFER_SIZE', 500))
+_query_counter = itertools.count(1)
+_log_lock = threading.Lock()
+_log = None
+
+# Wrappers between the ORM call site and the recorder
+_WRAPPER_FILES = {__file__, instrumentation.__file__, tracing.__file__}
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def fingerprint(sql):
+    """Normalize literals and placeholder lists so similar queries group together"""
+    normalized = re.sub(r"'(?:[^']|'')*'", '?', sql)
+    normalized = re.sub(r'\b\d+(?:\.\d+)?\b', '?', normalized)
+    normalized = normalized.replace('%s', '?')
+    normalized = re.sub(r'\(\s*\?(?:\s*,\s*\?)*\s*\)', '(...)', normalized)
+    normalized = re.sub(r'\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+', '(...)', normalized)
+    normalized = re.sub(r'\s+', ' ', normalized).strip()
+    return hashlib.sha1(normalized.encode()).hexdigest()[:12], normalized
+
+
+def params_shape(params, many):
+    """Describe parameters by type only, so no customer data is logged"""
+    if params is None:
+        return ''
+    if many:
+        params = list(params)
+        first = params_shape(params[0], False) if params else '()'
+        return f'{len(params)} x {first}'
+    if isinstance(params, dict):
+        return '{' + ', '.join(f'{key}: {type(value).__name__}' for key, value in params.items()) + '}'
+    return '(' + ', '.join(type(value).__name__ for value in params) + ')'
+
+
+def current_source():
+    """The view (or request path) or management command running the query"""
+    metrics = instrumentation.current_metrics()
+    if metrics is not None and metrics.source:
+        return metrics.source
+    if len(sys.argv) > 1 and os.path.basename(sys.argv[0]) in ('manage.py', 'django-admin'):
+        return f'manage.py {sys.argv[1]}'
+    return ''
+
+
+def call_stack(depth=STACK_DEPTH):
+    """Innermost project frames, skipping Django, libraries and our wrappers"""
+    base_dir = str(settings.BASE_DIR) + os.sep
+    frames = []
+    frame = sys._getframe(1)
+    while frame is not None and len(frames) < depth:
+        filename = frame.f_code.co_filename
+        if (filename.startswith(base_dir) and filename not in _WRAPPER_FILES
+                and 'site-packages' not in filename and not filename.startswith(sys.prefix)):
+            frames.append(
+                f'{os.path.relpath(filename, base_dir)}:{frame.f_lineno} in {frame.f_code.co_qualname}'
+            )
+        frame = frame.f_back
+    return frames
+
+
+def _log_file():
+    """This process's log file for the configured path, or None when disabled"""
+    global _log
+    path = _setting('SLOW_QUERY_LOG_FILE', '')
+    if not path:
+        return None
+    path = str(path)
+    with _log_lock:
+        if _log is None or _log.path != path:
+            if _log is not None:
+                _log.close()
+            _log = jsonl.JSONLFile(
+                path,
+                max_bytes=_setting('SLOW_QUERY_LOG_MAX_BYTES', 5 * 1024 * 1024),
+                backups=_setting('SLOW_QUERY_LOG_BACKUPS', 3),
+            )
+    return _log
+
+
+def record(sql, params, many, duration, alias, sampled):
+    fp, _ = fingerprint(sql)
+    entry = {
+        'time': timezone.now().isoformat(),
+        'fingerprint': fp,
+        'sql': sql[:MAX_SQL_LENGTH],
+        'params': params_shape(params, many),
+        'duration_ms': round(duration * 1000, 2),
+        'database': alias,
+        'source': current_source(),
+        'request_id': tracing.current_request_id() or '',
+        'stack': call_stack(),
+        'sampled': sampled,
+    }
+    _buffer.append(entry)
+    log = _log_file()
+    if log is not None:
+        log.write(entry)
+    return entry
+
+
+def log_slow_queries(execute, sql, params, many, context):
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - started
+        threshold = _setting('SLOW_QUERY_THRESHOLD_MS', 200)
+        every = _setting('SLOW_QUERY_SAMPLE_EVERY', 0)
+        sampled = bool(every) and next(_query_counter) % every == 0
+        if sampled or (threshold is not None and duration * 1000 >= threshold):
+            record(sql, params, many, duration, context['connection'].alias, sampled)
+
+
+def attach(sender, connection, **kwargs):
+    """connection_created receiver adding the wrapper once per connection"""
+    if not _setting('SLOW_QUERY_LOG', True):
+        return
+    # Outermost, and first in the list so execute_wrapper() context managers
+    # entered before the connection opened still pop their own wrapper
+    if log_slow_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, log_slow_queries)
+
+
+def recent_records():
+    """Records captured by this process, oldest first"""
+    return list(_buffer)
+
+
+def load_records(path=None, limit=10000):
+    """Records from every worker's log file and their rotated backups, newest last"""
+    path = str(path or _setting('SLOW_QUERY_LOG_FILE', ''))
+    if not path:
+        return []
+    return jsonl.read(path, limit)
+
+
+def top_offenders(records, limit=25):
+    """Group records by fingerprint, worst total time first"""
+    groups = {}
+    for entry in records:
+        group = groups.get(entry['fingerprint'])
+        if group is None:
+            group = groups[entry['fingerprint']] = {
+                'fingerprint': entry['fingerprint'],
+                'sql': fingerprint(entry['sql'])[1],
+                'count': 0,
+                'total_ms': 0.0,
+                'max_ms': 0.0,
+                'sources': {},
+                'call_sites': {},
+                'last_seen': entry['time'],
+            }
+        group['count'] += 1
+        group['total_ms'] += entry['duration_ms']
+        group['max_ms'] = max(group['max_ms'], entry['duration_ms'])
+        group['last_seen'] = max(group['last_seen'], entry['time'])
+        if entry['source']:
+            group['sources'][entry['source']] = group['sources'].get(entry['source'], 0) + 1
+        if entry['stack']:
+            site = entry['stack'][0]
+            group['call_sites'][site] = group['call_sites'].get(site, 0) + 1
+
+    offenders = sorted(groups.values(), key=lambda group: group['total_ms'], reverse=True)[:limit]
+    for group in offenders:
+        group['mean_ms'] = group['total_ms'] / group['count']
+        group['sources'] = sorted(group['sources'], key=group['sources'].get, reverse=True)[:3]
+        group['call_sites'] = sorted(group['call_sites'], key=group['call_sites'].get, reverse=True)[:3]
+    return offenders
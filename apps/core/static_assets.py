@@ -0,0 +1,100 @@
+"""
+What each page template ships.
+
+``template_assets()`` follows a template's ``{% extends %}`` and constant
+``{% include %}`` chain and collects the ``{% static %}`` files it links,
+plus scripts and stylesheets loaded from other hosts. ``asset_size()`` gives
+the bytes WhiteNoise sends for a file once collectstatic has run: raw, and
+gzip and brotli where its compressor keeps a precompressed copy (brotli only
+with the Brotli package installed).
+"""
+import re
+from functools import lru_cache
+
+from django.contrib.staticfiles import finders
+from django.template import engines
+from django.template.loader_tags import ExtendsNode, IncludeNode
+from django.templatetags.static import StaticNode
+from whitenoise.compress import Compressor, brotli_installed
+
+
+# Files on other hosts; bare origins are preconnect hints, not downloads
+_EXTERNAL = re.compile(
+    r'<(?:script[^>]*\bsrc|link[^>]*\bhref)=["\'](https?://[^/"\']+/[^"\']+)["\']', re.IGNORECASE
+)
+
+
+def _constant(filter_expression):
+    """The literal string of a template expression, or None for variables"""
+    value = getattr(filter_expression, 'var', None)
+    return value if isinstance(value, str) and not filter_expression.filters else None
+
+
+def template_assets(name, engine=None):
+    """``(static paths, external URLs)`` a template and its parents and includes load"""
+    engine = engine or engines['django']
+    static, external, seen = set(), set(), set()
+
+    def visit(template_name):
+        if template_name in seen:
+            return
+        seen.add(template_name)
+        template = engine.get_template(template_name).template
+        external.update(_EXTERNAL.findall(template.source))
+        for node in template.nodelist.get_nodes_by_type(StaticNode):
+            path = _constant(node.path)
+            if path:
+                static.add(path)
+        for node in template.nodelist.get_nodes_by_type(ExtendsNode):
+            parent = _constant(node.parent_name)
+            if parent:
+                visit(parent)
+        for node in template.nodelist.get_nodes_by_type(IncludeNode):
+            included = _constant(node.template)
+            if included:
+                visit(included)
+
+    visit(name)
+    return static, external
+
+
+@lru_cache(maxsize=None)
+def asset_size(path):
+    """``{'raw', 'gzip', 'brotli'}`` bytes sent for a static path, or None if it is missing"""
+    found = finders.find(path)
+    if not found:
+        return None
+    with open(found, 'rb') as f:
+        data = f.read()
+    size = {'raw': len(data), 'gzip': len(data), 'brotli': len(data) if brotli_installed else None}
+    compressor = Compressor(quiet=True)
+    if compressor.should_compress(found) and data:
+        # WhiteNoise only keeps a compressed copy that saves at least 5%
+        compressed = len(compressor.compress_gzip(data))
+        if compressed <= len(data) * 0.95:
+            size['gzip'] = compressed
+        if brotli_installed:
+            compressed = len(compressor.compress_brotli(data))
+            if compressed <= len(data) * 0.95:
+                size['brotli'] = compressed
+    return size
+
+
+def page_report(names, engine=None):
+    """Bytes shipped per template, largest first"""
+    rows = []
+    for name in names:
+        static, external = template_assets(name, engine)
+        row = {'template': name, 'assets': sorted(static), 'external': sorted(external),
+               'missing': [], 'raw': 0, 'gzip': 0, 'brotli': 0 if brotli_installed else None}
+        for path in row['assets']:
+            size = asset_size(path)
+            if size is None:
+                row['missing'].append(path)
+                continue
+            row['raw'] += size['raw']
+            row['gzip'] += size['gzip']
+            if brotli_installed:
+                row['brotli'] += size['brotli']
+        rows.append(row)
+    return sorted(rows, key=lambda row: row['gzip'], reverse=True)
@@ -0,0 +1,116 @@
+"""
+Storage backends.
+
+``StaticFilesStorage`` is the static files pipeline: collectstatic copies
+assets (minus ``STATICFILES_PRUNE``, see ``StaticFilesConfig``), renames each
+to include a hash of its content, records the names in staticfiles.json and
+writes gzip and, with the Brotli package installed, brotli copies next to
+them. WhiteNoise serves the hashed names with a ten-year
+``Cache-Control: public, immutable`` and the precompressed copy the browser
+accepts. collectstatic fails if a file in ``STATICFILES_REQUIRED`` (the
+layouts' bundles, built by ``npm run build``) was not found, rather than
+shipping pages without their CSS and JavaScript.
+
+``PrivateMediaStorage`` holds uploads that must not be public, such as
+quotation PDFs. It lives outside ``MEDIA_ROOT`` so nothing serves it
+directly; apps.core.media checks access and hands the file to the web
+server.
+
+``ContentAddressedStorage`` names each file after the SHA-256 of its bytes,
+in the directory ``upload_to`` picked: ``images/3f/3f2a...9c.jpg``. The
+same photo uploaded for a service, a product and a project is stored once
+and the rows share it; uploading bytes already stored only refreshes the
+file's modification time. Files are therefore never deleted along with a
+row; ``manage.py gc_media`` removes the ones nothing references any more.
+"""
+import hashlib
+import os
+import posixpath
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage, storages
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+
+class StaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """Hashed, precompressed static files that degrade to plain URLs"""
+
+    def stored_name(self, name):
+        # A template linking a file that was never collected (or a checkout
+        # where collectstatic has not run) should cost that one asset its
+        # cache busting, not the whole page a 500. WhiteNoise also probes
+        # names here to tell hashed files apart, so this stays quiet;
+        # static_report lists links to missing files.
+        try:
+            return super().stored_name(name)
+        except ValueError:
+            return name
+
+    def post_process(self, paths, dry_run=False, **options):
+        missing = [name for name in getattr(settings, 'STATICFILES_REQUIRED', ()) if name not in paths]
+        if missing and not dry_run:
+            raise ImproperlyConfigured(
+                f"Front-end bundles not built: {', '.join(missing)}. "
+                'Run `npm ci && npm run build` before collectstatic.'
+            )
+        yield from super().post_process(paths, dry_run, **options)
+
+
+class ContentAddressedMixin:
+    """Stores a file under the hash of its content, uploading bytes already stored only once"""
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+
+        digest = hashlib.sha256()
+        for chunk in content.chunks():
+            digest.update(chunk)
+        content.seek(0)
+
+        digest = digest.hexdigest()
+        directory = posixpath.dirname(name.replace('\\', '/'))
+        extension = os.path.splitext(name)[1].lower()
+        name = posixpath.join(directory, digest[:2], digest + extension)
+        if self.exists(name):
+            # gc_media keeps recently modified files, so a file that was an
+            # orphan until this upload is not collected under the new row
+            self.touch(name)
+            return name
+        return super().save(name, content, max_length)
+
+    def touch(self, name):
+        """Set the modification time of ``name`` to now"""
+        raise NotImplementedError('subclasses of ContentAddressedMixin must provide a touch() method')
+
+
+class ContentAddressedStorage(ContentAddressedMixin, FileSystemStorage):
+    """Deduplicated uploads in ``MEDIA_ROOT``"""
+
+    def touch(self, name):
+        os.utime(self.path(name))
+
+
+class PrivateMediaStorage(FileSystemStorage):
+    """Uploads only reachable through the protected media view"""
+
+    def __init__(self, location=None, base_url=None, **kwargs):
+        super().__init__(
+            location=location or settings.PRIVATE_MEDIA_ROOT,
+            base_url=base_url or settings.PRIVATE_MEDIA_URL,
+            **kwargs,
+        )
+
+
+def private_storage():
+    """The 'private' storage, for ``FileField(storage=private_storage)``"""
+    return storages['private']
+
+
+def image_storage():
+    """The 'images' storage, for ``ImageField(storage=image_storage)``"""
+    return storages['images']
@@ -0,0 +1,226 @@
+"""
+Reviewed SQL query budgets per named URL, used by test_query_budgets.
+
+Counts are for a GET by a logged-in superuser with a cold cache. Every view
+must run the same number of queries regardless of how many rows exist, so a
+budget is a ceiling for a constant, not an allowance for growth. Raising a
+budget should come with a reason in the review.
+
+Public pages include the user lookup PerformanceMiddleware makes for
+logged-in sessions to decide on the Server-Timing header. Dashboard widgets
+include the reads and writes of the database cache they are stored in.
+"""
+
+QUERY_BUDGETS = {
+    # Public pages
+    'core:about': 6,
+    'core:ajax_contact': 5,
+    'core:contact': 6,
+    'core:home': 6,
+    'core:metrics': 7,
+    'core:privacy': 6,
+    'core:protected_media': 5,
+    'core:sitemap': 6,
+    'core:terms': 6,
+    'core:test': 6,
+    # Services and products
+    'services:detail': 9,
+    'services:list': 11,
+    'services:product_detail': 12,
+    'services:products': 10,
+    # Portfolio
+    'portfolio:detail': 16,
+    'portfolio:list': 12,
+    # Blog
+    'blog:detail': 6,
+    'blog:list': 6,
+    # Bookings, inquiries and chat
+    'leads:booking_create': 7,
+    'leads:booking_create_service': 9,
+    'leads:booking_success': 9,
+    'leads:chat_history': 7,
+    'leads:chat_panel': 6,
+    'leads:chat_message': 5,
+    'leads:inquiry_create': 7,
+    'leads:inquiry_success': 6,
+    'leads:quote': 7,
+    # Admin portal
+    'users:admin_account_settings': 7,
+    'users:admin_booking_detail': 10,
+    'users:admin_bookings_export': 6,
+    'users:admin_bookings_list': 8,
+    'users:admin_customer_add': 6,
+    'users:admin_customer_delete': 10,
+    'users:admin_customer_edit': 7,
+    'users:admin_customer_view': 16,
+    'users:admin_customers_export': 6,
+    'users:admin_customers_list': 13,
+    'users:admin_dashboard': 6,
+    'users:admin_dashboard_widget[kpis]': 18,
+    'users:admin_dashboard_widget[monthly_trends]': 12,
+    'users:admin_dashboard_widget[portfolio]': 14,
+    'users:admin_dashboard_widget[quotations]': 13,
+    'users:admin_dashboard_widget[recent_bookings]': 12,
+    'users:admin_dashboard_widget[service_performance]': 12,
+    'users:admin_dashboard_widget[status_distribution]': 12,
+    'users:admin_email_templates': 7,
+    'users:admin_import_data': 6,
+    'users:admin_import_errors': 6,
+    'users:admin_inquiry_to_quotation': 7,
+    'users:admin_lead_detail': 10,
+    'users:admin_lead_respond': 5,
+    'users:admin_lead_status_update': 5,
+    'users:admin_leads_export': 6,
+    'users:admin_leads_list': 12,
+    'users:admin_login': 5,
+    'users:admin_portfolio_add': 7,
+    'users:admin_portfolio_delete': 11,
+    'users:admin_portfolio_detail': 13,
+    'users:admin_portfolio_edit': 10,
+    'users:admin_portfolio_list': 12,
+    'users:admin_portfolio_toggle_featured': 5,
+    'users:admin_portfolio_toggle_published': 5,
+    'users:admin_preferences': 7,
+    'users:admin_product_add': 7,
+    'users:admin_product_delete': 12,
+    'users:admin_product_edit': 9,
+    'users:admin_product_view': 10,
+    'users:admin_profile': 7,
+    'users:admin_profile_run_detail': 7,
+    'users:admin_traces': 6,
+    'users:admin_trace_detail': 5,
+    'users:admin_profile_runs': 8,
+    'users:admin_quotation_create': 8,
+    'users:admin_quotation_delete': 9,
+    'users:admin_quotation_detail': 10,
+    'users:admin_quotation_edit': 9,
+    'users:admin_quotation_send_email': 8,
+    'users:admin_quotation_status_update': 6,
+    'users:admin_quotations_export': 6,
+    'users:admin_quotations_list': 13,
+    'users:admin_security_settings': 7,
+    'users:admin_service_add': 7,
+    'users:admin_service_delete': 12,
+    'users:admin_service_edit': 9,
+    'users:admin_service_view': 10,
+    'users:admin_services_products': 22,
+    'users:admin_settings_general': 7,
+    'users:admin_signup': 5,
+    'users:admin_slow_queries': 6,
+    'users:admin_splashscreen': 5,
+    'users:admin_testimonial_add': 7,
+    'users:admin_user_add': 6,
+    'users:admin_user_delete': 6,
+    'users:admin_user_edit': 8,
+    'users:admin_user_management': 9,
+    'users:forgot_password': 5,
+    # Django admin
+    'admin:app_list[auth]': 6,
+    'admin:app_list[leads]': 6,
+    'admin:app_list[portfolio]': 6,
+    'admin:app_list[services]': 6,
+    'admin:app_list[sites]': 6,
+    'admin:app_list[users]': 6,
+    'admin:auth_group_add': 9,
+    'admin:auth_group_change': 11,
+    'admin:auth_group_changelist': 9,
+    'admin:auth_group_delete': 11,
+    'admin:auth_group_history': 8,
+    'admin:auth_user_add': 10,
+    'admin:auth_user_change': 15,
+    'admin:auth_user_changelist': 10,
+    'admin:auth_user_delete': 13,
+    'admin:auth_user_history': 8,
+    'admin:auth_user_password_change': 7,
+    'admin:autocomplete': 5,
+    'admin:index': 7,
+    'admin:jsi18n': 5,
+    'admin:leads_booking_add': 11,
+    'admin:leads_booking_change': 13,
+    'admin:leads_booking_changelist': 11,
+    'admin:leads_booking_delete': 10,
+    'admin:leads_booking_history': 9,
+    'admin:leads_chatmessage_add': 9,
+    'admin:leads_chatmessage_change': 10,
+    'admin:leads_chatmessage_changelist': 9,
+    'admin:leads_chatmessage_delete': 9,
+    'admin:leads_chatmessage_history': 8,
+    'admin:leads_chatsession_add': 10,
+    'admin:leads_chatsession_change': 12,
+    'admin:leads_chatsession_changelist': 9,
+    'admin:leads_chatsession_delete': 10,
+    'admin:leads_chatsession_history': 8,
+    'admin:leads_client_add': 8,
+    'admin:leads_client_change': 9,
+    'admin:leads_client_changelist': 9,
+    'admin:leads_client_delete': 15,
+    'admin:leads_client_history': 8,
+    'admin:leads_inquiry_add': 11,
+    'admin:leads_inquiry_change': 12,
+    'admin:leads_inquiry_changelist': 11,
+    'admin:leads_inquiry_delete': 11,
+    'admin:leads_inquiry_history': 8,
+    'admin:leads_quotation_add': 11,
+    'admin:leads_quotation_change': 13,
+    'admin:leads_quotation_changelist': 11,
+    'admin:leads_quotation_delete': 10,
+    'admin:leads_quotation_history': 9,
+    'admin:login': 5,
+    'admin:password_change': 6,
+    'admin:password_change_done': 6,
+    'admin:portfolio_project_add': 9,
+    'admin:portfolio_project_change': 14,
+    'admin:portfolio_project_changelist': 10,
+    'admin:portfolio_project_delete': 11,
+    'admin:portfolio_project_history': 8,
+    'admin:portfolio_projectimage_add': 9,
+    'admin:portfolio_projectimage_change': 11,
+    'admin:portfolio_projectimage_changelist': 9,
+    'admin:portfolio_projectimage_delete': 10,
+    'admin:portfolio_projectimage_history': 9,
+    'admin:portfolio_testimonial_add': 9,
+    'admin:portfolio_testimonial_change': 10,
+    'admin:portfolio_testimonial_changelist': 9,
+    'admin:portfolio_testimonial_delete': 9,
+    'admin:portfolio_testimonial_history': 8,
+    'admin:services_product_add': 9,
+    'admin:services_product_change': 13,
+    'admin:services_product_changelist': 10,
+    'admin:services_product_delete': 11,
+    'admin:services_product_history': 9,
+    'admin:services_productcategory_add': 8,
+    'admin:services_productcategory_change': 9,
+    'admin:services_productcategory_changelist': 9,
+    'admin:services_productcategory_delete': 11,
+    'admin:services_productcategory_history': 8,
+    'admin:services_service_add': 9,
+    'admin:services_service_change': 13,
+    'admin:services_service_changelist': 10,
+    'admin:services_service_delete': 13,
+    'admin:services_service_history': 9,
+    'admin:services_servicecategory_add': 8,
+    'admin:services_servicecategory_change': 9,
+    'admin:services_servicecategory_changelist': 9,
+    'admin:services_servicecategory_delete': 13,
+    'admin:services_servicecategory_history': 8,
+    'admin:sites_site_add': 8,
+    'admin:sites_site_change': 9,
+    'admin:sites_site_changelist': 9,
+    'admin:sites_site_delete': 9,
+    'admin:sites_site_history': 8,
+    'admin:users_userprofile_add': 9,
+    'admin:users_userprofile_change': 11,
+    'admin:users_userprofile_changelist': 10,
+    'admin:users_userprofile_delete': 10,
+    'admin:users_userprofile_history': 9,
+    # CKEditor uploads
+    'ckeditor_browse': 6,
+    'ckeditor_upload': 5,
+}
+
+# Named URLs that are not measured, with the reason
+SKIPPED_URLS = {
+    'admin:logout': 'logs the test client out',
+    'users:admin_logout': 'logs the test client out',
+    'admin:view_on_site': 'redirects to the object URL of any content type',
+}
@@ -0,0 +1,76 @@
+import io
+import json
+import os
+import tempfile
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from apps.core.benchmarks import compare, percentile
+from apps.leads.models import Booking, ChatSession
+from apps.services.models import Service, ServiceCategory
+
+
+class BenchmarkHttpTest(TestCase):
+    """Test cases for the HTTP benchmark command"""
+
+    def setUp(self):
+        category = ServiceCategory.objects.create(name='HVAC Services', slug='hvac-services')
+        Service.objects.create(name='AC Repair', slug='ac-repair', category=category, summary='Summary')
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.output = os.path.join(self.tmpdir.name, 'results.json')
+
+    def run_benchmark(self, *args):
+        out = io.StringIO()
+        call_command(
+            'benchmark_http', '--scenario', 'chat', '--scenario', 'booking',
+            '--iterations', '2', '--warmup', '0', *args, stdout=out, stderr=io.StringIO(),
+        )
+        return out.getvalue()
+
+    def test_reports_latency_and_queries_and_rolls_back(self):
+        """Test that results include percentiles and query counts and writes are undone"""
+        self.run_benchmark('--output', self.output)
+
+        with open(self.output) as f:
+            results = json.load(f)
+        step = results['steps']['chat.poll']
+        self.assertEqual(step['count'], 2)
+        self.assertEqual(step['errors'], 0)
+        self.assertGreater(step['queries'], 0)
+        self.assertLessEqual(step['p50_ms'], step['p99_ms'])
+        self.assertEqual(results['scenarios']['booking']['requests'], 4)
+        self.assertFalse(ChatSession.objects.exists())
+        self.assertFalse(Booking.objects.exists())
+
+    def test_fails_on_regression_against_baseline(self):
+        """Test that more queries per request than the baseline makes the command fail"""
+        self.run_benchmark('--output', self.output)
+        with open(self.output) as f:
+            baseline = json.load(f)
+        baseline['steps']['chat.poll']['queries'] -= 1
+        with open(self.output, 'w') as f:
+            json.dump(baseline, f)
+
+        with self.assertRaisesMessage(CommandError, 'regression'):
+            self.run_benchmark('--baseline', self.output)
+
+    def test_compare_ignores_noise_on_fast_steps(self):
+        """Test that p95 changes below the threshold or absolute floor are not regressions"""
+        baseline = {'steps': {'a': {'p95_ms': 1.0, 'queries': 3}, 'b': {'p95_ms': 100.0, 'queries': 3}},
+                    'scenarios': {'s': {'rps': 100.0}}}
+        results = {'steps': {'a': {'p95_ms': 2.5, 'queries': 3}, 'b': {'p95_ms': 115.0, 'queries': 3}},
+                   'scenarios': {'s': {'rps': 90.0}}}
+        self.assertEqual(compare(results, baseline), [])
+
+        results['steps']['b']['p95_ms'] = 130.0
+        results['scenarios']['s']['rps'] = 70.0
+        self.assertEqual(len(compare(results, baseline)), 2)
+
+    def test_percentile_interpolates(self):
+        """Test percentile calculation on small samples"""
+        self.assertEqual(percentile([], 95), 0.0)
+        self.assertEqual(percentile([5.0], 99), 5.0)
+        self.assertEqual(percentile([1.0, 2.0, 3.0, 4.0], 50), 2.5)
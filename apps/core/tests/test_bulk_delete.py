@@ -0,0 +1,142 @@
+import io
+import os
+import tempfile
+from datetime import date
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import DatabaseError
+from django.test import TestCase
+
+from apps.core.bulk_delete import DeleteCheckpoint, chunked_delete, delete_in_order
+from apps.leads.models import Booking, Client, Inquiry, Quotation
+from apps.services.models import Service, ServiceCategory
+
+
+class ChunkedDeleteTest(TestCase):
+    """Test cases for batched deletion"""
+
+    def setUp(self):
+        self.category = ServiceCategory.objects.create(name='HVAC Services', slug='hvac-services')
+        self.services = [
+            Service.objects.create(
+                name=f'Service {index}',
+                slug=f'service-{index}',
+                category=self.category,
+                summary='Summary',
+            )
+            for index in range(5)
+        ]
+        self.client_record = Client.objects.create(
+            name='Jane Doe', email='jane@example.com', phone='+254700000000'
+        )
+        for service in self.services:
+            Booking.objects.create(
+                service=service,
+                client=self.client_record,
+                contact_name='Jane Doe',
+                contact_email='jane@example.com',
+                contact_phone='+254700000000',
+                preferred_date=date(2025, 1, 10),
+                location_address='Nairobi',
+            )
+        self.inquiry = Inquiry.objects.create(
+            service=self.services[0],
+            contact_name='Jane Doe',
+            contact_email='jane@example.com',
+            contact_phone='+254700000000',
+            subject='Quote',
+            message='Please quote',
+        )
+        self.checkpoint_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.checkpoint_dir.cleanup)
+        self.checkpoint_path = os.path.join(self.checkpoint_dir.name, 'checkpoint.json')
+
+    def test_deletes_in_batches_with_cascades(self):
+        """Test that batches cascade to children and clear SET_NULL references"""
+        progress = []
+        counts = chunked_delete(Service.objects.all(), batch_size=2, progress=progress.append)
+
+        self.assertEqual(counts['services.Service'], 5)
+        self.assertEqual(counts['leads.Booking'], 5)
+        self.assertFalse(Service.objects.exists())
+        self.assertFalse(Booking.objects.exists())
+        # Inquiry.service is SET_NULL
+        self.inquiry.refresh_from_db()
+        self.assertIsNone(self.inquiry.service_id)
+        self.assertEqual([p['deleted'] for p in progress], [2, 4, 5])
+        self.assertEqual(progress[-1]['total'], 5)
+
+    def test_batches_do_not_load_rows(self):
+        """Test that a batch deletes with queries, not by loading instances"""
+        # Count, batch bound, then one statement per cascaded table (images,
+        # project links, bookings), the inquiry SET_NULL update and the
+        # service delete inside a savepoint
+        with self.assertNumQueries(9):
+            chunked_delete(Service.objects.all(), batch_size=10)
+
+    def test_filtered_queryset(self):
+        """Test that only rows matching the queryset are deleted"""
+        keep = self.services[0]
+        chunked_delete(Service.objects.exclude(pk=keep.pk), batch_size=2)
+        self.assertEqual(list(Service.objects.all()), [keep])
+        self.assertEqual(Booking.objects.count(), 1)
+
+    def test_dry_run_counts_cascades(self):
+        """Test that a dry run reports cascaded rows without deleting"""
+        counts = chunked_delete(ServiceCategory.objects.all(), dry_run=True)
+        self.assertEqual(counts['services.ServiceCategory'], 1)
+        self.assertEqual(counts['services.Service'], 5)
+        self.assertEqual(counts['leads.Booking'], 5)
+        self.assertEqual(Service.objects.count(), 5)
+
+    def test_resume_from_checkpoint(self):
+        """Test that an interrupted run resumes after the last deleted batch"""
+        checkpoint = DeleteCheckpoint(self.checkpoint_path)
+        real_delete = Service.objects.none()._raw_delete.__func__
+        calls = []
+
+        def failing_raw_delete(queryset, using):
+            if queryset.model is Service:
+                calls.append(1)
+                if len(calls) == 2:
+                    raise DatabaseError('connection lost')
+            return real_delete(queryset, using)
+
+        with mock.patch('django.db.models.query.QuerySet._raw_delete', failing_raw_delete):
+            with self.assertRaises(DatabaseError):
+                delete_in_order([Service.objects.all()], batch_size=2, checkpoint=checkpoint)
+
+        # First batch committed, second rolled back
+        self.assertEqual(Service.objects.count(), 3)
+        self.assertTrue(os.path.exists(self.checkpoint_path))
+
+        checkpoint = DeleteCheckpoint(self.checkpoint_path, resume=True)
+        counts = delete_in_order([Service.objects.all()], batch_size=2, checkpoint=checkpoint)
+        self.assertEqual(counts['services.Service'], 3)
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+    def test_clear_services_products_command(self):
+        """Test the maintenance command deletes through the chunked helper"""
+        out = io.StringIO()
+        call_command(
+            'clear_services_products', '--services-only', '--force', '--batch-size', '2',
+            '--checkpoint', self.checkpoint_path, stdout=out,
+        )
+        self.assertFalse(Service.objects.exists())
+        self.assertIn('Successfully deleted 5 services', out.getvalue())
+
+    def test_inquiry_cascade_to_quotations(self):
+        """Test that deleting inquiries removes their quotations"""
+        Quotation.objects.create(
+            inquiry=self.inquiry,
+            client=self.client_record,
+            title='Quote',
+            subtotal=100,
+            tax_amount=16,
+            total=116,
+            valid_until=date(2025, 2, 1),
+        )
+        counts = chunked_delete(Inquiry.objects.all())
+        self.assertEqual(counts['leads.Quotation'], 1)
+        self.assertFalse(Quotation.objects.exists())
@@ -0,0 +1,134 @@
+import gzip
+import json
+
+import brotli
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.middleware.csrf import get_token
+from django.test import TestCase, override_settings
+from django.urls import path
+
+from apps.core import compression, instrumentation
+
+
+PAGE = ('<tr><td>Booking</td><td>AC Installation</td><td>Nairobi</td></tr>\n' * 200).encode()
+
+
+def page(request):
+    return HttpResponse(PAGE)
+
+
+def form(request):
+    return HttpResponse(f'<input name="csrfmiddlewaretoken" value="{get_token(request)}">'.encode() + PAGE)
+
+
+def tiny(request):
+    return JsonResponse({'success': True})
+
+
+def image(request):
+    return HttpResponse(b'\x89PNG' + bytes(4096), content_type='image/png')
+
+
+def stream(request):
+    return StreamingHttpResponse((f'row {index}\n'.encode() for index in range(500)), content_type='text/csv')
+
+
+urlpatterns = [
+    path('page/', page),
+    path('form/', form),
+    path('tiny/', tiny),
+    path('image/', image),
+    path('stream/', stream),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__, COMPRESSION_ENABLED=True, COMPRESSION_MIN_SIZE=1024,
+                   COMPRESSION_SKIP_CSRF=False)
+class CompressionMiddlewareTest(TestCase):
+    """Test cases for on-the-fly response compression"""
+
+    def get(self, url, accept='br, gzip'):
+        return self.client.get(url, HTTP_ACCEPT_ENCODING=accept)
+
+    def test_negotiates_encoding(self):
+        """Test that brotli wins when it is as welcome as gzip, and q=0 refuses a coding"""
+        self.assertEqual(compression.choose_encoding('gzip, deflate, br'), 'br')
+        self.assertEqual(compression.choose_encoding('gzip;q=1.0, br;q=0.5'), 'gzip')
+        self.assertEqual(compression.choose_encoding('br;q=0, gzip'), 'gzip')
+        self.assertEqual(compression.choose_encoding('*'), 'br')
+        self.assertEqual(compression.choose_encoding('br', allow_brotli=False), None)
+        self.assertIsNone(compression.choose_encoding('identity'))
+        self.assertIsNone(compression.choose_encoding(''))
+
+    def test_compresses_html_with_brotli_or_gzip(self):
+        """Test that a large HTML body is compressed and decompresses to the original"""
+        counters = dict(instrumentation.histograms.counters)
+        response = self.get('/page/')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(brotli.decompress(response.content), PAGE)
+        self.assertEqual(int(response['Content-Length']), len(response.content))
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+        compressed_in = instrumentation.histograms.counters['http_compression_input_bytes_total']
+        self.assertEqual(compressed_in - counters.get('http_compression_input_bytes_total', 0), len(PAGE))
+
+        response = self.get('/page/', accept='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), PAGE)
+
+        response = self.get('/page/', accept='')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, PAGE)
+
+    def test_skips_tiny_and_binary_bodies(self):
+        """Test that small bodies and already compressed types are sent as they are"""
+        response = self.get('/tiny/')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(json.loads(response.content), {'success': True})
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+        response = self.get('/image/')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertNotIn('Accept-Encoding', response.get('Vary', ''))
+
+    def test_streaming_response_stays_streamed(self):
+        """Test that streamed bodies are compressed chunk by chunk, each chunk flushed"""
+        response = self.get('/stream/', accept='gzip')
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        chunks = list(response.streaming_content)
+        self.assertGreater(len(chunks), 100)
+        expected = ''.join(f'row {index}\n' for index in range(500)).encode()
+        self.assertEqual(gzip.decompress(b''.join(chunks)), expected)
+
+        # A sync flush after each chunk means everything so far can be decoded
+        decoder = brotli.Decompressor()
+        partial = b''
+        for chunk in self.get('/stream/').streaming_content:
+            partial += decoder.process(chunk)
+            if partial:
+                break
+        self.assertTrue(partial.startswith(b'row 0\n'))
+
+    def test_responses_with_csrf_token_are_padded_gzip(self):
+        """Test that a body holding a CSRF token is never brotli and gets a random gzip file name"""
+        response = self.get('/form/')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertTrue(response.content[3] & 0x08)
+        self.assertIn(b'csrfmiddlewaretoken', gzip.decompress(response.content))
+
+        # The file name after the 10 byte header changes length from response to response
+        name_lengths = {self.get('/form/').content[10:].index(b'\x00') for _ in range(10)}
+        self.assertGreater(len(name_lengths), 1)
+        self.assertLessEqual(max(name_lengths), compression.MAX_PADDING)
+
+        with override_settings(COMPRESSION_SKIP_CSRF=True):
+            response = self.get('/form/')
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_disabled(self):
+        """Test that COMPRESSION_ENABLED turns the middleware off"""
+        with override_settings(COMPRESSION_ENABLED=False):
+            response = self.get('/page/')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, PAGE)
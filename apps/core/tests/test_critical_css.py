@@ -0,0 +1,100 @@
+import os
+import re
+import tempfile
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.core import critical_css
+
+
+CSS = (
+    '*,:after{box-sizing:border-box}'
+    '.nav{display:flex}.hero{min-height:100vh}.cta{color:red}.footer-links{color:gray}'
+    '.below{margin:0}.hover\\:bg-blue:hover{background:blue}.w-1\\/2{width:50%}'
+    '@media (min-width:768px){.md\\:flex{display:flex}.md\\:hidden{display:none}}'
+    '@keyframes spin{to{transform:rotate(1turn)}}.animate-spin{animation:spin 1s linear infinite}'
+    '@keyframes ping{75%,to{opacity:0}}.animate-ping{animation:ping 1s infinite}'
+    '@font-face{font-family:Roboto;src:url(./fonts/roboto-latin-400-normal.woff2) format("woff2")}'
+)
+
+PAGE = """<html><body>
+<header class="nav hover:bg-blue"><a class="md:flex">Home</a></header>
+<main>
+  <section class="hero w-1/2"><span class="animate-spin"></span></section>
+  <script>var ignored = true;</script>
+  <div class="cta"></div>
+  <section class="below md:hidden"><span class="animate-ping"></span></section>
+</main>
+<footer class="footer-links"></footer>
+</body></html>"""
+
+
+class CriticalCSSTest(TestCase):
+    """Test cases for above-the-fold CSS extraction and inlining"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        settings_override = override_settings(CRITICAL_CSS_DIR=self.tmpdir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        critical_css.inline_css.cache_clear()
+        self.addCleanup(critical_css.inline_css.cache_clear)
+
+    def test_extract_keeps_rules_above_the_fold(self):
+        """Test that header and leading sections are styled while the footer and later sections are not"""
+        css = critical_css.extract(CSS, PAGE, sections=2)
+        for kept in ('*,:after{', '.nav{', '.hero{', '.cta{', '.hover\\:bg-blue:hover{', '.w-1\\/2{',
+                     '@media (min-width:768px){.md\\:flex{display:flex}}', '@keyframes spin', '@font-face'):
+            self.assertIn(kept, css)
+        for dropped in ('.below{', '.footer-links{', '.md\\:hidden', '@keyframes ping', '.animate-ping'):
+            self.assertNotIn(dropped, css)
+        self.assertIn('url(static:dist/fonts/roboto-latin-400-normal.woff2)', css)
+
+        self.assertNotIn('.cta{', critical_css.extract(CSS, PAGE, sections=1))
+
+    def test_page_inlines_critical_css_and_defers_stylesheet(self):
+        """Test that a page with critical CSS inlines it and preloads the full stylesheet"""
+        response = self.client.get(reverse('core:home'))
+        self.assertNotContains(response, 'rel="preload"')
+        self.assertRegex(response.content.decode(), r'<link href="/static/dist/public[^"]*\.css" rel="stylesheet">')
+
+        with open(os.path.join(self.tmpdir.name, 'core-home.css'), 'w') as f:
+            f.write('.hero{min-height:100vh}@font-face{src:url(static:dist/fonts/a.woff2)}')
+        critical_css.inline_css.cache_clear()
+        html = self.client.get(reverse('core:home')).content.decode()
+        self.assertIn('<style>.hero{min-height:100vh}@font-face{src:url(/static/dist/fonts/a.woff2)}</style>', html)
+        self.assertRegex(html, r'<link rel="preload" href="/static/dist/public[^"]*\.css" as="style"')
+        self.assertIn('<noscript>', html)
+
+        # Pages outside CRITICAL_CSS_PAGES keep the blocking stylesheet
+        self.assertNotContains(self.client.get(reverse('core:about')), '<style>.hero')
+
+    def test_command_writes_one_file_per_page(self):
+        """Test that the command renders each page and saves its critical CSS"""
+        static_dir = os.path.join(self.tmpdir.name, 'static')
+        os.makedirs(os.path.join(static_dir, 'dist'))
+        with open(os.path.join(static_dir, 'dist', 'public.css'), 'w') as f:
+            f.write('.min-h-screen{min-height:100vh}.unused-class{color:red}')
+        with override_settings(STATICFILES_DIRS=[static_dir]):
+            call_command('critical_css', 'core:home', stdout=open(os.devnull, 'w'))
+        with open(os.path.join(self.tmpdir.name, 'core-home.css')) as f:
+            self.assertEqual(f.read(), '.min-h-screen{min-height:100vh}')
+
+    def test_tailwind_scans_every_template(self):
+        """Test that Tailwind's content globs cover every template, so no used class is purged"""
+        with open(os.path.join(settings.BASE_DIR, 'tailwind.config.js')) as f:
+            config = f.read()
+        globs = re.findall(r"'\./([^']+)'", config[config.index('content:'):config.index(']')])
+        patterns = [
+            re.compile('^' + re.escape(glob).replace(r'\*\*/', '(?:.*/)?').replace(r'\*', '[^/]*') + '$')
+            for glob in globs
+        ]
+        templates = []
+        for directory in [settings.BASE_DIR / 'templates', *sorted((settings.BASE_DIR / 'apps').glob('*/templates'))]:
+            templates += [path.relative_to(settings.BASE_DIR).as_posix() for path in directory.rglob('*.html')]
+        self.assertGreater(len(templates), 50)
+        self.assertEqual([path for path in templates if not any(p.match(path) for p in patterns)], [])
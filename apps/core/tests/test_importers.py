@@ -0,0 +1,165 @@
+import io
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.core.importers import BookingImporter, ClientImporter, ProductImporter, read_rows
+from apps.leads.models import Booking, Client
+from apps.services.models import Product, ProductCategory, Service, ServiceCategory
+
+
+def csv_rows(text):
+    return read_rows(io.BytesIO(text.encode('utf-8')), 'data.csv')
+
+
+class ImporterTest(TestCase):
+    """Test cases for the bulk CSV importers"""
+
+    def setUp(self):
+        category = ServiceCategory.objects.create(name='HVAC Services', slug='hvac-services')
+        self.service = Service.objects.create(
+            name='AC Installation',
+            slug='ac-installation',
+            category=category,
+            summary='Professional AC installation',
+            is_active=True
+        )
+        self.product_category = ProductCategory.objects.create(name='AC Units')
+        self.date = (date.today() + timedelta(days=7)).isoformat()
+
+    def test_client_import_validates_with_form_rules(self):
+        """Test that client rows use ClientForm validation and preloaded uniqueness"""
+        Client.objects.create(name='Existing', email='taken@example.com', phone='+254700000000')
+        rows = csv_rows(
+            'name,email,phone,client_type\n'
+            'Jane Doe,jane@example.com,0712345678,\n'
+            'Dup,taken@example.com,0712345678,individual\n'
+            'Bad Phone,bad@example.com,123,individual\n'
+            'Jane Again,JANE@example.com,0712345678,individual\n'
+        )
+
+        importer = ClientImporter(batch_size=2)
+        summary = importer.run(rows)
+
+        self.assertEqual(summary['created'], 1)
+        self.assertEqual(summary['failed'], 3)
+        client = Client.objects.get(email='jane@example.com')
+        self.assertEqual(client.phone, '+254712345678')
+        self.assertEqual(client.client_type, 'individual')
+        self.assertEqual([row for row, _, _ in importer.errors], [3, 4, 5])
+
+    def test_booking_import_resolves_services_and_clients(self):
+        """Test that bookings resolve service slugs and link or create clients in bulk"""
+        existing = Client.objects.create(name='Known Client', email='known@example.com',
+                                         phone='+254700000000')
+        rows = csv_rows(
+            'service,contact_name,contact_email,contact_phone,preferred_date,location_address\n'
+            f'ac-installation,Known Client,known@example.com,0712345678,{self.date},Nairobi\n'
+            f'ac-installation,New Person,new@example.com,0712345678,{self.date},Mombasa\n'
+            f'ac-installation,New Person,new@example.com,0712345678,{self.date},Mombasa\n'
+            f'unknown-service,Some One,some@example.com,0712345678,{self.date},Kisumu\n'
+        )
+
+        with self.assertNumQueries(6):
+            # Two preload queries, then one transaction (a savepoint inside the
+            # test) holding the client and booking bulk inserts
+            importer = BookingImporter(batch_size=1000)
+            summary = importer.run(rows)
+
+        self.assertEqual(summary['created'], 3)
+        self.assertEqual(importer.errors[0][0], 5)
+        self.assertIn('service', importer.errors[0][2])
+        self.assertEqual(Booking.objects.filter(client=existing).count(), 1)
+        self.assertEqual(Client.objects.filter(email='new@example.com').count(), 1)
+        self.assertFalse(Booking.objects.filter(client__isnull=True).exists())
+
+    def test_product_import_generates_unique_slugs(self):
+        """Test that products get slugs and duplicate SKUs are rejected"""
+        rows = csv_rows(
+            'category,name,summary,description,price,sku\n'
+            'AC Units,Split AC,Split unit,Details,45000,SKU-1\n'
+            'AC Units,Split AC,Split unit,Details,46000,SKU-2\n'
+            'AC Units,Window AC,Window unit,Details,30000,SKU-1\n'
+        )
+
+        importer = ProductImporter()
+        summary = importer.run(rows)
+
+        self.assertEqual(summary['created'], 2)
+        self.assertEqual(
+            sorted(Product.objects.values_list('slug', flat=True)),
+            ['ac-units-split-ac', 'ac-units-split-ac-2'],
+        )
+        self.assertTrue(Product.objects.get(sku='SKU-1').is_active)
+
+    def test_dry_run_does_not_insert(self):
+        """Test that a dry run validates without writing"""
+        rows = csv_rows('name,email,phone\nJane Doe,jane@example.com,0712345678\n')
+        summary = ClientImporter(dry_run=True).run(rows)
+        self.assertEqual(summary['created'], 1)
+        self.assertFalse(Client.objects.exists())
+
+    def test_error_report(self):
+        """Test that failed rows are written to the error report"""
+        importer = ClientImporter()
+        importer.run(csv_rows('name,email,phone\nJane Doe,not-an-email,0712345678\n'))
+
+        report = io.StringIO()
+        importer.write_errors(report)
+        lines = report.getvalue().splitlines()
+        self.assertEqual(lines[0], 'row,field,error,data')
+        self.assertTrue(lines[1].startswith('2,email,'))
+
+    def test_import_data_command(self):
+        """Test the import_data management command end to end"""
+        import os
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'clients.csv')
+            with open(path, 'w') as f:
+                f.write('name,email,phone\nJane Doe,jane@example.com,0712345678\nBad,bad,1\n')
+            out = io.StringIO()
+            call_command('import_data', 'clients', path, stdout=out)
+
+            self.assertIn('Imported 1 clients from 2 rows', out.getvalue())
+            self.assertTrue(os.path.exists(path + '.errors.csv'))
+
+    def test_admin_upload(self):
+        """Test the admin upload page imports the file"""
+        User.objects.create_user('admin_user', 'admin@example.com', 'adminpass123', is_staff=True)
+        self.client.login(username='admin_user', password='adminpass123')
+
+        upload = SimpleUploadedFile(
+            'clients.csv', b'name,email,phone\nJane Doe,jane@example.com,0712345678\nBad,bad,1\n'
+        )
+        response = self.client.post(reverse('users:admin_import_data'), {
+            'kind': 'clients', 'file': upload, 'batch_size': 100,
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(Client.objects.filter(email='jane@example.com').exists())
+        token = response.context['errors_token']
+        response = self.client.get(reverse('users:admin_import_errors', args=[token]))
+        self.assertIn(b'email', response.content)
+
+    @override_settings(IMPORT_ADMIN_MAX_ROWS=1)
+    def test_admin_upload_rejects_files_over_the_row_cap(self):
+        """Test that the admin page turns away files too large to import within a request"""
+        User.objects.create_user('admin_user', 'admin@example.com', 'adminpass123', is_staff=True)
+        self.client.login(username='admin_user', password='adminpass123')
+
+        upload = SimpleUploadedFile(
+            'clients.csv', b'name,email,phone\nJane Doe,jane@example.com,0712345678\nJohn Doe,john@example.com,0712345679\n'
+        )
+        response = self.client.post(reverse('users:admin_import_data'), {
+            'kind': 'clients', 'file': upload, 'batch_size': 100,
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('manage.py import_data', response.context['form'].errors['file'][0])
+        self.assertFalse(Client.objects.exists())
@@ -0,0 +1,117 @@
+import io
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.template import Context, Template
+from django.test import TestCase, override_settings
+
+from apps.core import instrumentation
+from apps.core.instrumentation import RouteHistograms, estimate_percentile
+
+
+class FakeProcessHistograms(RouteHistograms):
+    """Histograms published under a made-up process id"""
+
+    def __init__(self, pid):
+        super().__init__()
+        self.pid = pid
+
+    @property
+    def process_key(self):
+        return f'perf:process:test:{self.pid}'
+
+
+class PerformanceMiddlewareTest(TestCase):
+    """Test cases for request-level performance instrumentation"""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        # Start every test with empty in-process histograms
+        patcher = mock.patch.object(instrumentation, 'histograms', RouteHistograms())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @override_settings(PERF_METRICS_FLUSH_INTERVAL=0)
+    def test_server_timing_header_is_sent_to_staff_only(self):
+        """Test that staff get a Server-Timing header and anonymous visitors do not"""
+        response = self.client.get('/')
+        self.assertNotIn('Server-Timing', response)
+
+        staff = User.objects.create_user('perf', 'perf@example.com', 'password', is_staff=True)
+        self.client.force_login(staff)
+        response = self.client.get('/')
+        self.assertIn('total;dur=', response['Server-Timing'])
+        self.assertIn('queries"', response['Server-Timing'])
+
+    def test_collect_counts_sql_templates_and_cache(self):
+        """Test that queries, template time and cache hits and misses are recorded"""
+        cache.set('perf-test', 1)
+        with instrumentation.collect() as metrics:
+            User.objects.count()
+            Template('{% for i in items %}{{ i }}{% endfor %}').render(Context({'items': range(3)}))
+            cache.get('perf-test')
+            cache.get('perf-missing')
+            cache.get_many(['perf-test', 'perf-missing'])
+
+        self.assertGreaterEqual(metrics.sql_count, 1)
+        self.assertGreater(metrics.template_time, 0)
+        self.assertEqual(metrics.cache_hits, 2)
+        self.assertEqual(metrics.cache_misses, 2)
+        self.assertGreaterEqual(metrics.total, metrics.sql_time)
+
+    def test_flushed_histograms_are_merged_across_processes(self):
+        """Test that route_stats merges every process's published histograms"""
+        for pid in (1, 2):
+            histograms = FakeProcessHistograms(pid)
+            metrics = instrumentation.RequestMetrics()
+            metrics.total = 0.030
+            metrics.sql_count = 4
+            histograms.observe('GET core:home', metrics)
+            histograms.flush(cache, 60)
+
+        stats = instrumentation.route_stats()['GET core:home']
+        self.assertEqual(stats['count'], 2)
+        self.assertEqual(stats['sql_count'], 8)
+        self.assertEqual(estimate_percentile(stats, 95), 50)
+
+        out = io.StringIO()
+        call_command('perf_stats', stdout=out)
+        self.assertIn('GET core:home', out.getvalue())
+
+    def test_index_is_not_changed_while_another_worker_holds_it(self):
+        """Test that a flush racing another worker's index update registers on its next flush"""
+        first = FakeProcessHistograms(1)
+        first.flush(cache, 60)
+        second = FakeProcessHistograms(2)
+        cache.add(instrumentation.INDEX_LOCK_KEY, 'perf:process:test:3')
+        second.flush(cache, 60)
+        self.assertEqual(instrumentation.read_index(cache)['processes'], [first.process_key])
+
+        cache.delete(instrumentation.INDEX_LOCK_KEY)
+        second.flush(cache, 60)
+        self.assertEqual(instrumentation.read_index(cache)['processes'], [first.process_key, second.process_key])
+
+    def test_retired_workers_keep_counters_monotonic(self):
+        """Test that an exited worker's counts move to the retired totals and an idle one is not counted twice"""
+        exited, idle, live = FakeProcessHistograms(1), FakeProcessHistograms(2), FakeProcessHistograms(3)
+        exited.increment('bookings_created_total', 5)
+        idle.increment('bookings_created_total', 3)
+        for histograms in (exited, idle, live):
+            histograms.flush(cache, 60)
+        self.assertEqual(instrumentation.app_counters()['bookings_created_total'], 8)
+
+        with mock.patch('time.time', return_value=instrumentation.time.time() + 3600):
+            live.flush(cache, 60, retire_after=60)
+        index = instrumentation.read_index(cache)
+        self.assertEqual(index['processes'], [live.process_key])
+        self.assertEqual(index['retired']['counters']['bookings_created_total'], 8)
+        self.assertEqual(instrumentation.app_counters()['bookings_created_total'], 8)
+
+        # The idle worker wakes up, hands its old numbers back and counts on
+        idle.increment('bookings_created_total')
+        idle.flush(cache, 60)
+        self.assertEqual(idle.counters['bookings_created_total'], 1)
+        self.assertEqual(instrumentation.app_counters()['bookings_created_total'], 9)
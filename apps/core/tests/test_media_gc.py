@@ -0,0 +1,130 @@
+import hashlib
+import os
+import tempfile
+import time
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.files.base import ContentFile
+from django.core.files.storage import storages
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from apps.core import media_gc
+from apps.portfolio.models import Project, ProjectImage
+from apps.services.models import Product, ProductCategory, ProductImage, Service, ServiceCategory, ServiceImage
+from apps.users.models import UserProfile
+
+
+PHOTO = b'\xff\xd8\xff\xe0' + b'split unit on the wall' * 50
+
+
+class MediaGCTest(TestCase):
+    """Test cases for content-addressed images and orphaned media collection"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        override = override_settings(MEDIA_ROOT=self.tmpdir.name)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        category = ServiceCategory.objects.create(name='HVAC Services', slug='hvac-services')
+        self.service = Service.objects.create(name='AC Installation', slug='ac-installation', category=category,
+                                              summary='Professional AC installation')
+        product_category = ProductCategory.objects.create(name='Air Conditioners', slug='air-conditioners')
+        self.product = Product.objects.create(name='Split Unit', slug='split-unit', category=product_category,
+                                              summary='12,000 BTU split unit')
+        self.project = Project.objects.create(title='Office Fit-out', slug='office-fit-out',
+                                              summary='Ducted AC for an office', location='Nairobi')
+
+    def write(self, name, content=b'x'):
+        return storages['default'].save(name, ContentFile(content))
+
+    def gc(self, *args):
+        out = StringIO()
+        call_command('gc_media', *args, stdout=out)
+        return out.getvalue()
+
+    def test_identical_photos_are_stored_once(self):
+        """Test that the same bytes uploaded for a service, product and project share one file"""
+        images = [
+            ServiceImage.objects.create(service=self.service, image=SimpleUploadedFile('front.jpg', PHOTO)),
+            ProductImage.objects.create(product=self.product, image=SimpleUploadedFile('unit.JPG', PHOTO)),
+            ProjectImage.objects.create(project=self.project, image=SimpleUploadedFile('site.jpg', PHOTO)),
+        ]
+        digest = hashlib.sha256(PHOTO).hexdigest()
+        self.assertEqual({image.image.name for image in images}, {f'images/{digest[:2]}/{digest}.jpg'})
+        self.assertEqual(os.listdir(os.path.join(self.tmpdir.name, 'images', digest[:2])), [f'{digest}.jpg'])
+
+        other = ServiceImage.objects.create(service=self.service, image=SimpleUploadedFile('front.jpg', PHOTO + b'!'))
+        self.assertNotEqual(other.image.name, images[0].image.name)
+
+    def test_walk_matches_string_order(self):
+        """Test that the storage walk yields names in the order Python and the database sort them"""
+        for name in ['a/x.jpg', 'a-b.jpg', 'a.jpg', 'a0/y.jpg', 'a/b/z.jpg', 'B.jpg']:
+            self.write(name)
+        names = list(media_gc.walk(storages['default']))
+        self.assertEqual(names, sorted(names))
+        self.assertEqual(len(names), 6)
+
+        self.assertEqual(list(media_gc.merge_orphans(['a', 'b', 'c', 'e'], ['b', 'd', 'e', 'f'])), ['a', 'c'])
+
+    def test_references_span_every_file_field_on_the_storage_root(self):
+        """Test that references come sorted and distinct from all models sharing the media root"""
+        ServiceImage.objects.create(service=self.service, image=SimpleUploadedFile('a.jpg', PHOTO))
+        ProjectImage.objects.create(project=self.project, image=SimpleUploadedFile('b.jpg', PHOTO))
+        ProductImage.objects.create(product=self.product, image=SimpleUploadedFile('c.jpg', b'other photo'))
+        user = User.objects.create_user('staff', 'staff@example.com', 'password')
+        UserProfile.objects.filter(user=user).update(avatar='profiles/Avatar.jpg')
+
+        references = list(media_gc.referenced(storages['default']))
+        self.assertEqual(references, sorted(set(references)))
+        self.assertEqual(len(references), 3)
+        self.assertIn('profiles/Avatar.jpg', references)
+
+        fields = {(model.__name__, field) for model, field in media_gc.file_fields(storages['default'])}
+        self.assertIn(('ServiceImage', 'image'), fields)
+        self.assertNotIn(('Quotation', 'pdf_file'), fields)
+
+    def test_reports_and_deletes_orphans(self):
+        """Test that files left by deleted rows are reported, then deleted, and referenced ones kept"""
+        kept = ServiceImage.objects.create(service=self.service, image=SimpleUploadedFile('a.jpg', PHOTO))
+        removed = ProductImage.objects.create(product=self.product, image=SimpleUploadedFile('b.jpg', b'old photo'))
+        removed.delete()
+        ckeditor_upload = self.write('uploads/2026/10/inline.png')
+
+        output = self.gc('--min-age', '0')
+        self.assertIn(removed.image.name, output)
+        self.assertNotIn(kept.image.name, output)
+        self.assertNotIn(ckeditor_upload, output)
+        self.assertIn('Found 1 orphaned files', output)
+        self.assertTrue(storages['default'].exists(removed.image.name))
+
+        # Recent files may belong to a row that is not committed yet
+        self.assertIn('Kept 1 orphaned files', self.gc())
+
+        self.gc('--min-age', '0', '--delete')
+        self.assertFalse(storages['default'].exists(removed.image.name))
+        self.assertTrue(storages['default'].exists(kept.image.name))
+        self.assertTrue(storages['default'].exists(ckeditor_upload))
+        self.assertIn('Found 0 orphaned files', self.gc('--min-age', '0'))
+
+    def test_reused_orphan_is_not_collected(self):
+        """Test that re-uploading an orphan's bytes refreshes it and a stale reference read cannot delete it"""
+        removed = ProductImage.objects.create(product=self.product, image=SimpleUploadedFile('b.jpg', PHOTO))
+        removed.delete()
+        path = os.path.join(self.tmpdir.name, removed.image.name)
+        week_ago = time.time() - 7 * 24 * 60 * 60
+        os.utime(path, (week_ago, week_ago))
+
+        reused = ServiceImage.objects.create(service=self.service, image=SimpleUploadedFile('a.jpg', PHOTO))
+        self.assertEqual(reused.image.name, removed.image.name)
+        self.assertGreater(os.path.getmtime(path), week_ago + 60)
+
+        # The reference stream was read before the new row existed
+        with mock.patch('apps.core.media_gc.referenced', return_value=iter([])):
+            self.gc('--min-age', '0', '--delete')
+        self.assertTrue(storages['default'].exists(reused.image.name))
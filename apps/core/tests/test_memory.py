@@ -0,0 +1,72 @@
+import io
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.core.memory import MemoryTrace, RSSWatermark, current_rss
+from apps.core.models import ProfileRun
+from apps.core.profiling import QUERY_PARAM, make_token
+from apps.leads.models import Client
+
+
+class MemoryDiagnosticsTest(TestCase):
+    """Test cases for tracemalloc-based memory diagnostics"""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_trace_attributes_allocations_to_project_lines(self):
+        """Test that peak growth and the allocating project line are reported"""
+        with MemoryTrace() as trace:
+            retained = [str(i) * 10 for i in range(50000)]  # the allocation site
+
+        self.assertGreater(trace.peak, 1024 * 1024)
+        self.assertGreater(trace.retained, 1024 * 1024)
+        top = trace.top_allocations[0]
+        self.assertTrue(top['site'].startswith('apps/core/tests/test_memory.py:'))
+        self.assertGreater(top['size_kb'], 1024)
+        del retained
+
+    def test_memory_run_traces_streamed_export_to_the_end(self):
+        """Test that a memory run of a streaming export is saved once the body is sent"""
+        for index in range(20):
+            Client.objects.create(name=f'Client {index}', email=f'c{index}@example.com', phone='+254700000000')
+        staff = User.objects.create_user('perf', 'perf@example.com', 'password', is_staff=True)
+        self.client.force_login(staff)
+        path = reverse('users:admin_customers_export')
+
+        response = self.client.get(path, {QUERY_PARAM: make_token(staff, path, 'memory')})
+        self.assertTrue(response.streaming)
+        self.assertFalse(ProfileRun.objects.exists())
+        b''.join(response.streaming_content)
+        response.close()
+
+        run = ProfileRun.objects.get()
+        self.assertEqual(run.kind, 'memory')
+        self.assertEqual(run.view_name, 'users:admin_customers_export')
+        self.assertGreater(run.peak_memory_kb, 0)
+
+        response = self.client.get(reverse('users:admin_profile_run_detail', args=[run.pk]))
+        self.assertContains(response, 'Top allocation sites')
+
+    def test_watermark_warns_once_per_crossing(self):
+        """Test that crossing the RSS watermark is logged once until RSS drops again"""
+        self.assertIsNotNone(current_rss())
+        watermark = RSSWatermark()
+        with override_settings(MEMORY_RSS_WATERMARK_MB=1):
+            with self.assertLogs('apps.core.memory', 'WARNING') as logs:
+                watermark.check('GET users:admin_customers_export')
+                watermark.check('GET users:admin_customers_export')
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn('users:admin_customers_export', logs.output[0])
+
+    def test_trace_memory_command_reports_peak(self):
+        """Test that trace_memory runs the wrapped command and prints a report"""
+        out = io.StringIO()
+        call_command('trace_memory', '--top', '5', 'check', stdout=out)
+        self.assertIn('=== Memory: manage.py check ===', out.getvalue())
+        self.assertIn('peak', out.getvalue())
@@ -0,0 +1,84 @@
+from datetime import date, timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from apps.core import instrumentation
+from apps.core.instrumentation import RouteHistograms
+from apps.leads.models import Booking, ChatSession, Inquiry
+from apps.services.models import Service, ServiceCategory
+
+
+@override_settings(METRICS_ALLOWED_IPS=['127.0.0.1'], METRICS_TOKEN='scrape-secret')
+class MetricsEndpointTest(TestCase):
+    """Test cases for the Prometheus /metrics endpoint"""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        patcher = mock.patch.object(instrumentation, 'histograms', RouteHistograms())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_access_is_restricted_by_address_or_token(self):
+        """Test that only allowed addresses or the bearer token can scrape"""
+        self.assertEqual(self.client.get('/metrics').status_code, 200)
+        self.assertEqual(self.client.get('/metrics', REMOTE_ADDR='203.0.113.9').status_code, 403)
+        self.assertEqual(self.client.get(
+            '/metrics', REMOTE_ADDR='203.0.113.9', HTTP_AUTHORIZATION='Bearer wrong',
+        ).status_code, 403)
+        self.assertEqual(self.client.get(
+            '/metrics', REMOTE_ADDR='203.0.113.9', HTTP_AUTHORIZATION='Bearer scrape-secret',
+        ).status_code, 200)
+
+    def test_proxied_requests_from_loopback_are_refused(self):
+        """Test that a request NGINX forwarded is not trusted for arriving from 127.0.0.1"""
+        self.assertEqual(self.client.get('/metrics', HTTP_X_FORWARDED_FOR='203.0.113.9').status_code, 403)
+        self.assertEqual(self.client.get('/metrics', HTTP_X_REAL_IP='203.0.113.9').status_code, 403)
+        self.assertEqual(self.client.get(
+            '/metrics', HTTP_X_FORWARDED_FOR='203.0.113.9', HTTP_AUTHORIZATION='Bearer scrape-secret',
+        ).status_code, 200)
+
+        with override_settings(METRICS_ALLOWED_IPS=[], METRICS_TOKEN=''):
+            self.assertEqual(self.client.get('/metrics').status_code, 403)
+
+    def test_exposes_request_histograms_and_business_counters(self):
+        """Test that requests, creations and open chats appear in text format"""
+        self.client.get('/')
+        self.client.get('/')
+        category = ServiceCategory.objects.create(name='HVAC Services')
+        service = Service.objects.create(name='AC Repair', category=category, summary='Summary')
+        Booking.objects.create(
+            service=service, contact_name='Jane', contact_email='jane@example.com',
+            contact_phone='+254700000000', preferred_date=date.today() + timedelta(days=2),
+            location_address='Nairobi',
+        )
+        Inquiry.objects.create(
+            contact_name='Jane', contact_email='jane@example.com', subject='Quote', message='Hi',
+        )
+        ChatSession.objects.create(session_id='open-1')
+        ChatSession.objects.create(session_id='closed-1', status='closed')
+
+        response = self.client.get('/metrics')
+        body = response.content.decode()
+
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        self.assertIn('# TYPE app_http_request_duration_seconds histogram', body)
+        self.assertIn('app_http_requests_total{method="GET",view="core:home"} 2', body)
+        self.assertIn('app_http_request_duration_seconds_bucket{method="GET",view="core:home",le="+Inf"} 2', body)
+        self.assertIn('app_bookings_created_total 1', body)
+        self.assertIn('app_inquiries_created_total 1', body)
+        self.assertIn('app_chat_sessions_open 1', body)
+        self.assertIn('app_cache_hit_ratio', body)
+
+    def test_counters_from_other_processes_are_summed(self):
+        """Test that snapshots published by other workers are added to this one's"""
+        other = RouteHistograms()
+        other.increment('bookings_created_total', 3)
+        cache.set('perf:process:other-host:1', other.snapshot())
+        cache.set(instrumentation.PROCESS_INDEX_KEY, ['perf:process:other-host:1'])
+        instrumentation.histograms.increment('bookings_created_total', 2)
+
+        body = self.client.get('/metrics').content.decode()
+        self.assertIn('app_bookings_created_total 5', body)
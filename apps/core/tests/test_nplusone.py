@@ -0,0 +1,105 @@
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+from django.template import engines
+from django.test import TestCase, override_settings
+from django.urls import path
+
+from apps.core.nplusone import NPlusOneError, record_queries, suggest
+from apps.leads.models import Booking
+from apps.services.models import Product, ProductCategory, ProductImage, Service, ServiceCategory
+
+
+BOOKINGS_TEMPLATE = '{% for booking in bookings %}{{ booking.service.name }}\n{% endfor %}'
+
+
+def lazy_bookings(request):
+    template = engines['django'].from_string(BOOKINGS_TEMPLATE)
+    return HttpResponse(template.render({'bookings': Booking.objects.all()}))
+
+
+def joined_bookings(request):
+    template = engines['django'].from_string(BOOKINGS_TEMPLATE)
+    return HttpResponse(template.render({'bookings': Booking.objects.select_related('service')}))
+
+
+urlpatterns = [
+    path('lazy/', lazy_bookings, name='lazy'),
+    path('joined/', joined_bookings, name='joined'),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__, NPLUSONE_DETECTION='raise', NPLUSONE_THRESHOLD=3,
+                   NPLUSONE_SCOPE=(__name__,))
+class NPlusOneDetectorTest(TestCase):
+    """Test cases for the N+1 query detector"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for index in range(4):
+            category = ServiceCategory.objects.create(name=f'Category {index}')
+            service = Service.objects.create(name=f'Service {index}', category=category, summary='Summary')
+            Booking.objects.create(
+                service=service, contact_name='Jane', contact_email='jane@example.com',
+                contact_phone='+254700000000', preferred_date=date.today() + timedelta(days=3),
+                location_address='Nairobi',
+            )
+
+    def test_raise_mode_reports_template_line_and_suggestion(self):
+        """Test that lazy relation access in a template fails with its location and a fix"""
+        with self.assertRaises(NPlusOneError) as raised:
+            self.client.get('/lazy/')
+        message = str(raised.exception)
+        self.assertIn('4 similar queries from <unknown source>:1 {{ booking.service.name }}', message)
+        self.assertIn('apps/core/tests/test_nplusone.py', message)
+        self.assertIn("select_related('service')", message)
+
+    def test_select_related_view_passes(self):
+        """Test that the fixed view is not reported"""
+        self.assertEqual(self.client.get('/joined/').status_code, 200)
+
+    @override_settings(NPLUSONE_DETECTION='log')
+    def test_log_mode_warns_instead_of_failing(self):
+        """Test that log mode serves the page and logs the N+1"""
+        with self.assertLogs('apps.core.nplusone', 'WARNING') as logs:
+            response = self.client.get('/lazy/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('(lazy)', logs.output[0])
+
+    @override_settings(NPLUSONE_IGNORE=['lazy'])
+    def test_ignored_views_are_not_reported(self):
+        """Test that known offenders can be allowed by view name"""
+        self.assertEqual(self.client.get('/lazy/').status_code, 200)
+
+    def test_record_queries_outside_requests(self):
+        """Test that repeated product image lookups are found with a prefetch hint"""
+        category = ProductCategory.objects.create(name='Parts')
+        for index in range(3):
+            product = Product.objects.create(name=f'Part {index}', category=category, summary='S', sku=f'P{index}')
+            ProductImage.objects.create(product=product, image='products/test.jpg')
+
+        with record_queries() as recorder:
+            for product in Product.objects.all():
+                product.images.first()
+        problems = recorder.problems()
+        self.assertEqual(len(problems), 1)
+        self.assertEqual(problems[0].suggestion, "prefetch_related('images') on Product querysets")
+
+    def test_suggestions_for_many_to_many(self):
+        """Test that through-table lookups suggest prefetching the m2m field"""
+        sql = ('SELECT "services_service"."id" FROM "services_service" INNER JOIN "portfolio_project_services" '
+               'ON ("services_service"."id" = "portfolio_project_services"."service_id") '
+               'WHERE "portfolio_project_services"."project_id" = ?')
+        self.assertEqual(suggest(sql), "prefetch_related('services') on Project querysets")
+
+
+class NPlusOneScopeTest(TestCase):
+    """Test that views outside apps/ are not checked"""
+
+    @override_settings(NPLUSONE_DETECTION='raise')
+    def test_django_admin_is_out_of_scope(self):
+        """Test that Django admin pages are served even with repeated queries"""
+        admin = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(admin)
+        self.assertEqual(self.client.get('/admin/').status_code, 200)
@@ -0,0 +1,85 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.core.models import ProfileRun
+from apps.core.profiling import QUERY_PARAM, SamplingProfiler, flame_rows, make_token
+
+
+def busy_loop(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(100))
+
+
+@override_settings(PROFILER_INTERVAL_MS=1, PROFILER_MAX_RUNS_PER_HOUR=5)
+class RequestProfilerTest(TestCase):
+    """Test cases for the on-demand request profiler"""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.staff = User.objects.create_user('perf', 'perf@example.com', 'password', is_staff=True)
+        # employee_id is unique, so a second user needs this one's set
+        self.staff.profile.employee_id = 'EMP-PERF'
+        self.staff.profile.save()
+        self.client.force_login(self.staff)
+        self.path = reverse('users:admin_customers_list')
+
+    def test_sampler_collects_collapsed_stacks_and_top_functions(self):
+        """Test that samples attribute time to the busy function"""
+        with SamplingProfiler(interval=0.001) as profiler:
+            busy_loop(0.05)
+
+        self.assertGreater(profiler.samples, 0)
+        self.assertIn('busy_loop (apps/core/tests/test_profiling.py:', profiler.collapsed())
+        top = profiler.top_functions()
+        self.assertTrue(any(f['function'].startswith('busy_loop') and f['total'] for f in top))
+
+    def test_flame_rows_lay_out_nested_boxes(self):
+        """Test that children are placed within their parent's width"""
+        rows = flame_rows('a;b 3\na;c 1\nd 4')
+        self.assertEqual([box['name'] for box in rows[0]], ['a', 'd'])
+        self.assertEqual(rows[0][0]['width'], 50.0)
+        self.assertEqual([(box['name'], box['left'], box['width']) for box in rows[1]],
+                         [('b', 0.0, 37.5), ('c', 37.5, 12.5)])
+
+    def test_signed_request_is_profiled_and_stored(self):
+        """Test that starting a profile redirects to a signed URL that records a ProfileRun"""
+        response = self.client.post(reverse('users:admin_profile_runs'), {'path': f'{self.path}?search=a'})
+        self.assertEqual(response.status_code, 302)
+        self.assertIn(f'search=a&{QUERY_PARAM}=', response.url)
+
+        response = self.client.get(response.url)
+        run = ProfileRun.objects.get()
+        self.assertEqual(response['X-Profile-Run'], str(run.pk))
+        self.assertEqual(run.view_name, 'users:admin_customers_list')
+        self.assertEqual(run.requested_by, self.staff)
+        self.assertGreater(run.sql_count, 0)
+
+        response = self.client.get(reverse('users:admin_profile_run_detail', args=[run.pk]))
+        self.assertEqual(response.status_code, 200)
+
+    def test_invalid_tokens_are_ignored(self):
+        """Test that tampered, foreign or misdirected tokens do not profile"""
+        other = User.objects.create_user('other', 'other@example.com', 'password', is_staff=True)
+        for token in ('tampered', make_token(other, self.path), make_token(self.staff, '/elsewhere/')):
+            response = self.client.get(self.path, {QUERY_PARAM: token})
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn('X-Profile-Run', response)
+
+        self.client.logout()
+        self.client.get(self.path, {QUERY_PARAM: make_token(self.staff, self.path)})
+        self.assertFalse(ProfileRun.objects.exists())
+
+    @override_settings(PROFILER_MAX_RUNS_PER_HOUR=1)
+    def test_runs_are_rate_limited(self):
+        """Test that runs beyond the hourly budget are served without profiling"""
+        token = make_token(self.staff, self.path)
+        self.client.get(self.path, HTTP_X_PROFILE_TOKEN=token)
+        response = self.client.get(self.path, HTTP_X_PROFILE_TOKEN=token)
+        self.assertNotIn('X-Profile-Run', response)
+        self.assertEqual(ProfileRun.objects.count(), 1)
@@ -0,0 +1,153 @@
+import importlib
+import tempfile
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.files.base import ContentFile
+from django.core.files.storage import storages
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.core import media
+from apps.core.storage import private_storage
+from apps.leads.models import Client, Quotation
+
+
+PDF = b'%PDF-1.4\n' + bytes(range(256)) * 8
+
+
+class ProtectedMediaTest(TestCase):
+    """Test cases for serving private uploads after a permission check"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        storages = {
+            **settings.STORAGES,
+            'private': {
+                'BACKEND': 'apps.core.storage.PrivateMediaStorage',
+                'OPTIONS': {'location': self.tmpdir.name},
+            },
+        }
+        override = override_settings(STORAGES=storages, PRIVATE_MEDIA_SERVER='django')
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.name = private_storage().save('quotations/2026/10/QT-0001.pdf', ContentFile(PDF))
+        self.url = reverse('core:protected_media', kwargs={'path': self.name})
+        self.staff = User.objects.create_user('staff', 'staff@example.com', 'password', is_staff=True)
+        # employee_id is unique, so a second user needs this one's set
+        self.staff.profile.employee_id = 'EMP-MEDIA'
+        self.staff.profile.save()
+
+    def test_requires_staff_or_signed_link(self):
+        """Test that anonymous and non-staff users are refused, staff and signed links are not"""
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+        User.objects.create_user('visitor', 'visitor@example.com', 'password')
+        self.client.login(username='visitor', password='password')
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+        self.client.login(username='staff', password='password')
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), PDF)
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        self.assertEqual(response['Content-Disposition'], 'inline; filename="QT-0001.pdf"')
+
+        self.client.logout()
+        response = self.client.get(media.signed_url(self.name))
+        self.assertEqual(response.status_code, 200)
+
+    def test_signed_link_is_bound_to_file_and_expires(self):
+        """Test that a token opens only the file it was signed for, and not after it expires"""
+        other = private_storage().save('quotations/2026/10/QT-0002.pdf', ContentFile(PDF))
+        token = media.signed_url(self.name).split('?token=')[1]
+        other_url = reverse('core:protected_media', kwargs={'path': other})
+        self.assertEqual(self.client.get(other_url, {'token': token}).status_code, 403)
+        self.assertEqual(self.client.get(self.url, {'token': token + 'x'}).status_code, 403)
+
+        with override_settings(PRIVATE_MEDIA_TOKEN_MAX_AGE=-1):
+            self.assertEqual(self.client.get(self.url, {'token': token}).status_code, 403)
+
+    def test_missing_and_traversing_paths_are_not_found(self):
+        """Test that unknown files and paths outside the storage return 404"""
+        self.client.login(username='staff', password='password')
+        missing = reverse('core:protected_media', kwargs={'path': 'quotations/missing.pdf'})
+        self.assertEqual(self.client.get(missing).status_code, 404)
+        self.assertEqual(self.client.get('/private-media/../config/settings.py').status_code, 404)
+        self.assertEqual(self.client.get('/private-media/%2E%2E/config/settings.py').status_code, 404)
+
+    def test_web_server_sends_the_file(self):
+        """Test that nginx and apache modes answer with headers only and no file bytes"""
+        self.client.login(username='staff', password='password')
+        with override_settings(PRIVATE_MEDIA_SERVER='nginx', PRIVATE_MEDIA_INTERNAL_URL='/internal-media/'):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Accel-Redirect'], f'/internal-media/{self.name}')
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        self.assertEqual(response.content, b'')
+
+        with override_settings(PRIVATE_MEDIA_SERVER='apache'):
+            response = self.client.get(self.url)
+        self.assertEqual(response['X-Sendfile'], private_storage().path(self.name))
+        self.assertEqual(response.content, b'')
+
+    def test_development_server_honours_range(self):
+        """Test that the worker fallback answers byte ranges with 206 and bad ones with 416"""
+        self.client.login(username='staff', password='password')
+        response = self.client.get(self.url, HTTP_RANGE='bytes=9-18')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.content, PDF[9:19])
+        self.assertEqual(response['Content-Range'], f'bytes 9-18/{len(PDF)}')
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=-4')
+        self.assertEqual(response.content, PDF[-4:])
+
+        response = self.client.get(self.url, HTTP_RANGE=f'bytes={len(PDF)}-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], f'bytes */{len(PDF)}')
+
+        # Several ranges at once are answered with the whole file
+        response = self.client.get(self.url, HTTP_RANGE='bytes=0-1,4-5')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+
+    def test_quotation_email_links_signed_pdf(self):
+        """Test that a sent quotation with a PDF mails the client a link that works without logging in"""
+        client = Client.objects.create(name='Jane Doe', email='jane@example.com', phone='+254700000000')
+        quotation = Quotation.objects.create(
+            client=client, title='Office AC', subtotal=1000, valid_until='2026-12-31', pdf_file=self.name,
+        )
+        self.client.login(username='staff', password='password')
+        self.client.post(reverse('users:admin_quotation_send_email', kwargs={'quotation_id': quotation.pk}))
+
+        self.assertEqual(len(mail.outbox), 1)
+        link = next(word for word in mail.outbox[0].body.split() if '/private-media/' in word)
+        self.client.logout()
+        response = self.client.get(link)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), PDF)
+
+    def test_migration_moves_existing_pdfs_out_of_public_media(self):
+        """Test that PDFs saved to public media before the move end up in the private storage"""
+        public_root = tempfile.TemporaryDirectory()
+        self.addCleanup(public_root.cleanup)
+        with override_settings(MEDIA_ROOT=public_root.name):
+            public = storages['default']
+            old_name = public.save('quotations/2025/03/QT-0002.pdf', ContentFile(PDF))
+            client = Client.objects.create(name='Acme', email='acme@example.com', phone='0700000000')
+            quotation = Quotation.objects.create(
+                client=client, title='Old quote', subtotal=1000, valid_until='2026-12-31', pdf_file=old_name,
+            )
+
+            migration = importlib.import_module('apps.leads.migrations.0005_move_quotation_pdfs_to_private_storage')
+            migration.move_to_private(apps, None)
+
+            self.assertFalse(public.exists(old_name))
+        quotation.refresh_from_db()
+        self.assertEqual(quotation.pdf_file.name, old_name)
+        with private_storage().open(old_name) as f:
+            self.assertEqual(f.read(), PDF)
@@ -0,0 +1,259 @@
+"""
+Query budget harness for every named URL in the project.
+
+Each GET-able named URL is requested as a superuser against two seeded data
+sizes. The number of SQL queries must be the same at both sizes (so no view
+grows an N+1) and within the budget declared in ``query_budgets.py``.
+"""
+from datetime import date, timedelta
+
+from django.contrib.auth.models import Group, User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+
+from apps.core.models import FAQ, ContactMessage, EmailTemplate, ProfileRun, Testimonial as SiteTestimonial
+from apps.core.tests.query_budgets import QUERY_BUDGETS, SKIPPED_URLS
+from apps.leads.models import Booking, ChatMessage, ChatSession, Client, Inquiry, Quotation
+from apps.portfolio.models import Project, ProjectImage, Testimonial
+from apps.services.models import Product, ProductCategory, ProductImage, Service, ServiceCategory, ServiceImage
+from apps.users.dashboard import WIDGETS
+
+
+SMALL_SIZE = 2
+LARGE_SIZE = 6
+
+ADMIN_APP_LABELS = ('auth', 'leads', 'portfolio', 'services', 'sites', 'users')
+
+
+def iter_named_urls(resolver=None, namespace=''):
+    """Yield (name, parameter names) for every named URL pattern"""
+    resolver = resolver or get_resolver()
+    for pattern in resolver.url_patterns:
+        if isinstance(pattern, URLResolver):
+            child_namespace = namespace
+            if pattern.namespace:
+                child_namespace = f'{namespace}{pattern.namespace}:'
+            for name, params in iter_named_urls(pattern, child_namespace):
+                params = list(pattern.pattern.regex.groupindex) + params
+                yield name, params
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            yield f'{namespace}{pattern.name}', list(pattern.pattern.regex.groupindex)
+
+
+def create_rows(start, stop):
+    """Create one of everything per index, with the relations views traverse"""
+    for index in range(start, stop):
+        user = User.objects.create_user(
+            f'staff{index}', f'staff{index}@example.com', 'password', is_staff=True,
+            first_name='Staff', last_name=str(index),
+        )
+        # employee_id is unique, so profiles cannot all keep the blank default
+        user.profile.employee_id = f'EMP{index:04d}'
+        user.profile.save()
+        user.groups.add(Group.objects.create(name=f'Group {index}'))
+
+        category = ServiceCategory.objects.create(name=f'Category {index}')
+        service = Service.objects.create(
+            name=f'Service {index}', category=category, summary='Summary', is_featured=True,
+        )
+        ServiceImage.objects.create(service=service, image='services/test.jpg', is_featured=True)
+
+        product_category = ProductCategory.objects.create(name=f'Product category {index}')
+        product = Product.objects.create(
+            name=f'Product {index}', category=product_category, summary='Summary',
+            sku=f'SKU-{index}', price=1000, is_featured=True,
+        )
+        ProductImage.objects.create(product=product, image='products/test.jpg', is_featured=True)
+
+        project = Project.objects.create(
+            title=f'Project {index}', summary='Summary', location='Nairobi', is_featured=True,
+        )
+        project.services.add(service)
+        for _ in range(2):
+            ProjectImage.objects.create(project=project, image='portfolio/test.jpg')
+        Testimonial.objects.create(
+            author_name=f'Author {index}', quote='Great work', related_project=project, is_featured=True,
+        )
+        SiteTestimonial.objects.create(name=f'Author {index}', content='Great work', is_featured=True)
+        FAQ.objects.create(question=f'Question {index}?', answer='Answer')
+        ContactMessage.objects.create(
+            name=f'Contact {index}', email=f'contact{index}@example.com', subject='Hello', message='Hi',
+        )
+        # (template_type, is_default) is unique, so use a different type per row
+        EmailTemplate.objects.create(
+            name=f'Template {index}', template_type=EmailTemplate.TEMPLATE_TYPES[index][0],
+            subject='Subject', content='Body',
+        )
+
+        client = Client.objects.create(
+            name=f'Client {index}', email=f'client{index}@example.com', phone='+254700000000',
+        )
+        Booking.objects.create(
+            service=service, client=client, contact_name=f'Client {index}',
+            contact_email=client.email, contact_phone=client.phone,
+            preferred_date=date.today() + timedelta(days=3), location_address='Nairobi',
+            assigned_technician=user,
+        )
+        inquiry = Inquiry.objects.create(
+            client=client, service=service, contact_name=client.name, contact_email=client.email,
+            contact_phone=client.phone, subject='Quote', message='Please quote', assigned_to=user,
+        )
+        Quotation.objects.create(
+            inquiry=inquiry, client=client, title=f'Quote {index}', subtotal=1000,
+            valid_until=date.today() + timedelta(days=30), created_by=user,
+            items=[{'description': 'Service', 'quantity': 1, 'unit_price': '1000', 'total': '1000'}],
+        )
+        session = ChatSession.objects.create(
+            session_id=f'session-{index}', name=client.name, email=client.email, assigned_to=user,
+        )
+        for message_type in ('user', 'bot', 'agent'):
+            ChatMessage.objects.create(session=session, message_type=message_type, content='Hello')
+        ProfileRun.objects.create(
+            method='GET', path='/', requested_by=user, collapsed_stacks='a;b 3\na;c 1',
+            top_functions=[{'function': 'b', 'self': 3, 'total': 3}],
+        )
+
+
+def admin_object_kwargs(name):
+    """Object id kwargs for Django admin change/delete/history views"""
+    from django.apps import apps
+
+    app_label, rest = name.split(':', 1)[1].split('_', 1)
+    model_name = rest.rsplit('_', 1)[0]
+    model = apps.get_model(app_label, model_name)
+    return {'object_id': model._default_manager.order_by('pk').first().pk}
+
+
+# kwargs for URLs with parameters, built from the first seeded objects
+URL_KWARGS = {
+    'services:detail': lambda: {'slug': Service.objects.order_by('pk').first().slug},
+    'services:product_detail': lambda: {'slug': Product.objects.order_by('pk').first().slug},
+    'portfolio:detail': lambda: {'slug': Project.objects.order_by('pk').first().slug},
+    'leads:booking_create_service': lambda: {'service_slug': Service.objects.order_by('pk').first().slug},
+    'leads:chat_history': lambda: {'session_id': 'session-0'},
+    'core:protected_media': lambda: {'path': 'quotations/missing.pdf'},
+    'blog:detail': lambda: {'slug': 'placeholder'},
+    'admin:auth_user_password_change': lambda: {'id': User.objects.order_by('pk').first().pk},
+    'users:admin_booking_detail': lambda: {'booking_id': Booking.objects.order_by('pk').first().booking_id},
+    'users:admin_quotation_detail': lambda: {'quotation_id': Quotation.objects.order_by('pk').first().pk},
+    'users:admin_quotation_edit': lambda: {'quotation_id': Quotation.objects.order_by('pk').first().pk},
+    'users:admin_quotation_delete': lambda: {'quotation_id': Quotation.objects.order_by('pk').first().pk},
+    'users:admin_quotation_send_email': lambda: {'quotation_id': Quotation.objects.order_by('pk').first().pk},
+    'users:admin_quotation_status_update': lambda: {'quotation_id': Quotation.objects.order_by('pk').first().pk},
+    'users:admin_inquiry_to_quotation': lambda: {'inquiry_id': Inquiry.objects.order_by('pk').first().inquiry_id},
+    'users:admin_service_view': lambda: {'service_id': Service.objects.order_by('pk').first().pk},
+    'users:admin_service_edit': lambda: {'service_id': Service.objects.order_by('pk').first().pk},
+    'users:admin_service_delete': lambda: {'service_id': Service.objects.order_by('pk').first().pk},
+    'users:admin_product_view': lambda: {'product_id': Product.objects.order_by('pk').first().pk},
+    'users:admin_product_edit': lambda: {'product_id': Product.objects.order_by('pk').first().pk},
+    'users:admin_product_delete': lambda: {'product_id': Product.objects.order_by('pk').first().pk},
+    'users:admin_portfolio_detail': lambda: {'project_id': Project.objects.order_by('pk').first().pk},
+    'users:admin_portfolio_edit': lambda: {'project_id': Project.objects.order_by('pk').first().pk},
+    'users:admin_portfolio_delete': lambda: {'project_id': Project.objects.order_by('pk').first().pk},
+    'users:admin_portfolio_toggle_featured': lambda: {'project_id': Project.objects.order_by('pk').first().pk},
+    'users:admin_portfolio_toggle_published': lambda: {'project_id': Project.objects.order_by('pk').first().pk},
+    'users:admin_customer_view': lambda: {'customer_id': Client.objects.order_by('pk').first().pk},
+    'users:admin_customer_edit': lambda: {'customer_id': Client.objects.order_by('pk').first().pk},
+    'users:admin_customer_delete': lambda: {'customer_id': Client.objects.order_by('pk').first().pk},
+    'users:admin_user_edit': lambda: {'user_id': User.objects.filter(is_staff=True).order_by('pk').first().pk},
+    'users:admin_user_delete': lambda: {'user_id': User.objects.filter(is_staff=True).order_by('pk').first().pk},
+    'users:admin_lead_detail': lambda: {'session_id': 'session-0'},
+    'users:admin_import_errors': lambda: {'token': 'expired'},
+    'users:admin_profile_run_detail': lambda: {'run_id': ProfileRun.objects.order_by('pk').first().pk},
+    'users:admin_trace_detail': lambda: {'request_id': 'missing'},
+}
+
+
+# Publishing performance histograms would add cache queries to random requests
+@override_settings(PERF_METRICS_FLUSH_INTERVAL=0)
+class QueryBudgetTest(TestCase):
+    """Test that every view runs a bounded, size-independent number of queries"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_superuser('budget', 'budget@example.com', 'password')
+        cls.superuser.profile.employee_id = 'EMP-ADMIN'
+        cls.superuser.profile.save()
+
+    def setUp(self):
+        self.client.force_login(self.superuser)
+
+    def measurable_urls(self):
+        urls = []
+        for name, params in iter_named_urls():
+            if name in SKIPPED_URLS:
+                continue
+            if not params:
+                urls.append((name, dict))
+            elif name in URL_KWARGS:
+                urls.append((name, URL_KWARGS[name]))
+            elif name.startswith('admin:') and params == ['object_id']:
+                urls.append((name, lambda name=name: admin_object_kwargs(name)))
+            elif name == 'users:admin_dashboard_widget':
+                for widget in WIDGETS:
+                    urls.append((f'{name}[{widget}]', lambda widget=widget: {'widget': widget}))
+            elif name.startswith('admin:') and params == ['app_label']:
+                for app_label in ADMIN_APP_LABELS:
+                    urls.append((f'{name}[{app_label}]', lambda app_label=app_label: {'app_label': app_label}))
+            else:
+                urls.append((name, None))
+        return urls
+
+    def count_queries(self):
+        counts = {}
+        for name, get_kwargs in self.measurable_urls():
+            if get_kwargs is None:
+                counts[name] = None
+                continue
+            url = reverse(name.split('[')[0], kwargs=get_kwargs())
+            # The first request fills process-level caches (content types,
+            # singletons); measure the second one, with the cache cleared
+            self.get(url)
+            cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                response = self.get(url)
+            counts[name] = (len(queries), response.status_code, url)
+        return counts
+
+    def get(self, url):
+        response = self.client.get(url)
+        if response.streaming:
+            b''.join(response.streaming_content)
+        return response
+
+    def test_views_stay_within_constant_query_budgets(self):
+        """Test that query counts do not grow with data size and stay within budget"""
+        create_rows(0, SMALL_SIZE)
+        small = self.count_queries()
+        create_rows(SMALL_SIZE, LARGE_SIZE)
+        large = self.count_queries()
+
+        for name, measured in large.items():
+            with self.subTest(url=name):
+                self.assertIsNotNone(
+                    measured, f'{name} takes URL parameters; add them to URL_KWARGS or SKIPPED_URLS.'
+                )
+                queries, status, url = measured
+                self.assertLess(status, 500, f'GET {url} failed with HTTP {status}')
+                self.assertIn(
+                    name, QUERY_BUDGETS,
+                    f'{name} has no query budget; it ran {queries} queries. Add it to query_budgets.py.',
+                )
+                self.assertEqual(
+                    small[name][0], queries,
+                    f'GET {url} ran {small[name][0]} queries with {SMALL_SIZE} rows per model '
+                    f'but {queries} with {LARGE_SIZE}; likely an N+1.',
+                )
+                self.assertLessEqual(
+                    queries, QUERY_BUDGETS[name],
+                    f'GET {url} ran {queries} queries, over its budget of {QUERY_BUDGETS[name]}.',
+                )
+
+    def test_budgets_refer_to_existing_urls(self):
+        """Test that the budget file has no entries for removed URLs"""
+        names = {name for name, _ in self.measurable_urls()}
+        stale = set(QUERY_BUDGETS) - names
+        self.assertFalse(stale, f'Budgets for unknown or skipped URLs: {sorted(stale)}')
@@ -0,0 +1,117 @@
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from apps.core.middleware import DatabaseRoutingMiddleware
+from apps.core.routers import (
+    PrimaryReplicaRouter, get_read_alias, replica_reads, track_writes,
+)
+from apps.leads.models import Client
+
+
+REPLICA_DATABASES = {
+    **settings.DATABASES,
+    'replica': {**settings.DATABASES['default'], 'TEST': {'MIRROR': 'default'}},
+}
+
+
+class PrimaryReplicaRouterTest(TestCase):
+    """Test cases for the primary/replica database router"""
+
+    def setUp(self):
+        self.router = PrimaryReplicaRouter()
+
+    def test_reads_use_primary_by_default(self):
+        """Test that reads stay on the primary unless opted in"""
+        with override_settings(DATABASES=REPLICA_DATABASES):
+            self.assertEqual(self.router.db_for_read(Client), 'default')
+
+    def test_replica_reads_use_replica(self):
+        """Test that opted-in reads go to the replica"""
+        with override_settings(DATABASES=REPLICA_DATABASES):
+            with replica_reads():
+                self.assertEqual(self.router.db_for_read(Client), 'replica')
+
+    def test_replica_reads_without_replica_fall_back_to_primary(self):
+        """Test that a missing replica alias falls back to the primary"""
+        with replica_reads():
+            self.assertEqual(self.router.db_for_read(Client), 'default')
+
+    def test_writes_always_use_primary(self):
+        """Test that writes go to the primary even in replica mode"""
+        with override_settings(DATABASES=REPLICA_DATABASES):
+            with replica_reads(), track_writes():
+                self.assertEqual(self.router.db_for_write(Client), 'default')
+
+    def test_read_after_write_is_pinned_to_primary(self):
+        """Test that reads after a write in the same request use the primary"""
+        with override_settings(DATABASES=REPLICA_DATABASES):
+            with replica_reads(), track_writes() as wrote:
+                self.assertEqual(get_read_alias(), 'replica')
+                self.router.db_for_write(Client)
+                self.assertTrue(wrote())
+                self.assertEqual(get_read_alias(), 'default')
+
+    def test_session_writes_do_not_pin(self):
+        """Test that session saves do not count as user writes"""
+        from django.contrib.sessions.models import Session
+
+        with override_settings(DATABASES=REPLICA_DATABASES):
+            with replica_reads(), track_writes() as wrote:
+                self.router.db_for_write(Session)
+                self.assertFalse(wrote())
+                self.assertEqual(get_read_alias(), 'replica')
+
+    def test_replica_is_never_migrated(self):
+        """Test that migrations only run on the primary"""
+        self.assertTrue(self.router.allow_migrate('default', 'leads'))
+        self.assertFalse(self.router.allow_migrate('replica', 'leads'))
+
+
+@override_settings(DATABASES=REPLICA_DATABASES, REPLICA_STICKY_SECONDS=30)
+class DatabaseRoutingMiddlewareTest(TestCase):
+    """Test cases for sticky-after-write routing"""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def make_request(self):
+        from django.contrib.sessions.backends.db import SessionStore
+
+        request = self.factory.get('/')
+        request.session = SessionStore()
+        request.user = User(username='staff')
+        return request
+
+    def test_write_makes_session_sticky(self):
+        """Test that a write records a sticky window in the session"""
+        def view(request):
+            PrimaryReplicaRouter().db_for_write(Client)
+            return HttpResponse('ok')
+
+        request = self.make_request()
+        DatabaseRoutingMiddleware(view)(request)
+
+        sticky_until = request.session[DatabaseRoutingMiddleware.session_key]
+        self.assertGreater(sticky_until, time.time() + 25)
+
+    def test_sticky_session_reads_from_primary(self):
+        """Test that a sticky session's replica reads are pinned to the primary"""
+        seen = {}
+
+        def view(request):
+            with replica_reads():
+                seen['alias'] = get_read_alias()
+            return HttpResponse('ok')
+
+        request = self.make_request()
+        request.session[DatabaseRoutingMiddleware.session_key] = time.time() + 10
+        DatabaseRoutingMiddleware(view)(request)
+        self.assertEqual(seen['alias'], 'default')
+
+        request = self.make_request()
+        DatabaseRoutingMiddleware(view)(request)
+        self.assertEqual(seen['alias'], 'replica')
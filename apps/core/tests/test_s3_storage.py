@@ -0,0 +1,130 @@
+import boto3
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from moto import mock_s3
+
+from apps.core.media import signed_url
+from apps.core.s3 import ContentAddressedMediaStorage, MediaStorage
+from apps.core.storage import private_storage
+
+
+BUCKET = 'globalcool-media'
+
+S3_SETTINGS = {
+    'AWS_ACCESS_KEY_ID': 'testing',
+    'AWS_SECRET_ACCESS_KEY': 'testing',
+    'AWS_STORAGE_BUCKET_NAME': BUCKET,
+    'AWS_S3_REGION_NAME': 'us-east-1',
+    'AWS_S3_ENDPOINT_URL': None,
+    'AWS_S3_CUSTOM_DOMAIN': None,
+    'AWS_S3_MULTIPART_THRESHOLD': 5 * 1024 * 1024,
+    'AWS_S3_MULTIPART_CHUNKSIZE': 5 * 1024 * 1024,
+    'STORAGES': {
+        **settings.STORAGES,
+        'default': {'BACKEND': 'apps.core.s3.MediaStorage'},
+        'private': {'BACKEND': 'apps.core.s3.PrivateMediaStorage'},
+    },
+    'CACHES': {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+}
+
+
+@override_settings(**S3_SETTINGS)
+class S3MediaStorageTest(TestCase):
+    """Test cases for the bucket-backed media storage, against moto's S3"""
+
+    def setUp(self):
+        mock = mock_s3()
+        mock.start()
+        self.addCleanup(mock.stop)
+        boto3.client('s3', region_name='us-east-1').create_bucket(Bucket=BUCKET)
+
+        self.storage = MediaStorage()
+        self.requests = []
+        self.storage.connection.meta.client.meta.events.register(
+            'before-call.s3', lambda model, **kwargs: self.requests.append(model.name)
+        )
+
+    def test_large_files_use_multipart_upload(self):
+        """Test that files past the threshold go up in parts and small ones in one request"""
+        photo = bytes(11 * 1024 * 1024)
+        name = self.storage.save('products/2026/10/compressor.jpg', ContentFile(photo))
+        head = self.storage.connection.meta.client.head_object(Bucket=BUCKET, Key=f'media/{name}')
+        self.assertTrue(head['ETag'].strip('"').endswith('-3'))
+        self.assertIn('CreateMultipartUpload', self.requests)
+        self.assertEqual(self.requests.count('UploadPart'), 3)
+
+        self.requests.clear()
+        self.storage.save('products/2026/10/label.png', ContentFile(b'\x89PNG' + bytes(64)))
+        self.assertNotIn('CreateMultipartUpload', self.requests)
+        self.assertIn('PutObject', self.requests)
+
+    def test_saved_files_need_no_requests_to_render(self):
+        """Test that exists, size and url after a save are answered without calling S3"""
+        name = self.storage.save('services/2026/10/split-unit.jpg', ContentFile(b'jpeg' * 100))
+        self.requests.clear()
+        for _ in range(3):
+            self.assertTrue(self.storage.exists(name))
+            self.assertEqual(self.storage.size(name), 400)
+            url = self.storage.url(name)
+        self.assertEqual(self.requests, [])
+        self.assertTrue(url.endswith('/media/services/2026/10/split-unit.jpg'))
+        self.assertNotIn('Signature', url)
+
+    def test_unknown_names_are_looked_up_once(self):
+        """Test that a name the map has not seen costs one HEAD request, then none"""
+        self.assertFalse(self.storage.exists('services/missing.jpg'))
+        self.assertFalse(self.storage.exists('services/missing.jpg'))
+        self.assertEqual(self.requests, ['HeadObject'])
+
+        # A file another server uploaded is found with its size
+        boto3.client('s3', region_name='us-east-1').put_object(
+            Bucket=BUCKET, Key='media/services/elsewhere.jpg', Body=b'12345'
+        )
+        self.assertEqual(self.storage.size('services/elsewhere.jpg'), 5)
+        self.assertTrue(self.storage.exists('services/elsewhere.jpg'))
+        self.assertEqual(self.requests, ['HeadObject', 'HeadObject'])
+
+    def test_same_name_upload_is_renamed_and_delete_is_remembered(self):
+        """Test that a second upload with the same name is kept apart and deletes update the map"""
+        first = self.storage.save('portfolio/site.jpg', ContentFile(b'first'))
+        second = self.storage.save('portfolio/site.jpg', ContentFile(b'second'))
+        self.assertNotEqual(first, second)
+        self.assertEqual(self.storage.open(first).read(), b'first')
+
+        self.storage.delete(first)
+        self.requests.clear()
+        self.assertFalse(self.storage.exists(first))
+        self.assertEqual(self.requests, [])
+
+    def test_private_media_redirects_to_signed_url(self):
+        """Test that the protected media view sends permitted users to a short-lived signed URL"""
+        storage = private_storage()
+        name = storage.save('quotations/2026/10/QT-0001.pdf', ContentFile(b'%PDF-1.4'))
+        response = self.client.get(signed_url(name))
+        self.assertEqual(response.status_code, 302)
+        location = response['Location']
+        self.assertIn(f'{BUCKET}', location)
+        self.assertIn('/private/quotations/2026/10/QT-0001.pdf', location)
+        self.assertIn('Signature', location)
+        self.assertIn('response-content-disposition', location)
+
+        anonymous = reverse('core:protected_media', kwargs={'path': name})
+        self.assertEqual(self.client.get(anonymous).status_code, 403)
+
+    def test_duplicate_upload_refreshes_the_stored_object(self):
+        """Test that uploading stored bytes again skips the upload but moves LastModified"""
+        storage = ContentAddressedMediaStorage()
+        storage.connection.meta.client.meta.events.register(
+            'before-call.s3', lambda model, **kwargs: self.requests.append(model.name)
+        )
+        first = storage.save('images/front.jpg', ContentFile(b'jpeg' * 100))
+        self.requests.clear()
+        second = storage.save('images/site.jpg', ContentFile(b'jpeg' * 100))
+        self.assertEqual(first, second)
+        self.assertEqual(self.requests, ['CopyObject'])
+
+        head = storage.connection.meta.client.head_object(Bucket=BUCKET, Key=f'media/{first}')
+        self.assertEqual(head['ContentType'], 'image/jpeg')
+        self.assertEqual(head['CacheControl'], settings.AWS_S3_OBJECT_PARAMETERS['CacheControl'])
@@ -0,0 +1,106 @@
+import io
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from apps.core.seeding import SEED_EMAIL_DOMAIN, seed_scale_data
+from apps.leads.models import Booking, ChatMessage, ChatSession, Client, Inquiry, Quotation
+from apps.services.models import Service, ServiceCategory
+
+
+VOLUMES = {
+    'clients': 50,
+    'bookings': 200,
+    'inquiries': 60,
+    'quotations': 20,
+    'chat_sessions': 10,
+    'chat_messages': 100,
+}
+
+
+class SeedScaleDataTest(TestCase):
+    """Test cases for scale data generation"""
+
+    def setUp(self):
+        category = ServiceCategory.objects.create(name='HVAC Services', slug='hvac-services')
+        self.service_ids = [
+            Service.objects.create(
+                name=f'Service {index}', slug=f'service-{index}', category=category, summary='Summary'
+            ).pk
+            for index in range(3)
+        ]
+
+    def snapshot(self):
+        return list(Booking.objects.order_by('booking_id').values_list(
+            'booking_id', 'contact_email', 'status', 'preferred_date', 'created_at', 'estimated_cost'
+        ))
+
+    def test_creates_requested_volumes(self):
+        """Test that each kind gets exactly the requested number of rows"""
+        created = seed_scale_data(VOLUMES, seed=1, service_ids=self.service_ids)
+
+        self.assertEqual(created, VOLUMES)
+        self.assertEqual(Client.objects.count(), 50)
+        self.assertEqual(Booking.objects.count(), 200)
+        self.assertEqual(Inquiry.objects.count(), 60)
+        self.assertEqual(Quotation.objects.count(), 20)
+        self.assertEqual(ChatSession.objects.count(), 10)
+        self.assertEqual(ChatMessage.objects.count(), 100)
+        self.assertFalse(Booking.objects.filter(client__isnull=True).exists())
+        self.assertEqual(Client.objects.filter(email__endswith=f'@{SEED_EMAIL_DOMAIN}').count(), 50)
+
+    def test_keeps_historic_timestamps_and_totals(self):
+        """Test that generated dates survive bulk_create and client totals are filled in"""
+        seed_scale_data(VOLUMES, seed=1, service_ids=self.service_ids)
+
+        dates = Booking.objects.dates('created_at', 'month')
+        self.assertGreater(len(dates), 6)
+        self.assertEqual(
+            sum(Client.objects.values_list('total_bookings', flat=True)),
+            Booking.objects.count(),
+        )
+        # auto_now/auto_now_add are restored afterwards
+        field = Booking._meta.get_field('created_at')
+        self.assertTrue(field.auto_now_add)
+
+    def test_same_seed_produces_same_data(self):
+        """Test that generation is deterministic for a seed and differs across seeds"""
+        volumes = {'clients': 30, 'bookings': 100}
+        seed_scale_data(volumes, seed=7, batch_size=7, service_ids=self.service_ids)
+        first = self.snapshot()
+        Booking.objects.all().delete()
+        Client.objects.all().delete()
+
+        seed_scale_data(volumes, seed=7, batch_size=500, service_ids=self.service_ids)
+        self.assertEqual(self.snapshot(), first)
+        Booking.objects.all().delete()
+        Client.objects.all().delete()
+
+        seed_scale_data(volumes, seed=8, service_ids=self.service_ids)
+        self.assertNotEqual(self.snapshot(), first)
+
+    def test_command_refuses_to_seed_twice_without_flush(self):
+        """Test that the command requires --flush when seeded rows already exist"""
+        out = io.StringIO()
+        args = ['--scale', '0', '--clients', '20', '--bookings', '40']
+        call_command('seed_scale_data', *args, stdout=out)
+        self.assertEqual(Booking.objects.count(), 40)
+
+        with self.assertRaises(CommandError):
+            call_command('seed_scale_data', *args, stdout=out)
+
+        call_command('seed_scale_data', *args, '--flush', stdout=out)
+        self.assertEqual(Client.objects.count(), 20)
+        self.assertEqual(Booking.objects.count(), 40)
+
+    def test_command_rejects_children_without_their_parents(self):
+        """Test that asking for rows without the rows they point at names the missing kind"""
+        for args, parent in [
+            (['--bookings', '5'], '--clients'),
+            (['--chat-messages', '5'], '--chat-sessions'),
+        ]:
+            with self.assertRaisesMessage(CommandError, parent):
+                call_command('seed_scale_data', '--scale', '0', *args, stdout=io.StringIO())
+        self.assertFalse(Booking.objects.exists())
+        self.assertFalse(ChatMessage.objects.exists())
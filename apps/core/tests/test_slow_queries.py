@@ -0,0 +1,90 @@
+import json
+import os
+import tempfile
+import time
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.core import jsonl, slow_queries
+from apps.leads.models import Client
+
+
+class SlowQueryLogTest(TestCase):
+    """Test cases for the slow-query log"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.log_file = os.path.join(self.tmpdir.name, 'slow.log')
+        slow_queries._buffer.clear()
+
+    def test_fingerprint_ignores_literals_and_list_lengths(self):
+        """Test that queries differing only in values share a fingerprint"""
+        a = slow_queries.fingerprint("SELECT * FROM t WHERE id IN (%s, %s) AND name = 'x' LIMIT 21")
+        b = slow_queries.fingerprint("SELECT *  FROM t WHERE id IN (%s, %s, %s) AND name = 'y''s' LIMIT 5")
+        self.assertEqual(a, b)
+        self.assertEqual(a[1], 'SELECT * FROM t WHERE id IN (...) AND name = ? LIMIT ?')
+
+    def test_records_call_site_and_writes_log_file(self):
+        """Test that a query over the threshold is logged with its ORM call site"""
+        self.assertIn(slow_queries.log_slow_queries, connection.execute_wrappers)
+        with override_settings(SLOW_QUERY_THRESHOLD_MS=0, SLOW_QUERY_LOG_FILE=self.log_file):
+            list(Client.objects.filter(email='someone@example.com'))
+
+        entry = slow_queries.recent_records()[-1]
+        self.assertIn('leads_client', entry['sql'])
+        self.assertEqual(entry['params'], '(str)')
+        self.assertIn('SlowQueryLogTest.test_records_call_site_and_writes_log_file', entry['stack'][0])
+        self.assertEqual(slow_queries.load_records(self.log_file)[-1]['fingerprint'], entry['fingerprint'])
+
+    def test_each_worker_writes_its_own_file(self):
+        """Test that records go to a file named after this process and are read back with other workers'"""
+        other = jsonl.worker_path(self.log_file, pid=99999)
+        with open(other, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'time': '2000-01-01T00:00:00+00:00', 'fingerprint': 'other'}) + '\n')
+        exited = jsonl.worker_path(self.log_file, pid=99998)
+        with open(exited, 'w', encoding='utf-8') as f:
+            f.write('{}\n')
+        month_ago = time.time() - 30 * 24 * 60 * 60
+        os.utime(exited, (month_ago, month_ago))
+
+        with override_settings(SLOW_QUERY_THRESHOLD_MS=0, SLOW_QUERY_LOG_FILE=self.log_file):
+            list(Client.objects.filter(email='someone@example.com'))
+        slow_queries._log.close()
+
+        self.assertTrue(os.path.exists(jsonl.worker_path(self.log_file)))
+        self.assertFalse(os.path.exists(self.log_file))
+        self.assertFalse(os.path.exists(exited))
+        records = slow_queries.load_records(self.log_file)
+        self.assertEqual(records[0]['fingerprint'], 'other')
+        self.assertEqual(records[-1]['fingerprint'], slow_queries.recent_records()[-1]['fingerprint'])
+
+    @override_settings(SLOW_QUERY_THRESHOLD_MS=None, SLOW_QUERY_SAMPLE_EVERY=2, SLOW_QUERY_LOG_FILE='')
+    def test_samples_every_nth_query(self):
+        """Test that sampling records a share of fast queries"""
+        for _ in range(10):
+            Client.objects.exists()
+        records = slow_queries.recent_records()
+        self.assertEqual(len(records), 5)
+        self.assertTrue(all(entry['sampled'] for entry in records))
+
+    @override_settings(SLOW_QUERY_THRESHOLD_MS=0)
+    def test_staff_page_lists_top_offenders_with_view_name(self):
+        """Test that the staff page groups records and names the view that ran them"""
+        staff = User.objects.create_user('perf', 'perf@example.com', 'password', is_staff=True)
+        self.client.force_login(staff)
+        with override_settings(SLOW_QUERY_LOG_FILE=self.log_file):
+            self.client.get(reverse('users:admin_customers_list'))
+            response = self.client.get(reverse('users:admin_slow_queries'))
+
+        self.assertEqual(response.status_code, 200)
+        offenders = response.context['offenders']
+        self.assertTrue(offenders)
+        self.assertTrue(any('users:admin_customers_list' in o['sources'] for o in offenders))
+
+        self.client.logout()
+        response = self.client.get(reverse('users:admin_slow_queries'))
+        self.assertEqual(response.status_code, 302)
@@ -0,0 +1,104 @@
+import json
+import os
+import tempfile
+
+from django.apps import apps
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.contrib.staticfiles.utils import matches_patterns
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.test import Client, TestCase, override_settings
+from whitenoise.compress import brotli_installed
+
+from apps.core.static_assets import asset_size, page_report, template_assets
+
+
+class StaticPipelineTest(TestCase):
+    """Test cases for the hashed, precompressed static files pipeline"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        settings = override_settings(
+            STATIC_ROOT=self.tmpdir.name,
+            # The project's own files are enough, and much faster than every app's
+            STATICFILES_FINDERS=['django.contrib.staticfiles.finders.FileSystemFinder'],
+            # static/dist is only there once `npm run build` has run
+            STATICFILES_REQUIRED=[],
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+        call_command('collectstatic', interactive=False, verbosity=0)
+
+    def collected(self, path):
+        return os.path.exists(os.path.join(self.tmpdir.name, path))
+
+    def test_collectstatic_hashes_compresses_and_prunes(self):
+        """Test that assets get hashed names and gzip copies, and pruned files are left out"""
+        with open(os.path.join(self.tmpdir.name, 'staticfiles.json')) as f:
+            manifest = json.load(f)['paths']
+        hashed = manifest['img/hero-bg.svg']
+        self.assertRegex(hashed, r'^img/hero-bg\.[0-9a-f]{12}\.svg$')
+        self.assertEqual(staticfiles_storage.url('img/hero-bg.svg'), f'/static/{hashed}')
+        self.assertTrue(self.collected(f'{hashed}.gz'))
+
+        self.assertFalse(self.collected('css/input.css'))
+        self.assertFalse(self.collected('src/admin.js'))
+        self.assertFalse(self.collected('admin-css/style.css'))
+        self.assertTrue(self.collected('admin-lib/chart/chart.min.js'))
+
+    @override_settings(STATICFILES_REQUIRED=['img/hero-bg.svg', 'dist/never-built.js'])
+    def test_collectstatic_fails_without_built_bundles(self):
+        """Test that a missing layout bundle stops collectstatic and names the build to run"""
+        with self.assertRaisesMessage(ImproperlyConfigured, 'dist/never-built.js'):
+            call_command('collectstatic', interactive=False, verbosity=0)
+
+    def test_vendor_translations_are_pruned(self):
+        """Test that CKEditor keeps only its English translations"""
+        patterns = apps.get_app_config('staticfiles').ignore_patterns
+        self.assertIn('CVS', patterns)
+        self.assertTrue(matches_patterns('ckeditor/ckeditor/lang/fr.js', patterns))
+        self.assertTrue(matches_patterns('ckeditor/ckeditor/plugins/a11yhelp/dialogs/lang/es.js', patterns))
+        self.assertFalse(matches_patterns('ckeditor/ckeditor/lang/en.js', patterns))
+        self.assertFalse(matches_patterns('ckeditor/ckeditor/plugins/image/dialogs/image.js', patterns))
+
+    def test_hashed_files_are_immutable_and_precompressed(self):
+        """Test that WhiteNoise serves hashed names with a long immutable lifetime"""
+        url = staticfiles_storage.url('img/hero-bg.svg')
+        response = Client().get(url, HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertEqual(response['Content-Encoding'], 'br' if brotli_installed else 'gzip')
+
+    def test_missing_files_fall_back_to_plain_urls(self):
+        """Test that linking an uncollected file does not break the page"""
+        self.assertEqual(staticfiles_storage.url('img/og-image.jpg'), '/static/img/og-image.jpg')
+
+
+class StaticReportTest(TestCase):
+    """Test cases for the per-template static assets report"""
+
+    def test_assets_follow_base_templates_and_includes(self):
+        """Test that a page's assets include its layout's"""
+        static, external = template_assets('admin/dashboard.html')
+        self.assertIn('dist/admin.css', static)
+        self.assertIn('admin-img/user.jpg', static)
+
+    def test_layouts_load_one_self_hosted_bundle_each(self):
+        """Test that both layouts load their own CSS and JS bundle and nothing from other hosts"""
+        # The chat launcher links its bundle to fetch on first use
+        for name, bundles in (('pages/home.html', {'dist/public.css', 'dist/public.js', 'dist/chat.js'}),
+                              ('admin/dashboard.html', {'dist/admin.css', 'dist/admin.js'})):
+            static, external = template_assets(name)
+            self.assertEqual(external, set())
+            self.assertEqual({path for path in static if path.endswith(('.css', '.js'))}, bundles)
+        html = Client().get('/').content.decode()
+        self.assertRegex(html, r'<script defer src="/static/dist/public(\.[0-9a-f]{12})?\.js">')
+
+    def test_report_sums_bytes_and_flags_missing_files(self):
+        """Test that the report measures raw and gzip bytes and lists missing files"""
+        row = page_report(['pages/home.html'])[0]
+        self.assertGreaterEqual(row['raw'], row['gzip'])
+        self.assertIn('img/og-image.jpg', row['missing'])
+        size = asset_size('img/hero-bg.svg')
+        self.assertLess(size['gzip'], size['raw'])
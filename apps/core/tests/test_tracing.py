@@ -0,0 +1,151 @@
+import logging
+import os
+import tempfile
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.core import jsonl, tracing
+from apps.leads.models import Booking
+from apps.services.models import Service, ServiceCategory
+
+
+class TracingTest(TestCase):
+    """Test cases for request IDs and request tracing"""
+
+    @classmethod
+    def setUpTestData(cls):
+        category = ServiceCategory.objects.create(name='Cooling')
+        cls.service = Service.objects.create(name='AC Repair', category=category, summary='Summary')
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.trace_file = os.path.join(self.tmpdir.name, 'traces.jsonl')
+        settings = override_settings(
+            TRACING_ENABLED=True, TRACING_SAMPLE_RATE=1.0, TRACING_EXPORTER='jsonl', TRACING_FILE=self.trace_file,
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+        tracing._buffer.clear()
+
+    def span_names(self, record):
+        return [span['name'] for span in record['spans']]
+
+    def test_request_id_is_echoed_or_generated(self):
+        """Test that a valid X-Request-ID is kept and anything else is replaced"""
+        response = self.client.get(reverse('core:home'), HTTP_X_REQUEST_ID='edge-1234')
+        self.assertEqual(response['X-Request-ID'], 'edge-1234')
+
+        response = self.client.get(reverse('core:home'), HTTP_X_REQUEST_ID='bad id\nwith newline')
+        self.assertRegex(response['X-Request-ID'], r'^[0-9a-f]{32}$')
+        self.assertEqual(tracing.recent_traces()[0]['request_id'], response['X-Request-ID'])
+
+    def test_booking_submission_breakdown(self):
+        """Test that a booking submission records form, ORM, template and email spans"""
+        response = self.client.post(reverse('leads:booking_create'), {
+            'service': self.service.pk,
+            'contact_name': 'Jane Doe',
+            'contact_email': 'jane@example.com',
+            'contact_phone': '+254700000000',
+            'preferred_date': (date.today() + timedelta(days=3)).isoformat(),
+            'preferred_time_slot': 'flexible',
+            'location_address': 'Nairobi',
+            'priority': 'normal',
+        }, HTTP_X_REQUEST_ID='booking-1')
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(Booking.objects.exists())
+
+        record = tracing.find_trace('booking-1')
+        names = self.span_names(record)
+        self.assertEqual(record['name'], 'POST leads:booking_create')
+        self.assertEqual(record['spans'][0]['attributes']['http.status_code'], 302)
+        for expected in ('BookingForm.full_clean', 'Client.objects.get_or_create', 'Booking.save',
+                         'render emails/booking_confirmation.html', 'email.send', 'INSERT leads_booking'):
+            self.assertIn(expected, names)
+
+        spans = {span['span_id']: span for span in record['spans']}
+        insert = next(span for span in record['spans'] if span['name'] == 'INSERT leads_booking')
+        self.assertEqual(spans[insert['parent_id']]['name'], 'Booking.save')
+        self.assertNotIn('jane@example.com', insert['attributes']['db.statement'])
+
+    def test_traces_are_written_to_this_workers_file(self):
+        """Test that exported traces land in a file named after the process and are found from it"""
+        self.client.get(reverse('core:home'), HTTP_X_REQUEST_ID='worker-file-1')
+        tracing.exporter().close()
+        tracing._buffer.clear()
+
+        self.assertTrue(os.path.exists(jsonl.worker_path(self.trace_file)))
+        self.assertFalse(os.path.exists(self.trace_file))
+        self.assertEqual(tracing.load_traces(self.trace_file)[0]['request_id'], 'worker-file-1')
+        self.assertEqual(tracing.find_trace('worker-file-1')['request_id'], 'worker-file-1')
+
+    def test_unsampled_requests_keep_request_id(self):
+        """Test that requests outside the sample get an ID but no trace"""
+        with override_settings(TRACING_SAMPLE_RATE=0):
+            response = self.client.get(reverse('core:home'))
+        self.assertIn('X-Request-ID', response)
+        self.assertEqual(tracing.recent_traces(), [])
+
+    def test_traceparent_continues_callers_trace(self):
+        """Test that a trusted caller's sampled traceparent is continued even when sampling is off"""
+        trace_id, parent_id = '4bf92f3577b34da6a3ce929d0e0e4736', '00f067aa0ba902b7'
+        with override_settings(TRACING_SAMPLE_RATE=0, TRACING_TRUST_TRACEPARENT=True):
+            self.client.get(reverse('core:home'), HTTP_TRACEPARENT=f'00-{trace_id}-{parent_id}-01')
+        record = tracing.recent_traces()[0]
+        self.assertEqual(record['trace_id'], trace_id)
+        self.assertEqual(record['spans'][0]['parent_id'], parent_id)
+
+    def test_untrusted_traceparent_cannot_force_sampling(self):
+        """Test that by default a client's sampled flag is ignored but its trace ID is kept"""
+        trace_id, parent_id = '4bf92f3577b34da6a3ce929d0e0e4736', '00f067aa0ba902b7'
+        header = f'00-{trace_id}-{parent_id}-01'
+        with override_settings(TRACING_SAMPLE_RATE=0):
+            self.client.get(reverse('core:home'), HTTP_TRACEPARENT=header)
+        self.assertEqual(tracing.recent_traces(), [])
+
+        self.client.get(reverse('core:home'), HTTP_TRACEPARENT=header)
+        self.assertEqual(tracing.recent_traces()[0]['trace_id'], trace_id)
+
+    def test_log_records_carry_request_id(self):
+        """Test that log lines written during a request carry its request ID"""
+        record = logging.LogRecord('apps.test', logging.INFO, __file__, 1, 'message', (), None)
+        with tracing.start_trace('job', request_id='log-1', sampled=False):
+            tracing.RequestIDFilter().filter(record)
+        self.assertEqual(record.request_id, 'log-1')
+
+    def test_management_jobs_are_traced(self):
+        """Test that commands listed as jobs get their own trace"""
+        with override_settings(TRACING_JOB_COMMANDS=['perf_stats']):
+            call_command('perf_stats', stdout=open(os.devnull, 'w'))
+        record = tracing.recent_traces()[0]
+        self.assertEqual(record['name'], 'manage.py perf_stats')
+        self.assertEqual(record['kind'], 'job')
+
+    def test_otlp_payload(self):
+        """Test that traces are encoded as OTLP/HTTP JSON"""
+        with tracing.start_trace('GET /', request_id='otlp-1'):
+            with tracing.span('work', answer=42):
+                pass
+        payload = tracing.otlp_payload([tracing.recent_traces()[0]], 'site')
+        spans = payload['resourceSpans'][0]['scopeSpans'][0]['spans']
+        self.assertEqual([span['name'] for span in spans], ['GET /', 'work'])
+        self.assertEqual(spans[0]['kind'], 2)
+        self.assertEqual(spans[1]['parentSpanId'], spans[0]['spanId'])
+        self.assertIn({'key': 'answer', 'value': {'intValue': '42'}}, spans[1]['attributes'])
+
+    def test_waterfall_page(self):
+        """Test that staff can look up a request ID and see its spans"""
+        self.client.get(reverse('core:home'), HTTP_X_REQUEST_ID='page-1')
+        staff = User.objects.create_user('staff', 'staff@example.com', 'password', is_staff=True)
+        self.client.force_login(staff)
+
+        response = self.client.get(reverse('users:admin_traces'), {'request_id': 'page-1'})
+        self.assertRedirects(response, reverse('users:admin_trace_detail', args=['page-1']))
+        response = self.client.get(reverse('users:admin_trace_detail', args=['page-1']))
+        self.assertContains(response, 'GET core:home')
+        self.assertEqual(response.context['rows'][0]['depth'], 0)
+        self.assertEqual(self.client.get(reverse('users:admin_trace_detail', args=['missing'])).status_code, 404)
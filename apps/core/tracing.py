@@ -0,0 +1,562 @@
+"""
+Lightweight tracing with request IDs.
+
+Every request gets a request ID: the caller's ``X-Request-ID`` when it looks
+sane, otherwise a new one. ``TracingMiddleware`` echoes it in the response,
+``RequestIDFilter`` adds it to log records as ``%(request_id)s`` and the
+slow-query log stores it with each record.
+
+Sampled requests (``TRACING_SAMPLE_RATE``) are also traced. An incoming W3C
+``traceparent`` header's trace ID is kept, but its sampled flag only decides
+when ``TRACING_TRUST_TRACEPARENT`` says the callers are our own services;
+otherwise any client could have every request traced. Spans are recorded around SQL
+queries, ORM writes (``save``, ``delete``, ``get_or_create``...), form
+validation, template rendering, cache operations and email sending, so a
+booking submission shows up as the form, ``Client.objects.get_or_create``,
+``Booking.save``, the confirmation template and SMTP. Management commands in
+``TRACING_JOB_COMMANDS``, the site's background jobs, are traced the same way.
+``span()`` and ``@traced`` add spans around any other code.
+
+Finished traces go to an in-process ring buffer and to the exporter chosen by
+``TRACING_EXPORTER``: ``jsonl`` appends one line per trace to a per-worker
+file named after ``TRACING_FILE`` (see apps.core.jsonl), ``otlp`` posts OTLP/HTTP JSON to ``TRACING_OTLP_ENDPOINT``
+(an OpenTelemetry collector, Jaeger or Tempo) from a background thread. Staff
+look request IDs up in the custom admin to see the span waterfall.
+"""
+import functools
+import json
+import logging
+import queue
+import random
+import re
+import secrets
+import threading
+import time
+import urllib.request
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import connections
+
+from . import jsonl
+
+
+REQUEST_ID_HEADER = 'HTTP_X_REQUEST_ID'
+TRACEPARENT_HEADER = 'HTTP_TRACEPARENT'
+REQUEST_ID_PATTERN = re.compile(r'^[A-Za-z0-9._-]{1,64}$')
+_TRACEPARENT = re.compile(r'^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$')
+_SQL_TABLE = re.compile(r'\b(?:FROM|INTO|UPDATE)\s+"?(\w+)"?', re.IGNORECASE)
+
+# OTLP SpanKind: SERVER for requests, CLIENT for calls out of the process
+_OTLP_KINDS = {'server': 2, 'db': 3, 'cache': 3, 'email': 3}
+
+_request_id = ContextVar('request_id', default=None)
+_trace = ContextVar('trace', default=None)
+_span = ContextVar('span', default=None)
+_buffer = deque(maxlen=getattr(settings, 'TRACING_BUFFER_SIZE', 200))
+
+logger = logging.getLogger(__name__)
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def new_request_id():
+    return secrets.token_hex(16)
+
+
+def request_id_from(value):
+    """The caller's request ID when it is safe to log and echo, else a new one"""
+    if value and REQUEST_ID_PATTERN.match(value):
+        return value
+    return new_request_id()
+
+
+def parse_traceparent(value):
+    """``(trace_id, parent_span_id, sampled)`` from a traceparent header, or None"""
+    match = _TRACEPARENT.match((value or '').strip().lower())
+    if not match or match.group(1) == '0' * 32 or match.group(2) == '0' * 16:
+        return None
+    return match.group(1), match.group(2), bool(int(match.group(3), 16) & 1)
+
+
+def current_request_id():
+    return _request_id.get()
+
+
+def current_trace():
+    return _trace.get()
+
+
+def propagation_headers():
+    """Headers carrying this request's ID and trace context to another service"""
+    headers = {}
+    request_id = _request_id.get()
+    if request_id:
+        headers['X-Request-ID'] = request_id
+    trace, span_ = _trace.get(), _span.get()
+    if trace is not None and span_ is not None:
+        headers['traceparent'] = f'00-{trace.trace_id}-{span_.span_id}-01'
+    return headers
+
+
+class RequestIDFilter(logging.Filter):
+    """Add ``request_id`` to every log record ('-' outside requests)"""
+
+    def filter(self, record):
+        record.request_id = _request_id.get() or '-'
+        return True
+
+
+class Span:
+    """One timed operation within a trace"""
+
+    __slots__ = ('span_id', 'parent_id', 'name', 'kind', 'start', 'duration', 'attributes', 'error', '_started')
+
+    def __init__(self, name, kind, parent_id, attributes):
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.attributes = attributes
+        self.error = ''
+        self.duration = 0.0
+        self.start = time.time()
+        self._started = time.perf_counter()
+
+    def finish(self):
+        self.duration = time.perf_counter() - self._started
+
+    def to_dict(self):
+        return {
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'kind': self.kind,
+            'start': self.start,
+            'duration_ms': round(self.duration * 1000, 3),
+            'attributes': self.attributes,
+            'error': self.error,
+        }
+
+
+class Trace:
+    """The spans recorded for one request or job"""
+
+    def __init__(self, request_id, trace_id=None, remote_parent_id=None):
+        self.request_id = request_id
+        self.trace_id = trace_id or secrets.token_hex(16)
+        self.remote_parent_id = remote_parent_id
+        self.spans = []
+        self.dropped = 0
+        self.root = None
+
+    def to_dict(self):
+        root = self.root
+        return {
+            'request_id': self.request_id,
+            'trace_id': self.trace_id,
+            'name': root.name,
+            'kind': root.kind,
+            'time': datetime.fromtimestamp(root.start, dt_timezone.utc).isoformat(),
+            'duration_ms': round(root.duration * 1000, 3),
+            'error': root.error,
+            'spans': [span_.to_dict() for span_ in self.spans],
+            'dropped_spans': self.dropped,
+        }
+
+
+@contextmanager
+def span(name, kind='internal', **attributes):
+    """Record the enclosed block as a span of the current trace, if any"""
+    trace = _trace.get()
+    if trace is None:
+        yield None
+        return
+    if len(trace.spans) >= _setting('TRACING_MAX_SPANS', 1000):
+        trace.dropped += 1
+        yield None
+        return
+    parent = _span.get()
+    current = Span(name, kind, parent.span_id if parent else trace.remote_parent_id, attributes)
+    trace.spans.append(current)
+    token = _span.set(current)
+    try:
+        yield current
+    except BaseException as exc:
+        current.error = f'{type(exc).__name__}: {exc}'[:300]
+        raise
+    finally:
+        current.finish()
+        _span.reset(token)
+
+
+def traced(name=None, kind='internal'):
+    """Decorator recording each call of the function as a span"""
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _trace.get() is None:
+                return func(*args, **kwargs)
+            with span(label, kind):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _sampled(remote_sampled):
+    if not _setting('TRACING_ENABLED', True):
+        return False
+    if remote_sampled is not None and _setting('TRACING_TRUST_TRACEPARENT', False):
+        return remote_sampled
+    rate = _setting('TRACING_SAMPLE_RATE', 1.0)
+    return rate >= 1 or random.random() < rate
+
+
+@contextmanager
+def start_trace(name, kind='server', request_id=None, parent=None, sampled=None, **attributes):
+    """
+    Run the enclosed block under ``request_id`` and, when sampled, trace it.
+    ``parent`` is a parsed traceparent continuing a caller's trace. Yields
+    the Trace, or None when the block is not sampled.
+    """
+    request_id = request_id or new_request_id()
+    request_token = _request_id.set(request_id)
+    try:
+        if sampled is None:
+            sampled = _sampled(parent[2] if parent else None)
+        if not sampled or _trace.get() is not None:
+            yield None
+            return
+
+        trace = Trace(request_id, *(parent[:2] if parent else ()))
+        trace_token = _trace.set(trace)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(_trace_sql))
+                with span(name, kind, **attributes) as root:
+                    trace.root = root
+                    yield trace
+        finally:
+            _trace.reset(trace_token)
+            export(trace)
+    finally:
+        _request_id.reset(request_token)
+
+
+def _trace_sql(execute, sql, params, many, context):
+    if _trace.get() is None:
+        return execute(sql, params, many, context)
+    # Parameters are passed separately, so the statement carries no customer data
+    operation = sql.lstrip().split(None, 1)[0].upper() if sql.strip() else 'SQL'
+    table = _SQL_TABLE.search(sql)
+    name = f'{operation} {table.group(1)}' if table else operation
+    attributes = {'db.statement': sql[:1000], 'db.name': context['connection'].alias}
+    if many:
+        attributes['db.batch'] = True
+    with span(name, 'db', **attributes):
+        return execute(sql, params, many, context)
+
+
+def _wrap(func, kind, label):
+    """Wrap a method so calls made while tracing become spans named ``label(self)``"""
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if _trace.get() is None:
+            return func(self, *args, **kwargs)
+        with span(label(self), kind):
+            return func(self, *args, **kwargs)
+    return wrapper
+
+
+def _wrap_cache(func, operation):
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        parent = _span.get()
+        # Backends implement get() with get_many() and so on; keep the outer call
+        if _trace.get() is None or (parent is not None and parent.kind == 'cache'):
+            return func(self, *args, **kwargs)
+        attributes = {'cache.backend': type(self).__name__}
+        if args and isinstance(args[0], str):
+            attributes['cache.key'] = args[0][:200]
+        with span(f'cache.{operation}', 'cache', **attributes):
+            return func(self, *args, **kwargs)
+    return wrapper
+
+
+def _wrap_get_connection(get_connection):
+    @functools.wraps(get_connection)
+    def traced_get_connection(*args, **kwargs):
+        connection = get_connection(*args, **kwargs)
+        send_messages = connection.send_messages
+
+        def traced_send_messages(email_messages):
+            if _trace.get() is None:
+                return send_messages(email_messages)
+            with span('email.send', 'email', backend=type(connection).__name__, messages=len(email_messages)):
+                return send_messages(email_messages)
+
+        connection.send_messages = traced_send_messages
+        return connection
+    return traced_get_connection
+
+
+def _wrap_command_execute(execute):
+    @functools.wraps(execute)
+    def traced_execute(self, *args, **options):
+        command = self.__module__.rsplit('.', 1)[-1]
+        if command not in _setting('TRACING_JOB_COMMANDS', ()) or _trace.get() is not None:
+            return execute(self, *args, **options)
+        with start_trace(f'manage.py {command}', kind='job', sampled=_setting('TRACING_ENABLED', True)):
+            return execute(self, *args, **options)
+    return traced_execute
+
+
+_installed = False
+
+
+def install():
+    """Add spans to the ORM, forms, templates, caches, email and jobs. Safe to call twice."""
+    global _installed
+    if _installed:
+        return
+    _installed = True
+
+    from django.core import mail
+    from django.core.cache import caches
+    from django.core.management.base import BaseCommand
+    from django.db.models import Model, QuerySet
+    from django.forms import BaseForm
+    from django.template.base import Template
+
+    Model.save_base = _wrap(Model.save_base, 'orm', lambda obj: f'{type(obj).__name__}.save')
+    Model.delete = _wrap(Model.delete, 'orm', lambda obj: f'{type(obj).__name__}.delete')
+    for method in ('get_or_create', 'update_or_create', 'bulk_create', 'bulk_update', 'update', 'delete'):
+        setattr(QuerySet, method, _wrap(
+            getattr(QuerySet, method), 'orm',
+            lambda qs, method=method: f'{qs.model.__name__}.objects.{method}',
+        ))
+
+    BaseForm.full_clean = _wrap(BaseForm.full_clean, 'form', lambda form: f'{type(form).__name__}.full_clean')
+    Template.render = _wrap(
+        Template.render, 'template',
+        lambda template: f"render {template.origin.template_name or '<string>'}",
+    )
+
+    patched = set()
+    for alias in settings.CACHES:
+        backend = type(caches[alias])
+        if backend not in patched:
+            for operation in ('get', 'get_many', 'set', 'set_many', 'add', 'delete', 'incr'):
+                setattr(backend, operation, _wrap_cache(getattr(backend, operation), operation))
+            patched.add(backend)
+
+    mail.get_connection = _wrap_get_connection(mail.get_connection)
+    BaseCommand.execute = _wrap_command_execute(BaseCommand.execute)
+
+
+class JSONLExporter:
+    """Append each trace as one JSON line to this worker's rotating file"""
+
+    def __init__(self, path):
+        self.file = jsonl.JSONLFile(
+            path,
+            max_bytes=_setting('TRACING_FILE_MAX_BYTES', 10 * 1024 * 1024),
+            backups=_setting('TRACING_FILE_BACKUPS', 3),
+        )
+
+    def export(self, record):
+        self.file.write(record)
+
+    def close(self):
+        self.file.close()
+
+
+def _otlp_value(value):
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+
+def otlp_payload(records, service_name):
+    """Traces in the OTLP/HTTP JSON encoding of ExportTraceServiceRequest"""
+    spans = []
+    for record in records:
+        for item in record['spans']:
+            start = int(item['start'] * 1e9)
+            attributes = dict(item['attributes'], **{'request.id': record['request_id']})
+            spans.append({
+                'traceId': record['trace_id'],
+                'spanId': item['span_id'],
+                'parentSpanId': item['parent_id'] or '',
+                'name': item['name'],
+                'kind': _OTLP_KINDS.get(item['kind'], 1),
+                'startTimeUnixNano': str(start),
+                'endTimeUnixNano': str(start + int(item['duration_ms'] * 1e6)),
+                'attributes': [{'key': key, 'value': _otlp_value(value)} for key, value in attributes.items()],
+                'status': {'code': 2, 'message': item['error']} if item['error'] else {},
+            })
+    return {
+        'resourceSpans': [{
+            'resource': {'attributes': [{'key': 'service.name', 'value': {'stringValue': service_name}}]},
+            'scopeSpans': [{'scope': {'name': __name__}, 'spans': spans}],
+        }],
+    }
+
+
+class OTLPExporter:
+    """Post traces to an OTLP/HTTP collector from a background thread"""
+
+    def __init__(self, endpoint, batch_size=50, timeout=2.0):
+        self.endpoint = endpoint
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.queue = queue.Queue(maxsize=1000)
+        self.failing = False
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def export(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            return
+        with self.lock:
+            # Started on use: worker processes may be forked after import
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name='trace-exporter', daemon=True)
+                self.thread.start()
+
+    def _run(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            self.send(batch)
+
+    def send(self, records):
+        payload = otlp_payload(records, _setting('TRACING_SERVICE_NAME', 'globalcool-light'))
+        request = urllib.request.Request(
+            self.endpoint, data=json.dumps(payload).encode(),
+            headers={'Content-Type': 'application/json'}, method='POST',
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout):
+                pass
+        except Exception as exc:
+            # Warn once per outage rather than once per batch
+            if not self.failing:
+                logger.warning('Could not export traces to %s: %s', self.endpoint, exc)
+            self.failing = True
+        else:
+            self.failing = False
+
+
+_exporter = None
+_exporter_key = None
+_exporter_lock = threading.Lock()
+
+
+def exporter():
+    """The configured exporter, or None when traces are only kept in memory"""
+    global _exporter, _exporter_key
+    kind = _setting('TRACING_EXPORTER', 'jsonl')
+    target = str(_setting('TRACING_OTLP_ENDPOINT' if kind == 'otlp' else 'TRACING_FILE', '') or '')
+    with _exporter_lock:
+        if _exporter_key != (kind, target):
+            if isinstance(_exporter, JSONLExporter):
+                _exporter.close()
+            if kind == 'jsonl' and target:
+                _exporter = JSONLExporter(target)
+            elif kind == 'otlp' and target:
+                _exporter = OTLPExporter(target)
+            else:
+                _exporter = None
+            _exporter_key = (kind, target)
+    return _exporter
+
+
+def export(trace):
+    if trace.root is None:
+        return
+    record = trace.to_dict()
+    _buffer.append(record)
+    target = exporter()
+    if target is not None:
+        try:
+            target.export(record)
+        except Exception:
+            logger.exception('Could not export trace %s', trace.request_id)
+
+
+def recent_traces():
+    """Traces finished in this process, newest first"""
+    return list(reversed(_buffer))
+
+
+def load_traces(path=None, limit=500):
+    """Traces from every worker's JSON-lines file and their rotated backups, newest first"""
+    path = str(path or _setting('TRACING_FILE', ''))
+    if not path:
+        return []
+    return list(reversed(jsonl.read(path, limit)))
+
+
+def find_trace(request_id):
+    """The trace for a request ID (or trace ID) from this process or the file"""
+    if _setting('TRACING_EXPORTER', 'jsonl') == 'jsonl':
+        candidates = load_traces(limit=10000) + recent_traces()
+    else:
+        candidates = recent_traces()
+    for record in candidates:
+        if request_id in (record['request_id'], record['trace_id']):
+            return record
+    return None
+
+
+def waterfall(record):
+    """
+    Spans in call order with their depth and position as percentages of the
+    trace duration: ``{'span', 'depth', 'offset', 'width', 'start_ms'}``.
+    """
+    spans = record['spans']
+    if not spans:
+        return []
+    started = min(item['start'] for item in spans)
+    total_ms = max(record['duration_ms'], 0.001)
+    ids = {item['span_id'] for item in spans}
+    children = {}
+    for item in spans:
+        parent = item['parent_id'] if item['parent_id'] in ids else None
+        children.setdefault(parent, []).append(item)
+
+    rows = []
+
+    def walk(parent, depth):
+        for item in sorted(children.get(parent, ()), key=lambda item: item['start']):
+            start_ms = (item['start'] - started) * 1000
+            rows.append({
+                'span': item,
+                'depth': depth,
+                'start_ms': start_ms,
+                'offset': min(start_ms * 100 / total_ms, 100),
+                'width': max(min(item['duration_ms'] * 100 / total_ms, 100), 0.2),
+            })
+            walk(item['span_id'], depth + 1)
+
+    walk(None, 0)
+    return rows
@@ -20,4 +20,10 @@ urlpatterns = [
 
     # AJAX endpoints
     path('ajax/contact/', views.ajax_contact_form, name='ajax_contact'),
+
+    # Prometheus scrape endpoint
+    path('metrics', views.metrics, name='metrics'),
+
+    # Private uploads, after a permission check
+    path('private-media/<path:path>', views.protected_media, name='protected_media'),
 ]
@@ -1,7 +1,8 @@
 from django.shortcuts import render, redirect
 from django.contrib import messages
 from django.views.generic import TemplateView
-from django.http import JsonResponse
+from django.http import HttpResponse, HttpResponseForbidden, JsonResponse
+from django.views.decorators.http import require_GET
 from django.core.mail import send_mail
 from django.conf import settings
 from .models import FAQ, Testimonial, ContactMessage
@@ -136,3 +137,34 @@ def ajax_contact_form(request):
             })
 
     return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+
+@require_GET
+def metrics(request):
+    """Prometheus scrape endpoint, restricted by address or bearer token"""
+    from .metrics import is_authorized, render_metrics
+
+    if not is_authorized(request):
+        return HttpResponseForbidden('Forbidden')
+    response = HttpResponse(render_metrics(), content_type='text/plain; version=0.0.4; charset=utf-8')
+    response['Cache-Control'] = 'no-store'
+    return response
+
+
+@require_GET
+def protected_media(request, path):
+    """A private upload, for staff or a signed link; the web server sends the bytes"""
+    from django.core.exceptions import SuspiciousFileOperation
+    from django.http import Http404
+    from .media import can_access, serve
+    from .storage import private_storage
+
+    if not can_access(request, path):
+        return HttpResponseForbidden('Forbidden')
+    storage = private_storage()
+    try:
+        if not storage.exists(path):
+            raise Http404('File not found')
+    except SuspiciousFileOperation:
+        raise Http404('File not found')
+    return serve(request, storage, path)
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count
 from .models import ChatSession, ChatMessage, Client, Booking, Inquiry, Quotation
 
 # Register your models here.
@@ -17,9 +18,13 @@ class ChatSessionAdmin(admin.ModelAdmin):
     readonly_fields = ('session_id', 'created_at', 'updated_at')
     inlines = [ChatMessageInline]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(message_count=Count('messages'))
+
     def message_count(self, obj):
-        return obj.messages.count()
+        return obj.message_count
     message_count.short_description = 'Messages'
+    message_count.admin_order_field = 'message_count'
 
 @admin.register(ChatMessage)
 class ChatMessageAdmin(admin.ModelAdmin):
@@ -49,15 +54,27 @@ class BookingAdmin(admin.ModelAdmin):
     readonly_fields = ['booking_id', 'created_at', 'updated_at']
     date_hierarchy = 'preferred_date'
 
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        # Service.__str__ includes the category name
+        if db_field.name == 'service':
+            kwargs['queryset'] = db_field.related_model.objects.select_related('category')
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
 
 @admin.register(Inquiry)
 class InquiryAdmin(admin.ModelAdmin):
     list_display = ['inquiry_id', 'contact_name', 'subject', 'service', 'status', 'priority', 'created_at']
     list_filter = ['status', 'priority', 'created_at']
+    list_select_related = ['service__category']
     search_fields = ['contact_name', 'contact_email', 'subject']
     readonly_fields = ['inquiry_id', 'created_at', 'updated_at']
     date_hierarchy = 'created_at'
 
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == 'service':
+            kwargs['queryset'] = db_field.related_model.objects.select_related('category')
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
 
 @admin.register(Quotation)
 class QuotationAdmin(admin.ModelAdmin):
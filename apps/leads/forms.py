@@ -86,7 +86,7 @@ class BookingForm(forms.ModelForm):
         super().__init__(*args, **kwargs)
         
         # Filter active services only
-        self.fields['service'].queryset = Service.objects.filter(is_active=True)
+        self.fields['service'].queryset = Service.objects.filter(is_active=True).select_related('category')
         
         # Pre-select service if provided
         if service_slug:
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.16 on 2026-10-19 07:01
+
+import apps.core.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0003_chatsession_assigned_to_chatsession_status'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='quotation',
+            name='pdf_file',
+            field=models.FileField(blank=True, storage=apps.core.storage.private_storage, upload_to='quotations/%Y/%m/'),
+        ),
+    ]
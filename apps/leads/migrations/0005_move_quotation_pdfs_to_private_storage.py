@@ -0,0 +1,37 @@
+from django.core.files.storage import storages
+from django.db import migrations
+
+
+def _move(Quotation, source, target):
+    quotations = Quotation.objects.exclude(pdf_file='').exclude(pdf_file__isnull=True).only('pk', 'pdf_file')
+    for quotation in quotations.iterator(chunk_size=500):
+        name = quotation.pdf_file.name
+        if not source.exists(name):
+            # Already moved, or the file was lost before this migration
+            continue
+        if not target.exists(name):
+            with source.open(name, 'rb') as f:
+                stored = target.save(name, f)
+            if stored != name:
+                Quotation.objects.filter(pk=quotation.pk).update(pdf_file=stored)
+        source.delete(name)
+
+
+def move_to_private(apps, schema_editor):
+    """Move PDFs generated before 0004 out of public media into the private storage"""
+    _move(apps.get_model('leads', 'Quotation'), storages['default'], storages['private'])
+
+
+def move_to_public(apps, schema_editor):
+    _move(apps.get_model('leads', 'Quotation'), storages['private'], storages['default'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0004_quotation_pdf_private_storage'),
+    ]
+
+    operations = [
+        migrations.RunPython(move_to_private, move_to_public),
+    ]
@@ -4,6 +4,8 @@ from django.utils import timezone
 from django.core.validators import RegexValidator
 import uuid
 
+from apps.core.storage import private_storage
+
 
 class Client(models.Model):
     """Customer/Client information"""
@@ -397,7 +399,7 @@ class Quotation(models.Model):
     decided_at = models.DateTimeField(null=True, blank=True)
 
     # Files
-    pdf_file = models.FileField(upload_to='quotations/%Y/%m/', blank=True)
+    pdf_file = models.FileField(upload_to='quotations/%Y/%m/', storage=private_storage, blank=True)
 
     # Admin fields
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='created_quotations')
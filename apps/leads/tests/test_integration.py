@@ -8,6 +8,7 @@ from unittest.mock import patch
 
 from apps.leads.models import Client, Booking, Inquiry
 from apps.services.models import Service, ServiceCategory
+from apps.users import dashboard
 
 
 class BookingFlowIntegrationTest(TransactionTestCase):
@@ -339,18 +340,20 @@ class BookingFlowIntegrationTest(TransactionTestCase):
         response = self.client.get(reverse('users:admin_dashboard'))
         self.assertEqual(response.status_code, 200)
         
-        # Check analytics data is present
-        self.assertIn('service_performance', response.context)
-        self.assertIn('status_distribution', response.context)
+        # Check analytics widgets load
+        for widget in ('service_performance', 'status_distribution'):
+            response = self.client.get(reverse('users:admin_dashboard_widget', args=[widget]))
+            self.assertEqual(response.status_code, 200)
         
         # Check specific metrics
-        context = response.context
-        self.assertEqual(context['total_bookings'], 11)  # 3+2+5+1
-        self.assertEqual(context['completed_bookings'], 5)
+        status_counts = dashboard.status_distribution()['status_distribution']
+        self.assertEqual(sum(row['count'] for row in status_counts), 11)  # 3+2+5+1
+        kpis = dashboard.kpis()
+        self.assertEqual(kpis['completed_bookings'], 5)
         
         # Check revenue calculation
         expected_revenue = sum([30000 + (i * 1000) for i in range(5)])
-        self.assertEqual(context['monthly_revenue'], expected_revenue)
+        self.assertEqual(kpis['monthly_revenue'], expected_revenue)
     
     def test_error_handling(self):
         """Test error handling in booking flow"""
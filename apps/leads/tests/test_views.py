@@ -5,7 +5,7 @@ from django.utils import timezone
 from datetime import date, timedelta
 from unittest.mock import patch
 
-from apps.leads.models import Client, Booking, Inquiry
+from apps.leads.models import Client, Booking, Inquiry, ChatSession, ChatMessage
 from apps.services.models import Service, ServiceCategory
 from apps.leads.forms import BookingForm, InquiryForm
 
@@ -375,3 +375,41 @@ class AdminBookingViewsTest(TestCase):
         # Check notes were updated
         self.booking.refresh_from_db()
         self.assertEqual(self.booking.admin_notes, 'Customer called to confirm appointment')
+
+
+class ChatViewsTest(TestCase):
+    """Test cases for the lazily loaded live chat"""
+
+    def setUp(self):
+        self.client = TestClient()
+        self.session = ChatSession.objects.create(session_id='chat-1', name='Jane', email='jane@example.com')
+        self.first = ChatMessage.objects.create(session=self.session, message_type='user', content='Hello')
+        self.reply = ChatMessage.objects.create(session=self.session, message_type='agent', content='Hi Jane')
+
+    def test_pages_ship_only_the_launcher(self):
+        """Test that public pages carry the launcher but not the chat panel or its code"""
+        response = self.client.get(reverse('core:home'))
+        self.assertContains(response, 'id="chat-launcher"')
+        self.assertContains(response, reverse('leads:chat_panel'))
+        self.assertNotContains(response, 'x-data="chatWidget')
+        self.assertNotContains(response, 'setInterval')
+
+    def test_chat_panel_is_cacheable(self):
+        """Test that the panel markup is served on its own with a public cache lifetime"""
+        response = self.client.get(reverse('leads:chat_panel'))
+        self.assertContains(response, 'x-data="chatWidget"')
+        self.assertIn('public', response['Cache-Control'])
+
+    def test_history_returns_only_newer_messages(self):
+        """Test that polling with ?after= returns only messages the widget has not seen"""
+        url = reverse('leads:chat_history', args=['chat-1'])
+        self.assertEqual(len(self.client.get(url).json()['messages']), 2)
+
+        messages = self.client.get(url, {'after': self.first.id}).json()['messages']
+        self.assertEqual([(m['type'], m['content']) for m in messages], [('agent', 'Hi Jane')])
+        self.assertEqual(self.client.get(url, {'after': self.reply.id}).json()['messages'], [])
+
+    def test_history_of_unknown_session_is_not_found(self):
+        """Test that a session with no messages sent yet is a 404, not a server error"""
+        response = self.client.get(reverse('leads:chat_history', args=['chat-unsent']))
+        self.assertEqual(response.status_code, 404)
@@ -17,6 +17,7 @@ urlpatterns = [
     path('quote/', views.QuoteRequestView.as_view(), name='quote'),
 
     # Chat URLs
+    path('chat/panel/', views.ChatPanelView.as_view(), name='chat_panel'),
     path('chat/message/', views.ChatMessageView.as_view(), name='chat_message'),
     path('chat/history/<str:session_id>/', views.ChatHistoryView.as_view(), name='chat_history'),
 ]
@@ -1,6 +1,7 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.views.generic import TemplateView, CreateView, DetailView
 from django.http import JsonResponse
+from django.views.decorators.cache import cache_control
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from django.views import View
@@ -8,6 +9,7 @@ from django.contrib import messages
 from django.urls import reverse_lazy, reverse
 from django.core.mail import send_mail
 from django.conf import settings
+from django.utils import timezone
 import json
 import uuid
 from .models import ChatSession, ChatMessage, Booking, Inquiry, Client
@@ -392,13 +394,24 @@ class ChatMessageView(View):
             return "Thank you for your message! Our team will review your inquiry and get back to you shortly. For immediate assistance, please call us at +254 700 000 000 or use our WhatsApp chat."
 
 
+@method_decorator(cache_control(public=True, max_age=3600), name='dispatch')
+class ChatPanelView(TemplateView):
+    """Live chat panel markup, fetched by the chat bundle on first use"""
+    template_name = 'components/chat-panel.html'
+
+
 class ChatHistoryView(View):
-    """Get chat history for a session"""
+    """Get chat history for a session, or with ?after=<id> only newer messages"""
 
     def get(self, request, session_id):
+        # Unknown sessions are a 404 so the widget knows not to poll them yet
+        session = get_object_or_404(ChatSession, session_id=session_id)
+        try:
+            after = int(request.GET.get('after', 0))
+        except ValueError:
+            after = 0
         try:
-            session = get_object_or_404(ChatSession, session_id=session_id)
-            messages = session.messages.all()
+            messages = session.messages.filter(id__gt=after) if after else session.messages.all()
 
             message_data = []
             for message in messages:
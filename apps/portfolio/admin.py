@@ -18,6 +18,12 @@ class ProjectAdmin(admin.ModelAdmin):
     filter_horizontal = ['services']
     inlines = [ProjectImageInline]
 
+    def formfield_for_manytomany(self, db_field, request, **kwargs):
+        # Service.__str__ includes the category name
+        if db_field.name == 'services':
+            kwargs['queryset'] = db_field.related_model.objects.select_related('category')
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
+
     fieldsets = (
         ('Basic Information', {
             'fields': ('title', 'slug', 'summary', 'description')
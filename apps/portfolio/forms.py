@@ -99,7 +99,7 @@ class ProjectForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fields['services'].queryset = Service.objects.filter(is_active=True)
+        self.fields['services'].queryset = Service.objects.filter(is_active=True).select_related('category')
         self.fields['services'].help_text = "Hold Ctrl/Cmd to select multiple services"
         
         # Make certain fields optional for better UX
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.16 on 2026-10-19 07:11
+
+import apps.core.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='projectimage',
+            name='image',
+            field=models.ImageField(storage=apps.core.storage.image_storage, upload_to='images/'),
+        ),
+    ]
@@ -3,6 +3,8 @@ from django.urls import reverse
 from django.utils.text import slugify
 from ckeditor.fields import RichTextField
 
+from apps.core.storage import image_storage
+
 
 class Project(models.Model):
     """Portfolio projects showcasing HVAC work"""
@@ -108,7 +110,7 @@ class ProjectImage(models.Model):
     ]
 
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='images')
-    image = models.ImageField(upload_to='portfolio/%Y/%m/')
+    image = models.ImageField(upload_to='images/', storage=image_storage)
     title = models.CharField(max_length=200, blank=True)
     description = models.TextField(blank=True)
     image_type = models.CharField(max_length=20, choices=IMAGE_TYPES, default='other')
@@ -1,11 +1,18 @@
 """
 Django management command to safely delete all services and products data.
 This command provides options to delete specific data types or all data.
+
+Rows are deleted in primary-key batches with short transactions (see
+apps.core.bulk_delete), so large tables are never loaded into memory or
+locked for the whole run. Interrupted runs can be continued with --resume.
 """
 
+import os
+import tempfile
+
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
-from django.utils import timezone
+from django.db import DatabaseError
+from apps.core.bulk_delete import DEFAULT_BATCH_SIZE, DeleteCheckpoint, delete_in_order
 from apps.services.models import (
     Service, ServiceCategory, ServiceImage,
     Product, ProductCategory, ProductImage
@@ -51,6 +58,22 @@ class Command(BaseCommand):
             action='store_true',
             help='Show what would be deleted without actually deleting',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f'Rows deleted per transaction (default: {DEFAULT_BATCH_SIZE})',
+        )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='Continue an interrupted deletion from its checkpoint',
+        )
+        parser.add_argument(
+            '--checkpoint',
+            default=os.path.join(tempfile.gettempdir(), 'clear_services_products.checkpoint.json'),
+            help='Checkpoint file used for --resume',
+        )
 
     def handle(self, *args, **options):
         # Validate arguments
@@ -73,6 +96,9 @@ class Command(BaseCommand):
                 "You can only specify one deletion option at a time"
             )
 
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size must be at least 1")
+
         # Show current data counts
         self.show_current_data()
 
@@ -99,6 +125,39 @@ class Command(BaseCommand):
         self.stdout.write(f"Product Images: {ProductImage.objects.count()}")
         self.stdout.write("")
 
+    def run_delete(self, querysets, options):
+        """Delete the querysets in order, in batches, and return rows deleted per model"""
+        checkpoint = DeleteCheckpoint(options['checkpoint'], resume=options['resume'])
+        try:
+            counts = delete_in_order(
+                querysets,
+                batch_size=options['batch_size'],
+                checkpoint=checkpoint,
+                progress=self.report_progress,
+            )
+        except DatabaseError as e:
+            raise CommandError(
+                f"Error deleting data: {e}\nRe-run with --resume to continue where it stopped."
+            )
+        for label, count in sorted(counts.items()):
+            self.stdout.write(f"  {label}: {count} deleted")
+        if counts.get('services.ServiceImage') or counts.get('services.ProductImage'):
+            # Image files can be shared between rows, so they are not deleted here
+            self.stdout.write("Run `manage.py gc_media --delete` to remove image files nothing references any more.")
+        return counts
+
+    def show_plan(self, querysets):
+        """Show every row a deletion would remove, including cascades"""
+        counts = delete_in_order(querysets, dry_run=True)
+        for label, count in sorted(counts.items()):
+            self.stdout.write(self.style.WARNING(f"  {label}: {count} would be deleted"))
+
+    def report_progress(self, progress):
+        self.stdout.write(
+            f"  {progress['label']}: {progress['deleted']}/{progress['total']} "
+            f"({progress['rate']:.0f} rows/s)"
+        )
+
     def confirm_deletion(self, message, force=False):
         """Ask for user confirmation unless force is True"""
         if force:
@@ -119,29 +178,25 @@ class Command(BaseCommand):
 
         message = f"This will delete {service_count} services and {service_image_count} service images."
         
+        # Delete service images first (though CASCADE would handle this)
+        querysets = [ServiceImage.objects.all(), Service.objects.all()]
+
         if options['dry_run']:
             self.stdout.write(self.style.WARNING(f"DRY RUN: {message}"))
+            self.show_plan(querysets)
             return
 
         if not self.confirm_deletion(message, options['force']):
             self.stdout.write("Operation cancelled.")
             return
 
-        try:
-            with transaction.atomic():
-                # Delete service images first (though CASCADE should handle this)
-                deleted_images = ServiceImage.objects.all().delete()
-                # Delete services
-                deleted_services = Service.objects.all().delete()
-                
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"Successfully deleted {deleted_services[0]} services "
-                        f"and {deleted_images[0]} service images."
-                    )
-                )
-        except Exception as e:
-            raise CommandError(f"Error deleting services data: {e}")
+        counts = self.run_delete(querysets, options)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully deleted {counts['services.Service']} services "
+                f"and {counts['services.ServiceImage']} service images."
+            )
+        )
 
     def delete_products_data(self, options):
         """Delete all products and related data"""
@@ -154,29 +209,25 @@ class Command(BaseCommand):
 
         message = f"This will delete {product_count} products and {product_image_count} product images."
         
+        # Delete product images first (though CASCADE would handle this)
+        querysets = [ProductImage.objects.all(), Product.objects.all()]
+
         if options['dry_run']:
             self.stdout.write(self.style.WARNING(f"DRY RUN: {message}"))
+            self.show_plan(querysets)
             return
 
         if not self.confirm_deletion(message, options['force']):
             self.stdout.write("Operation cancelled.")
             return
 
-        try:
-            with transaction.atomic():
-                # Delete product images first (though CASCADE should handle this)
-                deleted_images = ProductImage.objects.all().delete()
-                # Delete products
-                deleted_products = Product.objects.all().delete()
-                
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"Successfully deleted {deleted_products[0]} products "
-                        f"and {deleted_images[0]} product images."
-                    )
-                )
-        except Exception as e:
-            raise CommandError(f"Error deleting products data: {e}")
+        counts = self.run_delete(querysets, options)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully deleted {counts['services.Product']} products "
+                f"and {counts['services.ProductImage']} product images."
+            )
+        )
 
     def delete_categories_data(self, options):
         """Delete all categories (this will cascade delete all related data)"""
@@ -195,29 +246,26 @@ class Command(BaseCommand):
             f"{service_count} services and {product_count} products due to CASCADE."
         )
         
+        # Delete categories (CASCADE will handle related data)
+        querysets = [ServiceCategory.objects.all(), ProductCategory.objects.all()]
+
         if options['dry_run']:
             self.stdout.write(self.style.WARNING(f"DRY RUN: {message}"))
+            self.show_plan(querysets)
             return
 
         if not self.confirm_deletion(message, options['force']):
             self.stdout.write("Operation cancelled.")
             return
 
-        try:
-            with transaction.atomic():
-                # Delete categories (CASCADE will handle related data)
-                deleted_service_cats = ServiceCategory.objects.all().delete()
-                deleted_product_cats = ProductCategory.objects.all().delete()
-                
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"Successfully deleted {deleted_service_cats[0]} service categories "
-                        f"and {deleted_product_cats[0]} product categories "
-                        f"(and all related data)."
-                    )
-                )
-        except Exception as e:
-            raise CommandError(f"Error deleting categories: {e}")
+        counts = self.run_delete(querysets, options)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully deleted {counts['services.ServiceCategory']} service categories "
+                f"and {counts['services.ProductCategory']} product categories "
+                f"(and all related data)."
+            )
+        )
 
     def delete_images_data(self, options):
         """Delete only images"""
@@ -230,27 +278,24 @@ class Command(BaseCommand):
 
         message = f"This will delete {service_image_count} service images and {product_image_count} product images."
         
+        querysets = [ServiceImage.objects.all(), ProductImage.objects.all()]
+
         if options['dry_run']:
             self.stdout.write(self.style.WARNING(f"DRY RUN: {message}"))
+            self.show_plan(querysets)
             return
 
         if not self.confirm_deletion(message, options['force']):
             self.stdout.write("Operation cancelled.")
             return
 
-        try:
-            with transaction.atomic():
-                deleted_service_images = ServiceImage.objects.all().delete()
-                deleted_product_images = ProductImage.objects.all().delete()
-                
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"Successfully deleted {deleted_service_images[0]} service images "
-                        f"and {deleted_product_images[0]} product images."
-                    )
-                )
-        except Exception as e:
-            raise CommandError(f"Error deleting images: {e}")
+        counts = self.run_delete(querysets, options)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully deleted {counts['services.ServiceImage']} service images "
+                f"and {counts['services.ProductImage']} product images."
+            )
+        )
 
     def delete_all_data(self, options):
         """Delete all services and products data"""
@@ -279,35 +324,29 @@ class Command(BaseCommand):
             f"Total: {total_items} items"
         )
         
+        # Delete in order to avoid foreign key constraints
+        querysets = [
+            ServiceImage.objects.all(),
+            ProductImage.objects.all(),
+            Service.objects.all(),
+            Product.objects.all(),
+            ServiceCategory.objects.all(),
+            ProductCategory.objects.all(),
+        ]
+
         if options['dry_run']:
             self.stdout.write(self.style.WARNING(f"DRY RUN: {message}"))
+            self.show_plan(querysets)
             return
 
         if not self.confirm_deletion(message, options['force']):
             self.stdout.write("Operation cancelled.")
             return
 
-        try:
-            with transaction.atomic():
-                # Delete in order to avoid foreign key constraints
-                deleted_service_images = ServiceImage.objects.all().delete()
-                deleted_product_images = ProductImage.objects.all().delete()
-                deleted_services = Service.objects.all().delete()
-                deleted_products = Product.objects.all().delete()
-                deleted_service_cats = ServiceCategory.objects.all().delete()
-                deleted_product_cats = ProductCategory.objects.all().delete()
-                
-                total_deleted = (
-                    deleted_service_images[0] + deleted_product_images[0] +
-                    deleted_services[0] + deleted_products[0] +
-                    deleted_service_cats[0] + deleted_product_cats[0]
-                )
-                
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"Successfully deleted all services and products data "
-                        f"({total_deleted} total items)."
-                    )
-                )
-        except Exception as e:
-            raise CommandError(f"Error deleting all data: {e}")
+        counts = self.run_delete(querysets, options)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully deleted all services and products data "
+                f"({sum(counts.values())} total items)."
+            )
+        )
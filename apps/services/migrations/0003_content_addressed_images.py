@@ -0,0 +1,24 @@
+# Generated by Django 4.2.16 on 2026-10-19 07:11
+
+import apps.core.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0002_product_productcategory_serviceimage_productimage_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='productimage',
+            name='image',
+            field=models.ImageField(storage=apps.core.storage.image_storage, upload_to='images/'),
+        ),
+        migrations.AlterField(
+            model_name='serviceimage',
+            name='image',
+            field=models.ImageField(storage=apps.core.storage.image_storage, upload_to='images/'),
+        ),
+    ]
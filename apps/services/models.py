@@ -3,6 +3,8 @@ from django.urls import reverse
 from django.utils.text import slugify
 from ckeditor.fields import RichTextField
 
+from apps.core.storage import image_storage
+
 
 class ServiceCategory(models.Model):
     """Categories for HVAC services"""
@@ -111,7 +113,7 @@ class Service(models.Model):
 class ServiceImage(models.Model):
     """Images for services"""
     service = models.ForeignKey(Service, on_delete=models.CASCADE, related_name='images')
-    image = models.ImageField(upload_to='services/%Y/%m/')
+    image = models.ImageField(upload_to='images/', storage=image_storage)
     title = models.CharField(max_length=200, blank=True)
     description = models.TextField(blank=True)
     is_featured = models.BooleanField(default=False, help_text="Use as service thumbnail")
@@ -258,7 +260,7 @@ class ProductImage(models.Model):
     ]
 
     product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='images')
-    image = models.ImageField(upload_to='products/%Y/%m/')
+    image = models.ImageField(upload_to='images/', storage=image_storage)
     title = models.CharField(max_length=200, blank=True)
     description = models.TextField(blank=True)
     image_type = models.CharField(max_length=20, choices=IMAGE_TYPES, default='gallery')
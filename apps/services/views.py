@@ -40,7 +40,7 @@ class ServiceListView(ListView):
         context['search_query'] = self.request.GET.get('search', '')
 
         # Add products to the context for combined services/products page
-        context['products'] = Product.objects.filter(is_active=True).select_related('category')[:6]
+        context['products'] = Product.objects.filter(is_active=True).select_related('category').prefetch_related('images')[:6]
         context['product_categories'] = ProductCategory.objects.filter(
             is_active=True,
             products__is_active=True
@@ -87,7 +87,7 @@ class ProductListView(ListView):
     paginate_by = 12
 
     def get_queryset(self):
-        queryset = Product.objects.filter(is_active=True).select_related('category')
+        queryset = Product.objects.filter(is_active=True).select_related('category').prefetch_related('images')
 
         # Filter by category if provided
         category_slug = self.request.GET.get('category')
@@ -14,6 +14,7 @@ class UserProfileInline(admin.StackedInline):
 class UserAdmin(BaseUserAdmin):
     inlines = (UserProfileInline,)
     list_display = ['username', 'email', 'first_name', 'last_name', 'is_staff', 'get_role', 'date_joined']
+    list_select_related = ['profile']
 
     def get_role(self, obj):
         return obj.profile.get_role_display() if hasattr(obj, 'profile') else 'No Profile'
@@ -0,0 +1,202 @@
+"""
+Widgets for the admin dashboard.
+
+``admin/dashboard.html`` renders only the page shell. Each card group is then
+fetched from ``admin_dashboard_widget`` by HTMX, so the requests run in
+parallel and a slow widget cannot hold up the others. A widget's output is
+cached for its own TTL and shared by every staff user, since none of it
+depends on who is looking.
+
+Widgets with a template are served as HTML fragments, the others as JSON for
+charts and scripts.
+"""
+import json
+from datetime import datetime, timedelta
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Avg, Count, Q, Sum
+from django.template.loader import render_to_string
+
+
+WIDGETS = {}
+
+# Bootstrap badge colour per booking status
+STATUS_CLASSES = {
+    'new': 'primary',
+    'confirmed': 'info',
+    'in_progress': 'warning',
+    'completed': 'success',
+    'cancelled': 'danger',
+    'rescheduled': 'secondary'
+}
+
+
+def widget(name, ttl, template=None):
+    """Register a function returning a widget's data, cached for ``ttl`` seconds"""
+    def register(func):
+        WIDGETS[name] = {'data': func, 'ttl': ttl, 'template': template}
+        return func
+    return register
+
+
+def render_widget(name):
+    """``(content, content_type)`` of a widget, from the cache while it is fresh"""
+    spec = WIDGETS[name]
+    key = f'dashboard-widget:{name}'
+    rendered = cache.get(key)
+    if rendered is None:
+        data = spec['data']()
+        if spec['template']:
+            rendered = (render_to_string(spec['template'], data), 'text/html; charset=utf-8')
+        else:
+            rendered = (json.dumps(data, cls=DjangoJSONEncoder), 'application/json')
+        cache.set(key, rendered, spec['ttl'])
+    return rendered
+
+
+@widget('kpis', ttl=60, template='admin/partials/dashboard_kpis.html')
+def kpis():
+    from apps.leads.models import Booking, Client
+    from apps.services.models import Service
+
+    today = datetime.now().date()
+
+    # Calculate monthly revenue from completed bookings
+    monthly_revenue = Booking.objects.filter(
+        preferred_date__gte=today.replace(day=1),
+        status='completed',
+        actual_cost__isnull=False
+    ).aggregate(
+        total=Sum('actual_cost')
+    )['total'] or 0
+
+    return {
+        'today_bookings': Booking.objects.filter(preferred_date=today).count(),
+        'this_week_bookings': Booking.objects.filter(
+            preferred_date__gte=today - timedelta(days=7),
+            preferred_date__lte=today
+        ).count(),
+        'pending_bookings': Booking.objects.filter(status__in=['new', 'confirmed']).count(),
+        'total_customers': Client.objects.count(),
+        'active_services': Service.objects.filter(is_active=True).count(),
+        'monthly_revenue': int(monthly_revenue),
+        'completed_bookings': Booking.objects.filter(status='completed').count(),
+    }
+
+
+@widget('recent_bookings', ttl=30, template='admin/partials/dashboard_recent_bookings.html')
+def recent_bookings():
+    from apps.leads.models import Booking
+
+    bookings = Booking.objects.select_related('service').order_by('-created_at')[:10]
+    return {
+        'recent_bookings': [
+            {
+                'customer': booking.contact_name,
+                'service': booking.service.name,
+                'date': booking.preferred_date.strftime('%Y-%m-%d'),
+                'status': booking.get_status_display(),
+                'status_class': STATUS_CLASSES.get(booking.status, 'secondary'),
+                'booking_id': booking.booking_id.hex[:8]
+            }
+            for booking in bookings
+        ]
+    }
+
+
+@widget('service_performance', ttl=5 * 60, template='admin/partials/dashboard_service_performance.html')
+def service_performance():
+    from apps.leads.models import Booking
+
+    return {
+        'service_performance': list(Booking.objects.values(
+            'service__name'
+        ).annotate(
+            total_bookings=Count('id'),
+            completed_bookings=Count('id', filter=Q(status='completed')),
+            total_revenue=Sum('actual_cost', filter=Q(status='completed')),
+            avg_cost=Avg('actual_cost', filter=Q(status='completed'))
+        ).order_by('-total_bookings')[:5])
+    }
+
+
+@widget('monthly_trends', ttl=60 * 60)
+def monthly_trends():
+    from apps.leads.models import Booking
+
+    # Bookings created in each of the last 6 months, counted in one query
+    today = datetime.now().date()
+    month_dates = [today.replace(day=1) - timedelta(days=30*i) for i in range(6)]
+    month_counts = Booking.objects.aggregate(**{
+        f'month_{i}': Count('id', filter=Q(
+            created_at__date__gte=month_date,
+            created_at__date__lt=month_date + timedelta(days=32)
+        ))
+        for i, month_date in enumerate(month_dates)
+    })
+    trends = [
+        {'month': month_date.strftime('%b %Y'), 'bookings': month_counts[f'month_{i}']}
+        for i, month_date in enumerate(month_dates)
+    ]
+    trends.reverse()
+    return {'monthly_trends': trends}
+
+
+@widget('status_distribution', ttl=2 * 60, template='admin/partials/dashboard_status_distribution.html')
+def status_distribution():
+    from apps.leads.models import Booking
+
+    return {
+        'status_distribution': list(Booking.objects.values('status').annotate(
+            count=Count('id')
+        ).order_by('-count'))
+    }
+
+
+@widget('portfolio', ttl=5 * 60, template='admin/partials/dashboard_portfolio.html')
+def portfolio():
+    from apps.portfolio.models import Project
+
+    counts = Project.objects.aggregate(
+        total_projects=Count('id'),
+        published_projects=Count('id', filter=Q(is_published=True)),
+        featured_projects=Count('id', filter=Q(is_featured=True)),
+        draft_projects=Count('id', filter=Q(is_published=False)),
+    )
+    return {
+        **counts,
+        'recent_projects': list(Project.objects.prefetch_related('images').order_by('-created_at')[:5]),
+    }
+
+
+@widget('quotations', ttl=2 * 60)
+def quotations():
+    from apps.leads.models import Quotation
+
+    stats = Quotation.objects.aggregate(
+        total_quotations=Count('id'),
+        draft_quotations=Count('id', filter=Q(status='draft')),
+        sent_quotations=Count('id', filter=Q(status='sent')),
+        accepted_quotations=Count('id', filter=Q(status='accepted')),
+        pending_quotations=Count('id', filter=Q(status__in=['sent', 'viewed'])),
+        total_quotation_value=Sum('total'),
+        accepted_quotation_value=Sum('total', filter=Q(status='accepted')),
+    )
+    stats['total_quotation_value'] = int(stats['total_quotation_value'] or 0)
+    stats['accepted_quotation_value'] = int(stats['accepted_quotation_value'] or 0)
+
+    recent = Quotation.objects.select_related('client').order_by('-created_at')[:5]
+    stats['recent_quotations'] = [
+        {
+            'id': quotation.pk,
+            'quote_number': quotation.quote_number,
+            'title': quotation.title,
+            'client': quotation.client.name,
+            'status': quotation.get_status_display(),
+            'total': quotation.total,
+            'created_at': quotation.created_at,
+        }
+        for quotation in recent
+    ]
+    return stats
@@ -1,7 +1,12 @@
+import csv
+import itertools
+
 from django import forms
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.contrib.auth.forms import UserCreationForm
 from django.core.exceptions import ValidationError
+from apps.core.importers import read_rows
 from .models import UserProfile
 
 
@@ -225,3 +230,63 @@ class AdminUserEditForm(forms.ModelForm):
             user.profile.role = self.cleaned_data['role']
             user.profile.save()
         return user
+
+
+class DataImportForm(forms.Form):
+    """Form for uploading a CSV/XLSX file to bulk import"""
+
+    KIND_CHOICES = [
+        ('clients', 'Clients'),
+        ('bookings', 'Bookings'),
+        ('products', 'Products'),
+    ]
+
+    kind = forms.ChoiceField(
+        choices=KIND_CHOICES,
+        widget=forms.Select(attrs={'class': 'form-select'})
+    )
+    file = forms.FileField(
+        widget=forms.ClearableFileInput(attrs={
+            'class': 'form-control',
+            'accept': '.csv,.xlsx'
+        }),
+        help_text='CSV or Excel (.xlsx) file with a header row'
+    )
+    batch_size = forms.IntegerField(
+        min_value=1,
+        max_value=10000,
+        initial=1000,
+        widget=forms.NumberInput(attrs={'class': 'form-control'}),
+        help_text='Rows inserted per transaction'
+    )
+    dry_run = forms.BooleanField(
+        required=False,
+        widget=forms.CheckboxInput(attrs={'class': 'form-check-input'}),
+        help_text='Validate the file without importing anything'
+    )
+    allow_past_dates = forms.BooleanField(
+        required=False,
+        widget=forms.CheckboxInput(attrs={'class': 'form-check-input'}),
+        help_text='Accept bookings dated in the past (historical data)'
+    )
+
+    def clean_file(self):
+        upload = self.cleaned_data['file']
+        if not upload.name.lower().endswith(('.csv', '.xlsx')):
+            raise ValidationError('Upload a .csv or .xlsx file.')
+
+        # The import runs inside the request; a file that would outlast the
+        # worker timeout has to go through the management command instead
+        max_rows = getattr(settings, 'IMPORT_ADMIN_MAX_ROWS', 20000)
+        try:
+            rows = sum(1 for _ in itertools.islice(read_rows(upload, upload.name), max_rows + 1))
+        except (ImportError, csv.Error, UnicodeDecodeError):
+            # Reported by the view when the import reads the file again
+            rows = 0
+        upload.seek(0)
+        if rows > max_rows:
+            raise ValidationError(
+                f'This page imports at most {max_rows:,} rows. For larger files run '
+                f'"python manage.py import_data <kind> <file>" on the server.'
+            )
+        return upload
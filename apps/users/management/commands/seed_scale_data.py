@@ -0,0 +1,94 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.bulk_delete import delete_in_order
+from apps.core.seeding import DEFAULT_VOLUMES, PARENT_KINDS, SEED_ORDER, seed_scale_data, seeded_querysets
+from apps.services.models import Service
+
+
+class Command(BaseCommand):
+    help = 'Generate deterministic, production-sized data for load and performance testing'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scale',
+            type=float,
+            default=1.0,
+            help='Multiplier applied to the default volumes (e.g. 0.01 for a quick run)',
+        )
+        for kind in SEED_ORDER:
+            parser.add_argument(
+                f"--{kind.replace('_', '-')}",
+                type=int,
+                dest=kind,
+                help=f'Number of {kind.replace("_", " ")} to create (default {DEFAULT_VOLUMES[kind]:,} x scale)',
+            )
+        parser.add_argument('--seed', type=int, default=42, help='Random seed; the same seed produces the same data')
+        parser.add_argument('--batch-size', type=int, default=2000, help='Rows per INSERT')
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=0,
+            help='Generate rows in a process pool of this size while inserting (default: in-process)',
+        )
+        parser.add_argument(
+            '--flush',
+            action='store_true',
+            help='Delete previously seeded rows first',
+        )
+
+    def handle(self, *args, **options):
+        volumes = {
+            kind: options[kind] if options[kind] is not None else int(DEFAULT_VOLUMES[kind] * options['scale'])
+            for kind in SEED_ORDER
+        }
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1.')
+        for kind, parent in PARENT_KINDS.items():
+            if volumes[kind] and not volumes[parent]:
+                raise CommandError(
+                    f"--{kind.replace('_', '-')} needs --{parent.replace('_', '-')} to be seeded in the same run."
+                )
+
+        if options['flush']:
+            self.stdout.write('Removing previously seeded data...')
+            counts = delete_in_order(seeded_querysets(), batch_size=5000)
+            for label, count in sorted(counts.items()):
+                self.stdout.write(f'  {label}: {count:,}')
+        elif any(queryset.exists() for queryset in seeded_querysets()):
+            raise CommandError('Seeded data already exists. Run again with --flush to replace it.')
+
+        service_ids = list(Service.objects.filter(is_active=True).order_by('pk').values_list('pk', flat=True))
+        if not service_ids and (volumes['bookings'] or volumes['inquiries']):
+            from apps.users.management.commands.populate_sample_data import Command as SampleDataCommand
+            self.stdout.write('No active services found, creating the sample catalogue...')
+            SampleDataCommand(stdout=self.stdout, stderr=self.stderr).create_services()
+            service_ids = list(Service.objects.filter(is_active=True).order_by('pk').values_list('pk', flat=True))
+        staff_ids = list(User.objects.filter(is_staff=True).order_by('pk').values_list('pk', flat=True))
+
+        self.stdout.write('Seeding: ' + ', '.join(f'{volumes[kind]:,} {kind}' for kind in SEED_ORDER))
+        started = time.perf_counter()
+        created = seed_scale_data(
+            volumes,
+            seed=options['seed'],
+            batch_size=options['batch_size'],
+            workers=options['workers'],
+            service_ids=service_ids,
+            staff_ids=staff_ids,
+            progress=self.report_progress,
+        )
+
+        elapsed = time.perf_counter() - started
+        total = sum(created.values())
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {total:,} rows in {elapsed:.1f}s ({total / elapsed if elapsed else 0:,.0f} rows/s)'
+        ))
+
+    def report_progress(self, state):
+        self.stdout.write(
+            f"\r  {state['kind']}: {state['created']:,}/{state['total']:,}",
+            ending='\n' if state['created'] == state['total'] else '',
+        )
+        self.stdout.flush()
@@ -0,0 +1,96 @@
+"""
+Tests for the lazily loaded admin dashboard widgets.
+"""
+
+import json
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.leads.models import Booking
+from apps.services.models import Service, ServiceCategory
+from apps.users import dashboard
+
+User = get_user_model()
+
+
+class AdminDashboardWidgetTestCase(TestCase):
+    """Test cases for the dashboard shell and its widget endpoints"""
+
+    def setUp(self):
+        """Set up test data"""
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.client = Client()
+        User.objects.create_user(
+            username='admin_user',
+            email='admin@example.com',
+            password='adminpass123',
+            is_staff=True
+        )
+        self.client.login(username='admin_user', password='adminpass123')
+
+        category = ServiceCategory.objects.create(name='HVAC Services', slug='hvac-services')
+        service = Service.objects.create(name='AC Installation', slug='ac-installation', category=category,
+                                         summary='Professional AC installation', is_active=True)
+        for status in ['new', 'completed', 'completed']:
+            Booking.objects.create(service=service, contact_name='Wanjiku Otieno', contact_email='w@example.com',
+                                   contact_phone='+254700000000', preferred_date=date(2025, 1, 10),
+                                   location_address='Nairobi', status=status)
+
+    def widget_url(self, name):
+        return reverse('users:admin_dashboard_widget', args=[name])
+
+    def test_shell_loads_every_html_widget(self):
+        """Test that the dashboard renders placeholders instead of computing the widgets"""
+        response = self.client.get(reverse('users:admin_dashboard'))
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, 'Wanjiku Otieno')
+        for name, spec in dashboard.WIDGETS.items():
+            if spec['template']:
+                self.assertContains(response, f'hx-get="{self.widget_url(name)}" hx-trigger="load"')
+
+    def test_widget_renders_fragment_and_caches_it(self):
+        """Test that a widget is an HTML fragment served from the cache until its TTL runs out"""
+        response = self.client.get(self.widget_url('recent_bookings'))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Wanjiku Otieno')
+        self.assertNotContains(response, '<html')
+        self.assertIn('max-age=30', response['Cache-Control'])
+
+        Booking.objects.update(contact_name='Someone Else')
+        self.assertContains(self.client.get(self.widget_url('recent_bookings')), 'Wanjiku Otieno')
+
+        # Widgets expire independently
+        self.client.get(self.widget_url('kpis'))
+        cache.delete('dashboard-widget:recent_bookings')
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.widget_url('kpis'))
+        self.assertFalse(any('leads_booking' in query['sql'] for query in queries.captured_queries))
+        self.assertContains(self.client.get(self.widget_url('recent_bookings')), 'Someone Else')
+
+    def test_json_widgets(self):
+        """Test that chart data widgets return JSON"""
+        response = self.client.get(self.widget_url('monthly_trends'))
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(len(json.loads(response.content)['monthly_trends']), 6)
+
+        data = json.loads(self.client.get(self.widget_url('quotations')).content)
+        self.assertEqual(data['total_quotations'], 0)
+        self.assertEqual(data['recent_quotations'], [])
+
+    def test_kpis_count_bookings(self):
+        """Test that the KPI widget counts pending and completed bookings"""
+        response = self.client.get(self.widget_url('kpis'))
+        self.assertContains(response, 'Pending Bookings')
+        self.assertEqual(dashboard.kpis()['completed_bookings'], 2)
+        self.assertEqual(dashboard.kpis()['pending_bookings'], 1)
+
+    def test_unknown_widget_is_not_found(self):
+        """Test that an unregistered widget name is a 404"""
+        self.assertEqual(self.client.get(self.widget_url('missing')).status_code, 404)
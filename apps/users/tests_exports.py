@@ -0,0 +1,147 @@
+"""
+Tests for the streaming admin exports.
+"""
+
+import csv
+import gzip
+import io
+import json
+import time
+from datetime import date
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+
+from apps.core.middleware import DatabaseRoutingMiddleware
+from apps.leads.models import Booking, ChatSession
+from apps.leads.models import Client as Customer
+from apps.services.models import Service, ServiceCategory
+
+User = get_user_model()
+
+REPLICA_DATABASES = {
+    **settings.DATABASES,
+    'replica': {**settings.DATABASES['default'], 'TEST': {'MIRROR': 'default'}},
+}
+
+
+class AdminExportTestCase(TestCase):
+    """Test cases for the admin CSV/NDJSON exports"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = Client()
+        self.admin_user = User.objects.create_user(
+            username='admin_user',
+            email='admin@example.com',
+            password='adminpass123',
+            is_staff=True
+        )
+
+        category = ServiceCategory.objects.create(name='HVAC Services', slug='hvac-services')
+        self.service = Service.objects.create(
+            name='AC Installation',
+            slug='ac-installation',
+            category=category,
+            summary='Professional AC installation',
+            is_active=True
+        )
+        for index, status in enumerate(['new', 'confirmed', 'confirmed']):
+            Booking.objects.create(
+                service=self.service,
+                contact_name=f'Customer {index}',
+                contact_email=f'customer{index}@example.com',
+                contact_phone='+254700000000',
+                preferred_date=date(2025, 1, 10 + index),
+                location_address='Nairobi',
+                status=status,
+            )
+
+        self.export_url = reverse('users:admin_bookings_export')
+
+    def login(self):
+        self.client.login(username='admin_user', password='adminpass123')
+
+    def read_csv(self, response):
+        content = b''.join(response.streaming_content)
+        return list(csv.DictReader(io.StringIO(content.decode('utf-8'))))
+
+    def test_export_requires_staff(self):
+        """Test that anonymous users are redirected away from exports"""
+        response = self.client.get(self.export_url)
+        self.assertEqual(response.status_code, 302)
+
+    def test_csv_export_honors_filters(self):
+        """Test that the CSV export only contains rows matching the list filters"""
+        self.login()
+        response = self.client.get(self.export_url, {'format': 'csv', 'status': 'confirmed'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertTrue(response['Content-Type'].startswith('text/csv'))
+        self.assertIn('attachment; filename="bookings-', response['Content-Disposition'])
+
+        rows = self.read_csv(response)
+        self.assertEqual(len(rows), 2)
+        self.assertEqual({row['status'] for row in rows}, {'confirmed'})
+        self.assertEqual(rows[0]['service'], 'AC Installation')
+
+    def test_ndjson_export(self):
+        """Test that NDJSON exports one JSON object per line"""
+        self.login()
+        response = self.client.get(self.export_url, {'format': 'ndjson'})
+
+        self.assertTrue(response['Content-Type'].startswith('application/x-ndjson'))
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        records = [json.loads(line) for line in lines]
+        self.assertEqual(len(records), 3)
+        self.assertIn('booking_id', records[0])
+        self.assertIsNone(records[0]['assigned_technician'])
+
+    def test_gzip_export(self):
+        """Test that compress=gzip returns a valid gzip stream"""
+        self.login()
+        response = self.client.get(self.export_url, {'format': 'csv', 'compress': 'gzip'})
+
+        self.assertEqual(response['Content-Type'], 'application/gzip')
+        self.assertIn('.csv.gz', response['Content-Disposition'])
+        content = gzip.decompress(b''.join(response.streaming_content)).decode('utf-8')
+        self.assertEqual(len(list(csv.DictReader(io.StringIO(content)))), 3)
+
+    def test_customer_and_lead_exports(self):
+        """Test that customer and lead exports stream their rows"""
+        Customer.objects.create(name='Acme Ltd', client_type='business',
+                                email='info@acme.example', phone='+254700000001')
+        ChatSession.objects.create(session_id='abc123', name='Visitor', email='visitor@example.com')
+        self.login()
+
+        response = self.client.get(reverse('users:admin_customers_export'), {'client_type': 'business'})
+        rows = self.read_csv(response)
+        self.assertEqual([row['name'] for row in rows], ['Acme Ltd'])
+
+        response = self.client.get(reverse('users:admin_leads_export'), {'search': 'abc'})
+        rows = self.read_csv(response)
+        self.assertEqual([row['session_id'] for row in rows], ['abc123'])
+
+    @override_settings(DATABASES=REPLICA_DATABASES)
+    def test_export_reads_primary_while_session_is_pinned(self):
+        """Test that staff who just wrote export from the primary and others from the replica"""
+        self.login()
+        aliases = []
+
+        def record_alias(queryset, columns):
+            aliases.append(queryset.db)
+            return iter([])
+
+        with mock.patch('apps.users.exports.iter_rows', side_effect=record_alias):
+            b''.join(self.client.get(self.export_url).streaming_content)
+
+            session = self.client.session
+            session[DatabaseRoutingMiddleware.session_key] = time.time() + 30
+            session.save()
+            b''.join(self.client.get(self.export_url).streaming_content)
+
+        self.assertEqual(aliases, ['replica', 'default'])
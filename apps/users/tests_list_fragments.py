@@ -0,0 +1,122 @@
+"""
+Tests for the HTMX fragments of the admin list pages.
+"""
+
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.leads.models import Booking
+from apps.leads.models import Client as Customer
+from apps.services.models import Service, ServiceCategory
+
+User = get_user_model()
+
+
+class AdminListFragmentTestCase(TestCase):
+    """Test cases for rendering only the part of a list page HTMX swaps in"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = Client()
+        User.objects.create_user(
+            username='admin_user',
+            email='admin@example.com',
+            password='adminpass123',
+            is_staff=True
+        )
+        self.client.login(username='admin_user', password='adminpass123')
+
+        for name, client_type in [('Alice Kamau', 'individual'), ('Baridi Ltd', 'business')]:
+            Customer.objects.create(
+                name=name,
+                client_type=client_type,
+                email=f'{name.split()[0].lower()}@example.com',
+                phone='+254700000000',
+            )
+        self.customers_url = reverse('users:admin_customers_list')
+
+    def get(self, url, target=None, **headers):
+        if target:
+            headers.update(HTTP_HX_REQUEST='true', HTTP_HX_TARGET=target)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, **headers)
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries)
+
+    def test_full_page_includes_layout_stats_and_results(self):
+        """Test that a plain request renders the whole page around both fragments"""
+        response, _ = self.get(self.customers_url)
+        self.assertContains(response, '<html')
+        self.assertContains(response, 'id="customers-stats"')
+        self.assertContains(response, 'id="customers-results"')
+        self.assertContains(response, 'hx-target="#customers-results"')
+        self.assertIn('HX-Request', response['Vary'])
+
+    def test_results_fragment_skips_layout_and_stats(self):
+        """Test that a filter request gets only the filtered results, without the stats queries"""
+        _, page_queries = self.get(self.customers_url, client_type='business')
+        response, fragment_queries = self.get(
+            f'{self.customers_url}?client_type=business', target='customers-results'
+        )
+        html = response.content.decode()
+        self.assertIn('<div id="customers-results"', html)
+        self.assertNotIn('<html', html)
+        self.assertNotIn('customers-stats', html)
+        self.assertIn('Baridi Ltd', html)
+        self.assertNotIn('Alice Kamau', html)
+        # Five statistics queries fewer than the whole page
+        self.assertLessEqual(fragment_queries, page_queries - 5)
+
+    def test_results_fragment_updates_export_links_out_of_band(self):
+        """Test that filtering swaps in an export menu whose links carry the new filters"""
+        export_url = reverse('users:admin_customers_export')
+        response, _ = self.get(self.customers_url)
+        self.assertContains(response, '<div id="export-menu" class="dropdown">')
+        self.assertContains(response, f'href="{export_url}?format=csv&amp;"')
+
+        response, _ = self.get(f'{self.customers_url}?client_type=business', target='customers-results')
+        self.assertContains(response, '<div id="export-menu" class="dropdown" hx-swap-oob="true">')
+        self.assertContains(response, f'href="{export_url}?format=csv&amp;client_type=business"')
+        self.assertContains(response, f'href="{export_url}?format=ndjson&amp;compress=gzip&amp;client_type=business"')
+
+    def test_stats_fragment_skips_results(self):
+        """Test that the stats refresh renders only the statistics cards"""
+        response, _ = self.get(self.customers_url, target='customers-stats')
+        html = response.content.decode()
+        self.assertTrue(html.startswith('<div id="customers-stats"'))
+        self.assertNotIn('customers-results', html)
+        self.assertIn('Total Customers', html)
+
+    def test_unsupported_fragment_gets_whole_page(self):
+        """Test that asking for a fragment a page has no partial for renders the page, not an error"""
+        response, _ = self.get(reverse('users:admin_bookings_list'), target='bookings-stats')
+        self.assertContains(response, '<html')
+        self.assertContains(response, 'id="bookings-results"')
+
+    def test_history_restore_gets_whole_page(self):
+        """Test that HTMX restoring a pushed URL from history gets the full page"""
+        response, _ = self.get(self.customers_url, target='customers-results', HTTP_HX_HISTORY_RESTORE_REQUEST='true')
+        self.assertContains(response, '<html')
+
+    def test_bookings_fragment_updates_total_out_of_band(self):
+        """Test that the bookings results carry the filtered total for the page header"""
+        category = ServiceCategory.objects.create(name='HVAC Services', slug='hvac-services')
+        service = Service.objects.create(name='AC Installation', slug='ac-installation', category=category,
+                                         summary='Professional AC installation', is_active=True)
+        for status in ['new', 'confirmed', 'confirmed']:
+            Booking.objects.create(service=service, contact_name='Customer', contact_email='customer@example.com',
+                                   contact_phone='+254700000000', preferred_date=date(2025, 1, 10),
+                                   location_address='Nairobi', status=status)
+
+        response, _ = self.get(f"{reverse('users:admin_bookings_list')}?status=confirmed", target='bookings-results')
+        self.assertContains(response, 'hx-swap-oob="true">2 Total Bookings</span>')
+        self.assertNotContains(response, '<html')
+
+        response, _ = self.get(reverse('users:admin_bookings_list'))
+        self.assertContains(response, '<span id="bookings-total" class="badge bg-primary">3 Total Bookings</span>')
+        self.assertNotContains(response, 'hx-swap-oob')
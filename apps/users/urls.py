@@ -14,13 +14,16 @@ urlpatterns = [
 
     # Admin dashboard
     path('admin/dashboard/', views.admin_dashboard, name='admin_dashboard'),
+    path('admin/dashboard/widgets/<slug:widget>/', views.admin_dashboard_widget, name='admin_dashboard_widget'),
 
     # Admin booking management
     path('admin/bookings/', views.admin_bookings_list, name='admin_bookings_list'),
+    path('admin/bookings/export/', views.admin_bookings_export, name='admin_bookings_export'),
     path('admin/bookings/<uuid:booking_id>/', views.admin_booking_detail, name='admin_booking_detail'),
 
     # Admin quotation management
     path('admin/quotations/', views.admin_quotations_list, name='admin_quotations_list'),
+    path('admin/quotations/export/', views.admin_quotations_export, name='admin_quotations_export'),
     path('admin/quotations/create/', views.admin_quotation_create, name='admin_quotation_create'),
     path('admin/quotations/<int:quotation_id>/', views.admin_quotation_detail, name='admin_quotation_detail'),
     path('admin/quotations/<int:quotation_id>/edit/', views.admin_quotation_edit, name='admin_quotation_edit'),
@@ -59,6 +62,7 @@ urlpatterns = [
 
     # Customer CRUD
     path('admin/customers/', views.admin_customers_list, name='admin_customers_list'),
+    path('admin/customers/export/', views.admin_customers_export, name='admin_customers_export'),
     path('admin/customers/add/', views.admin_customer_add, name='admin_customer_add'),
     path('admin/customers/<int:customer_id>/', views.admin_customer_view, name='admin_customer_view'),
     path('admin/customers/<int:customer_id>/edit/', views.admin_customer_edit, name='admin_customer_edit'),
@@ -79,8 +83,20 @@ urlpatterns = [
     path('admin/settings/email-templates/', views.admin_email_templates, name='admin_email_templates'),
     path('admin/settings/security/', views.admin_security_settings, name='admin_security_settings'),
 
+    # Bulk data import
+    path('admin/import/', views.admin_import_data, name='admin_import_data'),
+    path('admin/import/errors/<str:token>/', views.admin_import_errors, name='admin_import_errors'),
+
+    # Performance
+    path('admin/performance/slow-queries/', views.admin_slow_queries, name='admin_slow_queries'),
+    path('admin/performance/profiles/', views.admin_profile_runs, name='admin_profile_runs'),
+    path('admin/performance/profiles/<int:run_id>/', views.admin_profile_run_detail, name='admin_profile_run_detail'),
+    path('admin/performance/traces/', views.admin_traces, name='admin_traces'),
+    path('admin/performance/traces/<str:request_id>/', views.admin_trace_detail, name='admin_trace_detail'),
+
     # Leads management
     path('admin/leads/', views.admin_leads_list, name='admin_leads_list'),
+    path('admin/leads/export/', views.admin_leads_export, name='admin_leads_export'),
     path('admin/leads/respond/', views.admin_lead_respond, name='admin_lead_respond'),
     path('admin/leads/status-update/', views.admin_lead_status_update, name='admin_lead_status_update'),
     path('admin/leads/<str:session_id>/', views.admin_lead_detail, name='admin_lead_detail'),
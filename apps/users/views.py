@@ -11,14 +11,37 @@ from django.core.paginator import Paginator
 from django.db.models import Q, Sum, Count, Avg
 from django.utils import timezone
 from django.http import JsonResponse
+from django.utils.cache import patch_vary_headers
 import json
 
+from apps.core.routers import use_replica
+
 
 def is_staff_user(user):
     """Check if user is staff/admin"""
     return user.is_authenticated and user.is_staff
 
 
+def _list_fragment(request, fragments=('results', 'stats')):
+    """
+    Part of a list page an HTMX request swaps in: one of the ``fragments``
+    the page has a partial for, or None for the whole page.
+    """
+    if request.headers.get('HX-Request') != 'true' or request.headers.get('HX-History-Restore-Request') == 'true':
+        return None
+    fragment = 'stats' if request.headers.get('HX-Target', '').endswith('-stats') else 'results'
+    return fragment if fragment in fragments else None
+
+
+def _render_list(request, fragment, page, context):
+    """Render ``admin/<page>.html``, or ``admin/partials/<page>_<fragment>.html`` for an HTMX request"""
+    template_name = f'admin/partials/{page}_{fragment}.html' if fragment else f'admin/{page}.html'
+    response = render(request, template_name, {**context, 'fragment': fragment})
+    # The same URL serves a page or a fragment, so caches must keep them apart
+    patch_vary_headers(response, ('HX-Request', 'HX-Target'))
+    return response
+
+
 @require_http_methods(["GET"])
 def admin_splashscreen(request):
     """Admin portal splashscreen view"""
@@ -138,170 +161,28 @@ def admin_signup(request):
 
 @login_required
 @user_passes_test(is_staff_user, login_url='users:admin_login')
+@use_replica
 def admin_dashboard(request):
-    """Admin dashboard view with real data"""
-    from datetime import datetime, timedelta
-    from django.db.models import Count, Sum, Q, Avg
-    from apps.leads.models import Booking, Client, Quotation
-    from apps.services.models import Service
-    from apps.portfolio.models import Project
+    """Admin dashboard shell; the card groups load from admin_dashboard_widget"""
+    return render(request, 'admin/dashboard.html')
 
-    # Get current date for filtering
-    today = datetime.now().date()
-    this_month_start = today.replace(day=1)
 
-    # Calculate statistics
-    today_bookings = Booking.objects.filter(
-        preferred_date=today
-    ).count()
-
-    active_services = Service.objects.filter(is_active=True).count()
-
-    total_customers = Client.objects.count()
-
-    # Calculate monthly revenue from completed bookings
-    monthly_revenue = Booking.objects.filter(
-        preferred_date__gte=this_month_start,
-        status='completed',
-        actual_cost__isnull=False
-    ).aggregate(
-        total=Sum('actual_cost')
-    )['total'] or 0
-
-    # Get recent bookings with proper status mapping
-    recent_bookings_qs = Booking.objects.select_related(
-        'service', 'client'
-    ).order_by('-created_at')[:10]
-
-    # Map status to Bootstrap classes
-    status_class_map = {
-        'new': 'primary',
-        'confirmed': 'info',
-        'in_progress': 'warning',
-        'completed': 'success',
-        'cancelled': 'danger',
-        'rescheduled': 'secondary'
-    }
+@login_required
+@user_passes_test(is_staff_user, login_url='users:admin_login')
+@use_replica
+def admin_dashboard_widget(request, widget):
+    """One dashboard card group, as an HTML fragment or JSON"""
+    from django.http import Http404, HttpResponse
+    from django.utils.cache import patch_cache_control
+    from . import dashboard
 
-    recent_bookings = []
-    for booking in recent_bookings_qs:
-        recent_bookings.append({
-            'customer': booking.contact_name,
-            'service': booking.service.name,
-            'date': booking.preferred_date.strftime('%Y-%m-%d'),
-            'status': booking.get_status_display(),
-            'status_class': status_class_map.get(booking.status, 'secondary'),
-            'booking_id': booking.booking_id.hex[:8]
-        })
+    if widget not in dashboard.WIDGETS:
+        raise Http404('Unknown dashboard widget')
 
-    # Additional statistics for dashboard cards
-    pending_bookings = Booking.objects.filter(
-        status__in=['new', 'confirmed']
-    ).count()
-
-    this_week_bookings = Booking.objects.filter(
-        preferred_date__gte=today - timedelta(days=7),
-        preferred_date__lte=today
-    ).count()
-
-    # Service performance analytics
-    service_performance = Booking.objects.values(
-        'service__name'
-    ).annotate(
-        total_bookings=Count('id'),
-        completed_bookings=Count('id', filter=Q(status='completed')),
-        total_revenue=Sum('actual_cost', filter=Q(status='completed')),
-        avg_cost=Avg('actual_cost', filter=Q(status='completed'))
-    ).order_by('-total_bookings')[:5]
-
-    # Monthly booking trends (last 6 months)
-    monthly_trends = []
-    for i in range(6):
-        month_date = today.replace(day=1) - timedelta(days=30*i)
-        month_bookings = Booking.objects.filter(
-            created_at__date__gte=month_date,
-            created_at__date__lt=month_date + timedelta(days=32)
-        ).count()
-        monthly_trends.append({
-            'month': month_date.strftime('%b %Y'),
-            'bookings': month_bookings
-        })
-    monthly_trends.reverse()
-
-    # Status distribution
-    status_distribution = Booking.objects.values('status').annotate(
-        count=Count('id')
-    ).order_by('-count')
-
-    # Portfolio statistics
-    total_projects = Project.objects.count()
-    published_projects = Project.objects.filter(is_published=True).count()
-    featured_projects = Project.objects.filter(is_featured=True).count()
-    draft_projects = Project.objects.filter(is_published=False).count()
-
-    # Recent projects
-    recent_projects = Project.objects.select_related().prefetch_related('images').order_by('-created_at')[:5]
-
-    # Quotation statistics
-    total_quotations = Quotation.objects.count()
-    draft_quotations = Quotation.objects.filter(status='draft').count()
-    sent_quotations = Quotation.objects.filter(status='sent').count()
-    accepted_quotations = Quotation.objects.filter(status='accepted').count()
-    pending_quotations = Quotation.objects.filter(status__in=['sent', 'viewed']).count()
-
-    # Recent quotations
-    recent_quotations = Quotation.objects.select_related('client', 'created_by').order_by('-created_at')[:5]
-
-    # Quotation value statistics
-    total_quotation_value = Quotation.objects.aggregate(
-        total=Sum('total')
-    )['total'] or 0
-
-    accepted_quotation_value = Quotation.objects.filter(
-        status='accepted'
-    ).aggregate(
-        total=Sum('total')
-    )['total'] or 0
-
-    context = {
-        'today_bookings': today_bookings,
-        'active_services': active_services,
-        'total_customers': total_customers,
-        'monthly_revenue': int(monthly_revenue),
-        'recent_bookings': recent_bookings,
-        'pending_bookings': pending_bookings,
-        'this_week_bookings': this_week_bookings,
-
-        # Additional stats for future use
-        'total_bookings': Booking.objects.count(),
-        'completed_bookings': Booking.objects.filter(status='completed').count(),
-        'active_quotations': Quotation.objects.filter(
-            status__in=['sent', 'viewed']
-        ).count(),
-
-        # Analytics data
-        'service_performance': service_performance,
-        'monthly_trends': monthly_trends,
-        'status_distribution': status_distribution,
-
-        # Portfolio statistics
-        'total_projects': total_projects,
-        'published_projects': published_projects,
-        'featured_projects': featured_projects,
-        'draft_projects': draft_projects,
-        'recent_projects': recent_projects,
-
-        # Quotation statistics
-        'total_quotations': total_quotations,
-        'draft_quotations': draft_quotations,
-        'sent_quotations': sent_quotations,
-        'accepted_quotations': accepted_quotations,
-        'pending_quotations': pending_quotations,
-        'recent_quotations': recent_quotations,
-        'total_quotation_value': int(total_quotation_value),
-        'accepted_quotation_value': int(accepted_quotation_value),
-    }
-    return render(request, 'admin/dashboard.html', context)
+    content, content_type = dashboard.render_widget(widget)
+    response = HttpResponse(content, content_type=content_type)
+    patch_cache_control(response, private=True, max_age=dashboard.WIDGETS[widget]['ttl'])
+    return response
 
 
 @login_required
@@ -312,11 +193,8 @@ def admin_logout(request):
     return redirect('users:admin_login')
 
 
-@login_required
-@user_passes_test(is_staff_user, login_url='users:admin_login')
-def admin_bookings_list(request):
-    """Admin bookings list view with filtering and search"""
-    from django.db.models import Q
+def _filter_bookings(request):
+    """Apply the bookings list filters from the query string"""
     from apps.leads.models import Booking
 
     # Get filter parameters
@@ -327,7 +205,7 @@ def admin_bookings_list(request):
     date_to = request.GET.get('date_to', '')
 
     # Base queryset
-    bookings = Booking.objects.select_related('service', 'client', 'assigned_technician').order_by('-created_at')
+    bookings = Booking.objects.order_by('-created_at')
 
     # Apply filters
     if status_filter:
@@ -351,6 +229,28 @@ def admin_bookings_list(request):
     if date_to:
         bookings = bookings.filter(preferred_date__lte=date_to)
 
+    current_filters = {
+        'status': status_filter,
+        'priority': priority_filter,
+        'search': search_query,
+        'date_from': date_from,
+        'date_to': date_to,
+    }
+    return bookings, current_filters
+
+
+@login_required
+@user_passes_test(is_staff_user, login_url='users:admin_login')
+@use_replica
+def admin_bookings_list(request):
+    """Admin bookings list view with filtering and search"""
+    from apps.leads.models import Booking
+
+    # The bookings page has no stats cards to refresh
+    fragment = _list_fragment(request, fragments=('results',))
+    bookings, current_filters = _filter_bookings(request)
+    bookings = bookings.select_related('service', 'client', 'assigned_technician')
+
     # Pagination
     from django.core.paginator import Paginator
     paginator = Paginator(bookings, 20)
@@ -365,17 +265,23 @@ def admin_bookings_list(request):
         'bookings': page_obj,
         'status_choices': status_choices,
         'priority_choices': priority_choices,
-        'current_filters': {
-            'status': status_filter,
-            'priority': priority_filter,
-            'search': search_query,
-            'date_from': date_from,
-            'date_to': date_to,
-        },
-        'total_bookings': bookings.count(),
+        'current_filters': current_filters,
+        # The paginator has already counted the filtered bookings
+        'total_bookings': paginator.count,
     }
 
-    return render(request, 'admin/bookings_list.html', context)
+    return _render_list(request, fragment, 'bookings_list', context)
+
+
+@login_required
+@user_passes_test(is_staff_user, login_url='users:admin_login')
+@use_replica
+def admin_bookings_export(request):
+    """Stream the filtered bookings as CSV or NDJSON"""
+    from .exports import BOOKING_EXPORT_COLUMNS, streaming_export
+
+    bookings, _ = _filter_bookings(request)
+    return streaming_export(request, bookings, BOOKING_EXPORT_COLUMNS, 'bookings')
 
 
 @login_required
@@ -714,13 +620,11 @@ def admin_product_delete(request, product_id):
 # QUOTATION MANAGEMENT VIEWS
 # ============================================================================
 
-@login_required
-@user_passes_test(is_staff_user, login_url='users:admin_login')
-def admin_quotations_list(request):
-    """List all quotations with search and filtering"""
+def _filter_quotations(request):
+    """Apply the quotations list filters from the query string"""
     from apps.leads.models import Quotation
 
-    quotations = Quotation.objects.select_related('client', 'inquiry', 'created_by').all()
+    quotations = Quotation.objects.all()
 
     # Search functionality
     search_query = request.GET.get('search', '')
@@ -751,30 +655,55 @@ def admin_quotations_list(request):
     # Ordering
     quotations = quotations.order_by('-created_at')
 
-    # Pagination
-    paginator = Paginator(quotations, 20)  # Show 20 quotations per page
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
-
-    # Statistics for dashboard
-    stats = {
-        'total_quotations': Quotation.objects.count(),
-        'draft_quotations': Quotation.objects.filter(status='draft').count(),
-        'sent_quotations': Quotation.objects.filter(status='sent').count(),
-        'accepted_quotations': Quotation.objects.filter(status='accepted').count(),
-        'pending_quotations': Quotation.objects.filter(status__in=['sent', 'viewed']).count(),
-    }
-
-    context = {
-        'page_obj': page_obj,
+    filters = {
         'search_query': search_query,
         'status_filter': status_filter,
         'date_filter': date_filter,
-        'stats': stats,
-        'status_choices': Quotation.STATUS_CHOICES,
-        'title': 'Quotation Management'
     }
-    return render(request, 'admin/quotations_list.html', context)
+    return quotations, filters
+
+
+@login_required
+@user_passes_test(is_staff_user, login_url='users:admin_login')
+@use_replica
+def admin_quotations_list(request):
+    """List all quotations with search and filtering"""
+    from apps.leads.models import Quotation
+
+    fragment = _list_fragment(request)
+    context = {'title': 'Quotation Management'}
+
+    if fragment != 'stats':
+        quotations, filters = _filter_quotations(request)
+        quotations = quotations.select_related('client', 'inquiry', 'created_by')
+
+        # Pagination
+        paginator = Paginator(quotations, 20)  # Show 20 quotations per page
+        page_number = request.GET.get('page')
+        context.update(filters, page_obj=paginator.get_page(page_number), status_choices=Quotation.STATUS_CHOICES)
+
+    if fragment != 'results':
+        # Statistics for dashboard
+        context['stats'] = {
+            'total_quotations': Quotation.objects.count(),
+            'draft_quotations': Quotation.objects.filter(status='draft').count(),
+            'sent_quotations': Quotation.objects.filter(status='sent').count(),
+            'accepted_quotations': Quotation.objects.filter(status='accepted').count(),
+            'pending_quotations': Quotation.objects.filter(status__in=['sent', 'viewed']).count(),
+        }
+
+    return _render_list(request, fragment, 'quotations_list', context)
+
+
+@login_required
+@user_passes_test(is_staff_user, login_url='users:admin_login')
+@use_replica
+def admin_quotations_export(request):
+    """Stream the filtered quotations as CSV or NDJSON"""
+    from .exports import QUOTATION_EXPORT_COLUMNS, streaming_export
+
+    quotations, _ = _filter_quotations(request)
+    return streaming_export(request, quotations, QUOTATION_EXPORT_COLUMNS, 'quotations')
 
 
 @login_required
@@ -943,6 +872,7 @@ def admin_inquiry_to_quotation(request, inquiry_id):
 @user_passes_test(is_staff_user, login_url='users:admin_login')
 def admin_quotation_send_email(request, quotation_id):
     """Send quotation via email to client"""
+    from apps.core.media import signed_url
     from apps.leads.models import Quotation
     from django.core.mail import send_mail
     from django.template.loader import render_to_string
@@ -967,6 +897,8 @@ def admin_quotation_send_email(request, quotation_id):
                 'company_name': 'Global Cool-Light E.A LTD',
                 'company_email': settings.DEFAULT_FROM_EMAIL,
                 'company_phone': '+254 700 000 000',  # Add to settings
+                # The client has no account, so the PDF link carries its own permission
+                'pdf_url': request.build_absolute_uri(signed_url(quotation.pdf_file.name)) if quotation.pdf_file else None,
             }
 
             # Render email template
@@ -1035,12 +967,9 @@ def admin_quotation_status_update(request, quotation_id):
 # CUSTOMER MANAGEMENT VIEWS
 # ============================================================================
 
-@login_required
-@user_passes_test(is_staff_user, login_url='users:admin_login')
-def admin_customers_list(request):
-    """List all customers with search and filtering"""
+def _filter_customers(request):
+    """Apply the customers list filters and sorting from the query string"""
     from apps.leads.models import Client
-    from django.db.models import Count, Sum
 
     customers = Client.objects.all()
 
@@ -1075,13 +1004,6 @@ def admin_customers_list(request):
         month_ago = timezone.now() - timezone.timedelta(days=30)
         customers = customers.filter(created_at__gte=month_ago)
 
-    # Annotate with related data
-    customers = customers.annotate(
-        bookings_count=Count('bookings'),
-        inquiries_count=Count('inquiries'),
-        quotations_count=Count('quotations')
-    )
-
     # Ordering
     sort_by = request.GET.get('sort', '-created_at')
     valid_sorts = ['-created_at', 'created_at', 'name', '-name', 'email', '-email',
@@ -1091,37 +1013,73 @@ def admin_customers_list(request):
     else:
         customers = customers.order_by('-created_at')
 
-    # Pagination
-    paginator = Paginator(customers, 20)  # Show 20 customers per page
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
-
-    # Statistics for dashboard
-    stats = {
-        'total_customers': Client.objects.count(),
-        'individual_customers': Client.objects.filter(client_type='individual').count(),
-        'business_customers': Client.objects.filter(client_type='business').count(),
-        'new_this_month': Client.objects.filter(
-            created_at__gte=timezone.now().replace(day=1)
-        ).count(),
-        'total_revenue': Client.objects.aggregate(
-            total=Sum('total_spent')
-        )['total'] or 0,
-    }
-
-    context = {
-        'page_obj': page_obj,
+    filters = {
         'search_query': search_query,
         'client_type_filter': client_type_filter,
         'contact_method_filter': contact_method_filter,
         'date_filter': date_filter,
         'sort_by': sort_by,
-        'stats': stats,
-        'client_type_choices': Client.CLIENT_TYPES,
-        'contact_method_choices': Client.CONTACT_METHODS,
-        'title': 'Customer Management'
     }
-    return render(request, 'admin/customers_list.html', context)
+    return customers, filters
+
+
+@login_required
+@user_passes_test(is_staff_user, login_url='users:admin_login')
+@use_replica
+def admin_customers_list(request):
+    """List all customers with search and filtering"""
+    from apps.leads.models import Client
+    from django.db.models import Count, Sum
+
+    fragment = _list_fragment(request)
+    context = {'title': 'Customer Management'}
+
+    if fragment != 'stats':
+        customers, filters = _filter_customers(request)
+
+        # Annotate with related data
+        customers = customers.annotate(
+            bookings_count=Count('bookings'),
+            inquiries_count=Count('inquiries'),
+            quotations_count=Count('quotations')
+        )
+
+        # Pagination
+        paginator = Paginator(customers, 20)  # Show 20 customers per page
+        page_number = request.GET.get('page')
+        context.update(
+            filters,
+            page_obj=paginator.get_page(page_number),
+            client_type_choices=Client.CLIENT_TYPES,
+            contact_method_choices=Client.CONTACT_METHODS,
+        )
+
+    if fragment != 'results':
+        # Statistics for dashboard
+        context['stats'] = {
+            'total_customers': Client.objects.count(),
+            'individual_customers': Client.objects.filter(client_type='individual').count(),
+            'business_customers': Client.objects.filter(client_type='business').count(),
+            'new_this_month': Client.objects.filter(
+                created_at__gte=timezone.now().replace(day=1)
+            ).count(),
+            'total_revenue': Client.objects.aggregate(
+                total=Sum('total_spent')
+            )['total'] or 0,
+        }
+
+    return _render_list(request, fragment, 'customers_list', context)
+
+
+@login_required
+@user_passes_test(is_staff_user, login_url='users:admin_login')
+@use_replica
+def admin_customers_export(request):
+    """Stream the filtered customers as CSV or NDJSON"""
+    from .exports import CUSTOMER_EXPORT_COLUMNS, streaming_export
+
+    customers, _ = _filter_customers(request)
+    return streaming_export(request, customers, CUSTOMER_EXPORT_COLUMNS, 'customers')
 
 
 @login_required
@@ -1588,6 +1546,204 @@ def admin_security_settings(request):
     return render(request, 'admin/settings_security.html', context)
 
 
+@login_required
+@user_passes_test(is_staff_user, login_url='users:admin_login')
+def admin_import_data(request):
+    """Bulk import clients, bookings or products from an uploaded CSV/XLSX file"""
+    import csv
+    import io
+    import uuid
+    from django.core.cache import cache
+    from apps.core.importers import IMPORTERS, read_rows
+    from .forms import DataImportForm
+
+    summary = None
+    errors_token = None
+
+    if request.method == 'POST':
+        form = DataImportForm(request.POST, request.FILES)
+        if form.is_valid():
+            kind = form.cleaned_data['kind']
+            upload = form.cleaned_data['file']
+            importer = IMPORTERS[kind](
+                batch_size=form.cleaned_data['batch_size'],
+                dry_run=form.cleaned_data['dry_run'],
+                allow_past_dates=form.cleaned_data['allow_past_dates'],
+            )
+            try:
+                summary = importer.run(read_rows(upload, upload.name))
+            except ImportError as e:
+                messages.error(request, str(e))
+            except (csv.Error, UnicodeDecodeError) as e:
+                messages.error(request, f'Could not read {upload.name}: {e}')
+            else:
+                verb = 'validated' if form.cleaned_data['dry_run'] else 'imported'
+                messages.success(
+                    request,
+                    f"{summary['created']} {kind} {verb} from {summary['processed']} rows "
+                    f"in {summary['elapsed']:.1f}s."
+                )
+                if importer.errors:
+                    # The report contains customer data, so keep it behind the
+                    # staff-only download view rather than in public media
+                    report = io.StringIO()
+                    importer.write_errors(report)
+                    errors_token = uuid.uuid4().hex
+                    cache.set(f'import-errors:{errors_token}', report.getvalue(), 60 * 60)
+                    messages.warning(request, f"{summary['failed']} rows failed validation.")
+    else:
+        form = DataImportForm()
+
+    context = {
+        'form': form,
+        'summary': summary,
+        'errors_token': errors_token,
+        'title': 'Import Data'
+    }
+    return render(request, 'admin/import_data.html', context)
+
+
+@login_required
+@user_passes_test(is_staff_user, login_url='users:admin_login')
+def admin_import_errors(request, token):
+    """Download the row-level error report of a recent import"""
+    from django.core.cache import cache
+    from django.http import Http404, HttpResponse
+
+    report = cache.get(f'import-errors:{token}')
+    if report is None:
+        raise Http404('Error report expired or not found')
+
+    response = HttpResponse(report, content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = 'attachment; filename="import-errors.csv"'
+    return response
+
+
+@login_required
+@user_passes_test(is_staff_user, login_url='users:admin_login')
+def admin_slow_queries(request):
+    """Slowest query fingerprints from the slow-query log"""
+    from django.conf import settings
+    from apps.core import slow_queries
+
+    # The shared log file covers every worker; the ring buffer only this one
+    if getattr(settings, 'SLOW_QUERY_LOG_FILE', ''):
+        records = slow_queries.load_records()
+    else:
+        records = slow_queries.recent_records()
+
+    context = {
+        'offenders': slow_queries.top_offenders(records),
+        'record_count': len(records),
+        'threshold_ms': getattr(settings, 'SLOW_QUERY_THRESHOLD_MS', 200),
+        'sample_every': getattr(settings, 'SLOW_QUERY_SAMPLE_EVERY', 0),
+        'title': 'Slow Queries'
+    }
+    return render(request, 'admin/slow_queries.html', context)
+
+
+@login_required
+@user_passes_test(is_staff_user, login_url='users:admin_login')
+def admin_profile_runs(request):
+    """List request profiles and start a new one for a given page"""
+    from urllib.parse import urlencode, urlsplit
+    from django.utils.http import url_has_allowed_host_and_scheme
+    from apps.core.models import ProfileRun
+    from apps.core.profiling import MODES, QUERY_PARAM, make_token
+
+    if request.method == 'POST':
+        target = request.POST.get('path', '').strip()
+        mode = request.POST.get('mode', 'cpu')
+        if mode in MODES and target.startswith('/') and url_has_allowed_host_and_scheme(target, allowed_hosts=None):
+            url = urlsplit(target)
+            params = url.query + '&' if url.query else ''
+            params += urlencode({QUERY_PARAM: make_token(request.user, url.path, mode)})
+            return redirect(f'{url.path}?{params}')
+        messages.error(request, 'Enter a path on this site, starting with "/".')
+
+    runs = ProfileRun.objects.select_related('requested_by').defer(
+        'collapsed_stacks', 'top_functions', 'top_allocations'
+    )
+    paginator = Paginator(runs, 25)
+    page_obj = paginator.get_page(request.GET.get('page'))
+
+    context = {
+        'page_obj': page_obj,
+        'title': 'Request Profiles'
+    }
+    return render(request, 'admin/profile_runs.html', context)
+
+
+@login_required
+@user_passes_test(is_staff_user, login_url='users:admin_login')
+def admin_profile_run_detail(request, run_id):
+    """Flame graph and top functions of one request profile"""
+    from django.http import HttpResponse
+    from apps.core.models import ProfileRun
+    from apps.core.profiling import flame_rows
+
+    run = get_object_or_404(ProfileRun.objects.select_related('requested_by'), pk=run_id)
+
+    if request.GET.get('format') == 'collapsed':
+        response = HttpResponse(run.collapsed_stacks, content_type='text/plain; charset=utf-8')
+        response['Content-Disposition'] = f'attachment; filename="profile-{run.pk}.collapsed.txt"'
+        return response
+
+    context = {
+        'run': run,
+        'flame_rows': flame_rows(run.collapsed_stacks),
+        'title': f'Request Profile #{run.pk}'
+    }
+    return render(request, 'admin/profile_run_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_staff_user, login_url='users:admin_login')
+def admin_traces(request):
+    """Recent request traces, and a lookup by request ID"""
+    from django.conf import settings
+    from apps.core import tracing
+
+    request_id = request.GET.get('request_id', '').strip()
+    if request_id:
+        if tracing.REQUEST_ID_PATTERN.match(request_id):
+            return redirect('users:admin_trace_detail', request_id=request_id)
+        messages.error(request, 'That is not a valid request ID.')
+
+    # The shared file covers every worker; the ring buffer only this one
+    if getattr(settings, 'TRACING_EXPORTER', 'jsonl') == 'jsonl':
+        traces = tracing.load_traces(limit=100)
+    else:
+        traces = tracing.recent_traces()[:100]
+
+    context = {
+        'traces': traces,
+        'sample_rate': getattr(settings, 'TRACING_SAMPLE_RATE', 1.0),
+        'exporter': getattr(settings, 'TRACING_EXPORTER', 'jsonl'),
+        'title': 'Request Traces'
+    }
+    return render(request, 'admin/traces.html', context)
+
+
+@login_required
+@user_passes_test(is_staff_user, login_url='users:admin_login')
+def admin_trace_detail(request, request_id):
+    """Span waterfall of one traced request"""
+    from django.http import Http404
+    from apps.core import tracing
+
+    record = tracing.find_trace(request_id)
+    if record is None:
+        raise Http404('No trace was recorded for this request ID.')
+
+    context = {
+        'trace': record,
+        'rows': tracing.waterfall(record),
+        'title': f'Trace {record["request_id"]}'
+    }
+    return render(request, 'admin/trace_detail.html', context)
+
+
 @login_required
 @user_passes_test(is_staff_user, login_url='users:admin_login')
 def admin_profile(request):
@@ -1605,21 +1761,8 @@ def admin_profile(request):
 # LEADS MANAGEMENT VIEWS
 # ============================================================================
 
-@login_required
-@user_passes_test(is_staff_user, login_url='users:admin_login')
-def admin_leads_list(request):
-    """List all chat sessions (leads) with filtering and search"""
-    from apps.leads.models import ChatSession
-    from django.db.models import Q, Count, Max
-    from django.core.paginator import Paginator
-
-    # Base queryset with related data
-    leads = ChatSession.objects.select_related('user').prefetch_related('messages').annotate(
-        message_count=Count('messages'),
-        last_message_time=Max('messages__timestamp'),
-        unread_count=Count('messages', filter=Q(messages__is_read=False, messages__message_type='user'))
-    ).order_by('-updated_at')
-
+def _filter_leads(request, leads):
+    """Apply the leads list filters from the query string to ``leads``"""
     # Search functionality
     search_query = request.GET.get('search', '')
     if search_query:
@@ -1665,38 +1808,70 @@ def admin_leads_list(request):
             month_ago = today - timedelta(days=30)
             leads = leads.filter(created_at__date__gte=month_ago)
 
-    # Pagination
-    paginator = Paginator(leads, 20)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
-
-    # Statistics
-    total_leads = ChatSession.objects.count()
-    active_leads = ChatSession.objects.filter(is_active=True).count()
-    new_leads = ChatSession.objects.filter(
-        messages__isnull=False,
-        is_active=True
-    ).exclude(
-        messages__message_type='agent'
-    ).distinct().count()
-    unread_messages = ChatSession.objects.filter(
-        messages__is_read=False,
-        messages__message_type='user'
-    ).distinct().count()
-
-    context = {
-        'page_obj': page_obj,
+    filters = {
         'search_query': search_query,
         'status_filter': status_filter,
         'unread_filter': unread_filter,
         'date_filter': date_filter,
-        'total_leads': total_leads,
-        'active_leads': active_leads,
-        'new_leads': new_leads,
-        'unread_messages': unread_messages,
-        'title': 'Leads Management'
     }
-    return render(request, 'admin/leads_list.html', context)
+    return leads, filters
+
+
+@login_required
+@user_passes_test(is_staff_user, login_url='users:admin_login')
+def admin_leads_list(request):
+    """List all chat sessions (leads) with filtering and search"""
+    from apps.leads.models import ChatSession
+    from django.db.models import Q, Count, Max
+    from django.core.paginator import Paginator
+
+    fragment = _list_fragment(request)
+    context = {'title': 'Leads Management'}
+
+    if fragment != 'stats':
+        # Base queryset with related data
+        leads = ChatSession.objects.select_related('user', 'assigned_to').annotate(
+            message_count=Count('messages'),
+            last_message_time=Max('messages__timestamp'),
+            unread_count=Count('messages', filter=Q(messages__is_read=False, messages__message_type='user'))
+        ).order_by('-updated_at')
+        leads, filters = _filter_leads(request, leads)
+
+        # Pagination
+        paginator = Paginator(leads, 20)
+        page_number = request.GET.get('page')
+        context.update(filters, page_obj=paginator.get_page(page_number))
+
+    if fragment != 'results':
+        # Statistics
+        context.update(
+            total_leads=ChatSession.objects.count(),
+            active_leads=ChatSession.objects.filter(is_active=True).count(),
+            new_leads=ChatSession.objects.filter(
+                messages__isnull=False,
+                is_active=True
+            ).exclude(
+                messages__message_type='agent'
+            ).distinct().count(),
+            unread_messages=ChatSession.objects.filter(
+                messages__is_read=False,
+                messages__message_type='user'
+            ).distinct().count(),
+        )
+
+    return _render_list(request, fragment, 'leads_list', context)
+
+
+@login_required
+@user_passes_test(is_staff_user, login_url='users:admin_login')
+@use_replica
+def admin_leads_export(request):
+    """Stream the filtered leads as CSV or NDJSON"""
+    from apps.leads.models import ChatSession
+    from .exports import LEAD_EXPORT_COLUMNS, streaming_export
+
+    leads, _ = _filter_leads(request, ChatSession.objects.order_by('-updated_at'))
+    return streaming_export(request, leads, LEAD_EXPORT_COLUMNS, 'leads')
 
 
 @login_required
@@ -36,7 +36,7 @@ DJANGO_APPS = [
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
-    'django.contrib.staticfiles',
+    'apps.core.apps.StaticFilesConfig',
     'django.contrib.sites',
 ]
 
@@ -67,13 +67,19 @@ LOCAL_APPS = [
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
 MIDDLEWARE = [
+    'apps.core.middleware.TracingMiddleware',
+    'apps.core.middleware.PerformanceMiddleware',
+    'apps.core.middleware.NPlusOneMiddleware',
+    'apps.core.middleware.CompressionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    'apps.core.middleware.DatabaseRoutingMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'apps.core.middleware.ProfilerMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -92,6 +98,7 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
                 'apps.core.context_processors.site_settings',
+                'apps.core.context_processors.critical_css',
             ],
         },
     },
@@ -104,6 +111,63 @@ DATABASES = {
     'default': env.db('DATABASE_URL', default='sqlite:///db.sqlite3')
 }
 
+# Persistent connections: reuse a connection across requests for up to
+# DB_CONN_MAX_AGE seconds and check it is still alive before reusing it.
+DATABASES['default']['CONN_MAX_AGE'] = env.int('DB_CONN_MAX_AGE', default=600)
+DATABASES['default']['CONN_HEALTH_CHECKS'] = env.bool('DB_CONN_HEALTH_CHECKS', default=True)
+
+if DATABASES['default']['ENGINE'] == 'django.db.backends.sqlite3':
+    # Python-level lock wait, matching the busy_timeout pragma below
+    DATABASES['default'].setdefault('OPTIONS', {})['timeout'] = 5
+
+    # Applied on every new connection by apps.core.db (WAL, busy_timeout, ...)
+    SQLITE_PRAGMAS = {
+        'journal_mode': env('SQLITE_JOURNAL_MODE', default='WAL'),
+        'synchronous': env('SQLITE_SYNCHRONOUS', default='NORMAL'),
+        'busy_timeout': env.int('SQLITE_BUSY_TIMEOUT', default=5000),
+        'mmap_size': env.int('SQLITE_MMAP_SIZE', default=256 * 1024 * 1024),
+    }
+
+elif DATABASES['default']['ENGINE'].startswith('django.db.backends.postgresql'):
+    DATABASES['default'].setdefault('OPTIONS', {})['connect_timeout'] = env.int('DB_CONNECT_TIMEOUT', default=5)
+
+    # Connection pooling on Django 4.2 is pgbouncer's job: run it in
+    # transaction pooling mode in front of PostgreSQL, point DATABASE_URL at
+    # it and set DB_PGBOUNCER. DB_POOL needs Django 5.1.
+    if env.bool('DB_PGBOUNCER', default=False):
+        # pgbouncer in transaction pooling mode cannot hold server-side cursors
+        # open between transactions; it owns the pooling instead.
+        DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+
+    if env.bool('DB_POOL', default=False):
+        import django
+        if django.VERSION < (5, 1):
+            from django.core.exceptions import ImproperlyConfigured
+            raise ImproperlyConfigured(
+                f'DB_POOL needs Django 5.1 or later (this is {django.get_version()}). '
+                'Use pgbouncer with DB_PGBOUNCER=True for connection pooling instead.'
+            )
+        # psycopg 3 connection pool; incompatible with persistent connections
+        DATABASES['default']['OPTIONS']['pool'] = {
+            'min_size': env.int('DB_POOL_MIN_SIZE', default=2),
+            'max_size': env.int('DB_POOL_MAX_SIZE', default=10),
+            'timeout': env.int('DB_POOL_TIMEOUT', default=10),
+        }
+        DATABASES['default']['CONN_MAX_AGE'] = 0
+
+# Optional read replica used by dashboards, reports and exports.
+# Locally this can be a second SQLite file kept current by `manage.py sync_replica`.
+if env('REPLICA_DATABASE_URL', default=''):
+    DATABASES['replica'] = env.db('REPLICA_DATABASE_URL')
+    DATABASES['replica']['CONN_MAX_AGE'] = DATABASES['default']['CONN_MAX_AGE']
+    DATABASES['replica']['CONN_HEALTH_CHECKS'] = DATABASES['default']['CONN_HEALTH_CHECKS']
+    DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+
+DATABASE_ROUTERS = ['apps.core.routers.PrimaryReplicaRouter']
+
+# Seconds a user's reads stay on the primary after they write
+REPLICA_STICKY_SECONDS = env.int('REPLICA_STICKY_SECONDS', default=15)
+
 # Custom User Model (temporarily disabled)
 # AUTH_USER_MODEL = 'users.User'
 
@@ -136,10 +200,102 @@ STATICFILES_DIRS = [
     BASE_DIR / 'static',
 ]
 
+# collectstatic writes content-hashed names plus .gz/.br copies (see
+# apps.core.storage); WhiteNoise serves them with Cache-Control: immutable
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'apps.core.storage.StaticFilesStorage',
+    },
+    # Quotation PDFs and other uploads served only through core:protected_media
+    'private': {
+        'BACKEND': 'apps.core.storage.PrivateMediaStorage',
+    },
+    # Service, product and project photos, stored once per distinct content
+    'images': {
+        'BACKEND': 'apps.core.storage.ContentAddressedStorage',
+    },
+}
+
+# Vendor files no page loads, left out of collectstatic. CKEditor runs in
+# English (LANGUAGE_CODE and no LocaleMiddleware), so its other translations
+# go too; check `python manage.py static_report` after changing templates.
+STATICFILES_PRUNE = [
+    'README.md', 'readme.md', 'CHANGES.md', 'SECURITY.md',
+    'ckeditor/ckeditor/*lang/[!e]*.js',
+    'ckeditor/ckeditor/*lang/e[!n]*.js',
+    'ckeditor/ckeditor/*lang/_translationstatus.txt',
+    'ckeditor/ckeditor/plugins/*/tests/*',
+    # The coreapi docs pages are not routed
+    'rest_framework/docs/*',
+    'rest_framework/js/coreapi-*.js',
+    # Bundle sources; the layouts load what esbuild writes to dist/
+    'css/*',
+    'src/*',
+    'admin-css/*',
+    # Inlined into pages by the critical_css context processor, never requested
+    'dist/critical/*',
+]
+
+# Files the layouts cannot do without; collectstatic fails when the build
+# that produces them (`npm run build`) has not run
+STATICFILES_REQUIRED = ['dist/public.css', 'dist/public.js', 'dist/admin.css', 'dist/admin.js']
+
+# Public pages whose above-the-fold CSS is inlined (`manage.py critical_css`
+# after `npm run build`); the rest of the stylesheet loads without blocking
+CRITICAL_CSS_PAGES = ['core:home', 'services:list', 'portfolio:list', 'core:contact']
+CRITICAL_CSS_DIR = BASE_DIR / 'static' / 'dist' / 'critical'
+# Sections of <main> counted as above the fold, after the header
+CRITICAL_CSS_SECTIONS = 2
+
 # Media files
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Protected media (apps.core.media): private uploads are served to staff or
+# to holders of a signed link after a permission check. The file itself is
+# sent by the web server: "nginx" answers with X-Accel-Redirect to
+# PRIVATE_MEDIA_INTERNAL_URL (an `internal` location aliased to
+# PRIVATE_MEDIA_ROOT), "apache" with X-Sendfile; "django" streams it from
+# the worker and is meant for development only.
+PRIVATE_MEDIA_ROOT = env('PRIVATE_MEDIA_ROOT', default=str(BASE_DIR / 'private'))
+PRIVATE_MEDIA_URL = '/private-media/'
+PRIVATE_MEDIA_SERVER = env('PRIVATE_MEDIA_SERVER', default='django' if DEBUG else 'nginx')
+PRIVATE_MEDIA_INTERNAL_URL = env('PRIVATE_MEDIA_INTERNAL_URL', default='/internal-media/')
+PRIVATE_MEDIA_TOKEN_MAX_AGE = env.int('PRIVATE_MEDIA_TOKEN_MAX_AGE', default=7 * 24 * 60 * 60)
+
+# S3-compatible media (apps.core.s3): with USE_S3 uploads go to a bucket all
+# app servers share (DigitalOcean Spaces), public ones under AWS_LOCATION and
+# private ones under private/, served through signed URLs that last
+# PRIVATE_MEDIA_URL_EXPIRE seconds. Files from AWS_S3_MULTIPART_THRESHOLD
+# bytes up go as parallel multipart uploads. Object sizes and existence are
+# remembered in MEDIA_STORAGE_CACHE so pages never wait on a HEAD request.
+USE_S3 = env('USE_S3')
+AWS_ACCESS_KEY_ID = env('AWS_ACCESS_KEY_ID', default='')
+AWS_SECRET_ACCESS_KEY = env('AWS_SECRET_ACCESS_KEY', default='')
+AWS_STORAGE_BUCKET_NAME = env('AWS_STORAGE_BUCKET_NAME', default='')
+AWS_S3_ENDPOINT_URL = env('AWS_S3_ENDPOINT_URL', default=None)
+AWS_S3_REGION_NAME = env('AWS_S3_REGION_NAME', default=None)
+AWS_S3_CUSTOM_DOMAIN = env('AWS_S3_CUSTOM_DOMAIN', default=None)
+AWS_LOCATION = 'media'
+AWS_DEFAULT_ACL = 'public-read'
+AWS_QUERYSTRING_AUTH = False
+AWS_S3_FILE_OVERWRITE = False
+AWS_S3_OBJECT_PARAMETERS = {'CacheControl': 'public, max-age=86400'}
+AWS_S3_MULTIPART_THRESHOLD = env.int('AWS_S3_MULTIPART_THRESHOLD', default=8 * 1024 * 1024)
+AWS_S3_MULTIPART_CHUNKSIZE = env.int('AWS_S3_MULTIPART_CHUNKSIZE', default=8 * 1024 * 1024)
+AWS_S3_MAX_CONCURRENCY = env.int('AWS_S3_MAX_CONCURRENCY', default=8)
+PRIVATE_MEDIA_URL_EXPIRE = env.int('PRIVATE_MEDIA_URL_EXPIRE', default=5 * 60)
+MEDIA_STORAGE_CACHE = env('MEDIA_STORAGE_CACHE', default='default')
+MEDIA_STORAGE_CACHE_TTL = env.int('MEDIA_STORAGE_CACHE_TTL', default=7 * 24 * 60 * 60)
+
+if USE_S3:
+    STORAGES['default'] = {'BACKEND': 'apps.core.s3.MediaStorage'}
+    STORAGES['private'] = {'BACKEND': 'apps.core.s3.PrivateMediaStorage'}
+    STORAGES['images'] = {'BACKEND': 'apps.core.s3.ContentAddressedMediaStorage'}
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -193,6 +349,115 @@ CACHES = {
     }
 }
 
+# Bulk import (apps.core.importers): the admin upload runs inside the
+# request, so it only accepts files small enough to finish well within the
+# worker timeout; larger ones go through `manage.py import_data`.
+IMPORT_ADMIN_MAX_ROWS = env.int('IMPORT_ADMIN_MAX_ROWS', default=20000)
+
+# Request performance instrumentation (apps.core.instrumentation): per-request
+# SQL/template/cache/email timing, Server-Timing headers for staff and
+# per-route histograms published to PERF_METRICS_CACHE every
+# PERF_METRICS_FLUSH_INTERVAL seconds (0 keeps them in-process only).
+# Workers that have not flushed for PERF_METRICS_RETIRE_AFTER seconds have
+# their totals folded into persistent retired totals.
+PERF_INSTRUMENTATION = env.bool('PERF_INSTRUMENTATION', default=True)
+PERF_METRICS_CACHE = env('PERF_METRICS_CACHE', default='default')
+PERF_METRICS_FLUSH_INTERVAL = env.int('PERF_METRICS_FLUSH_INTERVAL', default=10)
+PERF_METRICS_TTL = env.int('PERF_METRICS_TTL', default=24 * 60 * 60)
+PERF_METRICS_RETIRE_AFTER = env.int('PERF_METRICS_RETIRE_AFTER', default=15 * 60)
+
+# Slow-query log (apps.core.slow_queries): queries slower than the threshold,
+# plus every Nth query when sampling, go to a ring buffer and JSON-lines
+# files, one rotating file per worker named after SLOW_QUERY_LOG_FILE with
+# the pid added; staff see the top offenders under Settings.
+SLOW_QUERY_LOG = env.bool('SLOW_QUERY_LOG', default=True)
+SLOW_QUERY_THRESHOLD_MS = env.int('SLOW_QUERY_THRESHOLD_MS', default=200)
+SLOW_QUERY_SAMPLE_EVERY = env.int('SLOW_QUERY_SAMPLE_EVERY', default=0)
+SLOW_QUERY_BUFFER_SIZE = env.int('SLOW_QUERY_BUFFER_SIZE', default=500)
+SLOW_QUERY_LOG_FILE = env('SLOW_QUERY_LOG_FILE', default=str(BASE_DIR / 'logs' / 'slow_queries.log'))
+SLOW_QUERY_LOG_MAX_BYTES = env.int('SLOW_QUERY_LOG_MAX_BYTES', default=5 * 1024 * 1024)
+SLOW_QUERY_LOG_BACKUPS = env.int('SLOW_QUERY_LOG_BACKUPS', default=3)
+
+# On-demand request profiler (apps.core.profiling): staff start a run from
+# the admin; at most one per process at a time and PROFILER_MAX_RUNS_PER_HOUR
+# site-wide, each capped at PROFILER_MAX_SECONDS.
+PROFILER_INTERVAL_MS = env.float('PROFILER_INTERVAL_MS', default=5)
+PROFILER_MAX_SECONDS = env.float('PROFILER_MAX_SECONDS', default=30)
+PROFILER_MAX_RUNS_PER_HOUR = env.int('PROFILER_MAX_RUNS_PER_HOUR', default=20)
+PROFILER_TOKEN_MAX_AGE = env.int('PROFILER_TOKEN_MAX_AGE', default=600)
+
+# Memory diagnostics (apps.core.memory): warn when a worker's RSS crosses the
+# watermark (0 disables); memory runs and trace_memory keep this many frames
+# per allocation to find the project code responsible.
+MEMORY_RSS_WATERMARK_MB = env.int('MEMORY_RSS_WATERMARK_MB', default=512)
+MEMORY_TRACE_FRAMES = env.int('MEMORY_TRACE_FRAMES', default=40)
+
+# N+1 query detection (apps.core.nplusone): "log" warns during development,
+# "raise" fails the request (and so the test) in CI. Known offenders can be
+# ignored by view name or "view_name:fingerprint".
+NPLUSONE_DETECTION = env('NPLUSONE_DETECTION', default='log' if DEBUG else 'off')
+NPLUSONE_THRESHOLD = env.int('NPLUSONE_THRESHOLD', default=3)
+NPLUSONE_SCOPE = ('apps.',)
+NPLUSONE_IGNORE = env.list('NPLUSONE_IGNORE', default=[])
+
+# Response compression (apps.core.compression): brotli or gzip for text
+# responses of at least COMPRESSION_MIN_SIZE bytes, streamed ones included.
+# Responses carrying a CSRF token are gzipped with random padding, or sent
+# uncompressed with COMPRESSION_SKIP_CSRF.
+COMPRESSION_ENABLED = env.bool('COMPRESSION_ENABLED', default=True)
+COMPRESSION_MIN_SIZE = env.int('COMPRESSION_MIN_SIZE', default=1024)
+COMPRESSION_SKIP_CSRF = env.bool('COMPRESSION_SKIP_CSRF', default=False)
+
+# Tracing (apps.core.tracing): every request gets an X-Request-ID that is
+# added to the project's log lines; sampled requests and the jobs in
+# TRACING_JOB_COMMANDS record spans, exported as JSON lines to TRACING_FILE
+# ("jsonl", one file per worker with the pid added) or to an OTLP/HTTP
+# collector at TRACING_OTLP_ENDPOINT ("otlp").
+TRACING_ENABLED = env.bool('TRACING_ENABLED', default=True)
+TRACING_SAMPLE_RATE = env.float('TRACING_SAMPLE_RATE', default=1.0 if DEBUG else 0.1)
+# Follow the sampled flag of incoming traceparent headers; only when every
+# caller that can reach the app is trusted (e.g. behind an internal gateway)
+TRACING_TRUST_TRACEPARENT = env.bool('TRACING_TRUST_TRACEPARENT', default=False)
+TRACING_EXPORTER = env('TRACING_EXPORTER', default='jsonl')
+TRACING_FILE = env('TRACING_FILE', default=str(BASE_DIR / 'logs' / 'traces.jsonl'))
+TRACING_FILE_MAX_BYTES = env.int('TRACING_FILE_MAX_BYTES', default=10 * 1024 * 1024)
+TRACING_FILE_BACKUPS = env.int('TRACING_FILE_BACKUPS', default=3)
+TRACING_OTLP_ENDPOINT = env('TRACING_OTLP_ENDPOINT', default='http://localhost:4318/v1/traces')
+TRACING_SERVICE_NAME = env('TRACING_SERVICE_NAME', default='globalcool-light')
+TRACING_MAX_SPANS = env.int('TRACING_MAX_SPANS', default=1000)
+TRACING_BUFFER_SIZE = env.int('TRACING_BUFFER_SIZE', default=200)
+TRACING_JOB_COMMANDS = env.list('TRACING_JOB_COMMANDS', default=['import_data', 'sync_replica'])
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'filters': {
+        'request_id': {'()': 'apps.core.tracing.RequestIDFilter'},
+    },
+    'formatters': {
+        'request': {'format': '%(asctime)s %(levelname)s [%(request_id)s] %(name)s: %(message)s'},
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'filters': ['request_id'],
+            'formatter': 'request',
+        },
+    },
+    'loggers': {
+        'apps': {
+            'handlers': ['console'],
+            'level': env('LOG_LEVEL', default='INFO'),
+        },
+    },
+}
+
+# Prometheus /metrics endpoint (apps.core.metrics): served to requests sending
+# "Authorization: Bearer <METRICS_TOKEN>", or to scrapers connecting directly
+# (not through NGINX) from METRICS_ALLOWED_IPS. Nothing is allowed by default.
+METRICS_ALLOWED_IPS = env.list('METRICS_ALLOWED_IPS', default=[])
+METRICS_TOKEN = env('METRICS_TOKEN', default='')
+
 # Session configuration - Use database sessions for development
 SESSION_ENGINE = 'django.contrib.sessions.backends.db'
 SESSION_COOKIE_AGE = 86400  # 24 hours
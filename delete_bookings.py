@@ -1,18 +1,33 @@
 #!/usr/bin/env python
 """
 Delete all bookings from Global Cool-Light E.A LTD database
+
+Deletes in primary-key batches with short transactions. Pass --batch-size to
+tune the batch and --resume to continue an interrupted run.
 """
+import argparse
 import os
 import sys
+import tempfile
 import django
 
 # Setup Django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 django.setup()
 
+from apps.core.bulk_delete import DEFAULT_BATCH_SIZE, DeleteCheckpoint, delete_in_order
 from apps.leads.models import Booking, Inquiry
 
-def delete_all_bookings():
+CHECKPOINT_PATH = os.path.join(tempfile.gettempdir(), 'delete_bookings.checkpoint.json')
+
+
+def print_progress(progress):
+    """Print batch progress"""
+    print(f"   • {progress['label']}: {progress['deleted']}/{progress['total']} "
+          f"({progress['rate']:.0f} rows/s)")
+
+
+def delete_all_bookings(batch_size=DEFAULT_BATCH_SIZE, resume=False):
     """Delete all bookings from the database"""
     
     # Count existing bookings
@@ -42,15 +57,16 @@ def delete_all_bookings():
     
     print("\n🗑️  Deleting all bookings and inquiries...")
     
-    # Delete all bookings
-    if booking_count > 0:
-        deleted_bookings = Booking.objects.all().delete()
-        print(f"✅ Deleted {deleted_bookings[0]} bookings")
-    
-    # Delete all inquiries
-    if inquiry_count > 0:
-        deleted_inquiries = Inquiry.objects.all().delete()
-        print(f"✅ Deleted {deleted_inquiries[0]} inquiries")
+    # Delete bookings, then inquiries (and their quotations)
+    checkpoint = DeleteCheckpoint(CHECKPOINT_PATH, resume=resume)
+    deleted = delete_in_order(
+        [Booking.objects.all(), Inquiry.objects.all()],
+        batch_size=batch_size,
+        checkpoint=checkpoint,
+        progress=print_progress,
+    )
+    print(f"✅ Deleted {deleted['leads.Booking']} bookings")
+    print(f"✅ Deleted {deleted['leads.Inquiry']} inquiries")
     
     print("\n🎉 All bookings and inquiries have been successfully deleted!")
     print("\n📊 Database is now clean:")
@@ -63,9 +79,16 @@ def delete_all_bookings():
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description='Delete all bookings and inquiries')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help='Rows deleted per transaction')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue an interrupted deletion')
+    args = parser.parse_args()
+
     print("🗑️  Global Cool-Light E.A LTD - Delete All Bookings")
     print("=" * 50)
-    delete_all_bookings()
+    delete_all_bookings(batch_size=args.batch_size, resume=args.resume)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,124 @@
+/**
+ * Front-end bundles for the two layouts.
+ *
+ *   static/src/public.{js,css} -> static/dist/public.{js,css}  (templates/base/base.html)
+ *   static/src/admin.{js,css}  -> static/dist/admin.{js,css}   (templates/admin/admin_base.html)
+ *   static/src/chat.js         -> static/dist/chat.js          (loaded on demand by the chat launcher)
+ *
+ * Run after the Tailwind build (`npm run build`), or `npm run watch-assets`
+ * while developing. Output names are stable: collectstatic adds the content
+ * hash, rewrites the font URLs inside the CSS and writes .gz/.br copies.
+ *
+ * Fonts are self-hosted from @fontsource (latin subset, only the weights the
+ * stylesheets use). Font Awesome is cut down to the icons referenced in
+ * templates, app code and the bundle sources, the way Tailwind only keeps
+ * classes it finds in its `content` files: an icon class built at runtime
+ * has to appear somewhere in full to be kept.
+ */
+import * as esbuild from 'esbuild';
+import subsetFont from 'subset-font';
+import { mkdir, readFile, readdir, writeFile } from 'node:fs/promises';
+import path from 'node:path';
+
+const watch = process.argv.includes('--watch');
+
+const FONT_AWESOME = 'node_modules/@fortawesome/fontawesome-free';
+const ICONS_DIR = 'node_modules/.cache/icons';
+const ICON_SOURCES = [
+  ['templates', '.html'],
+  ['apps', '.html'],
+  ['apps', '.py'],
+  ['static/src', '.js'],
+];
+
+async function* walk(dir, extension) {
+  let entries;
+  try {
+    entries = await readdir(dir, { withFileTypes: true });
+  } catch {
+    return;
+  }
+  for (const entry of entries) {
+    const full = path.join(dir, entry.name);
+    if (entry.isDirectory()) {
+      yield* walk(full, extension);
+    } else if (entry.name.endsWith(extension)) {
+      yield full;
+    }
+  }
+}
+
+async function usedIcons() {
+  const names = new Set();
+  for (const [dir, extension] of ICON_SOURCES) {
+    for await (const file of walk(dir, extension)) {
+      for (const match of (await readFile(file, 'utf8')).matchAll(/\bfa-([a-z0-9-]+)/g)) {
+        names.add(match[1]);
+      }
+    }
+  }
+  return names;
+}
+
+/** Write Font Awesome's CSS and woff2 fonts trimmed to the icons in use */
+async function buildIcons() {
+  const names = await usedIcons();
+  const css = await readFile(`${FONT_AWESOME}/css/all.css`, 'utf8');
+  const codepoints = new Set();
+  const trimmed = css
+    .replace(/\.fa-([a-z0-9-]+):before\s*\{\s*content:\s*"\\([0-9a-f]+)";\s*\}\s*/g, (rule, name, code) => {
+      if (!names.has(name)) {
+        return '';
+      }
+      codepoints.add(String.fromCodePoint(parseInt(code, 16)));
+      return rule;
+    })
+    // Every browser the layouts support takes woff2
+    .replace(/src:\s*url\("\.\.\/webfonts\/([\w-]+)\.eot"\);\s*src:[^;]*;/g, 'src: url("$1.woff2") format("woff2");');
+
+  await mkdir(ICONS_DIR, { recursive: true });
+  const text = [...codepoints].join('');
+  for (const font of ['fa-solid-900', 'fa-regular-400', 'fa-brands-400']) {
+    const source = await readFile(`${FONT_AWESOME}/webfonts/${font}.ttf`);
+    await writeFile(`${ICONS_DIR}/${font}.woff2`, await subsetFont(source, text, { targetFormat: 'woff2' }));
+  }
+  await writeFile(`${ICONS_DIR}/icons.css`, trimmed);
+  console.log(`Font Awesome: kept ${codepoints.size} of ${names.size} referenced icon names`);
+}
+
+/** Resolve `@import "font-awesome-subset"` to the trimmed stylesheet */
+const iconsPlugin = {
+  name: 'font-awesome-subset',
+  setup(build) {
+    build.onResolve({ filter: /^font-awesome-subset$/ }, () => ({ path: path.resolve(ICONS_DIR, 'icons.css') }));
+  },
+};
+
+await buildIcons();
+
+const options = {
+  entryPoints: [
+    'static/src/public.js',
+    'static/src/public.css',
+    // Fetched by the chat launcher on first use, not by the layout
+    'static/src/chat.js',
+    'static/src/admin.js',
+    'static/src/admin.css',
+  ],
+  outdir: 'static/dist',
+  bundle: true,
+  minify: true,
+  legalComments: 'none',
+  target: ['es2018', 'chrome80', 'firefox78', 'safari13'],
+  loader: { '.woff2': 'file', '.woff': 'file' },
+  assetNames: 'fonts/[name]',
+  plugins: [iconsPlugin],
+  logLevel: 'info',
+};
+
+if (watch) {
+  const context = await esbuild.context(options);
+  await context.watch();
+} else {
+  await esbuild.build(options);
+}
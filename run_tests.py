@@ -21,6 +21,28 @@ if __name__ == "__main__":
         'apps.leads.tests.test_views', 
         'apps.leads.tests.test_forms',
         'apps.leads.tests.test_integration',
+        'apps.core.tests.test_routers',
+        'apps.core.tests.test_importers',
+        'apps.core.tests.test_bulk_delete',
+        'apps.core.tests.test_seeding',
+        'apps.core.tests.test_benchmarks',
+        'apps.core.tests.test_query_budgets',
+        'apps.core.tests.test_instrumentation',
+        'apps.core.tests.test_metrics',
+        'apps.core.tests.test_slow_queries',
+        'apps.core.tests.test_profiling',
+        'apps.core.tests.test_memory',
+        'apps.core.tests.test_nplusone',
+        'apps.core.tests.test_tracing',
+        'apps.core.tests.test_static_assets',
+        'apps.core.tests.test_critical_css',
+        'apps.core.tests.test_compression',
+        'apps.core.tests.test_protected_media',
+        'apps.core.tests.test_s3_storage',
+        'apps.core.tests.test_media_gc',
+        'apps.users.tests_exports',
+        'apps.users.tests_list_fragments',
+        'apps.users.tests_dashboard',
     ]
     
     print("=" * 70)
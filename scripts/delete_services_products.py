@@ -2,9 +2,12 @@
 """
 Quick script to delete services and products data.
 Run this with: python manage.py shell < scripts/delete_services_products.py
+
+Deletes in primary-key batches with short transactions; for large tables
+prefer `python manage.py clear_services_products`, which can also resume.
 """
 
-from django.db import transaction
+from apps.core.bulk_delete import delete_in_order
 from apps.services.models import (
     Service, ServiceCategory, ServiceImage,
     Product, ProductCategory, ProductImage
@@ -21,37 +24,37 @@ def show_current_counts():
     print(f"Product Images: {ProductImage.objects.count()}")
     print()
 
+def print_progress(progress):
+    """Print batch progress"""
+    print(f"  {progress['label']}: {progress['deleted']}/{progress['total']} "
+          f"({progress['rate']:.0f} rows/s)")
+
 def delete_all_services_products():
     """Delete all services and products data"""
     print("Starting deletion of all services and products data...")
     
     try:
-        with transaction.atomic():
-            # Delete in proper order to avoid foreign key constraints
-            service_images_deleted = ServiceImage.objects.all().delete()
-            product_images_deleted = ProductImage.objects.all().delete()
-            services_deleted = Service.objects.all().delete()
-            products_deleted = Product.objects.all().delete()
-            service_cats_deleted = ServiceCategory.objects.all().delete()
-            product_cats_deleted = ProductCategory.objects.all().delete()
-            
-            print("=== Deletion Results ===")
-            print(f"Service Images deleted: {service_images_deleted[0]}")
-            print(f"Product Images deleted: {product_images_deleted[0]}")
-            print(f"Services deleted: {services_deleted[0]}")
-            print(f"Products deleted: {products_deleted[0]}")
-            print(f"Service Categories deleted: {service_cats_deleted[0]}")
-            print(f"Product Categories deleted: {product_cats_deleted[0]}")
-            
-            total_deleted = (
-                service_images_deleted[0] + product_images_deleted[0] +
-                services_deleted[0] + products_deleted[0] +
-                service_cats_deleted[0] + product_cats_deleted[0]
-            )
-            
-            print(f"\nTotal items deleted: {total_deleted}")
-            print("✅ All services and products data deleted successfully!")
-            
+        # Delete in proper order to avoid foreign key constraints
+        deleted = delete_in_order([
+            ServiceImage.objects.all(),
+            ProductImage.objects.all(),
+            Service.objects.all(),
+            Product.objects.all(),
+            ServiceCategory.objects.all(),
+            ProductCategory.objects.all(),
+        ], progress=print_progress)
+
+        print("=== Deletion Results ===")
+        print(f"Service Images deleted: {deleted['services.ServiceImage']}")
+        print(f"Product Images deleted: {deleted['services.ProductImage']}")
+        print(f"Services deleted: {deleted['services.Service']}")
+        print(f"Products deleted: {deleted['services.Product']}")
+        print(f"Service Categories deleted: {deleted['services.ServiceCategory']}")
+        print(f"Product Categories deleted: {deleted['services.ProductCategory']}")
+
+        print(f"\nTotal items deleted: {sum(deleted.values())}")
+        print("✅ All services and products data deleted successfully!")
+
     except Exception as e:
         print(f"❌ Error during deletion: {e}")
         raise
@@ -61,14 +64,14 @@ def delete_services_only():
     print("Deleting services and service images only...")
     
     try:
-        with transaction.atomic():
-            service_images_deleted = ServiceImage.objects.all().delete()
-            services_deleted = Service.objects.all().delete()
-            
-            print(f"Service Images deleted: {service_images_deleted[0]}")
-            print(f"Services deleted: {services_deleted[0]}")
-            print("✅ Services data deleted successfully!")
-            
+        deleted = delete_in_order(
+            [ServiceImage.objects.all(), Service.objects.all()], progress=print_progress
+        )
+
+        print(f"Service Images deleted: {deleted['services.ServiceImage']}")
+        print(f"Services deleted: {deleted['services.Service']}")
+        print("✅ Services data deleted successfully!")
+
     except Exception as e:
         print(f"❌ Error during deletion: {e}")
         raise
@@ -78,14 +81,14 @@ def delete_products_only():
     print("Deleting products and product images only...")
     
     try:
-        with transaction.atomic():
-            product_images_deleted = ProductImage.objects.all().delete()
-            products_deleted = Product.objects.all().delete()
-            
-            print(f"Product Images deleted: {product_images_deleted[0]}")
-            print(f"Products deleted: {products_deleted[0]}")
-            print("✅ Products data deleted successfully!")
-            
+        deleted = delete_in_order(
+            [ProductImage.objects.all(), Product.objects.all()], progress=print_progress
+        )
+
+        print(f"Product Images deleted: {deleted['services.ProductImage']}")
+        print(f"Products deleted: {deleted['services.Product']}")
+        print("✅ Products data deleted successfully!")
+
     except Exception as e:
         print(f"❌ Error during deletion: {e}")
         raise
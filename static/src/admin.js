@@ -0,0 +1,10 @@
+// Admin layout bundle, loaded deferred from templates/admin/admin_base.html.
+// Libraries only some pages need are loaded by those pages' {% block extra_js %}.
+import './jquery.js';
+import * as bootstrap from 'bootstrap';
+import htmx from 'htmx.org';
+import './admin-theme.js';
+
+window.bootstrap = bootstrap;
+// Swaps the filtered results and stats fragments of the list pages
+window.htmx = htmx;
@@ -0,0 +1,217 @@
+// Live chat panel, loaded by templates/components/chat-widgets.html the first
+// time a visitor reaches for the launcher (or straight away when a chat is in
+// progress). Fetches the panel markup, mounts it as an Alpine component and
+// polls for staff replies only while a chat session exists on the server and
+// the tab is visible.
+const POLL_INTERVAL = 5000;
+const SESSION_KEY = 'chat_session_id';
+const CONTACT_KEY = 'chat_contact_info';
+
+const widgets = document.getElementById('chat-widgets');
+const launcher = document.getElementById('chat-launcher');
+
+function csrfToken() {
+    const match = document.cookie.match(/(?:^|;\s*)csrftoken=([^;]+)/);
+    return match ? match[1] : '';
+}
+
+function chatWidget() {
+    return {
+        liveChatOpen: false,
+        chatStarted: false,
+        messageText: '',
+        hasNewMessages: false,
+        sessionId: null,
+        // Whether the server knows the session, i.e. a message has been sent
+        sessionExists: false,
+        lastMessageId: 0,
+        isLoading: false,
+        timer: null,
+        contactForm: {
+            name: '',
+            email: '',
+            phone: ''
+        },
+
+        init() {
+            this.sessionId = localStorage.getItem(SESSION_KEY);
+            const contactInfo = localStorage.getItem(CONTACT_KEY);
+            if (this.sessionId && contactInfo) {
+                this.contactForm = JSON.parse(contactInfo);
+                this.chatStarted = true;
+                this.fetchMessages(false);
+            }
+
+            launcher.addEventListener('click', () => this.toggle());
+            document.addEventListener('visibilitychange', () => this.visibilityChanged());
+            this.$watch('liveChatOpen', () => this.renderLauncher());
+            this.$watch('hasNewMessages', () => this.renderLauncher());
+
+            // The click that loaded this bundle asked for the panel
+            this.liveChatOpen = widgets.dataset.chatOpen === 'true';
+            this.renderLauncher();
+        },
+
+        toggle() {
+            this.liveChatOpen = !this.liveChatOpen;
+            if (this.liveChatOpen) {
+                this.hasNewMessages = false;
+            }
+        },
+
+        renderLauncher() {
+            launcher.setAttribute('aria-expanded', String(this.liveChatOpen));
+            launcher.querySelector('[data-chat-icon="open"]').classList.toggle('hidden', this.liveChatOpen);
+            launcher.querySelector('[data-chat-icon="close"]').classList.toggle('hidden', !this.liveChatOpen);
+            launcher.querySelector('[data-chat-badge]').classList.toggle('hidden', !this.hasNewMessages);
+        },
+
+        // Poll while the server has a session and someone can see the page
+        schedule() {
+            clearTimeout(this.timer);
+            this.timer = null;
+            if (this.sessionExists && !document.hidden) {
+                this.timer = setTimeout(() => this.fetchMessages(true), POLL_INTERVAL);
+            }
+        },
+
+        visibilityChanged() {
+            if (document.hidden) {
+                this.schedule();
+            } else if (this.sessionExists) {
+                // Catch up on what arrived while the tab was hidden
+                this.fetchMessages(true);
+            }
+        },
+
+        async fetchMessages(notify) {
+            if (!this.sessionId) return;
+
+            try {
+                const url = widgets.dataset.chatHistoryUrl.replace('__session__', encodeURIComponent(this.sessionId));
+                const response = await fetch(`${url}?after=${this.lastMessageId}`);
+                // No message sent yet, so there is nothing to poll for
+                this.sessionExists = response.ok;
+                if (!response.ok) return;
+
+                const data = await response.json();
+                data.messages.forEach((message) => this.addMessage(message));
+                if (notify && !this.liveChatOpen && data.messages.some((message) => message.type !== 'user')) {
+                    this.hasNewMessages = true;
+                }
+            } catch (error) {
+                console.error('Error checking for new messages:', error);
+            } finally {
+                this.schedule();
+            }
+        },
+
+        startChat() {
+            if (!this.contactForm.name.trim() || !this.contactForm.email.trim()) {
+                return;
+            }
+            localStorage.setItem(CONTACT_KEY, JSON.stringify(this.contactForm));
+            if (!this.sessionId) {
+                this.sessionId = 'chat_' + Date.now() + '_' + Math.random().toString(36).slice(2, 11);
+                localStorage.setItem(SESSION_KEY, this.sessionId);
+            }
+            this.chatStarted = true;
+        },
+
+        async sendMessage() {
+            if (!this.messageText.trim() || this.isLoading) return;
+
+            const message = this.messageText.trim();
+            this.messageText = '';
+            this.isLoading = true;
+
+            try {
+                const response = await fetch(widgets.dataset.chatMessageUrl, {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json',
+                        'X-CSRFToken': csrfToken()
+                    },
+                    body: JSON.stringify({
+                        message: message,
+                        session_id: this.sessionId,
+                        name: this.contactForm.name,
+                        email: this.contactForm.email,
+                        phone: this.contactForm.phone
+                    })
+                });
+                const data = await response.json();
+                if (!data.success) {
+                    throw new Error(data.error || 'Failed to send message');
+                }
+
+                this.sessionId = data.session_id;
+                localStorage.setItem(SESSION_KEY, this.sessionId);
+                this.addMessage({ id: data.user_message.id, type: 'user', content: data.user_message.content });
+                this.addMessage({ id: data.bot_message.id, type: 'bot', content: data.bot_message.content });
+                if (!this.sessionExists) {
+                    this.sessionExists = true;
+                    this.schedule();
+                }
+            } catch (error) {
+                console.error('Error sending message:', error);
+                this.addMessage({ type: 'bot', content: 'Sorry, there was an error sending your message. Please try again.' });
+            } finally {
+                this.isLoading = false;
+            }
+        },
+
+        addMessage(message) {
+            if (message.id) {
+                if (message.id <= this.lastMessageId) return;
+                this.lastMessageId = message.id;
+            }
+
+            const fromVisitor = message.type === 'user';
+            const row = document.createElement('div');
+            row.className = 'mb-4';
+            row.innerHTML = fromVisitor ? `
+                <div class="flex items-start space-x-2 justify-end">
+                    <div class="bg-primary-500 text-white rounded-lg rounded-tr-none px-3 py-2 shadow-sm max-w-xs">
+                        <p class="text-sm"></p>
+                        <span class="text-xs text-primary-100 mt-1 block">Just now</span>
+                    </div>
+                    <div class="w-6 h-6 bg-gray-400 rounded-full flex items-center justify-center flex-shrink-0">
+                        <svg class="w-3 h-3 text-white" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M16 7a4 4 0 11-8 0 4 4 0 018 0zM12 14a7 7 0 00-7 7h14a7 7 0 00-7-7z"/>
+                        </svg>
+                    </div>
+                </div>` : `
+                <div class="flex items-start space-x-2">
+                    <div class="w-6 h-6 bg-primary-500 rounded-full flex items-center justify-center flex-shrink-0">
+                        <svg class="w-3 h-3 text-white" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M16 7a4 4 0 11-8 0 4 4 0 018 0zM12 14a7 7 0 00-7 7h14a7 7 0 00-7-7z"/>
+                        </svg>
+                    </div>
+                    <div class="bg-white rounded-lg rounded-tl-none px-3 py-2 shadow-sm max-w-xs">
+                        <p class="text-sm text-gray-800"></p>
+                        <span class="text-xs text-gray-500 mt-1 block">Just now</span>
+                    </div>
+                </div>`;
+            // Message text is never parsed as HTML
+            row.querySelector('p').textContent = message.content;
+
+            this.$refs.messages.appendChild(row);
+            this.$refs.scroller.scrollTop = this.$refs.scroller.scrollHeight;
+        }
+    };
+}
+
+async function mount() {
+    window.Alpine.data('chatWidget', chatWidget);
+    const response = await fetch(widgets.dataset.chatPanelUrl);
+    // Alpine initialises the component as soon as the markup is in the page
+    document.getElementById('chat-panel-root').innerHTML = await response.text();
+}
+
+// Alpine comes from the deferred layout bundle, which has run by DOMContentLoaded
+if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', mount);
+} else {
+    mount();
+}
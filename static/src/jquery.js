@@ -0,0 +1,5 @@
+// Bootstrap registers its jQuery plugins and the theme script uses `jQuery`,
+// so the global has to exist before either module runs
+import $ from 'jquery';
+
+window.$ = window.jQuery = $;
@@ -0,0 +1,11 @@
+// Public layout bundle, loaded deferred from templates/base/base.html
+import htmx from 'htmx.org';
+import Alpine from 'alpinejs';
+
+// Inline scripts and hx-on handlers use the globals the CDN builds used to set
+window.htmx = htmx;
+window.Alpine = Alpine;
+
+// Components such as chatWidgets() are defined by inline scripts in the page,
+// which have all run by the time a deferred script starts
+Alpine.start();
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("autoembed","nb",{embeddingInProgress:"Prøver å bygge inn innlimt URL...",embeddingFailed:"URL-en kunne ikke bli automatisk bygget inn."});
\ No newline at end of file
@@ -1,3 +0,0 @@
-﻿CKEDITOR.plugins.setLang("docprops","af",{bgColor:"Agtergrond kleur",bgFixed:"Vasgeklemde Agtergrond",bgImage:"Agtergrond Beeld URL",charset:"Karakterstel Kodeering",charsetASCII:"ASCII",charsetCE:"Sentraal Europa",charsetCR:"Cyrillic",charsetCT:"Chinees Traditioneel (Big5)",charsetGR:"Grieks",charsetJP:"Japanees",charsetKR:"Koreans",charsetOther:"Ander Karakterstel Kodeering",charsetTR:"Turks",charsetUN:"Unicode (UTF-8)",charsetWE:"Western European",chooseColor:"Kies",design:"Design",docTitle:"Bladsy Opskrif",
-docType:"Dokument Opskrif Soort",docTypeOther:"Ander Dokument Opskrif Soort",label:"Dokument Eienskappe",margin:"Bladsy Rante",marginBottom:"Onder",marginLeft:"Links",marginRight:"Regs",marginTop:"Bo",meta:"Meta Data",metaAuthor:"Skrywer",metaCopyright:"Kopiereg",metaDescription:"Dokument Beskrywing",metaKeywords:"Dokument Index Sleutelwoorde(comma verdeelt)",other:"<ander>",previewHtml:'<p>This is some <strong>sample text</strong>. You are using <a href="javascript:void(0)">CKEditor</a>.</p>',title:"Dokument Eienskappe",
-txtColor:"Tekskleur",xhtmlDec:"Voeg XHTML verklaring by"});
\ No newline at end of file
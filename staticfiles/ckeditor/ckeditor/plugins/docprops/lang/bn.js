@@ -1,3 +0,0 @@
-﻿CKEDITOR.plugins.setLang("docprops","bn",{bgColor:"ব্যাকগ্রাউন্ড রং",bgFixed:"স্ক্রলহীন ব্যাকগ্রাউন্ড",bgImage:"ব্যাকগ্রাউন্ড ছবির URL",charset:"ক্যারেক্টার সেট এনকোডিং",charsetASCII:"ASCII",charsetCE:"Central European",charsetCR:"Cyrillic",charsetCT:"Chinese Traditional (Big5)",charsetGR:"Greek",charsetJP:"Japanese",charsetKR:"Korean",charsetOther:"অন্য ক্যারেক্টার সেট এনকোডিং",charsetTR:"Turkish",charsetUN:"Unicode (UTF-8)",charsetWE:"Western European",chooseColor:"Choose",design:"Design",docTitle:"পেজ শীর্ষক",
-docType:"ডক্যুমেন্ট টাইপ হেডিং",docTypeOther:"অন্য ডক্যুমেন্ট টাইপ হেডিং",label:"ডক্যুমেন্ট প্রোপার্টি",margin:"পেজ মার্জিন",marginBottom:"নীচে",marginLeft:"বামে",marginRight:"ডানে",marginTop:"উপর",meta:"মেটাডেটা",metaAuthor:"লেখক",metaCopyright:"কপীরাইট",metaDescription:"ডক্যূমেন্ট বর্ণনা",metaKeywords:"ডক্যুমেন্ট ইন্ডেক্স কিওয়ার্ড (কমা দ্বারা বিচ্ছিন্ন)",other:"<other>",previewHtml:'<p>This is some <strong>sample text</strong>. You are using <a href="javascript:void(0)">CKEditor</a>.</p>',title:"ডক্যুমেন্ট প্রোপার্টি",
-txtColor:"টেক্স্ট রং",xhtmlDec:"XHTML ডেক্লারেশন যুক্ত কর"});
\ No newline at end of file
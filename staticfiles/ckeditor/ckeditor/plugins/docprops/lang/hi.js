@@ -1,3 +0,0 @@
-﻿CKEDITOR.plugins.setLang("docprops","hi",{bgColor:"बैक्ग्राउन्ड रंग",bgFixed:"स्क्रॉल न करने वाला बैक्ग्राउन्ड",bgImage:"बैक्ग्राउन्ड तस्वीर URL",charset:"करेक्टर सॅट ऍन्कोडिंग",charsetASCII:"ASCII",charsetCE:"मध्य यूरोपीय (Central European)",charsetCR:"सिरीलिक (Cyrillic)",charsetCT:"चीनी (Chinese Traditional Big5)",charsetGR:"यवन (Greek)",charsetJP:"जापानी (Japanese)",charsetKR:"कोरीयन (Korean)",charsetOther:"अन्य करेक्टर सॅट ऍन्कोडिंग",charsetTR:"तुर्की (Turkish)",charsetUN:"यूनीकोड (UTF-8)",charsetWE:"पश्चिम यूरोपीय (Western European)",
-chooseColor:"Choose",design:"Design",docTitle:"पेज शीर्षक",docType:"डॉक्यूमॅन्ट प्रकार शीर्षक",docTypeOther:"अन्य डॉक्यूमॅन्ट प्रकार शीर्षक",label:"डॉक्यूमॅन्ट प्रॉपर्टीज़",margin:"पेज मार्जिन",marginBottom:"नीचे",marginLeft:"बायें",marginRight:"दायें",marginTop:"ऊपर",meta:"मॅटाडेटा",metaAuthor:"लेखक",metaCopyright:"कॉपीराइट",metaDescription:"डॉक्यूमॅन्ट करॅक्टरन",metaKeywords:"डॉक्युमॅन्ट इन्डेक्स संकेतशब्द (अल्पविराम से अलग करें)",other:"<अन्य>",previewHtml:'<p>This is some <strong>sample text</strong>. You are using <a href="javascript:void(0)">CKEditor</a>.</p>',
-title:"डॉक्यूमॅन्ट प्रॉपर्टीज़",txtColor:"टेक्स्ट रंग",xhtmlDec:"XHTML सूचना सम्मिलित करें"});
\ No newline at end of file
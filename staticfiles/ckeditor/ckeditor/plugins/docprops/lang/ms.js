@@ -1,3 +0,0 @@
-﻿CKEDITOR.plugins.setLang("docprops","ms",{bgColor:"Warna Latarbelakang",bgFixed:"Imej Latarbelakang tanpa Skrol",bgImage:"URL Gambar Latarbelakang",charset:"Enkod Set Huruf",charsetASCII:"ASCII",charsetCE:"Central European",charsetCR:"Cyrillic",charsetCT:"Chinese Traditional (Big5)",charsetGR:"Greek",charsetJP:"Japanese",charsetKR:"Korean",charsetOther:"Enkod Set Huruf yang Lain",charsetTR:"Turkish",charsetUN:"Unicode (UTF-8)",charsetWE:"Western European",chooseColor:"Choose",design:"Design",docTitle:"Tajuk Muka Surat",
-docType:"Jenis Kepala Dokumen",docTypeOther:"Jenis Kepala Dokumen yang Lain",label:"Ciri-ciri dokumen",margin:"Margin Muka Surat",marginBottom:"Bawah",marginLeft:"Kiri",marginRight:"Kanan",marginTop:"Atas",meta:"Data Meta",metaAuthor:"Penulis",metaCopyright:"Hakcipta",metaDescription:"Keterangan Dokumen",metaKeywords:"Kata Kunci Indeks Dokumen (dipisahkan oleh koma)",other:"<lain>",previewHtml:'<p>This is some <strong>sample text</strong>. You are using <a href="javascript:void(0)">CKEditor</a>.</p>',
-title:"Ciri-ciri dokumen",txtColor:"Warna Text",xhtmlDec:"Masukkan pemula kod XHTML"});
\ No newline at end of file
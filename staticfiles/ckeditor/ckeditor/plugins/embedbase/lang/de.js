@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("embedbase","de",{pathName:"Medienobjekt",title:"Media Embed",button:"Insert Media Embed",unsupportedUrlGiven:"Die angegebene URL wird nicht unterstützt.",unsupportedUrl:"The URL {url} is not supported by Media Embed.",fetchingFailedGiven:"Abrufen des Inhalts für die angegebene URL ist fehlgeschlagen.",fetchingFailed:"Abrufen des Inhalts für {url} ist fehlgeschlagen.",fetchingOne:"Fetching oEmbed response...",fetchingMany:"Fetching oEmbed responses, {current} of {max} done..."});
\ No newline at end of file
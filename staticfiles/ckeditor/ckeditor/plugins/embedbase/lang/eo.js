@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("embedbase","eo",{pathName:"Aŭdvidea objekto",title:"Media Embed",button:"Insert Media Embed",unsupportedUrlGiven:"The specified URL is not supported.",unsupportedUrl:"The URL {url} is not supported by Media Embed.",fetchingFailedGiven:"Failed to fetch content for the given URL.",fetchingFailed:"Failed to fetch content for {url}.",fetchingOne:"Fetching oEmbed response...",fetchingMany:"Fetching oEmbed responses, {current} of {max} done..."});
\ No newline at end of file
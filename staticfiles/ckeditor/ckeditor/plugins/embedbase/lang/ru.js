@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("embedbase","ru",{pathName:"media object",title:"Вставка медиаконтента",button:"Вставить медиаконтент",unsupportedUrlGiven:"Данный URL не поддерживает возможность вставки медиаконтента",unsupportedUrl:"URL {url} не поддерживает возможность вставки медиаконтента",fetchingFailedGiven:"Не удалось извлечь контент для заданного URL",fetchingFailed:"Не удалось извлечь контент для {url}",fetchingOne:"Fetching oEmbed response...",fetchingMany:"Fetching oEmbed responses, {current} of {max} done..."});
\ No newline at end of file
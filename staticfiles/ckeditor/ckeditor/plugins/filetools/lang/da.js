@@ -1,5 +0,0 @@
-﻿/*
- Copyright (c) 2003-2015, CKSource - Frederico Knabben. All rights reserved.
- For licensing, see LICENSE.md or http://ckeditor.com/license
-*/
-CKEDITOR.plugins.setLang("filetools","da",{loadError:"Der skete en fejl ved indlæsningen af filen.",networkError:"Der skete en netværks fejl under uploadingen.",httpError404:"Der skete en HTTP fejl under uploadingen (404: File not found).",httpError403:"Der skete en HTTP fejl under uploadingen (403: Forbidden).",httpError:"Der skete en HTTP fejl under uploadingen (error status: %1).",noUrlError:"Upload URL er ikke defineret.",responseError:"Ikke korrekt server svar."});
\ No newline at end of file
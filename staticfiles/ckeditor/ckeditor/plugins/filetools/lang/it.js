@@ -1,6 +0,0 @@
-﻿/*
- Copyright (c) 2003-2015, CKSource - Frederico Knabben. All rights reserved.
- For licensing, see LICENSE.md or http://ckeditor.com/license
-*/
-CKEDITOR.plugins.setLang("filetools","it",{loadError:"Si è verificato un errore durante la lettura del file.",networkError:"Si è verificato un errore di rete durante il caricamento del file.",httpError404:"Si è verificato un errore HTTP durante il caricamento del file (404: file non trovato).",httpError403:"Si è verificato un errore HTTP durante il caricamento del file (403: accesso negato).",httpError:"Si è verificato un errore HTTP durante il caricamento del file (stato dell'errore: %1).",noUrlError:"L'URL per il caricamento non è stato definito.",
-responseError:"La risposta del server non è corretta."});
\ No newline at end of file
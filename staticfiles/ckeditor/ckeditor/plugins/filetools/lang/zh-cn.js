@@ -1,5 +0,0 @@
-﻿/*
- Copyright (c) 2003-2015, CKSource - Frederico Knabben. All rights reserved.
- For licensing, see LICENSE.md or http://ckeditor.com/license
-*/
-CKEDITOR.plugins.setLang("filetools","zh-cn",{loadError:"读取文件时发生错误。",networkError:"上传文件时发生网络错误。",httpError404:"上传文件时发生 HTTP 错误（404：无法找到文件）。",httpError403:"上传文件时发生 HTTP 错误（403：禁止访问）。",httpError:"上传文件时发生 HTTP 错误（错误代码：%1）。",noUrlError:"上传的 URL 未定义。",responseError:"不正确的服务器响应。"});
\ No newline at end of file
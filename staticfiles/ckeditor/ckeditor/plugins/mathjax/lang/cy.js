@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("mathjax","cy",{title:"Mathemateg mewn TeX",button:"Math",dialogInput:"Ysgrifennwch eich TeX yma",docUrl:"http://en.wikibooks.org/wiki/LaTeX/Mathematics",docLabel:"Dogfennaeth TeX",loading:"llwytho...",pathName:"math"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("mathjax","de",{title:"Mathematik in Tex",button:"Rechnung",dialogInput:"Schreiben Sie hier in Tex",docUrl:"http://en.wikibooks.org/wiki/LaTeX/Mathematics",docLabel:"TeX-Dokumentation",loading:"Ladevorgang...",pathName:"rechnen"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("mathjax","gl",{title:"Matemáticas en TeX",button:"Matemáticas",dialogInput:"Escriba o seu TeX aquí",docUrl:"http://en.wikibooks.org/wiki/LaTeX/Mathematics",docLabel:"Documentación de TeX",loading:"cargando...",pathName:"matemáticas"});
\ No newline at end of file
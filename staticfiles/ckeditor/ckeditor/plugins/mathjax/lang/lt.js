@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("mathjax","lt",{title:"Matematika per TeX",button:"Matematika",dialogInput:"Parašyk savo TeX čia",docUrl:"http://en.wikibooks.org/wiki/LaTeX/Mathematics",docLabel:"TeX žinynas",loading:"kraunasi...",pathName:"matematika"});
\ No newline at end of file
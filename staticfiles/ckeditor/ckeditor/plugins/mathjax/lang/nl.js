@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("mathjax","nl",{title:"Wiskunde in TeX",button:"Wiskunde",dialogInput:"Typ hier uw TeX",docUrl:"http://en.wikibooks.org/wiki/LaTeX/Mathematics",docLabel:"TeX documentatie",loading:"laden...",pathName:"wiskunde"});
\ No newline at end of file
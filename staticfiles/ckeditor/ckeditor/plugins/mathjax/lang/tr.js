@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("mathjax","tr",{title:"TeX ile Matematik",button:"Matematik",dialogInput:"TeX kodunuzu buraya yazın",docUrl:"http://en.wikibooks.org/wiki/LaTeX/Mathematics",docLabel:"TeX yardım dökümanı",loading:"yükleniyor...",pathName:"matematik"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("mathjax","tt",{title:"TeX'та математика",button:"Математика",dialogInput:"Биредә TeX форматында аңлатмагызны языгыз",docUrl:"http://en.wikibooks.org/wiki/LaTeX/Mathematics",docLabel:"TeX турыдна документлар",loading:"йөкләнә...",pathName:"математика"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("notification","da",{closed:"Notefikation lukket."});
\ No newline at end of file
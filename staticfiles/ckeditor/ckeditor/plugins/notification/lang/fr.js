@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("notification","fr",{closed:"La notification est close."});
\ No newline at end of file
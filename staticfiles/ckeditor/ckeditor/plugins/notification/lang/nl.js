@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("notification","nl",{closed:"Melding gesloten."});
\ No newline at end of file
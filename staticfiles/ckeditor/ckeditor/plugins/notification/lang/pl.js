@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("notification","pl",{closed:"Powiadomienie zostało zamknięte."});
\ No newline at end of file
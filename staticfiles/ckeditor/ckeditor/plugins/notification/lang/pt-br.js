@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("notification","pt-br",{closed:"Notificação fechada."});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("notification","zh",{closed:"通知已關閉。"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","ar",{toolbar:"المصدر",title:"المصدر"});
\ No newline at end of file
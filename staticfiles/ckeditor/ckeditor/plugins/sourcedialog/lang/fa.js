@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","fa",{toolbar:"منبع",title:"منبع"});
\ No newline at end of file
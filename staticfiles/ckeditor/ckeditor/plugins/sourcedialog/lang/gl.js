@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","gl",{toolbar:"Orixe",title:"Orixe"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","ka",{toolbar:"კოდები",title:"კოდები"});
\ No newline at end of file
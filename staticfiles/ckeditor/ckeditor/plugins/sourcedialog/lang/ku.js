@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","ku",{toolbar:"سەرچاوە",title:"سەرچاوە"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","ru",{toolbar:"Исходник",title:"Источник"});
\ No newline at end of file
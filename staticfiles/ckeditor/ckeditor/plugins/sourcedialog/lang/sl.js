@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","sl",{toolbar:"Izvorna koda",title:"Izvorna koda"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","th",{toolbar:"ดูรหัส HTML",title:"ดูรหัส HTML"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","tr",{toolbar:"Kaynak",title:"Kaynak"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","tt",{toolbar:"Чыганак",title:"Чыганак"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","ug",{toolbar:"مەنبە",title:"مەنبە"});
\ No newline at end of file
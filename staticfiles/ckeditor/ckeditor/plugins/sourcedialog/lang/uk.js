@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","uk",{toolbar:"Джерело",title:"Джерело"});
\ No newline at end of file
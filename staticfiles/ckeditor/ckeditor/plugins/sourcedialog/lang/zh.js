@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","zh",{toolbar:"原始碼",title:"原始碼"});
\ No newline at end of file
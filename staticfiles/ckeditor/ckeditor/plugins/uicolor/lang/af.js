@@ -1,5 +0,0 @@
-﻿/*
- Copyright (c) 2003-2015, CKSource - Frederico Knabben. All rights reserved.
- For licensing, see LICENSE.md or http://ckeditor.com/license
-*/
-CKEDITOR.plugins.setLang("uicolor","af",{title:"UI kleur keuse",preview:"Voorskou",config:"Voeg hierdie in jou config.js lêr in",predefined:"Voordefinieerte kleur keuses"});
\ No newline at end of file
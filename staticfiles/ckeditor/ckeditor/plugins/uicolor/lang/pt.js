@@ -1,5 +0,0 @@
-﻿/*
- Copyright (c) 2003-2015, CKSource - Frederico Knabben. All rights reserved.
- For licensing, see LICENSE.md or http://ckeditor.com/license
-*/
-CKEDITOR.plugins.setLang("uicolor","pt",{title:"Seleção de Cor da IU",preview:"Pré-visualização ao vivo ",config:"Colar este item no seu ficheiro config.js",predefined:"Conjuntos de cor predefinidos"});
\ No newline at end of file
@@ -1,225 +0,0 @@
-﻿if("undefined"==typeof YAHOO||!YAHOO)var YAHOO={};YAHOO.namespace=function(){var c=arguments,e=null,b,d,a;for(b=0;b<c.length;b+=1){a=(""+c[b]).split(".");e=YAHOO;for(d="YAHOO"==a[0]?1:0;d<a.length;d+=1)e[a[d]]=e[a[d]]||{},e=e[a[d]]}return e};YAHOO.log=function(c,e,b){var d=YAHOO.widget.Logger;return d&&d.log?d.log(c,e,b):!1};
-YAHOO.register=function(c,e,b){var d=YAHOO.env.modules,a,f,g;d[c]||(d[c]={versions:[],builds:[]});d=d[c];a=b.version;b=b.build;f=YAHOO.env.listeners;d.name=c;d.version=a;d.build=b;d.versions.push(a);d.builds.push(b);d.mainClass=e;for(g=0;g<f.length;g+=1)f[g](d);e?(e.VERSION=a,e.BUILD=b):YAHOO.log("mainClass is undefined for module "+c,"warn")};YAHOO.env=YAHOO.env||{modules:[],listeners:[]};YAHOO.env.getVersion=function(c){return YAHOO.env.modules[c]||null};
-YAHOO.env.ua=function(){var c={ie:0,opera:0,gecko:0,webkit:0,mobile:null,air:0,caja:0},e=navigator.userAgent,b;/KHTML/.test(e)&&(c.webkit=1);if((b=e.match(/AppleWebKit\/([^\s]*)/))&&b[1]){c.webkit=parseFloat(b[1]);if(/ Mobile\//.test(e))c.mobile="Apple";else if(b=e.match(/NokiaN[^\/]*/))c.mobile=b[0];if(b=e.match(/AdobeAIR\/([^\s]*)/))c.air=b[0]}if(!c.webkit)if((b=e.match(/Opera[\s\/]([^\s]*)/))&&b[1]){if(c.opera=parseFloat(b[1]),b=e.match(/Opera Mini[^;]*/))c.mobile=b[0]}else if((b=e.match(/MSIE\s([^;]*)/))&&
-b[1])c.ie=parseFloat(b[1]);else if(b=e.match(/Gecko\/([^\s]*)/))if(c.gecko=1,(b=e.match(/rv:([^\s\)]*)/))&&b[1])c.gecko=parseFloat(b[1]);if((b=e.match(/Caja\/([^\s]*)/))&&b[1])c.caja=parseFloat(b[1]);return c}();(function(){YAHOO.namespace("util","widget","example");if("undefined"!==typeof YAHOO_config){var c=YAHOO_config.listener,e=YAHOO.env.listeners,b=!0,d;if(c){for(d=0;d<e.length;d+=1)if(e[d]==c){b=!1;break}b&&e.push(c)}}})();YAHOO.lang=YAHOO.lang||{};
-(function(){var c=YAHOO.lang,e=Object.prototype,b=["toString","valueOf"],d={isArray:function(a){return"[object Array]"===e.toString.apply(a)},isBoolean:function(a){return"boolean"===typeof a},isFunction:function(a){return"[object Function]"===e.toString.apply(a)},isNull:function(a){return null===a},isNumber:function(a){return"number"===typeof a&&isFinite(a)},isObject:function(a){return a&&("object"===typeof a||c.isFunction(a))||!1},isString:function(a){return"string"===typeof a},isUndefined:function(a){return"undefined"===
-typeof a},_IEEnumFix:YAHOO.env.ua.ie?function(a,d){var g,h,i;for(g=0;g<b.length;g+=1)h=b[g],i=d[h],c.isFunction(i)&&i!=e[h]&&(a[h]=i)}:function(){},extend:function(a,b,d){if(!b||!a)throw Error("extend failed, please check that all dependencies are included.");var h=function(){},i;h.prototype=b.prototype;a.prototype=new h;a.prototype.constructor=a;a.superclass=b.prototype;b.prototype.constructor==e.constructor&&(b.prototype.constructor=b);if(d){for(i in d)c.hasOwnProperty(d,i)&&(a.prototype[i]=d[i]);
-c._IEEnumFix(a.prototype,d)}},augmentObject:function(a,b){if(!b||!a)throw Error("Absorb failed, verify dependencies.");var d=arguments,e,i=d[2];if(i&&!0!==i)for(e=2;e<d.length;e+=1)a[d[e]]=b[d[e]];else{for(e in b)if(i||!(e in a))a[e]=b[e];c._IEEnumFix(a,b)}},augmentProto:function(a,b){if(!b||!a)throw Error("Augment failed, verify dependencies.");var d=[a.prototype,b.prototype],e;for(e=2;e<arguments.length;e+=1)d.push(arguments[e]);c.augmentObject.apply(this,d)},dump:function(a,b){var d,e,i=[];if(c.isObject(a)){if(a instanceof
-Date||"nodeType"in a&&"tagName"in a)return a;if(c.isFunction(a))return"f(){...}"}else return a+"";b=c.isNumber(b)?b:3;if(c.isArray(a)){i.push("[");d=0;for(e=a.length;d<e;d+=1)c.isObject(a[d])?i.push(0<b?c.dump(a[d],b-1):"{...}"):i.push(a[d]),i.push(", ");1<i.length&&i.pop();i.push("]")}else{i.push("{");for(d in a)c.hasOwnProperty(a,d)&&(i.push(d+" => "),c.isObject(a[d])?i.push(0<b?c.dump(a[d],b-1):"{...}"):i.push(a[d]),i.push(", "));1<i.length&&i.pop();i.push("}")}return i.join("")},substitute:function(a,
-b,d){for(var h,i,j,k,l,m=[],n;;){h=a.lastIndexOf("{");if(0>h)break;i=a.indexOf("}",h);if(h+1>=i)break;k=n=a.substring(h+1,i);l=null;j=k.indexOf(" ");-1<j&&(l=k.substring(j+1),k=k.substring(0,j));j=b[k];d&&(j=d(k,j,l));c.isObject(j)?c.isArray(j)?j=c.dump(j,parseInt(l,10)):(l=l||"",k=l.indexOf("dump"),-1<k&&(l=l.substring(4)),j=j.toString===e.toString||-1<k?c.dump(j,parseInt(l,10)):j.toString()):!c.isString(j)&&!c.isNumber(j)&&(j="~-"+m.length+"-~",m[m.length]=n);a=a.substring(0,h)+j+a.substring(i+
-1)}for(h=m.length-1;0<=h;h-=1)a=a.replace(RegExp("~-"+h+"-~"),"{"+m[h]+"}","g");return a},trim:function(a){try{return a.replace(/^\s+|\s+$/g,"")}catch(b){return a}},merge:function(){var a={},b=arguments,d=b.length,e;for(e=0;e<d;e+=1)c.augmentObject(a,b[e],!0);return a},later:function(a,b,d,e,i){var a=a||0,b=b||{},j=d,k=e,l;c.isString(d)&&(j=b[d]);if(!j)throw new TypeError("method undefined");c.isArray(k)||(k=[e]);d=function(){j.apply(b,k)};l=i?setInterval(d,a):setTimeout(d,a);return{interval:i,cancel:function(){this.interval?
-clearInterval(l):clearTimeout(l)}}},isValue:function(a){return c.isObject(a)||c.isString(a)||c.isNumber(a)||c.isBoolean(a)}};c.hasOwnProperty=e.hasOwnProperty?function(a,b){return a&&a.hasOwnProperty(b)}:function(a,b){return!c.isUndefined(a[b])&&a.constructor.prototype[b]!==a[b]};d.augmentObject(c,d,!0);YAHOO.util.Lang=c;c.augment=c.augmentProto;YAHOO.augment=c.augmentProto;YAHOO.extend=c.extend})();YAHOO.register("yahoo",YAHOO,{version:"2.7.0",build:"1796"});
-(function(){YAHOO.env._id_counter=YAHOO.env._id_counter||0;var c=YAHOO.util,e=YAHOO.lang,b=YAHOO.env.ua,d=YAHOO.lang.trim,a={},f={},g=/^t(?:able|d|h)$/i,h=/color$/i,i=window.document,j=i.documentElement,k=b.opera,l=b.webkit,m=b.gecko,n=b.ie;c.Dom={CUSTOM_ATTRIBUTES:!j.hasAttribute?{"for":"htmlFor","class":"className"}:{htmlFor:"for",className:"class"},get:function(a){var b,d,f,e;if(a){if(a.nodeType||a.item)return a;if("string"===typeof a){b=a;a=i.getElementById(a);if(!(a&&a.id===b)&&a&&i.all){a=null;
-d=i.all[b];f=0;for(e=d.length;f<e;++f)if(d[f].id===b)return d[f]}return a}a.DOM_EVENTS&&(a=a.get("element"));if("length"in a){b=[];f=0;for(e=a.length;f<e;++f)b[b.length]=c.Dom.get(a[f]);return b}return a}return null},getComputedStyle:function(a,b){if(window.getComputedStyle)return a.ownerDocument.defaultView.getComputedStyle(a,null)[b];if(a.currentStyle)return c.Dom.IE_ComputedStyle.get(a,b)},getStyle:function(a,b){return c.Dom.batch(a,c.Dom._getStyle,b)},_getStyle:function(){if(window.getComputedStyle)return function(a,
-b){var b="float"===b?b="cssFloat":c.Dom._toCamel(b),d=a.style[b],f;d||(f=a.ownerDocument.defaultView.getComputedStyle(a,null))&&(d=f[b]);return d};if(j.currentStyle)return function(a,b){var d;switch(b){case "opacity":d=100;try{d=a.filters["DXImageTransform.Microsoft.Alpha"].opacity}catch(f){try{d=a.filters("alpha").opacity}catch(e){}}return d/100;case "float":b="styleFloat";default:return b=c.Dom._toCamel(b),d=a.currentStyle?a.currentStyle[b]:null,a.style[b]||d}}}(),setStyle:function(a,b,d){c.Dom.batch(a,
-c.Dom._setStyle,{prop:b,val:d})},_setStyle:function(){return n?function(a,b){var d=c.Dom._toCamel(b.prop),f=b.val;if(a)switch(d){case "opacity":if(e.isString(a.style.filter)&&(a.style.filter="alpha(opacity="+100*f+")",!a.currentStyle||!a.currentStyle.hasLayout))a.style.zoom=1;break;case "float":d="styleFloat";default:a.style[d]=f}}:function(a,b){var d=c.Dom._toCamel(b.prop),f=b.val;a&&("float"==d&&(d="cssFloat"),a.style[d]=f)}}(),getXY:function(a){return c.Dom.batch(a,c.Dom._getXY)},_canPosition:function(a){return"none"!==
-c.Dom._getStyle(a,"display")&&c.Dom._inDoc(a)},_getXY:function(){return i.documentElement.getBoundingClientRect?function(a){var d,f,e,g,j,h,m,k=Math.floor;f=!1;if(c.Dom._canPosition(a)){f=a.getBoundingClientRect();e=a.ownerDocument;a=c.Dom.getDocumentScrollLeft(e);d=c.Dom.getDocumentScrollTop(e);f=[k(f.left),k(f.top)];n&&8>b.ie&&(j=g=2,h=e.compatMode,m=o(e.documentElement,"borderLeftWidth"),e=o(e.documentElement,"borderTopWidth"),6===b.ie&&"BackCompat"!==h&&(j=g=0),"BackCompat"==h&&("medium"!==m&&
-(g=parseInt(m,10)),"medium"!==e&&(j=parseInt(e,10))),f[0]-=g,f[1]-=j);if(d||a)f[0]+=a,f[1]+=d;f[0]=k(f[0]);f[1]=k(f[1])}return f}:function(a){var d,f,e,g=!1,j=a;if(c.Dom._canPosition(a)){g=[a.offsetLeft,a.offsetTop];d=c.Dom.getDocumentScrollLeft(a.ownerDocument);f=c.Dom.getDocumentScrollTop(a.ownerDocument);for(e=m||519<b.webkit?!0:!1;j=j.offsetParent;)g[0]+=j.offsetLeft,g[1]+=j.offsetTop,e&&(g=c.Dom._calcBorders(j,g));if("fixed"!==c.Dom._getStyle(a,"position")){for(j=a;(j=j.parentNode)&&j.tagName;)if(a=
-j.scrollTop,e=j.scrollLeft,m&&"visible"!==c.Dom._getStyle(j,"overflow")&&(g=c.Dom._calcBorders(j,g)),a||e)g[0]-=e,g[1]-=a;g[0]+=d;g[1]+=f}else if(k)g[0]-=d,g[1]-=f;else if(l||m)g[0]+=d,g[1]+=f;g[0]=Math.floor(g[0]);g[1]=Math.floor(g[1])}return g}}(),getX:function(a){return c.Dom.batch(a,function(a){return c.Dom.getXY(a)[0]},c.Dom,!0)},getY:function(a){return c.Dom.batch(a,function(a){return c.Dom.getXY(a)[1]},c.Dom,!0)},setXY:function(a,b,d){c.Dom.batch(a,c.Dom._setXY,{pos:b,noRetry:d})},_setXY:function(a,
-b){var d=c.Dom._getStyle(a,"position"),f=c.Dom.setStyle,e=b.pos,g=b.noRetry,j=[parseInt(c.Dom.getComputedStyle(a,"left"),10),parseInt(c.Dom.getComputedStyle(a,"top"),10)],h;"static"==d&&(d="relative",f(a,"position",d));h=c.Dom._getXY(a);if(!e||!1===h)return!1;isNaN(j[0])&&(j[0]="relative"==d?0:a.offsetLeft);isNaN(j[1])&&(j[1]="relative"==d?0:a.offsetTop);null!==e[0]&&f(a,"left",e[0]-h[0]+j[0]+"px");null!==e[1]&&f(a,"top",e[1]-h[1]+j[1]+"px");g||(d=c.Dom._getXY(a),(null!==e[0]&&d[0]!=e[0]||null!==
-e[1]&&d[1]!=e[1])&&c.Dom._setXY(a,{pos:e,noRetry:!0}))},setX:function(a,b){c.Dom.setXY(a,[b,null])},setY:function(a,b){c.Dom.setXY(a,[null,b])},getRegion:function(a){return c.Dom.batch(a,function(a){var b=!1;c.Dom._canPosition(a)&&(b=c.Region.getRegion(a));return b},c.Dom,!0)},getClientWidth:function(){return c.Dom.getViewportWidth()},getClientHeight:function(){return c.Dom.getViewportHeight()},getElementsByClassName:function(a,b,d,f,g,j){a=e.trim(a);b=b||"*";d=d?c.Dom.get(d):i;if(!d)return[];for(var h=
-[],b=d.getElementsByTagName(b),d=c.Dom.hasClass,m=0,k=b.length;m<k;++m)d(b[m],a)&&(h[h.length]=b[m]);f&&c.Dom.batch(h,f,g,j);return h},hasClass:function(a,b){return c.Dom.batch(a,c.Dom._hasClass,b)},_hasClass:function(a,b){var d=!1;a&&b&&(d=c.Dom.getAttribute(a,"className")||"",d=b.exec?b.test(d):b&&-1<(" "+d+" ").indexOf(" "+b+" "));return d},addClass:function(a,b){return c.Dom.batch(a,c.Dom._addClass,b)},_addClass:function(a,b){var f=!1,e;a&&b&&(e=c.Dom.getAttribute(a,"className")||"",c.Dom._hasClass(a,
-b)||(c.Dom.setAttribute(a,"className",d(e+" "+b)),f=!0));return f},removeClass:function(a,b){return c.Dom.batch(a,c.Dom._removeClass,b)},_removeClass:function(a,b){var f=!1,e,g;a&&b&&(e=c.Dom.getAttribute(a,"className")||"",c.Dom.setAttribute(a,"className",e.replace(c.Dom._getClassRegex(b),"")),g=c.Dom.getAttribute(a,"className"),e!==g&&(c.Dom.setAttribute(a,"className",d(g)),f=!0,""===c.Dom.getAttribute(a,"className")&&(e=a.hasAttribute&&a.hasAttribute("class")?"class":"className",a.removeAttribute(e))));
-return f},replaceClass:function(a,b,d){return c.Dom.batch(a,c.Dom._replaceClass,{from:b,to:d})},_replaceClass:function(a,b){var f,e,g=!1;a&&b&&(f=b.from,(e=b.to)?f?f!==e&&(g=c.Dom.getAttribute(a,"className")||"",f=(" "+g.replace(c.Dom._getClassRegex(f)," "+e)).split(c.Dom._getClassRegex(e)),f.splice(1,0," "+e),c.Dom.setAttribute(a,"className",d(f.join(""))),g=!0):g=c.Dom._addClass(a,b.to):g=!1);return g},generateId:function(a,b){var b=b||"yui-gen",d=function(a){if(a&&a.id)return a.id;var d=b+YAHOO.env._id_counter++;
-if(a){if(a.ownerDocument.getElementById(d))return c.Dom.generateId(a,d+b);a.id=d}return d};return c.Dom.batch(a,d,c.Dom,!0)||d.apply(c.Dom,arguments)},isAncestor:function(a,b){var a=c.Dom.get(a),b=c.Dom.get(b),d=!1;a&&b&&(a.nodeType&&b.nodeType)&&(a.contains&&a!==b?d=a.contains(b):a.compareDocumentPosition&&(d=!!(a.compareDocumentPosition(b)&16)));return d},inDocument:function(a,b){return c.Dom._inDoc(c.Dom.get(a),b)},_inDoc:function(a,b){var d=!1;a&&a.tagName&&(b=b||a.ownerDocument,d=c.Dom.isAncestor(b.documentElement,
-a));return d},getElementsBy:function(a,b,d,f,e,g,j){b=b||"*";d=d?c.Dom.get(d):i;if(!d)return[];for(var h=[],b=d.getElementsByTagName(b),d=0,m=b.length;d<m;++d)if(a(b[d]))if(j){h=b[d];break}else h[h.length]=b[d];f&&c.Dom.batch(h,f,e,g);return h},getElementBy:function(a,b,d){return c.Dom.getElementsBy(a,b,d,null,null,null,!0)},batch:function(a,b,d,f){var e=[],f=f?d:window;if((a=a&&(a.tagName||a.item)?a:c.Dom.get(a))&&b){if(a.tagName||void 0===a.length)return b.call(f,a,d);for(var g=0;g<a.length;++g)e[e.length]=
-b.call(f,a[g],d)}else return!1;return e},getDocumentHeight:function(){return Math.max("CSS1Compat"!=i.compatMode||l?i.body.scrollHeight:j.scrollHeight,c.Dom.getViewportHeight())},getDocumentWidth:function(){return Math.max("CSS1Compat"!=i.compatMode||l?i.body.scrollWidth:j.scrollWidth,c.Dom.getViewportWidth())},getViewportHeight:function(){var a=self.innerHeight,b=i.compatMode;if((b||n)&&!k)a="CSS1Compat"==b?j.clientHeight:i.body.clientHeight;return a},getViewportWidth:function(){var a=self.innerWidth,
-b=i.compatMode;if(b||n)a="CSS1Compat"==b?j.clientWidth:i.body.clientWidth;return a},getAncestorBy:function(a,b){for(;a=a.parentNode;)if(c.Dom._testElement(a,b))return a;return null},getAncestorByClassName:function(a,b){a=c.Dom.get(a);return!a?null:c.Dom.getAncestorBy(a,function(a){return c.Dom.hasClass(a,b)})},getAncestorByTagName:function(a,b){a=c.Dom.get(a);return!a?null:c.Dom.getAncestorBy(a,function(a){return a.tagName&&a.tagName.toUpperCase()==b.toUpperCase()})},getPreviousSiblingBy:function(a,
-b){for(;a;)if(a=a.previousSibling,c.Dom._testElement(a,b))return a;return null},getPreviousSibling:function(a){a=c.Dom.get(a);return!a?null:c.Dom.getPreviousSiblingBy(a)},getNextSiblingBy:function(a,b){for(;a;)if(a=a.nextSibling,c.Dom._testElement(a,b))return a;return null},getNextSibling:function(a){a=c.Dom.get(a);return!a?null:c.Dom.getNextSiblingBy(a)},getFirstChildBy:function(a,b){return(c.Dom._testElement(a.firstChild,b)?a.firstChild:null)||c.Dom.getNextSiblingBy(a.firstChild,b)},getFirstChild:function(a){a=
-c.Dom.get(a);return!a?null:c.Dom.getFirstChildBy(a)},getLastChildBy:function(a,b){return!a?null:(c.Dom._testElement(a.lastChild,b)?a.lastChild:null)||c.Dom.getPreviousSiblingBy(a.lastChild,b)},getLastChild:function(a){a=c.Dom.get(a);return c.Dom.getLastChildBy(a)},getChildrenBy:function(a,b){var d=c.Dom.getFirstChildBy(a,b),f=d?[d]:[];c.Dom.getNextSiblingBy(d,function(a){if(!b||b(a))f[f.length]=a;return!1});return f},getChildren:function(a){a=c.Dom.get(a);return c.Dom.getChildrenBy(a)},getDocumentScrollLeft:function(a){a=
-a||i;return Math.max(a.documentElement.scrollLeft,a.body.scrollLeft)},getDocumentScrollTop:function(a){a=a||i;return Math.max(a.documentElement.scrollTop,a.body.scrollTop)},insertBefore:function(a,b){a=c.Dom.get(a);b=c.Dom.get(b);return!a||!b||!b.parentNode?null:b.parentNode.insertBefore(a,b)},insertAfter:function(a,b){a=c.Dom.get(a);b=c.Dom.get(b);return!a||!b||!b.parentNode?null:b.nextSibling?b.parentNode.insertBefore(a,b.nextSibling):b.parentNode.appendChild(a)},getClientRegion:function(){var a=
-c.Dom.getDocumentScrollTop(),b=c.Dom.getDocumentScrollLeft(),d=c.Dom.getViewportWidth()+b,f=c.Dom.getViewportHeight()+a;return new c.Region(a,d,f,b)},setAttribute:function(a,b,d){b=c.Dom.CUSTOM_ATTRIBUTES[b]||b;a.setAttribute(b,d)},getAttribute:function(a,b){b=c.Dom.CUSTOM_ATTRIBUTES[b]||b;return a.getAttribute(b)},_toCamel:function(b){function d(a,b){return b.toUpperCase()}return a[b]||(a[b]=-1===b.indexOf("-")?b:b.replace(/-([a-z])/gi,d))},_getClassRegex:function(a){var b;void 0!==a&&(a.exec?b=
-a:(b=f[a],b||(a=a.replace(c.Dom._patterns.CLASS_RE_TOKENS,"\\$1"),b=f[a]=RegExp("(?:^|\\s)"+a+"(?= |$)","g"))));return b},_patterns:{ROOT_TAG:/^body|html$/i,CLASS_RE_TOKENS:/([\.\(\)\^\$\*\+\?\|\[\]\{\}])/g},_testElement:function(a,b){return a&&1==a.nodeType&&(!b||b(a))},_calcBorders:function(a,b){var d=parseInt(c.Dom.getComputedStyle(a,"borderTopWidth"),10)||0,f=parseInt(c.Dom.getComputedStyle(a,"borderLeftWidth"),10)||0;m&&g.test(a.tagName)&&(f=d=0);b[0]+=f;b[1]+=d;return b}};var o=c.Dom.getComputedStyle;
-b.opera&&(c.Dom.getComputedStyle=function(a,b){var d=o(a,b);h.test(b)&&(d=c.Dom.Color.toRGB(d));return d});b.webkit&&(c.Dom.getComputedStyle=function(a,b){var d=o(a,b);"rgba(0, 0, 0, 0)"===d&&(d="transparent");return d})})();YAHOO.util.Region=function(c,e,b,d){this.y=this.top=c;this[1]=c;this.right=e;this.bottom=b;this.x=this.left=d;this[0]=d;this.width=this.right-this.left;this.height=this.bottom-this.top};
-YAHOO.util.Region.prototype.contains=function(c){return c.left>=this.left&&c.right<=this.right&&c.top>=this.top&&c.bottom<=this.bottom};YAHOO.util.Region.prototype.getArea=function(){return(this.bottom-this.top)*(this.right-this.left)};YAHOO.util.Region.prototype.intersect=function(c){var e=Math.max(this.top,c.top),b=Math.min(this.right,c.right),d=Math.min(this.bottom,c.bottom),c=Math.max(this.left,c.left);return d>=e&&b>=c?new YAHOO.util.Region(e,b,d,c):null};
-YAHOO.util.Region.prototype.union=function(c){var e=Math.min(this.top,c.top),b=Math.max(this.right,c.right),d=Math.max(this.bottom,c.bottom),c=Math.min(this.left,c.left);return new YAHOO.util.Region(e,b,d,c)};YAHOO.util.Region.prototype.toString=function(){return"Region {top: "+this.top+", right: "+this.right+", bottom: "+this.bottom+", left: "+this.left+", height: "+this.height+", width: "+this.width+"}"};
-YAHOO.util.Region.getRegion=function(c){var e=YAHOO.util.Dom.getXY(c);return new YAHOO.util.Region(e[1],e[0]+c.offsetWidth,e[1]+c.offsetHeight,e[0])};YAHOO.util.Point=function(c,e){YAHOO.lang.isArray(c)&&(e=c[1],c=c[0]);YAHOO.util.Point.superclass.constructor.call(this,e,c,e,c)};YAHOO.extend(YAHOO.util.Point,YAHOO.util.Region);
-(function(){var c=YAHOO.util,e=/^width|height$/,b=/^(\d[.\d]*)+(em|ex|px|gd|rem|vw|vh|vm|ch|mm|cm|in|pt|pc|deg|rad|ms|s|hz|khz|%){1}?/i,d={get:function(a,d){var e="",e=a.currentStyle[d];return e="opacity"===d?c.Dom.getStyle(a,"opacity"):!e||e.indexOf&&-1<e.indexOf("px")?e:c.Dom.IE_COMPUTED[d]?c.Dom.IE_COMPUTED[d](a,d):b.test(e)?c.Dom.IE.ComputedStyle.getPixel(a,d):e},getOffset:function(a,b){var d=a.currentStyle[b],c=b.charAt(0).toUpperCase()+b.substr(1),j="offset"+c,k="pixel"+c,c="";"auto"==d?(c=
-d=a[j],e.test(b)&&(a.style[b]=d,a[j]>d&&(c=d-(a[j]-d)),a.style[b]="auto")):(!a.style[k]&&!a.style[b]&&(a.style[b]=d),c=a.style[k]);return c+"px"},getBorderWidth:function(a,b){var d=null;a.currentStyle.hasLayout||(a.style.zoom=1);switch(b){case "borderTopWidth":d=a.clientTop;break;case "borderBottomWidth":d=a.offsetHeight-a.clientHeight-a.clientTop;break;case "borderLeftWidth":d=a.clientLeft;break;case "borderRightWidth":d=a.offsetWidth-a.clientWidth-a.clientLeft}return d+"px"},getPixel:function(a,
-b){var d=null,c=a.currentStyle.right;a.style.right=a.currentStyle[b];d=a.style.pixelRight;a.style.right=c;return d+"px"},getMargin:function(a,b){return"auto"==a.currentStyle[b]?"0px":c.Dom.IE.ComputedStyle.getPixel(a,b)},getVisibility:function(a,b){for(var d;(d=a.currentStyle)&&"inherit"==d[b];)a=a.parentNode;return d?d[b]:"visible"},getColor:function(a,b){return c.Dom.Color.toRGB(a.currentStyle[b])||"transparent"},getBorderColor:function(a,b){var d=a.currentStyle;return c.Dom.Color.toRGB(c.Dom.Color.toHex(d[b]||
-d.color))}},a={};a.top=a.right=a.bottom=a.left=a.width=a.height=d.getOffset;a.color=d.getColor;a.borderTopWidth=a.borderRightWidth=a.borderBottomWidth=a.borderLeftWidth=d.getBorderWidth;a.marginTop=a.marginRight=a.marginBottom=a.marginLeft=d.getMargin;a.visibility=d.getVisibility;a.borderColor=a.borderTopColor=a.borderRightColor=a.borderBottomColor=a.borderLeftColor=d.getBorderColor;c.Dom.IE_COMPUTED=a;c.Dom.IE_ComputedStyle=d})();
-(function(){var c=parseInt,e=RegExp,b=YAHOO.util;b.Dom.Color={KEYWORDS:{black:"000",silver:"c0c0c0",gray:"808080",white:"fff",maroon:"800000",red:"f00",purple:"800080",fuchsia:"f0f",green:"008000",lime:"0f0",olive:"808000",yellow:"ff0",navy:"000080",blue:"00f",teal:"008080",aqua:"0ff"},re_RGB:/^rgb\(([0-9]+)\s*,\s*([0-9]+)\s*,\s*([0-9]+)\)$/i,re_hex:/^#?([0-9A-F]{2})([0-9A-F]{2})([0-9A-F]{2})$/i,re_hex3:/([0-9A-F])/gi,toRGB:function(d){b.Dom.Color.re_RGB.test(d)||(d=b.Dom.Color.toHex(d));b.Dom.Color.re_hex.exec(d)&&
-(d="rgb("+[c(e.$1,16),c(e.$2,16),c(e.$3,16)].join(", ")+")");return d},toHex:function(d){d=b.Dom.Color.KEYWORDS[d]||d;if(b.Dom.Color.re_RGB.exec(d))var d=1===e.$2.length?"0"+e.$2:Number(e.$2),a=1===e.$3.length?"0"+e.$3:Number(e.$3),d=[(1===e.$1.length?"0"+e.$1:Number(e.$1)).toString(16),d.toString(16),a.toString(16)].join("");6>d.length&&(d=d.replace(b.Dom.Color.re_hex3,"$1$1"));"transparent"!==d&&0>d.indexOf("#")&&(d="#"+d);return d.toLowerCase()}}})();
-YAHOO.register("dom",YAHOO.util.Dom,{version:"2.7.0",build:"1796"});YAHOO.util.CustomEvent=function(c,e,b,d){this.type=c;this.scope=e||window;this.silent=b;this.signature=d||YAHOO.util.CustomEvent.LIST;this.subscribers=[];"_YUICEOnSubscribe"!==c&&(this.subscribeEvent=new YAHOO.util.CustomEvent("_YUICEOnSubscribe",this,!0));this.lastError=null};YAHOO.util.CustomEvent.LIST=0;YAHOO.util.CustomEvent.FLAT=1;
-YAHOO.util.CustomEvent.prototype={subscribe:function(c,e,b){if(!c)throw Error("Invalid callback for subscriber to '"+this.type+"'");this.subscribeEvent&&this.subscribeEvent.fire(c,e,b);this.subscribers.push(new YAHOO.util.Subscriber(c,e,b))},unsubscribe:function(c,e){if(!c)return this.unsubscribeAll();for(var b=!1,d=0,a=this.subscribers.length;d<a;++d){var f=this.subscribers[d];f&&f.contains(c,e)&&(this._delete(d),b=!0)}return b},fire:function(){this.lastError=null;var c=this.subscribers.length;if(!c&&
-this.silent)return!0;var e=[].slice.call(arguments,0),b=!0,d,a=this.subscribers.slice(),f=YAHOO.util.Event.throwErrors;for(d=0;d<c;++d){var g=a[d];if(g){var h=g.getScope(this.scope);if(this.signature==YAHOO.util.CustomEvent.FLAT){var i=null;0<e.length&&(i=e[0]);try{b=g.fn.call(h,i,g.obj)}catch(j){if(this.lastError=j,f)throw j;}}else try{b=g.fn.call(h,this.type,e,g.obj)}catch(k){if(this.lastError=k,f)throw k;}if(!1===b)break}}return!1!==b},unsubscribeAll:function(){var c=this.subscribers.length,e;
-for(e=c-1;-1<e;e--)this._delete(e);this.subscribers=[];return c},_delete:function(c){var e=this.subscribers[c];e&&(delete e.fn,delete e.obj);this.subscribers.splice(c,1)},toString:function(){return"CustomEvent: '"+this.type+"', context: "+this.scope}};YAHOO.util.Subscriber=function(c,e,b){this.fn=c;this.obj=YAHOO.lang.isUndefined(e)?null:e;this.overrideContext=b};
-YAHOO.util.Subscriber.prototype.getScope=function(c){return this.overrideContext?!0===this.overrideContext?this.obj:this.overrideContext:c};YAHOO.util.Subscriber.prototype.contains=function(c,e){return e?this.fn==c&&this.obj==e:this.fn==c};YAHOO.util.Subscriber.prototype.toString=function(){return"Subscriber { obj: "+this.obj+", overrideContext: "+(this.overrideContext||"no")+" }"};
-YAHOO.util.Event||(YAHOO.util.Event=function(){var c=!1,e=[],b=[],d=[],a=[],f=0,g=[],h=[],i=0,j={63232:38,63233:40,63234:37,63235:39,63276:33,63277:34,25:9},k=YAHOO.env.ua.ie?"focusin":"focus",l=YAHOO.env.ua.ie?"focusout":"blur";return{POLL_RETRYS:2E3,POLL_INTERVAL:20,EL:0,TYPE:1,FN:2,WFN:3,UNLOAD_OBJ:3,ADJ_SCOPE:4,OBJ:5,OVERRIDE:6,lastError:null,isSafari:YAHOO.env.ua.webkit,webkit:YAHOO.env.ua.webkit,isIE:YAHOO.env.ua.ie,_interval:null,_dri:null,DOMReady:!1,throwErrors:!1,startInterval:function(){if(!this._interval){var a=
-this;this._interval=setInterval(function(){a._tryPreloadAttach()},this.POLL_INTERVAL)}},onAvailable:function(a,b,d,c,e){for(var a=YAHOO.lang.isString(a)?[a]:a,j=0;j<a.length;j+=1)g.push({id:a[j],fn:b,obj:d,overrideContext:c,checkReady:e});f=this.POLL_RETRYS;this.startInterval()},onContentReady:function(a,b,d,c){this.onAvailable(a,b,d,c,!0)},onDOMReady:function(a,b,d){this.DOMReady?setTimeout(function(){var c=window;d&&(c=!0===d?b:d);a.call(c,"DOMReady",[],b)},0):this.DOMReadyEvent.subscribe(a,b,d)},
-_addListener:function(c,f,g,j,k,i){if(!g||!g.call)return!1;if(this._isValidCollection(c)){for(var i=!0,l=0,s=c.length;l<s;++l)i=this.on(c[l],f,g,j,k)&&i;return i}if(YAHOO.lang.isString(c))if(l=this.getEl(c))c=l;else return this.onAvailable(c,function(){YAHOO.util.Event.on(c,f,g,j,k)}),!0;if(!c)return!1;if("unload"==f&&j!==this)return b[b.length]=[c,f,g,j,k],!0;var t=c;k&&(t=!0===k?j:k);l=function(a){return g.call(t,YAHOO.util.Event.getEvent(a,c),j)};s=[c,f,g,l,t,j,k];e[e.length]=s;if(this.useLegacyEvent(c,
-f)){var p=this.getLegacyIndex(c,f);if(-1==p||c!=d[p][0])p=d.length,h[c.id+f]=p,d[p]=[c,f,c["on"+f]],a[p]=[],c["on"+f]=function(a){YAHOO.util.Event.fireLegacyEvent(YAHOO.util.Event.getEvent(a),p)};a[p].push(s)}else try{this._simpleAdd(c,f,l,i)}catch(u){return this.lastError=u,this.removeListener(c,f,g),!1}return!0},addListener:function(a,b,d,c,f){return this._addListener(a,b,d,c,f,!1)},addFocusListener:function(a,b,d,c){return this._addListener(a,k,b,d,c,!0)},removeFocusListener:function(a,b){return this.removeListener(a,
-k,b)},addBlurListener:function(a,b,d,c){return this._addListener(a,l,b,d,c,!0)},removeBlurListener:function(a,b){return this.removeListener(a,l,b)},fireLegacyEvent:function(b,c){var f=!0,e,g,j;e=a[c].slice();for(var h=0,k=e.length;h<k;++h)if((g=e[h])&&g[this.WFN])j=g[this.ADJ_SCOPE],g=g[this.WFN].call(j,b),f=f&&g;if((e=d[c])&&e[2])e[2](b);return f},getLegacyIndex:function(a,b){var d=this.generateId(a)+b;return"undefined"==typeof h[d]?-1:h[d]},useLegacyEvent:function(a,b){return this.webkit&&419>this.webkit&&
-("click"==b||"dblclick"==b)},removeListener:function(d,c,f,g){var j,h,k;if("string"==typeof d)d=this.getEl(d);else if(this._isValidCollection(d)){g=!0;for(j=d.length-1;-1<j;j--)g=this.removeListener(d[j],c,f)&&g;return g}if(!f||!f.call)return this.purgeElement(d,!1,c);if("unload"==c){for(j=b.length-1;-1<j;j--)if((k=b[j])&&k[0]==d&&k[1]==c&&k[2]==f)return b.splice(j,1),!0;return!1}j=null;"undefined"===typeof g&&(g=this._getCacheIndex(d,c,f));0<=g&&(j=e[g]);if(!d||!j)return!1;if(this.useLegacyEvent(d,
-c)){j=this.getLegacyIndex(d,c);var i=a[j];if(i){j=0;for(h=i.length;j<h;++j)if((k=i[j])&&k[this.EL]==d&&k[this.TYPE]==c&&k[this.FN]==f){i.splice(j,1);break}}}else try{this._simpleRemove(d,c,j[this.WFN],!1)}catch(l){return this.lastError=l,!1}delete e[g][this.WFN];delete e[g][this.FN];e.splice(g,1);return!0},getTarget:function(a){return this.resolveTextNode(a.target||a.srcElement)},resolveTextNode:function(a){try{if(a&&3==a.nodeType)return a.parentNode}catch(b){}return a},getPageX:function(a){var b=
-a.pageX;!b&&0!==b&&(b=a.clientX||0,this.isIE&&(b+=this._getScrollLeft()));return b},getPageY:function(a){var b=a.pageY;!b&&0!==b&&(b=a.clientY||0,this.isIE&&(b+=this._getScrollTop()));return b},getXY:function(a){return[this.getPageX(a),this.getPageY(a)]},getRelatedTarget:function(a){var b=a.relatedTarget;b||("mouseout"==a.type?b=a.toElement:"mouseover"==a.type&&(b=a.fromElement));return this.resolveTextNode(b)},getTime:function(a){if(!a.time){var b=(new Date).getTime();try{a.time=b}catch(d){return this.lastError=
-d,b}}return a.time},stopEvent:function(a){this.stopPropagation(a);this.preventDefault(a)},stopPropagation:function(a){a.stopPropagation?a.stopPropagation():a.cancelBubble=!0},preventDefault:function(a){a.preventDefault?a.preventDefault():a.returnValue=!1},getEvent:function(a){a=a||window.event;if(!a)for(var b=this.getEvent.caller;b&&!((a=b.arguments[0])&&Event==a.constructor);)b=b.caller;return a},getCharCode:function(a){a=a.keyCode||a.charCode||0;YAHOO.env.ua.webkit&&a in j&&(a=j[a]);return a},_getCacheIndex:function(a,
-b,d){for(var c=0,f=e.length;c<f;c+=1){var g=e[c];if(g&&g[this.FN]==d&&g[this.EL]==a&&g[this.TYPE]==b)return c}return-1},generateId:function(a){var b=a.id;b||(b="yuievtautoid-"+i,++i,a.id=b);return b},_isValidCollection:function(a){try{return a&&"string"!==typeof a&&a.length&&!a.tagName&&!a.alert&&"undefined"!==typeof a[0]}catch(b){return!1}},elCache:{},getEl:function(a){return"string"===typeof a?document.getElementById(a):a},clearCache:function(){},DOMReadyEvent:new YAHOO.util.CustomEvent("DOMReady",
-this),_load:function(){if(!c){c=!0;var a=YAHOO.util.Event;a._ready();a._tryPreloadAttach()}},_ready:function(){var a=YAHOO.util.Event;a.DOMReady||(a.DOMReady=!0,a.DOMReadyEvent.fire(),a._simpleRemove(document,"DOMContentLoaded",a._ready))},_tryPreloadAttach:function(){if(0===g.length)f=0,this._interval&&(clearInterval(this._interval),this._interval=null);else if(!this.locked)if(this.isIE&&!this.DOMReady)this.startInterval();else{this.locked=!0;var a=!c;a||(a=0<f&&0<g.length);var b=[],d=function(a,
-b){var d=a;b.overrideContext&&(d=!0===b.overrideContext?b.obj:b.overrideContext);b.fn.call(d,b.obj)},e,j,h,k,i=[];e=0;for(j=g.length;e<j;e+=1)if(h=g[e])if(k=this.getEl(h.id))if(h.checkReady){if(c||k.nextSibling||!a)i.push(h),g[e]=null}else d(k,h),g[e]=null;else b.push(h);e=0;for(j=i.length;e<j;e+=1)h=i[e],d(this.getEl(h.id),h);f--;if(a){for(e=g.length-1;-1<e;e--)h=g[e],(!h||!h.id)&&g.splice(e,1);this.startInterval()}else this._interval&&(clearInterval(this._interval),this._interval=null);this.locked=
-!1}},purgeElement:function(a,b,d){var a=YAHOO.lang.isString(a)?this.getEl(a):a,c=this.getListeners(a,d),f;if(c)for(f=c.length-1;-1<f;f--){var e=c[f];this.removeListener(a,e.type,e.fn)}if(b&&a&&a.childNodes){f=0;for(c=a.childNodes.length;f<c;++f)this.purgeElement(a.childNodes[f],b,d)}},getListeners:function(a,d){var c=[],f;f=d?"unload"===d?[b]:[e]:[e,b];for(var g=YAHOO.lang.isString(a)?this.getEl(a):a,j=0;j<f.length;j+=1){var h=f[j];if(h)for(var k=0,i=h.length;k<i;++k){var l=h[k];l&&(l[this.EL]===
-g&&(!d||d===l[this.TYPE]))&&c.push({type:l[this.TYPE],fn:l[this.FN],obj:l[this.OBJ],adjust:l[this.OVERRIDE],scope:l[this.ADJ_SCOPE],index:k})}}return c.length?c:null},_unload:function(a){var c=YAHOO.util.Event,f,g,j,h=b.slice(),k;f=0;for(j=b.length;f<j;++f)if(g=h[f])k=window,g[c.ADJ_SCOPE]&&(k=!0===g[c.ADJ_SCOPE]?g[c.UNLOAD_OBJ]:g[c.ADJ_SCOPE]),g[c.FN].call(k,c.getEvent(a,g[c.EL]),g[c.UNLOAD_OBJ]),h[f]=null;b=null;if(e)for(a=e.length-1;-1<a;a--)(g=e[a])&&c.removeListener(g[c.EL],g[c.TYPE],g[c.FN],
-a);d=null;c._simpleRemove(window,"unload",c._unload)},_getScrollLeft:function(){return this._getScroll()[1]},_getScrollTop:function(){return this._getScroll()[0]},_getScroll:function(){var a=document.documentElement,b=document.body;return a&&(a.scrollTop||a.scrollLeft)?[a.scrollTop,a.scrollLeft]:b?[b.scrollTop,b.scrollLeft]:[0,0]},regCE:function(){},_simpleAdd:function(){return window.addEventListener?function(a,b,d,c){a.addEventListener(b,d,c)}:window.attachEvent?function(a,b,d){a.attachEvent("on"+
-b,d)}:function(){}}(),_simpleRemove:function(){return window.removeEventListener?function(a,b,d,c){a.removeEventListener(b,d,c)}:window.detachEvent?function(a,b,d){a.detachEvent("on"+b,d)}:function(){}}()}}(),function(){var c=YAHOO.util.Event;c.on=c.addListener;c.onFocus=c.addFocusListener;c.onBlur=c.addBlurListener;if(c.isIE){YAHOO.util.Event.onDOMReady(YAHOO.util.Event._tryPreloadAttach,YAHOO.util.Event,!0);var e=document.createElement("p");c._dri=setInterval(function(){try{e.doScroll("left"),clearInterval(c._dri),
-c._dri=null,c._ready(),e=null}catch(b){}},c.POLL_INTERVAL)}else c.webkit&&525>c.webkit?c._dri=setInterval(function(){var b=document.readyState;if("loaded"==b||"complete"==b)clearInterval(c._dri),c._dri=null,c._ready()},c.POLL_INTERVAL):c._simpleAdd(document,"DOMContentLoaded",c._ready);c._simpleAdd(window,"load",c._load);c._simpleAdd(window,"unload",c._unload);c._tryPreloadAttach()}());YAHOO.util.EventProvider=function(){};
-YAHOO.util.EventProvider.prototype={__yui_events:null,__yui_subscribers:null,subscribe:function(c,e,b,d){this.__yui_events=this.__yui_events||{};var a=this.__yui_events[c];if(a)a.subscribe(e,b,d);else{a=this.__yui_subscribers=this.__yui_subscribers||{};a[c]||(a[c]=[]);a[c].push({fn:e,obj:b,overrideContext:d})}},unsubscribe:function(c,e,b){var d=this.__yui_events=this.__yui_events||{};if(c){if(d=d[c])return d.unsubscribe(e,b)}else{var c=true,a;for(a in d)YAHOO.lang.hasOwnProperty(d,a)&&(c=c&&d[a].unsubscribe(e,
-b));return c}return false},unsubscribeAll:function(c){return this.unsubscribe(c)},createEvent:function(c,e){this.__yui_events=this.__yui_events||{};var b=e||{},d=this.__yui_events;if(!d[c]){var a=new YAHOO.util.CustomEvent(c,b.scope||this,b.silent,YAHOO.util.CustomEvent.FLAT);d[c]=a;b.onSubscribeCallback&&a.subscribeEvent.subscribe(b.onSubscribeCallback);this.__yui_subscribers=this.__yui_subscribers||{};if(b=this.__yui_subscribers[c])for(var f=0;f<b.length;++f)a.subscribe(b[f].fn,b[f].obj,b[f].overrideContext)}return d[c]},
-fireEvent:function(c,e,b,d){this.__yui_events=this.__yui_events||{};var a=this.__yui_events[c];if(!a)return null;for(var f=[],g=1;g<arguments.length;++g)f.push(arguments[g]);return a.fire.apply(a,f)},hasEvent:function(c){return this.__yui_events&&this.__yui_events[c]?true:false}};
-(function(){var c=YAHOO.util.Event,e=YAHOO.lang;YAHOO.util.KeyListener=function(b,a,f,g){function h(b){if(!a.shift)a.shift=false;if(!a.alt)a.alt=false;if(!a.ctrl)a.ctrl=false;if(b.shiftKey==a.shift&&b.altKey==a.alt&&b.ctrlKey==a.ctrl){var d,f=a.keys,e;if(YAHOO.lang.isArray(f))for(var g=0;g<f.length;g++){d=f[g];e=c.getCharCode(b);if(d==e){i.fire(e,b);break}}else{e=c.getCharCode(b);f==e&&i.fire(e,b)}}}if(!g)g=YAHOO.util.KeyListener.KEYDOWN;var i=new YAHOO.util.CustomEvent("keyPressed");this.enabledEvent=
-new YAHOO.util.CustomEvent("enabled");this.disabledEvent=new YAHOO.util.CustomEvent("disabled");e.isString(b)&&(b=document.getElementById(b));e.isFunction(f)?i.subscribe(f):i.subscribe(f.fn,f.scope,f.correctScope);this.enable=function(){if(!this.enabled){c.on(b,g,h);this.enabledEvent.fire(a)}this.enabled=true};this.disable=function(){if(this.enabled){c.removeListener(b,g,h);this.disabledEvent.fire(a)}this.enabled=false};this.toString=function(){return"KeyListener ["+a.keys+"] "+b.tagName+(b.id?"["+
-b.id+"]":"")}};var b=YAHOO.util.KeyListener;b.KEYDOWN="keydown";b.KEYUP="keyup";b.KEY={ALT:18,BACK_SPACE:8,CAPS_LOCK:20,CONTROL:17,DELETE:46,DOWN:40,END:35,ENTER:13,ESCAPE:27,HOME:36,LEFT:37,META:224,NUM_LOCK:144,PAGE_DOWN:34,PAGE_UP:33,PAUSE:19,PRINTSCREEN:44,RIGHT:39,SCROLL_LOCK:145,SHIFT:16,SPACE:32,TAB:9,UP:38}})();YAHOO.register("event",YAHOO.util.Event,{version:"2.7.0",build:"1796"});YAHOO.register("yahoo-dom-event",YAHOO,{version:"2.7.0",build:"1796"});
-YAHOO.util.DragDropMgr||(YAHOO.util.DragDropMgr=function(){var c=YAHOO.util.Event,e=YAHOO.util.Dom;return{useShim:false,_shimActive:false,_shimState:false,_debugShim:false,_createShim:function(){var b=document.createElement("div");b.id="yui-ddm-shim";document.body.firstChild?document.body.insertBefore(b,document.body.firstChild):document.body.appendChild(b);b.style.display="none";b.style.backgroundColor="red";b.style.position="absolute";b.style.zIndex="99999";e.setStyle(b,"opacity","0");this._shim=
-b;c.on(b,"mouseup",this.handleMouseUp,this,true);c.on(b,"mousemove",this.handleMouseMove,this,true);c.on(window,"scroll",this._sizeShim,this,true)},_sizeShim:function(){if(this._shimActive){var b=this._shim;b.style.height=e.getDocumentHeight()+"px";b.style.width=e.getDocumentWidth()+"px";b.style.top="0";b.style.left="0"}},_activateShim:function(){if(this.useShim){this._shim||this._createShim();this._shimActive=true;var b=this._shim,d="0";this._debugShim&&(d=".5");e.setStyle(b,"opacity",d);this._sizeShim();
-b.style.display="block"}},_deactivateShim:function(){this._shim.style.display="none";this._shimActive=false},_shim:null,ids:{},handleIds:{},dragCurrent:null,dragOvers:{},deltaX:0,deltaY:0,preventDefault:true,stopPropagation:true,initialized:false,locked:false,interactionInfo:null,init:function(){this.initialized=true},POINT:0,INTERSECT:1,STRICT_INTERSECT:2,mode:0,_execOnAll:function(b,d){for(var a in this.ids)for(var c in this.ids[a]){var e=this.ids[a][c];this.isTypeOfDD(e)&&e[b].apply(e,d)}},_onLoad:function(){this.init();
-c.on(document,"mouseup",this.handleMouseUp,this,true);c.on(document,"mousemove",this.handleMouseMove,this,true);c.on(window,"unload",this._onUnload,this,true);c.on(window,"resize",this._onResize,this,true)},_onResize:function(){this._execOnAll("resetConstraints",[])},lock:function(){this.locked=true},unlock:function(){this.locked=false},isLocked:function(){return this.locked},locationCache:{},useCache:true,clickPixelThresh:3,clickTimeThresh:1E3,dragThreshMet:false,clickTimeout:null,startX:0,startY:0,
-fromTimeout:false,regDragDrop:function(b,d){this.initialized||this.init();this.ids[d]||(this.ids[d]={});this.ids[d][b.id]=b},removeDDFromGroup:function(b,d){this.ids[d]||(this.ids[d]={});var a=this.ids[d];a&&a[b.id]&&delete a[b.id]},_remove:function(b){for(var d in b.groups)if(d){var a=this.ids[d];a&&a[b.id]&&delete a[b.id]}delete this.handleIds[b.id]},regHandle:function(b,d){this.handleIds[b]||(this.handleIds[b]={});this.handleIds[b][d]=d},isDragDrop:function(b){return this.getDDById(b)?true:false},
-getRelated:function(b,d){var a=[],c;for(c in b.groups)for(var e in this.ids[c]){var h=this.ids[c][e];if(this.isTypeOfDD(h)&&(!d||h.isTarget))a[a.length]=h}return a},isLegalTarget:function(b,d){for(var a=this.getRelated(b,true),c=0,e=a.length;c<e;++c)if(a[c].id==d.id)return true;return false},isTypeOfDD:function(b){return b&&b.__ygDragDrop},isHandle:function(b,d){return this.handleIds[b]&&this.handleIds[b][d]},getDDById:function(b){for(var d in this.ids)if(this.ids[d][b])return this.ids[d][b];return null},
-handleMouseDown:function(b,d){this.currentTarget=YAHOO.util.Event.getTarget(b);this.dragCurrent=d;var a=d.getEl();this.startX=YAHOO.util.Event.getPageX(b);this.startY=YAHOO.util.Event.getPageY(b);this.deltaX=this.startX-a.offsetLeft;this.deltaY=this.startY-a.offsetTop;this.dragThreshMet=false;this.clickTimeout=setTimeout(function(){var a=YAHOO.util.DDM;a.startDrag(a.startX,a.startY);a.fromTimeout=true},this.clickTimeThresh)},startDrag:function(b,d){if(this.dragCurrent&&this.dragCurrent.useShim){this._shimState=
-this.useShim;this.useShim=true}this._activateShim();clearTimeout(this.clickTimeout);var a=this.dragCurrent;if(a&&a.events.b4StartDrag){a.b4StartDrag(b,d);a.fireEvent("b4StartDragEvent",{x:b,y:d})}if(a&&a.events.startDrag){a.startDrag(b,d);a.fireEvent("startDragEvent",{x:b,y:d})}this.dragThreshMet=true},handleMouseUp:function(b){if(this.dragCurrent){clearTimeout(this.clickTimeout);if(this.dragThreshMet){if(this.fromTimeout){this.fromTimeout=false;this.handleMouseMove(b)}this.fromTimeout=false;this.fireEvents(b,
-true)}this.stopDrag(b);this.stopEvent(b)}},stopEvent:function(b){this.stopPropagation&&YAHOO.util.Event.stopPropagation(b);this.preventDefault&&YAHOO.util.Event.preventDefault(b)},stopDrag:function(b,d){var a=this.dragCurrent;if(a&&!d){if(this.dragThreshMet){if(a.events.b4EndDrag){a.b4EndDrag(b);a.fireEvent("b4EndDragEvent",{e:b})}if(a.events.endDrag){a.endDrag(b);a.fireEvent("endDragEvent",{e:b})}}if(a.events.mouseUp){a.onMouseUp(b);a.fireEvent("mouseUpEvent",{e:b})}}if(this._shimActive){this._deactivateShim();
-if(this.dragCurrent&&this.dragCurrent.useShim){this.useShim=this._shimState;this._shimState=false}}this.dragCurrent=null;this.dragOvers={}},handleMouseMove:function(b){var d=this.dragCurrent;if(d){if(YAHOO.util.Event.isIE&&!b.button){this.stopEvent(b);return this.handleMouseUp(b)}if(!this.dragThreshMet){var a=Math.abs(this.startX-YAHOO.util.Event.getPageX(b)),c=Math.abs(this.startY-YAHOO.util.Event.getPageY(b));(a>this.clickPixelThresh||c>this.clickPixelThresh)&&this.startDrag(this.startX,this.startY)}if(this.dragThreshMet){if(d&&
-d.events.b4Drag){d.b4Drag(b);d.fireEvent("b4DragEvent",{e:b})}if(d&&d.events.drag){d.onDrag(b);d.fireEvent("dragEvent",{e:b})}d&&this.fireEvents(b,false)}this.stopEvent(b)}},fireEvents:function(b,d){var a=this.dragCurrent;if(a&&!a.isLocked()&&!a.dragOnly){var c=YAHOO.util.Event.getPageX(b),e=YAHOO.util.Event.getPageY(b),h=new YAHOO.util.Point(c,e),e=a.getTargetCoord(h.x,h.y),i=a.getDragEl(),c=["out","over","drop","enter"],j=new YAHOO.util.Region(e.y,e.x+i.offsetWidth,e.y+i.offsetHeight,e.x),k=[],
-l={},e=[],i={outEvts:[],overEvts:[],dropEvts:[],enterEvts:[]},m;for(m in this.dragOvers){var n=this.dragOvers[m];if(this.isTypeOfDD(n)){this.isOverTarget(h,n,this.mode,j)||i.outEvts.push(n);k[m]=true;delete this.dragOvers[m]}}for(var o in a.groups)if("string"==typeof o)for(m in this.ids[o]){n=this.ids[o][m];if(this.isTypeOfDD(n)&&n.isTarget&&(!n.isLocked()&&n!=a)&&this.isOverTarget(h,n,this.mode,j)){l[o]=true;if(d)i.dropEvts.push(n);else{k[n.id]?i.overEvts.push(n):i.enterEvts.push(n);this.dragOvers[n.id]=
-n}}}this.interactionInfo={out:i.outEvts,enter:i.enterEvts,over:i.overEvts,drop:i.dropEvts,point:h,draggedRegion:j,sourceRegion:this.locationCache[a.id],validDrop:d};for(var r in l)e.push(r);if(d&&!i.dropEvts.length){this.interactionInfo.validDrop=false;if(a.events.invalidDrop){a.onInvalidDrop(b);a.fireEvent("invalidDropEvent",{e:b})}}for(m=0;m<c.length;m++){o=null;i[c[m]+"Evts"]&&(o=i[c[m]+"Evts"]);if(o&&o.length){k=c[m].charAt(0).toUpperCase()+c[m].substr(1);r="onDrag"+k;h="b4Drag"+k;j="drag"+k+
-"Event";k="drag"+k;if(this.mode){if(a.events[h]){a[h](b,o,e);a.fireEvent(h+"Event",{event:b,info:o,group:e})}if(a.events[k]){a[r](b,o,e);a.fireEvent(j,{event:b,info:o,group:e})}}else{l=0;for(n=o.length;l<n;++l){if(a.events[h]){a[h](b,o[l].id,e[0]);a.fireEvent(h+"Event",{event:b,info:o[l].id,group:e[0]})}if(a.events[k]){a[r](b,o[l].id,e[0]);a.fireEvent(j,{event:b,info:o[l].id,group:e[0]})}}}}}}},getBestMatch:function(b){var d=null,a=b.length;if(a==1)d=b[0];else for(var c=0;c<a;++c){var e=b[c];if(this.mode==
-this.INTERSECT&&e.cursorIsOver){d=e;break}else if(!d||!d.overlap||e.overlap&&d.overlap.getArea()<e.overlap.getArea())d=e}return d},refreshCache:function(b){var b=b||this.ids,d;for(d in b)if("string"==typeof d)for(var a in this.ids[d]){var c=this.ids[d][a];if(this.isTypeOfDD(c)){var e=this.getLocation(c);e?this.locationCache[c.id]=e:delete this.locationCache[c.id]}}},verifyEl:function(b){try{if(b&&b.offsetParent)return true}catch(d){}return false},getLocation:function(b){if(!this.isTypeOfDD(b))return null;
-var d=b.getEl(),a,c,e;try{a=YAHOO.util.Dom.getXY(d)}catch(h){}if(!a)return null;c=a[0];e=c+d.offsetWidth;a=a[1];return new YAHOO.util.Region(a-b.padding[0],e+b.padding[1],a+d.offsetHeight+b.padding[2],c-b.padding[3])},isOverTarget:function(b,d,a,c){var e=this.locationCache[d.id];if(!e||!this.useCache){e=this.getLocation(d);this.locationCache[d.id]=e}if(!e)return false;d.cursorIsOver=e.contains(b);var h=this.dragCurrent;if(!h||!a&&!h.constrainX&&!h.constrainY)return d.cursorIsOver;d.overlap=null;if(!c){b=
-h.getTargetCoord(b.x,b.y);h=h.getDragEl();c=new YAHOO.util.Region(b.y,b.x+h.offsetWidth,b.y+h.offsetHeight,b.x)}if(e=c.intersect(e)){d.overlap=e;return a?true:d.cursorIsOver}return false},_onUnload:function(){this.unregAll()},unregAll:function(){if(this.dragCurrent){this.stopDrag();this.dragCurrent=null}this._execOnAll("unreg",[]);this.ids={}},elementCache:{},getElWrapper:function(b){var d=this.elementCache[b];if(!d||!d.el)d=this.elementCache[b]=new this.ElementWrapper(YAHOO.util.Dom.get(b));return d},
-getElement:function(b){return YAHOO.util.Dom.get(b)},getCss:function(b){return(b=YAHOO.util.Dom.get(b))?b.style:null},ElementWrapper:function(b){this.id=(this.el=b||null)&&b.id;this.css=this.el&&b.style},getPosX:function(b){return YAHOO.util.Dom.getX(b)},getPosY:function(b){return YAHOO.util.Dom.getY(b)},swapNode:function(b,d){if(b.swapNode)b.swapNode(d);else{var a=d.parentNode,c=d.nextSibling;if(c==b)a.insertBefore(b,d);else if(d==b.nextSibling)a.insertBefore(d,b);else{b.parentNode.replaceChild(d,
-b);a.insertBefore(b,c)}}},getScroll:function(){var b,d,a=document.documentElement,c=document.body;if(a&&(a.scrollTop||a.scrollLeft)){b=a.scrollTop;d=a.scrollLeft}else if(c){b=c.scrollTop;d=c.scrollLeft}return{top:b,left:d}},getStyle:function(b,d){return YAHOO.util.Dom.getStyle(b,d)},getScrollTop:function(){return this.getScroll().top},getScrollLeft:function(){return this.getScroll().left},moveToEl:function(b,d){var a=YAHOO.util.Dom.getXY(d);YAHOO.util.Dom.setXY(b,a)},getClientHeight:function(){return YAHOO.util.Dom.getViewportHeight()},
-getClientWidth:function(){return YAHOO.util.Dom.getViewportWidth()},numericSort:function(b,d){return b-d},_timeoutCount:0,_addListeners:function(){var b=YAHOO.util.DDM;if(YAHOO.util.Event&&document)b._onLoad();else if(!(b._timeoutCount>2E3)){setTimeout(b._addListeners,10);if(document&&document.body)b._timeoutCount=b._timeoutCount+1}},handleWasClicked:function(b,d){if(this.isHandle(d,b.id))return true;for(var a=b.parentNode;a;){if(this.isHandle(d,a.id))return true;a=a.parentNode}return false}}}(),
-YAHOO.util.DDM=YAHOO.util.DragDropMgr,YAHOO.util.DDM._addListeners());
-(function(){var c=YAHOO.util.Event,e=YAHOO.util.Dom;YAHOO.util.DragDrop=function(b,d,a){b&&this.init(b,d,a)};YAHOO.util.DragDrop.prototype={events:null,on:function(){this.subscribe.apply(this,arguments)},id:null,config:null,dragElId:null,handleElId:null,invalidHandleTypes:null,invalidHandleIds:null,invalidHandleClasses:null,startPageX:0,startPageY:0,groups:null,locked:false,lock:function(){this.locked=true},unlock:function(){this.locked=false},isTarget:true,padding:null,dragOnly:false,useShim:false,
-_domRef:null,__ygDragDrop:true,constrainX:false,constrainY:false,minX:0,maxX:0,minY:0,maxY:0,deltaX:0,deltaY:0,maintainOffset:false,xTicks:null,yTicks:null,primaryButtonOnly:true,available:false,hasOuterHandles:false,cursorIsOver:false,overlap:null,b4StartDrag:function(){},startDrag:function(){},b4Drag:function(){},onDrag:function(){},onDragEnter:function(){},b4DragOver:function(){},onDragOver:function(){},b4DragOut:function(){},onDragOut:function(){},b4DragDrop:function(){},onDragDrop:function(){},
-onInvalidDrop:function(){},b4EndDrag:function(){},endDrag:function(){},b4MouseDown:function(){},onMouseDown:function(){},onMouseUp:function(){},onAvailable:function(){},getEl:function(){if(!this._domRef)this._domRef=e.get(this.id);return this._domRef},getDragEl:function(){return e.get(this.dragElId)},init:function(b,d,a){this.initTarget(b,d,a);c.on(this._domRef||this.id,"mousedown",this.handleMouseDown,this,true);for(var e in this.events)this.createEvent(e+"Event")},initTarget:function(b,d,a){this.config=
-a||{};this.events={};this.DDM=YAHOO.util.DDM;this.groups={};if(typeof b!=="string"){this._domRef=b;b=e.generateId(b)}this.id=b;this.addToGroup(d?d:"default");this.handleElId=b;c.onAvailable(b,this.handleOnAvailable,this,true);this.setDragElId(b);this.invalidHandleTypes={A:"A"};this.invalidHandleIds={};this.invalidHandleClasses=[];this.applyConfig()},applyConfig:function(){this.events={mouseDown:true,b4MouseDown:true,mouseUp:true,b4StartDrag:true,startDrag:true,b4EndDrag:true,endDrag:true,drag:true,
-b4Drag:true,invalidDrop:true,b4DragOut:true,dragOut:true,dragEnter:true,b4DragOver:true,dragOver:true,b4DragDrop:true,dragDrop:true};if(this.config.events)for(var b in this.config.events)this.config.events[b]===false&&(this.events[b]=false);this.padding=this.config.padding||[0,0,0,0];this.isTarget=this.config.isTarget!==false;this.maintainOffset=this.config.maintainOffset;this.primaryButtonOnly=this.config.primaryButtonOnly!==false;this.dragOnly=this.config.dragOnly===true?true:false;this.useShim=
-this.config.useShim===true?true:false},handleOnAvailable:function(){this.available=true;this.resetConstraints();this.onAvailable()},setPadding:function(b,d,a,c){this.padding=!d&&0!==d?[b,b,b,b]:!a&&0!==a?[b,d,b,d]:[b,d,a,c]},setInitPosition:function(b,d){var a=this.getEl();if(this.DDM.verifyEl(a)){var c=b||0,g=d||0,a=e.getXY(a);this.initPageX=a[0]-c;this.initPageY=a[1]-g;this.lastPageX=a[0];this.lastPageY=a[1];this.setStartPosition(a)}},setStartPosition:function(b){b=b||e.getXY(this.getEl());this.deltaSetXY=
-null;this.startPageX=b[0];this.startPageY=b[1]},addToGroup:function(b){this.groups[b]=true;this.DDM.regDragDrop(this,b)},removeFromGroup:function(b){this.groups[b]&&delete this.groups[b];this.DDM.removeDDFromGroup(this,b)},setDragElId:function(b){this.dragElId=b},setHandleElId:function(b){typeof b!=="string"&&(b=e.generateId(b));this.handleElId=b;this.DDM.regHandle(this.id,b)},setOuterHandleElId:function(b){typeof b!=="string"&&(b=e.generateId(b));c.on(b,"mousedown",this.handleMouseDown,this,true);
-this.setHandleElId(b);this.hasOuterHandles=true},unreg:function(){c.removeListener(this.id,"mousedown",this.handleMouseDown);this._domRef=null;this.DDM._remove(this)},isLocked:function(){return this.DDM.isLocked()||this.locked},handleMouseDown:function(b){var d=b.which||b.button;if(!(this.primaryButtonOnly&&d>1)&&!this.isLocked()){var d=this.b4MouseDown(b),a=true;this.events.b4MouseDown&&(a=this.fireEvent("b4MouseDownEvent",b));var e=this.onMouseDown(b),g=true;this.events.mouseDown&&(g=this.fireEvent("mouseDownEvent",
-b));if(!(d===false||e===false||a===false||g===false)){this.DDM.refreshCache(this.groups);d=new YAHOO.util.Point(c.getPageX(b),c.getPageY(b));if((this.hasOuterHandles||this.DDM.isOverTarget(d,this))&&this.clickValidator(b)){this.setStartPosition();this.DDM.handleMouseDown(b,this);this.DDM.stopEvent(b)}}}},clickValidator:function(b){b=YAHOO.util.Event.getTarget(b);return this.isValidHandleChild(b)&&(this.id==this.handleElId||this.DDM.handleWasClicked(b,this.id))},getTargetCoord:function(b,d){var a=
-b-this.deltaX,c=d-this.deltaY;if(this.constrainX){if(a<this.minX)a=this.minX;if(a>this.maxX)a=this.maxX}if(this.constrainY){if(c<this.minY)c=this.minY;if(c>this.maxY)c=this.maxY}a=this.getTick(a,this.xTicks);c=this.getTick(c,this.yTicks);return{x:a,y:c}},addInvalidHandleType:function(b){b=b.toUpperCase();this.invalidHandleTypes[b]=b},addInvalidHandleId:function(b){typeof b!=="string"&&(b=e.generateId(b));this.invalidHandleIds[b]=b},addInvalidHandleClass:function(b){this.invalidHandleClasses.push(b)},
-removeInvalidHandleType:function(b){delete this.invalidHandleTypes[b.toUpperCase()]},removeInvalidHandleId:function(b){typeof b!=="string"&&(b=e.generateId(b));delete this.invalidHandleIds[b]},removeInvalidHandleClass:function(b){for(var d=0,a=this.invalidHandleClasses.length;d<a;++d)this.invalidHandleClasses[d]==b&&delete this.invalidHandleClasses[d]},isValidHandleChild:function(b){var d=true,a;try{a=b.nodeName.toUpperCase()}catch(c){a=b.nodeName}d=(d=d&&!this.invalidHandleTypes[a])&&!this.invalidHandleIds[b.id];
-a=0;for(var g=this.invalidHandleClasses.length;d&&a<g;++a)d=!e.hasClass(b,this.invalidHandleClasses[a]);return d},setXTicks:function(b,d){this.xTicks=[];this.xTickSize=d;for(var a={},c=this.initPageX;c>=this.minX;c=c-d)if(!a[c]){this.xTicks[this.xTicks.length]=c;a[c]=true}for(c=this.initPageX;c<=this.maxX;c=c+d)if(!a[c]){this.xTicks[this.xTicks.length]=c;a[c]=true}this.xTicks.sort(this.DDM.numericSort)},setYTicks:function(b,d){this.yTicks=[];this.yTickSize=d;for(var a={},c=this.initPageY;c>=this.minY;c=
-c-d)if(!a[c]){this.yTicks[this.yTicks.length]=c;a[c]=true}for(c=this.initPageY;c<=this.maxY;c=c+d)if(!a[c]){this.yTicks[this.yTicks.length]=c;a[c]=true}this.yTicks.sort(this.DDM.numericSort)},setXConstraint:function(b,d,a){this.leftConstraint=parseInt(b,10);this.rightConstraint=parseInt(d,10);this.minX=this.initPageX-this.leftConstraint;this.maxX=this.initPageX+this.rightConstraint;a&&this.setXTicks(this.initPageX,a);this.constrainX=true},clearConstraints:function(){this.constrainY=this.constrainX=
-false;this.clearTicks()},clearTicks:function(){this.yTicks=this.xTicks=null;this.yTickSize=this.xTickSize=0},setYConstraint:function(b,d,a){this.topConstraint=parseInt(b,10);this.bottomConstraint=parseInt(d,10);this.minY=this.initPageY-this.topConstraint;this.maxY=this.initPageY+this.bottomConstraint;a&&this.setYTicks(this.initPageY,a);this.constrainY=true},resetConstraints:function(){this.initPageX||this.initPageX===0?this.setInitPosition(this.maintainOffset?this.lastPageX-this.initPageX:0,this.maintainOffset?
-this.lastPageY-this.initPageY:0):this.setInitPosition();this.constrainX&&this.setXConstraint(this.leftConstraint,this.rightConstraint,this.xTickSize);this.constrainY&&this.setYConstraint(this.topConstraint,this.bottomConstraint,this.yTickSize)},getTick:function(b,d){if(d){if(d[0]>=b)return d[0];for(var a=0,c=d.length;a<c;++a){var e=a+1;if(d[e]&&d[e]>=b)return d[e]-b>b-d[a]?d[a]:d[e]}return d[d.length-1]}return b},toString:function(){return"DragDrop "+this.id}};YAHOO.augment(YAHOO.util.DragDrop,YAHOO.util.EventProvider)})();
-YAHOO.util.DD=function(c,e,b){c&&this.init(c,e,b)};
-YAHOO.extend(YAHOO.util.DD,YAHOO.util.DragDrop,{scroll:!0,autoOffset:function(c,e){this.setDelta(c-this.startPageX,e-this.startPageY)},setDelta:function(c,e){this.deltaX=c;this.deltaY=e},setDragElPos:function(c,e){this.alignElWithMouse(this.getDragEl(),c,e)},alignElWithMouse:function(c,e,b){var d=this.getTargetCoord(e,b);if(this.deltaSetXY){YAHOO.util.Dom.setStyle(c,"left",d.x+this.deltaSetXY[0]+"px");YAHOO.util.Dom.setStyle(c,"top",d.y+this.deltaSetXY[1]+"px")}else{YAHOO.util.Dom.setXY(c,[d.x,d.y]);
-e=parseInt(YAHOO.util.Dom.getStyle(c,"left"),10);b=parseInt(YAHOO.util.Dom.getStyle(c,"top"),10);this.deltaSetXY=[e-d.x,b-d.y]}this.cachePosition(d.x,d.y);var a=this;setTimeout(function(){a.autoScroll.call(a,d.x,d.y,c.offsetHeight,c.offsetWidth)},0)},cachePosition:function(c,e){if(c){this.lastPageX=c;this.lastPageY=e}else{var b=YAHOO.util.Dom.getXY(this.getEl());this.lastPageX=b[0];this.lastPageY=b[1]}},autoScroll:function(c,e,b,d){if(this.scroll){var a=this.DDM.getClientHeight(),f=this.DDM.getClientWidth(),
-g=this.DDM.getScrollTop(),h=this.DDM.getScrollLeft(),d=d+c,i=a+g-e-this.deltaY,j=f+h-c-this.deltaX,k=document.all?80:30;b+e>a&&i<40&&window.scrollTo(h,g+k);e<g&&(g>0&&e-g<40)&&window.scrollTo(h,g-k);d>f&&j<40&&window.scrollTo(h+k,g);c<h&&(h>0&&c-h<40)&&window.scrollTo(h-k,g)}},applyConfig:function(){YAHOO.util.DD.superclass.applyConfig.call(this);this.scroll=this.config.scroll!==false},b4MouseDown:function(c){this.setStartPosition();this.autoOffset(YAHOO.util.Event.getPageX(c),YAHOO.util.Event.getPageY(c))},
-b4Drag:function(c){this.setDragElPos(YAHOO.util.Event.getPageX(c),YAHOO.util.Event.getPageY(c))},toString:function(){return"DD "+this.id}});YAHOO.util.DDProxy=function(c,e,b){if(c){this.init(c,e,b);this.initFrame()}};YAHOO.util.DDProxy.dragElId="ygddfdiv";
-YAHOO.extend(YAHOO.util.DDProxy,YAHOO.util.DD,{resizeFrame:!0,centerFrame:!1,createFrame:function(){var c=this,e=document.body;if(!e||!e.firstChild)setTimeout(function(){c.createFrame()},50);else{var b=this.getDragEl(),d=YAHOO.util.Dom;if(!b){b=document.createElement("div");b.id=this.dragElId;var a=b.style;a.position="absolute";a.visibility="hidden";a.cursor="move";a.border="2px solid #aaa";a.zIndex=999;a.height="25px";a.width="25px";a=document.createElement("div");d.setStyle(a,"height","100%");d.setStyle(a,
-"width","100%");d.setStyle(a,"background-color","#ccc");d.setStyle(a,"opacity","0");b.appendChild(a);e.insertBefore(b,e.firstChild)}}},initFrame:function(){this.createFrame()},applyConfig:function(){YAHOO.util.DDProxy.superclass.applyConfig.call(this);this.resizeFrame=this.config.resizeFrame!==false;this.centerFrame=this.config.centerFrame;this.setDragElId(this.config.dragElId||YAHOO.util.DDProxy.dragElId)},showFrame:function(c,e){this.getEl();var b=this.getDragEl(),d=b.style;this._resizeProxy();
-this.centerFrame&&this.setDelta(Math.round(parseInt(d.width,10)/2),Math.round(parseInt(d.height,10)/2));this.setDragElPos(c,e);YAHOO.util.Dom.setStyle(b,"visibility","visible")},_resizeProxy:function(){if(this.resizeFrame){var c=YAHOO.util.Dom,e=this.getEl(),b=this.getDragEl(),d=parseInt(c.getStyle(b,"borderTopWidth"),10),a=parseInt(c.getStyle(b,"borderRightWidth"),10),f=parseInt(c.getStyle(b,"borderBottomWidth"),10),g=parseInt(c.getStyle(b,"borderLeftWidth"),10);isNaN(d)&&(d=0);isNaN(a)&&(a=0);isNaN(f)&&
-(f=0);isNaN(g)&&(g=0);a=Math.max(0,e.offsetWidth-a-g);e=Math.max(0,e.offsetHeight-d-f);c.setStyle(b,"width",a+"px");c.setStyle(b,"height",e+"px")}},b4MouseDown:function(c){this.setStartPosition();var e=YAHOO.util.Event.getPageX(c),c=YAHOO.util.Event.getPageY(c);this.autoOffset(e,c)},b4StartDrag:function(c,e){this.showFrame(c,e)},b4EndDrag:function(){YAHOO.util.Dom.setStyle(this.getDragEl(),"visibility","hidden")},endDrag:function(){var c=YAHOO.util.Dom,e=this.getEl(),b=this.getDragEl();c.setStyle(b,
-"visibility","");c.setStyle(e,"visibility","hidden");YAHOO.util.DDM.moveToEl(e,b);c.setStyle(b,"visibility","hidden");c.setStyle(e,"visibility","")},toString:function(){return"DDProxy "+this.id}});YAHOO.util.DDTarget=function(c,e,b){c&&this.initTarget(c,e,b)};YAHOO.extend(YAHOO.util.DDTarget,YAHOO.util.DragDrop,{toString:function(){return"DDTarget "+this.id}});YAHOO.register("dragdrop",YAHOO.util.DragDropMgr,{version:"2.7.0",build:"1796"});
-(function(){function c(a,b,d,e){c.ANIM_AVAIL=!YAHOO.lang.isUndefined(YAHOO.util.Anim);if(a){this.init(a,b,true);this.initSlider(e);this.initThumb(d)}}var e=YAHOO.util.Dom.getXY,b=YAHOO.util.Event,d=Array.prototype.slice;YAHOO.lang.augmentObject(c,{getHorizSlider:function(a,b,d,e,i){return new c(a,a,new YAHOO.widget.SliderThumb(b,a,d,e,0,0,i),"horiz")},getVertSlider:function(a,b,d,e,i){return new c(a,a,new YAHOO.widget.SliderThumb(b,a,0,0,d,e,i),"vert")},getSliderRegion:function(a,b,d,e,i,j,k){return new c(a,
-a,new YAHOO.widget.SliderThumb(b,a,d,e,i,j,k),"region")},SOURCE_UI_EVENT:1,SOURCE_SET_VALUE:2,SOURCE_KEY_EVENT:3,ANIM_AVAIL:false},true);YAHOO.extend(c,YAHOO.util.DragDrop,{_mouseDown:false,dragOnly:true,initSlider:function(a){this.type=a;this.createEvent("change",this);this.createEvent("slideStart",this);this.createEvent("slideEnd",this);this.isTarget=false;this.animate=c.ANIM_AVAIL;this.backgroundEnabled=true;this.tickPause=40;this.enableKeys=true;this.keyIncrement=20;this.moveComplete=true;this.animationDuration=
-0.2;this.SOURCE_UI_EVENT=1;this.SOURCE_SET_VALUE=2;this.valueChangeSource=0;this._silent=false;this.lastOffset=[0,0]},initThumb:function(a){var b=this;this.thumb=a;a.cacheBetweenDrags=true;if(a._isHoriz&&a.xTicks&&a.xTicks.length)this.tickPause=Math.round(360/a.xTicks.length);else if(a.yTicks&&a.yTicks.length)this.tickPause=Math.round(360/a.yTicks.length);a.onAvailable=function(){return b.setStartSliderState()};a.onMouseDown=function(){b._mouseDown=true;return b.focus()};a.startDrag=function(){b._slideStart()};
-a.onDrag=function(){b.fireEvents(true)};a.onMouseUp=function(){b.thumbMouseUp()}},onAvailable:function(){this._bindKeyEvents()},_bindKeyEvents:function(){b.on(this.id,"keydown",this.handleKeyDown,this,true);b.on(this.id,"keypress",this.handleKeyPress,this,true)},handleKeyPress:function(a){if(this.enableKeys)switch(b.getCharCode(a)){case 37:case 38:case 39:case 40:case 36:case 35:b.preventDefault(a)}},handleKeyDown:function(a){if(this.enableKeys){var d=b.getCharCode(a),e=this.thumb,h=this.getXValue(),
-i=this.getYValue(),j=true;switch(d){case 37:h=h-this.keyIncrement;break;case 38:i=i-this.keyIncrement;break;case 39:h=h+this.keyIncrement;break;case 40:i=i+this.keyIncrement;break;case 36:h=e.leftConstraint;i=e.topConstraint;break;case 35:h=e.rightConstraint;i=e.bottomConstraint;break;default:j=false}if(j){e._isRegion?this._setRegionValue(c.SOURCE_KEY_EVENT,h,i,true):this._setValue(c.SOURCE_KEY_EVENT,e._isHoriz?h:i,true);b.stopEvent(a)}}},setStartSliderState:function(){this.setThumbCenterPoint();
-this.baselinePos=e(this.getEl());this.thumb.startOffset=this.thumb.getOffsetFromParent(this.baselinePos);if(this.thumb._isRegion)if(this.deferredSetRegionValue){this._setRegionValue.apply(this,this.deferredSetRegionValue);this.deferredSetRegionValue=null}else this.setRegionValue(0,0,true,true,true);else if(this.deferredSetValue){this._setValue.apply(this,this.deferredSetValue);this.deferredSetValue=null}else this.setValue(0,true,true,true)},setThumbCenterPoint:function(){var a=this.thumb.getEl();
-if(a)this.thumbCenterPoint={x:parseInt(a.offsetWidth/2,10),y:parseInt(a.offsetHeight/2,10)}},lock:function(){this.thumb.lock();this.locked=true},unlock:function(){this.thumb.unlock();this.locked=false},thumbMouseUp:function(){this._mouseDown=false;!this.isLocked()&&!this.moveComplete&&this.endMove()},onMouseUp:function(){this._mouseDown=false;this.backgroundEnabled&&(!this.isLocked()&&!this.moveComplete)&&this.endMove()},getThumb:function(){return this.thumb},focus:function(){this.valueChangeSource=
-c.SOURCE_UI_EVENT;var a=this.getEl();if(a.focus)try{a.focus()}catch(b){}this.verifyOffset();return!this.isLocked()},onChange:function(){},onSlideStart:function(){},onSlideEnd:function(){},getValue:function(){return this.thumb.getValue()},getXValue:function(){return this.thumb.getXValue()},getYValue:function(){return this.thumb.getYValue()},setValue:function(){var a=d.call(arguments);a.unshift(c.SOURCE_SET_VALUE);return this._setValue.apply(this,a)},_setValue:function(a,b,d,e,i){var j=this.thumb,k;
-if(!j.available){this.deferredSetValue=arguments;return false}if(this.isLocked()&&!e||isNaN(b)||j._isRegion)return false;this._silent=i;this.valueChangeSource=a||c.SOURCE_SET_VALUE;j.lastOffset=[b,b];this.verifyOffset(true);this._slideStart();if(j._isHoriz){k=j.initPageX+b+this.thumbCenterPoint.x;this.moveThumb(k,j.initPageY,d)}else{k=j.initPageY+b+this.thumbCenterPoint.y;this.moveThumb(j.initPageX,k,d)}return true},setRegionValue:function(){var a=d.call(arguments);a.unshift(c.SOURCE_SET_VALUE);return this._setRegionValue.apply(this,
-a)},_setRegionValue:function(a,b,d,e,i,j){var k=this.thumb;if(!k.available){this.deferredSetRegionValue=arguments;return false}if(this.isLocked()&&!i||isNaN(b)||!k._isRegion)return false;this._silent=j;this.valueChangeSource=a||c.SOURCE_SET_VALUE;k.lastOffset=[b,d];this.verifyOffset(true);this._slideStart();this.moveThumb(k.initPageX+b+this.thumbCenterPoint.x,k.initPageY+d+this.thumbCenterPoint.y,e);return true},verifyOffset:function(){var a=e(this.getEl()),b=this.thumb;(!this.thumbCenterPoint||!this.thumbCenterPoint.x)&&
-this.setThumbCenterPoint();if(a&&(a[0]!=this.baselinePos[0]||a[1]!=this.baselinePos[1])){this.setInitPosition();this.baselinePos=a;b.initPageX=this.initPageX+b.startOffset[0];b.initPageY=this.initPageY+b.startOffset[1];b.deltaSetXY=null;this.resetThumbConstraints();return false}return true},moveThumb:function(a,b,d,h){var i=this.thumb,j=this,k,l;if(i.available){i.setDelta(this.thumbCenterPoint.x,this.thumbCenterPoint.y);l=i.getTargetCoord(a,b);k=[Math.round(l.x),Math.round(l.y)];if(this.animate&&
-i._graduated&&!d){this.lock();this.curCoord=e(this.thumb.getEl());this.curCoord=[Math.round(this.curCoord[0]),Math.round(this.curCoord[1])];setTimeout(function(){j.moveOneTick(k)},this.tickPause)}else if(this.animate&&c.ANIM_AVAIL&&!d){this.lock();a=new YAHOO.util.Motion(i.id,{points:{to:k}},this.animationDuration,YAHOO.util.Easing.easeOut);a.onComplete.subscribe(function(){j.unlock();j._mouseDown||j.endMove()});a.animate()}else{i.setDragElPos(a,b);!h&&!this._mouseDown&&this.endMove()}}},_slideStart:function(){if(!this._sliding){if(!this._silent){this.onSlideStart();
-this.fireEvent("slideStart")}this._sliding=true}},_slideEnd:function(){if(this._sliding&&this.moveComplete){var a=this._silent;this.moveComplete=this._silent=this._sliding=false;if(!a){this.onSlideEnd();this.fireEvent("slideEnd")}}},moveOneTick:function(a){var b=this.thumb,d=this,c=null,e;if(b._isRegion){c=this._getNextX(this.curCoord,a);e=c!==null?c[0]:this.curCoord[0];c=this._getNextY(this.curCoord,a);c=c!==null?c[1]:this.curCoord[1];c=e!==this.curCoord[0]||c!==this.curCoord[1]?[e,c]:null}else c=
-b._isHoriz?this._getNextX(this.curCoord,a):this._getNextY(this.curCoord,a);if(c){this.curCoord=c;this.thumb.alignElWithMouse(b.getEl(),c[0]+this.thumbCenterPoint.x,c[1]+this.thumbCenterPoint.y);if(c[0]==a[0]&&c[1]==a[1]){this.unlock();this._mouseDown||this.endMove()}else setTimeout(function(){d.moveOneTick(a)},this.tickPause)}else{this.unlock();this._mouseDown||this.endMove()}},_getNextX:function(a,b){var d=this.thumb,c;c=[];c=null;if(a[0]>b[0]){c=d.tickSize-this.thumbCenterPoint.x;c=d.getTargetCoord(a[0]-
-c,a[1]);c=[c.x,c.y]}else if(a[0]<b[0]){c=d.tickSize+this.thumbCenterPoint.x;c=d.getTargetCoord(a[0]+c,a[1]);c=[c.x,c.y]}return c},_getNextY:function(a,b){var d=this.thumb,c;c=[];c=null;if(a[1]>b[1]){c=d.tickSize-this.thumbCenterPoint.y;c=d.getTargetCoord(a[0],a[1]-c);c=[c.x,c.y]}else if(a[1]<b[1]){c=d.tickSize+this.thumbCenterPoint.y;c=d.getTargetCoord(a[0],a[1]+c);c=[c.x,c.y]}return c},b4MouseDown:function(){if(!this.backgroundEnabled)return false;this.thumb.autoOffset();this.resetThumbConstraints()},
-onMouseDown:function(a){if(!this.backgroundEnabled||this.isLocked())return false;this._mouseDown=true;var d=b.getPageX(a),a=b.getPageY(a);this.focus();this._slideStart();this.moveThumb(d,a)},onDrag:function(a){if(this.backgroundEnabled&&!this.isLocked()){var d=b.getPageX(a),a=b.getPageY(a);this.moveThumb(d,a,true,true);this.fireEvents()}},endMove:function(){this.unlock();this.fireEvents();this.moveComplete=true;this._slideEnd()},resetThumbConstraints:function(){var a=this.thumb;a.setXConstraint(a.leftConstraint,
-a.rightConstraint,a.xTickSize);a.setYConstraint(a.topConstraint,a.bottomConstraint,a.xTickSize)},fireEvents:function(a){var b=this.thumb;a||b.cachePosition();if(!this.isLocked())if(b._isRegion){a=b.getXValue();b=b.getYValue();if((a!=this.previousX||b!=this.previousY)&&!this._silent){this.onChange(a,b);this.fireEvent("change",{x:a,y:b})}this.previousX=a;this.previousY=b}else{b=b.getValue();if(b!=this.previousVal&&!this._silent){this.onChange(b);this.fireEvent("change",b)}this.previousVal=b}},toString:function(){return"Slider ("+
-this.type+") "+this.id}});YAHOO.lang.augmentProto(c,YAHOO.util.EventProvider);YAHOO.widget.Slider=c})();YAHOO.widget.SliderThumb=function(c,e,b,d,a,f,g){if(c){YAHOO.widget.SliderThumb.superclass.constructor.call(this,c,e);this.parentElId=e}this.isTarget=false;this.tickSize=g;this.maintainOffset=true;this.initSlider(b,d,a,f,g);this.scroll=false};
-YAHOO.extend(YAHOO.widget.SliderThumb,YAHOO.util.DD,{startOffset:null,dragOnly:!0,_isHoriz:!1,_prevVal:0,_graduated:!1,getOffsetFromParent0:function(c){var e=YAHOO.util.Dom.getXY(this.getEl()),c=c||YAHOO.util.Dom.getXY(this.parentElId);return[e[0]-c[0],e[1]-c[1]]},getOffsetFromParent:function(c){var e=this.getEl(),b;if(this.deltaOffset){b=parseInt(YAHOO.util.Dom.getStyle(e,"left"),10);e=parseInt(YAHOO.util.Dom.getStyle(e,"top"),10);b=[b+this.deltaOffset[0],e+this.deltaOffset[1]]}else{b=YAHOO.util.Dom.getXY(e);
-c=c||YAHOO.util.Dom.getXY(this.parentElId);b=[b[0]-c[0],b[1]-c[1]];c=parseInt(YAHOO.util.Dom.getStyle(e,"left"),10);e=parseInt(YAHOO.util.Dom.getStyle(e,"top"),10);c=c-b[0];e=e-b[1];if(!isNaN(c)&&!isNaN(e))this.deltaOffset=[c,e]}return b},initSlider:function(c,e,b,d,a){this.initLeft=c;this.initRight=e;this.initUp=b;this.initDown=d;this.setXConstraint(c,e,a);this.setYConstraint(b,d,a);if(a&&a>1)this._graduated=true;this._isHoriz=c||e;this._isVert=b||d;this._isRegion=this._isHoriz&&this._isVert},clearTicks:function(){YAHOO.widget.SliderThumb.superclass.clearTicks.call(this);
-this.tickSize=0;this._graduated=false},getValue:function(){return this._isHoriz?this.getXValue():this.getYValue()},getXValue:function(){if(!this.available)return 0;var c=this.getOffsetFromParent();if(YAHOO.lang.isNumber(c[0])){this.lastOffset=c;return c[0]-this.startOffset[0]}return this.lastOffset[0]-this.startOffset[0]},getYValue:function(){if(!this.available)return 0;var c=this.getOffsetFromParent();if(YAHOO.lang.isNumber(c[1])){this.lastOffset=c;return c[1]-this.startOffset[1]}return this.lastOffset[1]-
-this.startOffset[1]},toString:function(){return"SliderThumb "+this.id},onChange:function(){}});
-(function(){function c(b,a,c,e){var h=this,i=false,j=false,k,l;this.minSlider=b;this.maxSlider=a;this.activeSlider=b;this.isHoriz=b.thumb._isHoriz;k=this.minSlider.thumb.onMouseDown;l=this.maxSlider.thumb.onMouseDown;this.minSlider.thumb.onMouseDown=function(){h.activeSlider=h.minSlider;k.apply(this,arguments)};this.maxSlider.thumb.onMouseDown=function(){h.activeSlider=h.maxSlider;l.apply(this,arguments)};this.minSlider.thumb.onAvailable=function(){b.setStartSliderState();i=true;j&&h.fireEvent("ready",
-h)};this.maxSlider.thumb.onAvailable=function(){a.setStartSliderState();j=true;i&&h.fireEvent("ready",h)};b.onMouseDown=a.onMouseDown=function(a){return this.backgroundEnabled&&h._handleMouseDown(a)};b.onDrag=a.onDrag=function(a){h._handleDrag(a)};b.onMouseUp=a.onMouseUp=function(a){h._handleMouseUp(a)};b._bindKeyEvents=function(){h._bindKeyEvents(this)};a._bindKeyEvents=function(){};b.subscribe("change",this._handleMinChange,b,this);b.subscribe("slideStart",this._handleSlideStart,b,this);b.subscribe("slideEnd",
-this._handleSlideEnd,b,this);a.subscribe("change",this._handleMaxChange,a,this);a.subscribe("slideStart",this._handleSlideStart,a,this);a.subscribe("slideEnd",this._handleSlideEnd,a,this);this.createEvent("ready",this);this.createEvent("change",this);this.createEvent("slideStart",this);this.createEvent("slideEnd",this);e=YAHOO.lang.isArray(e)?e:[0,c];e[0]=Math.min(Math.max(parseInt(e[0],10)|0,0),c);e[1]=Math.max(Math.min(parseInt(e[1],10)|0,c),0);e[0]>e[1]&&e.splice(0,2,e[1],e[0]);this.minVal=e[0];
-this.maxVal=e[1];this.minSlider.setValue(this.minVal,true,true,true);this.maxSlider.setValue(this.maxVal,true,true,true)}var e=YAHOO.util.Event,b=YAHOO.widget;c.prototype={minVal:-1,maxVal:-1,minRange:0,_handleSlideStart:function(b,a){this.fireEvent("slideStart",a)},_handleSlideEnd:function(b,a){this.fireEvent("slideEnd",a)},_handleDrag:function(d){b.Slider.prototype.onDrag.call(this.activeSlider,d)},_handleMinChange:function(){this.activeSlider=this.minSlider;this.updateValue()},_handleMaxChange:function(){this.activeSlider=
-this.maxSlider;this.updateValue()},_bindKeyEvents:function(b){e.on(b.id,"keydown",this._handleKeyDown,this,true);e.on(b.id,"keypress",this._handleKeyPress,this,true)},_handleKeyDown:function(b){this.activeSlider.handleKeyDown.apply(this.activeSlider,arguments)},_handleKeyPress:function(b){this.activeSlider.handleKeyPress.apply(this.activeSlider,arguments)},setValues:function(b,a,c,e,h){var i=this.minSlider,j=this.maxSlider,k=i.thumb,l=j.thumb,m=this,n=false,o=false;if(k._isHoriz){k.setXConstraint(k.leftConstraint,
-l.rightConstraint,k.tickSize);l.setXConstraint(k.leftConstraint,l.rightConstraint,l.tickSize)}else{k.setYConstraint(k.topConstraint,l.bottomConstraint,k.tickSize);l.setYConstraint(k.topConstraint,l.bottomConstraint,l.tickSize)}this._oneTimeCallback(i,"slideEnd",function(){n=true;if(o){m.updateValue(h);setTimeout(function(){m._cleanEvent(i,"slideEnd");m._cleanEvent(j,"slideEnd")},0)}});this._oneTimeCallback(j,"slideEnd",function(){o=true;if(n){m.updateValue(h);setTimeout(function(){m._cleanEvent(i,
-"slideEnd");m._cleanEvent(j,"slideEnd")},0)}});i.setValue(b,c,e,false);j.setValue(a,c,e,false)},setMinValue:function(b,a,c,e){var h=this.minSlider,i=this;this.activeSlider=h;i=this;this._oneTimeCallback(h,"slideEnd",function(){i.updateValue(e);setTimeout(function(){i._cleanEvent(h,"slideEnd")},0)});h.setValue(b,a,c)},setMaxValue:function(b,a,c,e){var h=this.maxSlider,i=this;this.activeSlider=h;this._oneTimeCallback(h,"slideEnd",function(){i.updateValue(e);setTimeout(function(){i._cleanEvent(h,"slideEnd")},
-0)});h.setValue(b,a,c)},updateValue:function(b){var a=this.minSlider.getValue(),c=this.maxSlider.getValue(),e=false,h,i,j,k;if(a!=this.minVal||c!=this.maxVal){e=true;h=this.minSlider.thumb;i=this.maxSlider.thumb;j=this.isHoriz?"x":"y";k=this.minSlider.thumbCenterPoint[j]+this.maxSlider.thumbCenterPoint[j];j=Math.max(c-k-this.minRange,0);k=Math.min(-a-k-this.minRange,0);if(this.isHoriz){j=Math.min(j,i.rightConstraint);h.setXConstraint(h.leftConstraint,j,h.tickSize);i.setXConstraint(k,i.rightConstraint,
-i.tickSize)}else{j=Math.min(j,i.bottomConstraint);h.setYConstraint(h.leftConstraint,j,h.tickSize);i.setYConstraint(k,i.bottomConstraint,i.tickSize)}}this.minVal=a;this.maxVal=c;e&&!b&&this.fireEvent("change",this)},selectActiveSlider:function(b){var a=this.minSlider,c=this.maxSlider,e=a.isLocked()||!a.backgroundEnabled,h=c.isLocked()||!a.backgroundEnabled,i=YAHOO.util.Event;if(e||h)this.activeSlider=e?c:a;else{b=this.isHoriz?i.getPageX(b)-a.thumb.initPageX-a.thumbCenterPoint.x:i.getPageY(b)-a.thumb.initPageY-
-a.thumbCenterPoint.y;this.activeSlider=b*2>c.getValue()+a.getValue()?c:a}},_handleMouseDown:function(d){if(d._handled)return false;d._handled=true;this.selectActiveSlider(d);return b.Slider.prototype.onMouseDown.call(this.activeSlider,d)},_handleMouseUp:function(d){b.Slider.prototype.onMouseUp.apply(this.activeSlider,arguments)},_oneTimeCallback:function(b,a,c){b.subscribe(a,function(){b.unsubscribe(a,arguments.callee);c.apply({},[].slice.apply(arguments))})},_cleanEvent:function(b,a){var c,e,h,i,
-j,k;if(b.__yui_events&&b.events[a]){for(e=b.__yui_events.length;e>=0;--e)if(b.__yui_events[e].type===a){c=b.__yui_events[e];break}if(c){j=c.subscribers;k=[];e=i=0;for(h=j.length;e<h;++e)j[e]&&(k[i++]=j[e]);c.subscribers=k}}}};YAHOO.lang.augmentProto(c,YAHOO.util.EventProvider);b.Slider.getHorizDualSlider=function(d,a,e,g,h,i){a=new b.SliderThumb(a,d,0,g,0,0,h);e=new b.SliderThumb(e,d,0,g,0,0,h);return new c(new b.Slider(d,d,a,"horiz"),new b.Slider(d,d,e,"horiz"),g,i)};b.Slider.getVertDualSlider=function(c,
-a,e,g,h,i){a=new b.SliderThumb(a,c,0,0,0,g,h);e=new b.SliderThumb(e,c,0,0,0,g,h);return new b.DualSlider(new b.Slider(c,c,a,"vert"),new b.Slider(c,c,e,"vert"),g,i)};YAHOO.widget.DualSlider=c})();YAHOO.register("slider",YAHOO.widget.Slider,{version:"2.7.0",build:"1796"});YAHOO.util.Attribute=function(c,e){if(e){this.owner=e;this.configure(c,true)}};
-YAHOO.util.Attribute.prototype={name:void 0,value:null,owner:null,readOnly:!1,writeOnce:!1,_initialConfig:null,_written:!1,method:null,setter:null,getter:null,validator:null,getValue:function(){var c=this.value;this.getter&&(c=this.getter.call(this.owner,this.name));return c},setValue:function(c,e){var b,d=this.owner,a=this.name,f={type:a,prevValue:this.getValue(),newValue:c};if(this.readOnly||this.writeOnce&&this._written||this.validator&&!this.validator.call(d,c))return false;if(!e){b=d.fireBeforeChangeEvent(f);
-if(b===false)return false}this.setter&&(c=this.setter.call(d,c,this.name));this.method&&this.method.call(d,c,this.name);this.value=c;this._written=true;f.type=a;e||this.owner.fireChangeEvent(f);return true},configure:function(c,e){c=c||{};if(e)this._written=false;this._initialConfig=this._initialConfig||{};for(var b in c)if(c.hasOwnProperty(b)){this[b]=c[b];e&&(this._initialConfig[b]=c[b])}},resetValue:function(){return this.setValue(this._initialConfig.value)},resetConfig:function(){this.configure(this._initialConfig,
-true)},refresh:function(c){this.setValue(this.value,c)}};
-(function(){var c=YAHOO.util.Lang;YAHOO.util.AttributeProvider=function(){};YAHOO.util.AttributeProvider.prototype={_configs:null,get:function(c){this._configs=this._configs||{};var b=this._configs[c];return!b||!this._configs.hasOwnProperty(c)?null:b.getValue()},set:function(c,b,d){this._configs=this._configs||{};c=this._configs[c];return!c?false:c.setValue(b,d)},getAttributeKeys:function(){this._configs=this._configs;var e=[],b;for(b in this._configs)c.hasOwnProperty(this._configs,b)&&!c.isUndefined(this._configs[b])&&
-(e[e.length]=b);return e},setAttributes:function(e,b){for(var d in e)c.hasOwnProperty(e,d)&&this.set(d,e[d],b)},resetValue:function(c,b){this._configs=this._configs||{};if(this._configs[c]){this.set(c,this._configs[c]._initialConfig.value,b);return true}return false},refresh:function(e,b){for(var d=this._configs=this._configs||{},e=(c.isString(e)?[e]:e)||this.getAttributeKeys(),a=0,f=e.length;a<f;++a)d.hasOwnProperty(e[a])&&this._configs[e[a]].refresh(b)},register:function(c,b){this.setAttributeConfig(c,
-b)},getAttributeConfig:function(e){this._configs=this._configs||{};var b=this._configs[e]||{},d={};for(e in b)c.hasOwnProperty(b,e)&&(d[e]=b[e]);return d},setAttributeConfig:function(c,b,d){this._configs=this._configs||{};b=b||{};if(this._configs[c])this._configs[c].configure(b,d);else{b.name=c;this._configs[c]=this.createAttribute(b)}},configureAttribute:function(c,b,d){this.setAttributeConfig(c,b,d)},resetAttributeConfig:function(c){this._configs=this._configs||{};this._configs[c].resetConfig()},
-subscribe:function(c,b){this._events=this._events||{};c in this._events||(this._events[c]=this.createEvent(c));YAHOO.util.EventProvider.prototype.subscribe.apply(this,arguments)},on:function(){this.subscribe.apply(this,arguments)},addListener:function(){this.subscribe.apply(this,arguments)},fireBeforeChangeEvent:function(c){var b;b="before"+(c.type.charAt(0).toUpperCase()+c.type.substr(1)+"Change");c.type=b;return this.fireEvent(c.type,c)},fireChangeEvent:function(c){c.type=c.type+"Change";return this.fireEvent(c.type,
-c)},createAttribute:function(c){return new YAHOO.util.Attribute(c,this)}};YAHOO.augment(YAHOO.util.AttributeProvider,YAHOO.util.EventProvider)})();
-(function(){var c=YAHOO.util.Dom,e=YAHOO.util.AttributeProvider,b=function(b,a){this.init.apply(this,arguments)};b.DOM_EVENTS={click:true,dblclick:true,keydown:true,keypress:true,keyup:true,mousedown:true,mousemove:true,mouseout:true,mouseover:true,mouseup:true,focus:true,blur:true,submit:true,change:true};b.prototype={DOM_EVENTS:null,DEFAULT_HTML_SETTER:function(b,a){var c=this.get("element");c&&(c[a]=b)},DEFAULT_HTML_GETTER:function(b){var a=this.get("element"),c;a&&(c=a[b]);return c},appendChild:function(b){b=
-b.get?b.get("element"):b;return this.get("element").appendChild(b)},getElementsByTagName:function(b){return this.get("element").getElementsByTagName(b)},hasChildNodes:function(){return this.get("element").hasChildNodes()},insertBefore:function(b,a){b=b.get?b.get("element"):b;a=a&&a.get?a.get("element"):a;return this.get("element").insertBefore(b,a)},removeChild:function(b){b=b.get?b.get("element"):b;return this.get("element").removeChild(b)},replaceChild:function(b,a){b=b.get?b.get("element"):b;a=
-a.get?a.get("element"):a;return this.get("element").replaceChild(b,a)},initAttributes:function(){},addListener:function(b,a,c,e){var h=this.get("element")||this.get("id"),e=e||this,i=this;if(!this._events[b]){h&&this.DOM_EVENTS[b]&&YAHOO.util.Event.addListener(h,b,function(a){if(a.srcElement&&!a.target)a.target=a.srcElement;i.fireEvent(b,a)},c,e);this.createEvent(b,this)}return YAHOO.util.EventProvider.prototype.subscribe.apply(this,arguments)},on:function(){return this.addListener.apply(this,arguments)},
-subscribe:function(){return this.addListener.apply(this,arguments)},removeListener:function(b,a){return this.unsubscribe.apply(this,arguments)},addClass:function(b){c.addClass(this.get("element"),b)},getElementsByClassName:function(b,a){return c.getElementsByClassName(b,a,this.get("element"))},hasClass:function(b){return c.hasClass(this.get("element"),b)},removeClass:function(b){return c.removeClass(this.get("element"),b)},replaceClass:function(b,a){return c.replaceClass(this.get("element"),b,a)},
-setStyle:function(b,a){return c.setStyle(this.get("element"),b,a)},getStyle:function(b){return c.getStyle(this.get("element"),b)},fireQueue:function(){for(var b=this._queue,a=0,c=b.length;a<c;++a)this[b[a][0]].apply(this,b[a][1])},appendTo:function(b,a){b=b.get?b.get("element"):c.get(b);this.fireEvent("beforeAppendTo",{type:"beforeAppendTo",target:b});var a=a&&a.get?a.get("element"):c.get(a),e=this.get("element");if(!e||!b)return false;e.parent!=b&&(a?b.insertBefore(e,a):b.appendChild(e));this.fireEvent("appendTo",
-{type:"appendTo",target:b});return e},get:function(b){var a=this._configs||{},c=a.element;c&&(!a[b]&&!YAHOO.lang.isUndefined(c.value[b]))&&this._setHTMLAttrConfig(b);return e.prototype.get.call(this,b)},setAttributes:function(b,a){for(var c={},e=this._configOrder,h=0,i=e.length;h<i;++h)if(b[e[h]]!==void 0){c[e[h]]=true;this.set(e[h],b[e[h]],a)}for(var j in b)b.hasOwnProperty(j)&&!c[j]&&this.set(j,b[j],a)},set:function(b,a,c){var g=this.get("element");if(g){!this._configs[b]&&!YAHOO.lang.isUndefined(g[b])&&
-this._setHTMLAttrConfig(b);return e.prototype.set.apply(this,arguments)}this._queue[this._queue.length]=["set",arguments];if(this._configs[b])this._configs[b].value=a},setAttributeConfig:function(b,a,c){this._configOrder.push(b);e.prototype.setAttributeConfig.apply(this,arguments)},createEvent:function(b,a){this._events[b]=true;return e.prototype.createEvent.apply(this,arguments)},init:function(b,a){this._initElement(b,a)},destroy:function(){var b=this.get("element");YAHOO.util.Event.purgeElement(b,
-true);this.unsubscribeAll();b&&b.parentNode&&b.parentNode.removeChild(b);this._queue=[];this._events={};this._configs={};this._configOrder=[]},_initElement:function(d,a){this._queue=this._queue||[];this._events=this._events||{};this._configs=this._configs||{};this._configOrder=[];a=a||{};a.element=a.element||d||null;var e=false,g=b.DOM_EVENTS;this.DOM_EVENTS=this.DOM_EVENTS||{};for(var h in g)g.hasOwnProperty(h)&&(this.DOM_EVENTS[h]=g[h]);typeof a.element==="string"&&this._setHTMLAttrConfig("id",
-{value:a.element});if(c.get(a.element)){e=true;this._initHTMLElement(a);this._initContent(a)}YAHOO.util.Event.onAvailable(a.element,function(){e||this._initHTMLElement(a);this.fireEvent("available",{type:"available",target:c.get(a.element)})},this,true);YAHOO.util.Event.onContentReady(a.element,function(){e||this._initContent(a);this.fireEvent("contentReady",{type:"contentReady",target:c.get(a.element)})},this,true)},_initHTMLElement:function(b){this.setAttributeConfig("element",{value:c.get(b.element),
-readOnly:true})},_initContent:function(b){this.initAttributes(b);this.setAttributes(b,true);this.fireQueue()},_setHTMLAttrConfig:function(b,a){var c=this.get("element"),a=a||{};a.name=b;a.setter=a.setter||this.DEFAULT_HTML_SETTER;a.getter=a.getter||this.DEFAULT_HTML_GETTER;a.value=a.value||c[b];this._configs[b]=new YAHOO.util.Attribute(a,this)}};YAHOO.augment(b,e);YAHOO.util.Element=b})();YAHOO.register("element",YAHOO.util.Element,{version:"2.7.0",build:"1796"});
-YAHOO.util.Color=function(){var c=YAHOO.lang.isArray,e=YAHOO.lang.isNumber;return{real2dec:function(b){return Math.min(255,Math.round(b*256))},hsv2rgb:function(b,d,a){if(c(b))return this.hsv2rgb.call(this,b[0],b[1],b[2]);var e,g,h,i=Math.floor(b/60%6),j=b/60-i,b=a*(1-d),k=a*(1-j*d),d=a*(1-(1-j)*d);switch(i){case 0:e=a;g=d;h=b;break;case 1:e=k;g=a;h=b;break;case 2:e=b;g=a;h=d;break;case 3:e=b;g=k;h=a;break;case 4:e=d;g=b;h=a;break;case 5:e=a;g=b;h=k}a=this.real2dec;return[a(e),a(g),a(h)]},rgb2hsv:function(b,
-d,a){if(c(b))return this.rgb2hsv.apply(this,b);var b=b/255,d=d/255,a=a/255,e,g=Math.min(Math.min(b,d),a),h=Math.max(Math.max(b,d),a),i=h-g;switch(h){case g:e=0;break;case b:e=60*(d-a)/i;d<a&&(e=e+360);break;case d:e=60*(a-b)/i+120;break;case a:e=60*(b-d)/i+240}return[Math.round(e),h===0?0:1-g/h,h]},rgb2hex:function(b,d,a){if(c(b))return this.rgb2hex.apply(this,b);var e=this.dec2hex;return e(b)+e(d)+e(a)},dec2hex:function(b){b=parseInt(b,10)|0;return("0"+(b>255||b<0?0:b).toString(16)).slice(-2).toUpperCase()},
-hex2dec:function(b){return parseInt(b,16)},hex2rgb:function(b){var c=this.hex2dec;return[c(b.slice(0,2)),c(b.slice(2,4)),c(b.slice(4,6))]},websafe:function(b,d,a){if(c(b))return this.websafe.apply(this,b);var f=function(a){if(e(a)){var a=Math.min(Math.max(0,a),255),b,c;for(b=0;b<256;b=b+51){c=b+51;if(a>=b&&a<=c)return a-b>25?c:b}}return a};return[f(b),f(d),f(a)]}}}();
-(function(){function c(a,b){e=e+1;b=b||{};if(arguments.length===1&&!YAHOO.lang.isString(a)&&!a.nodeName){b=a;a=b.element||null}!a&&!b.element&&(a=this._createHostElement(b));c.superclass.constructor.call(this,a,b);this.initPicker()}var e=0,b=YAHOO.util,d=YAHOO.lang,a=YAHOO.widget.Slider,f=b.Color,g=b.Dom,h=b.Event,i=d.substitute;YAHOO.extend(c,YAHOO.util.Element,{ID:{R:"yui-picker-r",R_HEX:"yui-picker-rhex",G:"yui-picker-g",G_HEX:"yui-picker-ghex",B:"yui-picker-b",B_HEX:"yui-picker-bhex",H:"yui-picker-h",
-S:"yui-picker-s",V:"yui-picker-v",PICKER_BG:"yui-picker-bg",PICKER_THUMB:"yui-picker-thumb",HUE_BG:"yui-picker-hue-bg",HUE_THUMB:"yui-picker-hue-thumb",HEX:"yui-picker-hex",SWATCH:"yui-picker-swatch",WEBSAFE_SWATCH:"yui-picker-websafe-swatch",CONTROLS:"yui-picker-controls",RGB_CONTROLS:"yui-picker-rgb-controls",HSV_CONTROLS:"yui-picker-hsv-controls",HEX_CONTROLS:"yui-picker-hex-controls",HEX_SUMMARY:"yui-picker-hex-summary",CONTROLS_LABEL:"yui-picker-controls-label"},TXT:{ILLEGAL_HEX:"Illegal hex value entered",
-SHOW_CONTROLS:"Show color details",HIDE_CONTROLS:"Hide color details",CURRENT_COLOR:"Currently selected color: {rgb}",CLOSEST_WEBSAFE:"Closest websafe color: {rgb}. Click to select.",R:"R",G:"G",B:"B",H:"H",S:"S",V:"V",HEX:"#",DEG:"°",PERCENT:"%"},IMAGE:{PICKER_THUMB:"../../build/colorpicker/assets/picker_thumb.png",HUE_THUMB:"../../build/colorpicker/assets/hue_thumb.png"},DEFAULT:{PICKER_SIZE:180},OPT:{HUE:"hue",SATURATION:"saturation",VALUE:"value",RED:"red",GREEN:"green",BLUE:"blue",HSV:"hsv",
-RGB:"rgb",WEBSAFE:"websafe",HEX:"hex",PICKER_SIZE:"pickersize",SHOW_CONTROLS:"showcontrols",SHOW_RGB_CONTROLS:"showrgbcontrols",SHOW_HSV_CONTROLS:"showhsvcontrols",SHOW_HEX_CONTROLS:"showhexcontrols",SHOW_HEX_SUMMARY:"showhexsummary",SHOW_WEBSAFE:"showwebsafe",CONTAINER:"container",IDS:"ids",ELEMENTS:"elements",TXT:"txt",IMAGES:"images",ANIMATE:"animate"},skipAnim:true,_createHostElement:function(){var a=document.createElement("div");if(this.CSS.BASE)a.className=this.CSS.BASE;return a},_updateHueSlider:function(){var a=
-this.get(this.OPT.PICKER_SIZE),b=this.get(this.OPT.HUE),b=a-Math.round(b/360*a);b===a&&(b=0);this.hueSlider.setValue(b,this.skipAnim)},_updatePickerSlider:function(){var a=this.get(this.OPT.PICKER_SIZE),b=this.get(this.OPT.SATURATION),c=this.get(this.OPT.VALUE),b=Math.round(b*a/100),c=Math.round(a-c*a/100);this.pickerSlider.setRegionValue(b,c,this.skipAnim)},_updateSliders:function(){this._updateHueSlider();this._updatePickerSlider()},setValue:function(a,b){this.set(this.OPT.RGB,a,b||false);this._updateSliders()},
-hueSlider:null,pickerSlider:null,_getH:function(){var a=this.get(this.OPT.PICKER_SIZE),a=(a-this.hueSlider.getValue())/a,a=Math.round(a*360);return a===360?0:a},_getS:function(){return this.pickerSlider.getXValue()/this.get(this.OPT.PICKER_SIZE)},_getV:function(){var a=this.get(this.OPT.PICKER_SIZE);return(a-this.pickerSlider.getYValue())/a},_updateSwatch:function(){var a=this.get(this.OPT.RGB),b=this.get(this.OPT.WEBSAFE),c=this.getElement(this.ID.SWATCH),a=a.join(","),d=this.get(this.OPT.TXT);g.setStyle(c,
-"background-color","rgb("+a+")");c.title=i(d.CURRENT_COLOR,{rgb:"#"+this.get(this.OPT.HEX)});c=this.getElement(this.ID.WEBSAFE_SWATCH);a=b.join(",");g.setStyle(c,"background-color","rgb("+a+")");c.title=i(d.CLOSEST_WEBSAFE,{rgb:"#"+f.rgb2hex(b)})},_getValuesFromSliders:function(){this.set(this.OPT.RGB,f.hsv2rgb(this._getH(),this._getS(),this._getV()))},_updateFormFields:function(){this.getElement(this.ID.H).value=this.get(this.OPT.HUE);this.getElement(this.ID.S).value=this.get(this.OPT.SATURATION);
-this.getElement(this.ID.V).value=this.get(this.OPT.VALUE);this.getElement(this.ID.R).value=this.get(this.OPT.RED);this.getElement(this.ID.R_HEX).innerHTML=f.dec2hex(this.get(this.OPT.RED));this.getElement(this.ID.G).value=this.get(this.OPT.GREEN);this.getElement(this.ID.G_HEX).innerHTML=f.dec2hex(this.get(this.OPT.GREEN));this.getElement(this.ID.B).value=this.get(this.OPT.BLUE);this.getElement(this.ID.B_HEX).innerHTML=f.dec2hex(this.get(this.OPT.BLUE));this.getElement(this.ID.HEX).value=this.get(this.OPT.HEX)},
-_onHueSliderChange:function(){var b=this._getH(),c="rgb("+f.hsv2rgb(b,1,1).join(",")+")";this.set(this.OPT.HUE,b,true);g.setStyle(this.getElement(this.ID.PICKER_BG),"background-color",c);this.hueSlider.valueChangeSource!==a.SOURCE_SET_VALUE&&this._getValuesFromSliders();this._updateFormFields();this._updateSwatch()},_onPickerSliderChange:function(){var b=this._getS(),c=this._getV();this.set(this.OPT.SATURATION,Math.round(b*100),true);this.set(this.OPT.VALUE,Math.round(c*100),true);this.pickerSlider.valueChangeSource!==
-a.SOURCE_SET_VALUE&&this._getValuesFromSliders();this._updateFormFields();this._updateSwatch()},_getCommand:function(a){var b=h.getCharCode(a);return b===38?3:b===13?6:b===40?4:b>=48&&b<=57?1:b>=97&&b<=102?2:b>=65&&b<=70?2:"8, 9, 13, 27, 37, 39".indexOf(b)>-1||a.ctrlKey||a.metaKey?5:0},_useFieldValue:function(a,b,c){a=b.value;c!==this.OPT.HEX&&(a=parseInt(a,10));a!==this.get(c)&&this.set(c,a)},_rgbFieldKeypress:function(a,b,c){var d=this._getCommand(a),e=a.shiftKey?10:1;switch(d){case 6:this._useFieldValue.apply(this,
-arguments);break;case 3:this.set(c,Math.min(this.get(c)+e,255));this._updateFormFields();break;case 4:this.set(c,Math.max(this.get(c)-e,0));this._updateFormFields()}},_hexFieldKeypress:function(a,b,c){this._getCommand(a)===6&&this._useFieldValue.apply(this,arguments)},_hexOnly:function(a,b){switch(this._getCommand(a)){case 6:case 5:case 1:break;case 2:if(b!==true)break;default:h.stopEvent(a);return false}},_numbersOnly:function(a){return this._hexOnly(a,true)},getElement:function(a){return this.get(this.OPT.ELEMENTS)[this.get(this.OPT.IDS)[a]]},
-_createElements:function(){var a,b,c,e,f=this.get(this.OPT.IDS),g=this.get(this.OPT.TXT),h=this.get(this.OPT.IMAGES),i=function(a,b){var c=document.createElement(a);b&&d.augmentObject(c,b,true);return c},q=function(a,b){var c=d.merge({autocomplete:"off",value:"0",size:3,maxlength:3},b);c.name=c.id;return new i(a,c)};e=this.get("element");a=new i("div",{id:f[this.ID.PICKER_BG],className:"yui-picker-bg",tabIndex:-1,hideFocus:true});b=new i("div",{id:f[this.ID.PICKER_THUMB],className:"yui-picker-thumb"});
-c=new i("img",{src:h.PICKER_THUMB});b.appendChild(c);a.appendChild(b);e.appendChild(a);a=new i("div",{id:f[this.ID.HUE_BG],className:"yui-picker-hue-bg",tabIndex:-1,hideFocus:true});b=new i("div",{id:f[this.ID.HUE_THUMB],className:"yui-picker-hue-thumb"});c=new i("img",{src:h.HUE_THUMB});b.appendChild(c);a.appendChild(b);e.appendChild(a);a=new i("div",{id:f[this.ID.CONTROLS],className:"yui-picker-controls"});e.appendChild(a);e=a;a=new i("div",{className:"hd"});b=new i("a",{id:f[this.ID.CONTROLS_LABEL],
-href:"#"});a.appendChild(b);e.appendChild(a);a=new i("div",{className:"bd"});e.appendChild(a);e=a;a=new i("ul",{id:f[this.ID.RGB_CONTROLS],className:"yui-picker-rgb-controls"});b=new i("li");b.appendChild(document.createTextNode(g.R+" "));c=new q("input",{id:f[this.ID.R],className:"yui-picker-r"});b.appendChild(c);a.appendChild(b);b=new i("li");b.appendChild(document.createTextNode(g.G+" "));c=new q("input",{id:f[this.ID.G],className:"yui-picker-g"});b.appendChild(c);a.appendChild(b);b=new i("li");
-b.appendChild(document.createTextNode(g.B+" "));c=new q("input",{id:f[this.ID.B],className:"yui-picker-b"});b.appendChild(c);a.appendChild(b);e.appendChild(a);a=new i("ul",{id:f[this.ID.HSV_CONTROLS],className:"yui-picker-hsv-controls"});b=new i("li");b.appendChild(document.createTextNode(g.H+" "));c=new q("input",{id:f[this.ID.H],className:"yui-picker-h"});b.appendChild(c);b.appendChild(document.createTextNode(" "+g.DEG));a.appendChild(b);b=new i("li");b.appendChild(document.createTextNode(g.S+" "));
-c=new q("input",{id:f[this.ID.S],className:"yui-picker-s"});b.appendChild(c);b.appendChild(document.createTextNode(" "+g.PERCENT));a.appendChild(b);b=new i("li");b.appendChild(document.createTextNode(g.V+" "));c=new q("input",{id:f[this.ID.V],className:"yui-picker-v"});b.appendChild(c);b.appendChild(document.createTextNode(" "+g.PERCENT));a.appendChild(b);e.appendChild(a);a=new i("ul",{id:f[this.ID.HEX_SUMMARY],className:"yui-picker-hex_summary"});b=new i("li",{id:f[this.ID.R_HEX]});a.appendChild(b);
-b=new i("li",{id:f[this.ID.G_HEX]});a.appendChild(b);b=new i("li",{id:f[this.ID.B_HEX]});a.appendChild(b);e.appendChild(a);a=new i("div",{id:f[this.ID.HEX_CONTROLS],className:"yui-picker-hex-controls"});a.appendChild(document.createTextNode(g.HEX+" "));b=new q("input",{id:f[this.ID.HEX],className:"yui-picker-hex",size:6,maxlength:6});a.appendChild(b);e.appendChild(a);e=this.get("element");a=new i("div",{id:f[this.ID.SWATCH],className:"yui-picker-swatch"});e.appendChild(a);a=new i("div",{id:f[this.ID.WEBSAFE_SWATCH],
-className:"yui-picker-websafe-swatch"});e.appendChild(a)},_attachRGBHSV:function(a,b){h.on(this.getElement(a),"keydown",function(a,c){c._rgbFieldKeypress(a,this,b)},this);h.on(this.getElement(a),"keypress",this._numbersOnly,this,true);h.on(this.getElement(a),"blur",function(a,c){c._useFieldValue(a,this,b)},this)},_updateRGB:function(){this.set(this.OPT.RGB,[this.get(this.OPT.RED),this.get(this.OPT.GREEN),this.get(this.OPT.BLUE)]);this._updateSliders()},_initElements:function(){var a=this.OPT,b=this.get(a.IDS),
-a=this.get(a.ELEMENTS),c,e,f;for(c in this.ID)d.hasOwnProperty(this.ID,c)&&(b[this.ID[c]]=b[c]);(e=g.get(b[this.ID.PICKER_BG]))||this._createElements();for(c in b)if(d.hasOwnProperty(b,c)){e=g.get(b[c]);f=g.generateId(e);b[c]=f;b[b[c]]=f;a[f]=e}},initPicker:function(){this._initSliders();this._bindUI();this.syncUI(true)},_initSliders:function(){var b=this.ID,c=this.get(this.OPT.PICKER_SIZE);this.hueSlider=a.getVertSlider(this.getElement(b.HUE_BG),this.getElement(b.HUE_THUMB),0,c);this.pickerSlider=
-a.getSliderRegion(this.getElement(b.PICKER_BG),this.getElement(b.PICKER_THUMB),0,c,0,c);this.set(this.OPT.ANIMATE,this.get(this.OPT.ANIMATE))},_bindUI:function(){var a=this.ID,b=this.OPT;this.hueSlider.subscribe("change",this._onHueSliderChange,this,true);this.pickerSlider.subscribe("change",this._onPickerSliderChange,this,true);h.on(this.getElement(a.WEBSAFE_SWATCH),"click",function(){this.setValue(this.get(b.WEBSAFE))},this,true);h.on(this.getElement(a.CONTROLS_LABEL),"click",function(a){this.set(b.SHOW_CONTROLS,
-!this.get(b.SHOW_CONTROLS));h.preventDefault(a)},this,true);this._attachRGBHSV(a.R,b.RED);this._attachRGBHSV(a.G,b.GREEN);this._attachRGBHSV(a.B,b.BLUE);this._attachRGBHSV(a.H,b.HUE);this._attachRGBHSV(a.S,b.SATURATION);this._attachRGBHSV(a.V,b.VALUE);h.on(this.getElement(a.HEX),"keydown",function(a,c){c._hexFieldKeypress(a,this,b.HEX)},this);h.on(this.getElement(this.ID.HEX),"keypress",this._hexOnly,this,true);h.on(this.getElement(this.ID.HEX),"blur",function(a,c){c._useFieldValue(a,this,b.HEX)},
-this)},syncUI:function(a){this.skipAnim=a;this._updateRGB();this.skipAnim=false},_updateRGBFromHSV:function(){var a=[this.get(this.OPT.HUE),this.get(this.OPT.SATURATION)/100,this.get(this.OPT.VALUE)/100];this.set(this.OPT.RGB,f.hsv2rgb(a));this._updateSliders()},_updateHex:function(){var a=this.get(this.OPT.HEX),b=a.length,c;if(b===3){a=a.split("");for(c=0;c<b;c=c+1)a[c]=a[c]+a[c];a=a.join("")}if(a.length!==6)return false;this.setValue(f.hex2rgb(a))},_hideShowEl:function(a,b){var c=d.isString(a)?
-this.getElement(a):a;g.setStyle(c,"display",b?"":"none")},initAttributes:function(a){a=a||{};c.superclass.initAttributes.call(this,a);this.setAttributeConfig(this.OPT.PICKER_SIZE,{value:a.size||this.DEFAULT.PICKER_SIZE});this.setAttributeConfig(this.OPT.HUE,{value:a.hue||0,validator:d.isNumber});this.setAttributeConfig(this.OPT.SATURATION,{value:a.saturation||0,validator:d.isNumber});this.setAttributeConfig(this.OPT.VALUE,{value:d.isNumber(a.value)?a.value:100,validator:d.isNumber});this.setAttributeConfig(this.OPT.RED,
-{value:d.isNumber(a.red)?a.red:255,validator:d.isNumber});this.setAttributeConfig(this.OPT.GREEN,{value:d.isNumber(a.green)?a.green:255,validator:d.isNumber});this.setAttributeConfig(this.OPT.BLUE,{value:d.isNumber(a.blue)?a.blue:255,validator:d.isNumber});this.setAttributeConfig(this.OPT.HEX,{value:a.hex||"FFFFFF",validator:d.isString});this.setAttributeConfig(this.OPT.RGB,{value:a.rgb||[255,255,255],method:function(a){this.set(this.OPT.RED,a[0],true);this.set(this.OPT.GREEN,a[1],true);this.set(this.OPT.BLUE,
-a[2],true);var b=f.websafe(a),c=f.rgb2hex(a),a=f.rgb2hsv(a);this.set(this.OPT.WEBSAFE,b,true);this.set(this.OPT.HEX,c,true);a[1]&&this.set(this.OPT.HUE,a[0],true);this.set(this.OPT.SATURATION,Math.round(a[1]*100),true);this.set(this.OPT.VALUE,Math.round(a[2]*100),true)},readonly:true});this.setAttributeConfig(this.OPT.CONTAINER,{value:null,method:function(a){a&&a.showEvent.subscribe(function(){this.pickerSlider.focus()},this,true)}});this.setAttributeConfig(this.OPT.WEBSAFE,{value:a.websafe||[255,
-255,255]});var b=a.ids||d.merge({},this.ID),h;if(!a.ids&&e>1)for(h in b)d.hasOwnProperty(b,h)&&(b[h]=b[h]+e);this.setAttributeConfig(this.OPT.IDS,{value:b,writeonce:true});this.setAttributeConfig(this.OPT.TXT,{value:a.txt||this.TXT,writeonce:true});this.setAttributeConfig(this.OPT.IMAGES,{value:a.images||this.IMAGE,writeonce:true});this.setAttributeConfig(this.OPT.ELEMENTS,{value:{},readonly:true});this.setAttributeConfig(this.OPT.SHOW_CONTROLS,{value:d.isBoolean(a.showcontrols)?a.showcontrols:true,
-method:function(a){this._hideShowEl(g.getElementsByClassName("bd","div",this.getElement(this.ID.CONTROLS))[0],a);this.getElement(this.ID.CONTROLS_LABEL).innerHTML=a?this.get(this.OPT.TXT).HIDE_CONTROLS:this.get(this.OPT.TXT).SHOW_CONTROLS}});this.setAttributeConfig(this.OPT.SHOW_RGB_CONTROLS,{value:d.isBoolean(a.showrgbcontrols)?a.showrgbcontrols:true,method:function(a){this._hideShowEl(this.ID.RGB_CONTROLS,a)}});this.setAttributeConfig(this.OPT.SHOW_HSV_CONTROLS,{value:d.isBoolean(a.showhsvcontrols)?
-a.showhsvcontrols:false,method:function(a){this._hideShowEl(this.ID.HSV_CONTROLS,a);a&&this.get(this.OPT.SHOW_HEX_SUMMARY)&&this.set(this.OPT.SHOW_HEX_SUMMARY,false)}});this.setAttributeConfig(this.OPT.SHOW_HEX_CONTROLS,{value:d.isBoolean(a.showhexcontrols)?a.showhexcontrols:false,method:function(a){this._hideShowEl(this.ID.HEX_CONTROLS,a)}});this.setAttributeConfig(this.OPT.SHOW_WEBSAFE,{value:d.isBoolean(a.showwebsafe)?a.showwebsafe:true,method:function(a){this._hideShowEl(this.ID.WEBSAFE_SWATCH,
-a)}});this.setAttributeConfig(this.OPT.SHOW_HEX_SUMMARY,{value:d.isBoolean(a.showhexsummary)?a.showhexsummary:true,method:function(a){this._hideShowEl(this.ID.HEX_SUMMARY,a);a&&this.get(this.OPT.SHOW_HSV_CONTROLS)&&this.set(this.OPT.SHOW_HSV_CONTROLS,false)}});this.setAttributeConfig(this.OPT.ANIMATE,{value:d.isBoolean(a.animate)?a.animate:true,method:function(a){if(this.pickerSlider){this.pickerSlider.animate=a;this.hueSlider.animate=a}}});this.on(this.OPT.HUE+"Change",this._updateRGBFromHSV,this,
-true);this.on(this.OPT.SATURATION+"Change",this._updateRGBFromHSV,this,true);this.on(this.OPT.VALUE+"Change",this._updateRGBFromHSV,this,true);this.on(this.OPT.RED+"Change",this._updateRGB,this,true);this.on(this.OPT.GREEN+"Change",this._updateRGB,this,true);this.on(this.OPT.BLUE+"Change",this._updateRGB,this,true);this.on(this.OPT.HEX+"Change",this._updateHex,this,true);this._initElements()}});YAHOO.widget.ColorPicker=c})();YAHOO.register("colorpicker",YAHOO.widget.ColorPicker,{version:"2.7.0",build:"1796"});
-(function(){var c=YAHOO.util,e=function(b,c,a,e){this.init(b,c,a,e)};e.NAME="Anim";e.prototype={toString:function(){var b=this.getEl()||{};return this.constructor.NAME+": "+(b.id||b.tagName)},patterns:{noNegatives:/width|height|opacity|padding/i,offsetAttribute:/^((width|height)|(top|left))$/,defaultUnit:/width|height|top$|bottom$|left$|right$/i,offsetUnit:/\d+(em|%|en|ex|pt|in|cm|mm|pc)$/i},doMethod:function(b,c,a){return this.method(this.currentFrame,c,a-c,this.totalFrames)},setAttribute:function(b,
-d,a){var e=this.getEl();this.patterns.noNegatives.test(b)&&(d=d>0?d:0);"style"in e?c.Dom.setStyle(e,b,d+a):b in e&&(e[b]=d)},getAttribute:function(b){var d=this.getEl(),a=c.Dom.getStyle(d,b);if(a!=="auto"&&!this.patterns.offsetUnit.test(a))return parseFloat(a);var e=this.patterns.offsetAttribute.exec(b)||[],g=!!e[3],h=!!e[2];"style"in d?a=h||c.Dom.getStyle(d,"position")=="absolute"&&g?d["offset"+e[0].charAt(0).toUpperCase()+e[0].substr(1)]:0:b in d&&(a=d[b]);return a},getDefaultUnit:function(b){return this.patterns.defaultUnit.test(b)?
-"px":""},setRuntimeAttribute:function(b){var c,a,e=this.attributes;this.runtimeAttributes[b]={};var g=function(a){return typeof a!=="undefined"};if(!g(e[b].to)&&!g(e[b].by))return false;c=g(e[b].from)?e[b].from:this.getAttribute(b);if(g(e[b].to))a=e[b].to;else if(g(e[b].by))if(c.constructor==Array){a=[];for(var h=0,i=c.length;h<i;++h)a[h]=c[h]+e[b].by[h]*1}else a=c+e[b].by*1;this.runtimeAttributes[b].start=c;this.runtimeAttributes[b].end=a;this.runtimeAttributes[b].unit=g(e[b].unit)?e[b].unit:this.getDefaultUnit(b);
-return true},init:function(b,d,a,e){var g=false,h=null,i=0,b=c.Dom.get(b);this.attributes=d||{};this.duration=!YAHOO.lang.isUndefined(a)?a:1;this.method=e||c.Easing.easeNone;this.useSeconds=true;this.currentFrame=0;this.totalFrames=c.AnimMgr.fps;this.setEl=function(a){b=c.Dom.get(a)};this.getEl=function(){return b};this.isAnimated=function(){return g};this.getStartTime=function(){return h};this.runtimeAttributes={};this.animate=function(){if(this.isAnimated())return false;this.currentFrame=0;this.totalFrames=
-this.useSeconds?Math.ceil(c.AnimMgr.fps*this.duration):this.duration;if(this.duration===0&&this.useSeconds)this.totalFrames=1;c.AnimMgr.registerElement(this);return true};this.stop=function(a){if(!this.isAnimated())return false;if(a){this.currentFrame=this.totalFrames;this._onTween.fire()}c.AnimMgr.stop(this)};this._onStart=new c.CustomEvent("_start",this,true);this.onStart=new c.CustomEvent("start",this);this.onTween=new c.CustomEvent("tween",this);this._onTween=new c.CustomEvent("_tween",this,true);
-this.onComplete=new c.CustomEvent("complete",this);this._onComplete=new c.CustomEvent("_complete",this,true);this._onStart.subscribe(function(){this.onStart.fire();this.runtimeAttributes={};for(var a in this.attributes)this.setRuntimeAttribute(a);g=true;i=0;h=new Date});this._onTween.subscribe(function(){var a={duration:new Date-this.getStartTime(),currentFrame:this.currentFrame,toString:function(){return"duration: "+a.duration+", currentFrame: "+a.currentFrame}};this.onTween.fire(a);var b=this.runtimeAttributes,
-c;for(c in b)this.setAttribute(c,this.doMethod(c,b[c].start,b[c].end),b[c].unit);i=i+1});this._onComplete.subscribe(function(){var a=(new Date-h)/1E3,b={duration:a,frames:i,fps:i/a,toString:function(){return"duration: "+b.duration+", frames: "+b.frames+", fps: "+b.fps}};g=false;i=0;this.onComplete.fire(b)})}};c.Anim=e})();
-YAHOO.util.AnimMgr=new function(){var c=null,e=[],b=0;this.fps=1E3;this.delay=1;this.registerElement=function(c){e[e.length]=c;b=b+1;c._onStart.fire();this.start()};this.unRegister=function(c,a){var f;if(!(f=a))a:{f=0;for(var g=e.length;f<g;++f)if(e[f]==c)break a;f=-1}a=f;if(!c.isAnimated()||a==-1)return false;c._onComplete.fire();e.splice(a,1);b=b-1;b<=0&&this.stop();return true};this.start=function(){c===null&&(c=setInterval(this.run,this.delay))};this.stop=function(d){if(d)this.unRegister(d);else{clearInterval(c);
-for(var d=0,a=e.length;d<a;++d)this.unRegister(e[0],0);e=[];c=null;b=0}};this.run=function(){for(var b=0,a=e.length;b<a;++b){var c=e[b];if(c&&c.isAnimated())if(c.currentFrame<c.totalFrames||c.totalFrames===null){c.currentFrame=c.currentFrame+1;if(c.useSeconds){var g=c,h=g.totalFrames,i=g.currentFrame,j=g.currentFrame*g.duration*1E3/g.totalFrames,k=new Date-g.getStartTime(),l=0,l=k<g.duration*1E3?Math.round((k/j-1)*g.currentFrame):h-(i+1);if(l>0&&isFinite(l)){g.currentFrame+l>=h&&(l=h-(i+1));g.currentFrame=
-g.currentFrame+l}}c._onTween.fire()}else YAHOO.util.AnimMgr.stop(c,b)}}};YAHOO.util.Bezier=new function(){this.getPosition=function(c,e){for(var b=c.length,d=[],a=0;a<b;++a)d[a]=[c[a][0],c[a][1]];for(var f=1;f<b;++f)for(a=0;a<b-f;++a){d[a][0]=(1-e)*d[a][0]+e*d[parseInt(a+1,10)][0];d[a][1]=(1-e)*d[a][1]+e*d[parseInt(a+1,10)][1]}return[d[0][0],d[0][1]]}};
-(function(){var c=function(a,b,d,e){c.superclass.constructor.call(this,a,b,d,e)};c.NAME="ColorAnim";c.DEFAULT_BGCOLOR="#fff";var e=YAHOO.util;YAHOO.extend(c,e.Anim);var b=c.superclass,d=c.prototype;d.patterns.color=/color$/i;d.patterns.rgb=/^rgb\(([0-9]+)\s*,\s*([0-9]+)\s*,\s*([0-9]+)\)$/i;d.patterns.hex=/^#?([0-9A-F]{2})([0-9A-F]{2})([0-9A-F]{2})$/i;d.patterns.hex3=/^#?([0-9A-F]{1})([0-9A-F]{1})([0-9A-F]{1})$/i;d.patterns.transparent=/^transparent|rgba\(0, 0, 0, 0\)$/;d.parseColor=function(a){if(a.length==
-3)return a;var b=this.patterns.hex.exec(a);if(b&&b.length==4)return[parseInt(b[1],16),parseInt(b[2],16),parseInt(b[3],16)];if((b=this.patterns.rgb.exec(a))&&b.length==4)return[parseInt(b[1],10),parseInt(b[2],10),parseInt(b[3],10)];return(b=this.patterns.hex3.exec(a))&&b.length==4?[parseInt(b[1]+b[1],16),parseInt(b[2]+b[2],16),parseInt(b[3]+b[3],16)]:null};d.getAttribute=function(a){var d=this.getEl();if(this.patterns.color.test(a)){var g=YAHOO.util.Dom.getStyle(d,a),h=this;if(this.patterns.transparent.test(g))g=
-(d=YAHOO.util.Dom.getAncestorBy(d,function(){return!h.patterns.transparent.test(g)}))?e.Dom.getStyle(d,a):c.DEFAULT_BGCOLOR}else g=b.getAttribute.call(this,a);return g};d.doMethod=function(a,c,d){var e;if(this.patterns.color.test(a)){e=[];for(var i=0,j=c.length;i<j;++i)e[i]=b.doMethod.call(this,a,c[i],d[i]);e="rgb("+Math.floor(e[0])+","+Math.floor(e[1])+","+Math.floor(e[2])+")"}else e=b.doMethod.call(this,a,c,d);return e};d.setRuntimeAttribute=function(a){b.setRuntimeAttribute.call(this,a);if(this.patterns.color.test(a)){var c=
-this.attributes,d=this.parseColor(this.runtimeAttributes[a].start),e=this.parseColor(this.runtimeAttributes[a].end);if(typeof c[a].to==="undefined"&&typeof c[a].by!=="undefined")for(var e=this.parseColor(c[a].by),c=0,i=d.length;c<i;++c)e[c]=d[c]+e[c];this.runtimeAttributes[a].start=d;this.runtimeAttributes[a].end=e}};e.ColorAnim=c})();
-YAHOO.util.Easing={easeNone:function(c,e,b,d){return b*c/d+e},easeIn:function(c,e,b,d){return b*(c=c/d)*c+e},easeOut:function(c,e,b,d){return-b*(c=c/d)*(c-2)+e},easeBoth:function(c,e,b,d){return(c=c/(d/2))<1?b/2*c*c+e:-b/2*(--c*(c-2)-1)+e},easeInStrong:function(c,e,b,d){return b*(c=c/d)*c*c*c+e},easeOutStrong:function(c,e,b,d){return-b*((c=c/d-1)*c*c*c-1)+e},easeBothStrong:function(c,e,b,d){return(c=c/(d/2))<1?b/2*c*c*c*c+e:-b/2*((c=c-2)*c*c*c-2)+e},elasticIn:function(c,e,b,d,a,f){if(c==0)return e;
-if((c=c/d)==1)return e+b;f||(f=d*0.3);if(!a||a<Math.abs(b)){a=b;b=f/4}else b=f/(2*Math.PI)*Math.asin(b/a);return-(a*Math.pow(2,10*(c=c-1))*Math.sin((c*d-b)*2*Math.PI/f))+e},elasticOut:function(c,e,b,d,a,f){if(c==0)return e;if((c=c/d)==1)return e+b;f||(f=d*0.3);if(!a||a<Math.abs(b))var a=b,g=f/4;else g=f/(2*Math.PI)*Math.asin(b/a);return a*Math.pow(2,-10*c)*Math.sin((c*d-g)*2*Math.PI/f)+b+e},elasticBoth:function(c,e,b,d,a,f){if(c==0)return e;if((c=c/(d/2))==2)return e+b;f||(f=d*0.3*1.5);if(!a||a<Math.abs(b))var a=
-b,g=f/4;else g=f/(2*Math.PI)*Math.asin(b/a);return c<1?-0.5*a*Math.pow(2,10*(c=c-1))*Math.sin((c*d-g)*2*Math.PI/f)+e:a*Math.pow(2,-10*(c=c-1))*Math.sin((c*d-g)*2*Math.PI/f)*0.5+b+e},backIn:function(c,e,b,d,a){typeof a=="undefined"&&(a=1.70158);return b*(c=c/d)*c*((a+1)*c-a)+e},backOut:function(c,e,b,d,a){typeof a=="undefined"&&(a=1.70158);return b*((c=c/d-1)*c*((a+1)*c+a)+1)+e},backBoth:function(c,e,b,d,a){typeof a=="undefined"&&(a=1.70158);return(c=c/(d/2))<1?b/2*c*c*(((a=a*1.525)+1)*c-a)+e:b/2*
-((c=c-2)*c*(((a=a*1.525)+1)*c+a)+2)+e},bounceIn:function(c,e,b,d){return b-YAHOO.util.Easing.bounceOut(d-c,0,b,d)+e},bounceOut:function(c,e,b,d){return(c=c/d)<1/2.75?b*7.5625*c*c+e:c<2/2.75?b*(7.5625*(c=c-1.5/2.75)*c+0.75)+e:c<2.5/2.75?b*(7.5625*(c=c-2.25/2.75)*c+0.9375)+e:b*(7.5625*(c=c-2.625/2.75)*c+0.984375)+e},bounceBoth:function(c,e,b,d){return c<d/2?YAHOO.util.Easing.bounceIn(c*2,0,b,d)*0.5+e:YAHOO.util.Easing.bounceOut(c*2-d,0,b,d)*0.5+b*0.5+e}};
-(function(){var c=function(a,b,d,e){a&&c.superclass.constructor.call(this,a,b,d,e)};c.NAME="Motion";var e=YAHOO.util;YAHOO.extend(c,e.ColorAnim);var b=c.superclass,d=c.prototype;d.patterns.points=/^points$/i;d.setAttribute=function(a,c,d){if(this.patterns.points.test(a)){d=d||"px";b.setAttribute.call(this,"left",c[0],d);b.setAttribute.call(this,"top",c[1],d)}else b.setAttribute.call(this,a,c,d)};d.getAttribute=function(a){return this.patterns.points.test(a)?[b.getAttribute.call(this,"left"),b.getAttribute.call(this,
-"top")]:b.getAttribute.call(this,a)};d.doMethod=function(a,c,d){var f=null;if(this.patterns.points.test(a)){c=this.method(this.currentFrame,0,100,this.totalFrames)/100;f=e.Bezier.getPosition(this.runtimeAttributes[a],c)}else f=b.doMethod.call(this,a,c,d);return f};d.setRuntimeAttribute=function(c){if(this.patterns.points.test(c)){var d=this.getEl(),i=this.attributes,j=i.points.control||[],k,l,m;if(j.length>0&&!(j[0]instanceof Array))j=[j];else{var n=[];l=0;for(m=j.length;l<m;++l)n[l]=j[l];j=n}e.Dom.getStyle(d,
-"position")=="static"&&e.Dom.setStyle(d,"position","relative");f(i.points.from)?e.Dom.setXY(d,i.points.from):e.Dom.setXY(d,e.Dom.getXY(d));d=this.getAttribute("points");if(f(i.points.to)){k=a.call(this,i.points.to,d);e.Dom.getXY(this.getEl());l=0;for(m=j.length;l<m;++l)j[l]=a.call(this,j[l],d)}else if(f(i.points.by)){k=[d[0]+i.points.by[0],d[1]+i.points.by[1]];l=0;for(m=j.length;l<m;++l)j[l]=[d[0]+j[l][0],d[1]+j[l][1]]}this.runtimeAttributes[c]=[d];j.length>0&&(this.runtimeAttributes[c]=this.runtimeAttributes[c].concat(j));
-this.runtimeAttributes[c][this.runtimeAttributes[c].length]=k}else b.setRuntimeAttribute.call(this,c)};var a=function(a,b){var c=e.Dom.getXY(this.getEl());return a=[a[0]-c[0]+b[0],a[1]-c[1]+b[1]]},f=function(a){return typeof a!=="undefined"};e.Motion=c})();
-(function(){var c=function(a,b,d,e){a&&c.superclass.constructor.call(this,a,b,d,e)};c.NAME="Scroll";var e=YAHOO.util;YAHOO.extend(c,e.ColorAnim);var b=c.superclass,d=c.prototype;d.doMethod=function(a,c,d){var e=null;return e=a=="scroll"?[this.method(this.currentFrame,c[0],d[0]-c[0],this.totalFrames),this.method(this.currentFrame,c[1],d[1]-c[1],this.totalFrames)]:b.doMethod.call(this,a,c,d)};d.getAttribute=function(a){var c=null,c=this.getEl();return c=a=="scroll"?[c.scrollLeft,c.scrollTop]:b.getAttribute.call(this,
-a)};d.setAttribute=function(a,c,d){var e=this.getEl();if(a=="scroll"){e.scrollLeft=c[0];e.scrollTop=c[1]}else b.setAttribute.call(this,a,c,d)};e.Scroll=c})();YAHOO.register("animation",YAHOO.util.Anim,{version:"2.7.0",build:"1799"});
\ No newline at end of file
@@ -1,5 +0,0 @@
-﻿/*
- Copyright (c) 2003-2015, CKSource - Frederico Knabben. All rights reserved.
- For licensing, see LICENSE.md or http://ckeditor.com/license
-*/
-CKEDITOR.plugins.setLang("widget","el",{move:"Κάνετε κλικ και σύρετε το ποντίκι για να μετακινήστε"});
\ No newline at end of file
@@ -1,10 +1,12 @@
 /** @type {import('tailwindcss').Config} */
 module.exports = {
+  // Every file that can put a class on a page: templates, widget attrs and
+  // messages built in Python, and the bundle sources
   content: [
     './templates/**/*.html',
     './apps/**/templates/**/*.html',
-    './apps/**/forms.py',
-    './static/js/**/*.js',
+    './apps/**/*.py',
+    './static/src/**/*.js',
   ],
   theme: {
     extend: {